@@ -1,8 +1,9 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from .models import (
     Client, ContactMessage, WithdrawalRequest,
     ExternalLink, Product, Order, OrderItem, PaymentAttempt,Gallery
 )
+from . import payouts
 
 @admin.register(Client)
 class ClientAdmin(admin.ModelAdmin):
@@ -18,13 +19,29 @@ class ContactMessageAdmin(admin.ModelAdmin):
 
 @admin.register(WithdrawalRequest)
 class WithdrawalRequestAdmin(admin.ModelAdmin):
-    list_display = ("client", "amount", "method", "status", "created_at")
+    list_display = ("client", "amount", "method", "status", "created_at", "processed_at")
+    list_select_related = ("client__user",)
     list_filter = ("method", "status")
+    readonly_fields = ("claimed_by", "claimed_at", "processed_at", "raw_response")
+    actions = ["queue_for_payout"]
+
+    @admin.action(description="Queue selected withdrawals for payout")
+    def queue_for_payout(self, request, queryset):
+        selected = queryset.count()
+        queued = payouts.enqueue(queryset)
+        self.message_user(request, f"{queued} withdrawal(s) queued; run process_payouts to pay them out.")
+        if queued < selected:
+            self.message_user(
+                request,
+                f"{selected - queued} skipped: only pending Airtel Money / TNM Mpamba withdrawals can be queued.",
+                messages.WARNING,
+            )
 
 
 @admin.register(ExternalLink)
 class ExternalLinkAdmin(admin.ModelAdmin):
     list_display = ("title", "category", "created_at", "created_by")
+    list_select_related = ("created_by__user",)
     search_fields = ("title", "url", "category")
 
 
@@ -42,7 +59,25 @@ class GalleryAdmin(admin.ModelAdmin):
     ordering = ('-uploaded_at',)
 
 
+# Order and OrderItem print their client and product; list_select_related
+# joins them into the changelist query instead of one query per row.
+@admin.register(Order)
+class OrderAdmin(admin.ModelAdmin):
+    list_display = ("__str__", "created_at", "paid")
+    list_filter = ("paid",)
+    list_select_related = ("client__user",)
+
+
+@admin.register(OrderItem)
+class OrderItemAdmin(admin.ModelAdmin):
+    list_display = ("__str__", "order", "price")
+    list_select_related = ("order__client__user", "product")
+
+
+@admin.register(PaymentAttempt)
+class PaymentAttemptAdmin(admin.ModelAdmin):
+    list_display = ("tx_ref", "order", "payment_type", "amount", "status", "created_at")
+    list_filter = ("payment_type", "status")
+    search_fields = ("tx_ref",)
+    list_select_related = ("order__client__user",)
 
-admin.site.register(Order)
-admin.site.register(OrderItem)
-admin.site.register(PaymentAttempt)
@@ -0,0 +1,110 @@
+# breaker.py
+"""
+Circuit breaker with its state in the database.
+
+After PAYCHANGU_BREAKER_THRESHOLD consecutive failures the circuit opens
+and calls raise CircuitOpen straight away instead of waiting out the
+upstream timeout. After PAYCHANGU_BREAKER_COOLDOWN seconds it is
+half-open: one caller across all workers is let through as a probe. A
+successful probe closes the circuit and a failed one opens it for
+another cooldown.
+
+The state is one BreakerState row per endpoint. Claiming the probe and
+counting a failure are single guarded UPDATEs, which the database applies
+atomically; the cache backends offer no such guarantee (the file cache's
+add() is a read followed by a write). A closed circuit costs one primary
+key read per call, in before_call(), whose answer tells record_success()
+whether there is anything to reset; nothing is written until something
+fails. The methods are synchronous: async callers run them through
+sync_to_async.
+"""
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+
+from .models import BreakerState
+
+CLOSED, OPEN, HALF_OPEN = 0, 1, 2
+STATE_NAMES = {CLOSED: "closed", OPEN: "open", HALF_OPEN: "half_open"}
+
+_now = time.time
+
+
+class CircuitOpen(Exception):
+    def __init__(self, name, retry_after):
+        self.name = name
+        self.retry_after = max(1, round(retry_after))
+        super().__init__(f"{name} is temporarily unavailable, retry in {self.retry_after}s")
+
+
+class CircuitBreaker:
+    def __init__(self, name, threshold=None, cooldown=None, probe_timeout=30):
+        self.name = name
+        self._threshold = threshold
+        self._cooldown = cooldown
+        # A probe that never reports back (crashed worker) stops blocking after this.
+        self.probe_timeout = probe_timeout
+
+    @property
+    def threshold(self):
+        return self._threshold or settings.PAYCHANGU_BREAKER_THRESHOLD
+
+    @property
+    def cooldown(self):
+        return self._cooldown or settings.PAYCHANGU_BREAKER_COOLDOWN
+
+    def _row(self):
+        return BreakerState.objects.filter(name=self.name)
+
+    def state(self):
+        return self._state(self._row().values_list("opened_at", flat=True).first())
+
+    def _state(self, opened):
+        if opened is None:
+            return CLOSED
+        return OPEN if _now() < opened + self.cooldown else HALF_OPEN
+
+    def before_call(self):
+        """
+        Raise CircuitOpen unless the call may go ahead. Returns True if the
+        circuit was closed with no failures, which tells record_success()
+        there is nothing to reset.
+        """
+        failures, opened = self._row().values_list("failures", "opened_at").first() or (0, None)
+        if opened is None:
+            return failures == 0
+        now = _now()
+        remaining = opened + self.cooldown - now
+        if remaining > 0:
+            raise CircuitOpen(self.name, remaining)
+        claimed = self._row().filter(
+            Q(probe_until__isnull=True) | Q(probe_until__lt=now), opened_at__isnull=False,
+        ).update(probe_until=now + self.probe_timeout)
+        if not claimed:
+            raise CircuitOpen(self.name, self.cooldown)
+        return False
+
+    def record_success(self, clean=False):
+        """``clean`` is what before_call() returned for this call."""
+        if not clean:
+            self._row().update(failures=0, opened_at=None, probe_until=None)
+
+    def record_failure(self):
+        BreakerState.objects.bulk_create([BreakerState(name=self.name)], ignore_conflicts=True)
+        with transaction.atomic():
+            self._row().update(failures=F("failures") + 1)
+            failures, opened = self._row().values_list("failures", "opened_at").get()
+            if failures >= self.threshold or opened is not None:
+                # Tripped, or the half-open probe failed: (re)open for a full cooldown.
+                self._row().update(opened_at=_now(), probe_until=None)
+
+    def reset(self):
+        self._row().delete()
+
+
+def states(breakers):
+    """The state of each breaker, read in one query."""
+    opened = dict(BreakerState.objects.filter(name__in=[b.name for b in breakers]).values_list("name", "opened_at"))
+    return [b._state(opened.get(b.name)) for b in breakers]
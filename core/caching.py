@@ -0,0 +1,125 @@
+# caching.py
+"""
+Versioned result cache for marketplace listings.
+
+Every cached listing key embeds the current catalog version. Product and
+Gallery post_save/post_delete bump that version (see signals.py), which
+makes all older entries unreachable at once; they simply age out of the
+backend. The backend is whatever ``settings.CACHES`` points at.
+
+The version and the time of the last bump also drive the ETag and
+Last-Modified headers of the catalog pages (see conditional.py). If the
+version is ever evicted it restarts from the current time in
+milliseconds rather than from 1, so it never returns to a value that
+older keys and ETags were built on.
+"""
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+
+VERSION_KEY = "catalog:version"
+MODIFIED_KEY = "catalog:modified"
+
+
+class CacheStats:
+    """Process-local hit/miss counters. ``listeners`` are also called with each lookup's ``hit``."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.listeners = []
+
+    def record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        for listener in self.listeners:
+            listener(hit)
+
+    def snapshot(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
+
+    def reset(self):
+        with self._lock:
+            self.hits = self.misses = 0
+
+
+stats = CacheStats()
+
+
+def get_cache():
+    return caches[getattr(settings, "MARKETPLACE_CACHE_ALIAS", "default")]
+
+
+def initial_version():
+    # Above any version reached before: that would take a bump per millisecond.
+    return time.time_ns() // 1_000_000
+
+
+def catalog_version():
+    cache = get_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, initial_version(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def catalog_modified():
+    """When the catalog version last changed (or was first seen by this cache)."""
+    cache = get_cache()
+    modified = cache.get(MODIFIED_KEY)
+    if modified is None:
+        cache.add(MODIFIED_KEY, timezone.now(), timeout=None)
+        modified = cache.get(MODIFIED_KEY)
+    return modified
+
+
+def bump_catalog_version():
+    cache = get_cache()
+    cache.set(MODIFIED_KEY, timezone.now(), timeout=None)
+    try:
+        return cache.incr(VERSION_KEY)
+    except ValueError:
+        # Key missing (first write, or evicted): a fresh start invalidates.
+        cache.add(VERSION_KEY, initial_version(), timeout=None)
+        return cache.get(VERSION_KEY)
+
+
+def listing_key(*parts, version=None):
+    if version is None:
+        version = catalog_version()
+    digest = hashlib.sha1("\x1f".join(str(p) for p in parts).encode()).hexdigest()
+    return f"marketplace:v{version}:{digest}"
+
+
+def cached_listing(parts, build):
+    """
+    Return the cached value for ``parts`` at the current catalog version,
+    calling ``build()`` and storing its result on a miss. Exceptions from
+    ``build`` propagate and nothing is stored.
+    """
+    cache = get_cache()
+    key = listing_key(*parts)
+    value = cache.get(key)
+    if value is not None:
+        stats.record(hit=True)
+        return value
+
+    stats.record(hit=False)
+    value = build()
+    cache.set(key, value, getattr(settings, "MARKETPLACE_CACHE_TIMEOUT", 300))
+    return value
@@ -0,0 +1,83 @@
+# conditional.py
+"""
+ETag / Last-Modified functions for django.views.decorators.http.condition.
+
+Catalog pages (index, marketplace, gallery) are validated against the
+catalog version kept in the cache, so a 304 costs no database query.
+Product pages are validated against Product.updated_at, read on its own
+without loading the row.
+
+HTML pages also depend on the logged-in user (navigation bar), on the
+CSRF token embedded in their forms and scripts, and on the templates
+themselves, so all three are folded into their ETags. Login rotates the
+CSRF secret, so a page carrying a stale token is not revalidated.
+"""
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+from django.middleware.csrf import get_token
+
+from . import caching
+from .models import Product
+
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+
+
+@lru_cache(maxsize=None)
+def template_fingerprint():
+    """Hash of every template file, so a deploy that changes markup changes ETags."""
+    digest = hashlib.sha1()
+    for path in sorted(TEMPLATE_DIR.rglob("*.html")):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def make_etag(*parts):
+    return hashlib.sha1(":".join(str(p) for p in parts).encode()).hexdigest()[:32]
+
+
+def is_json_request(request):
+    return request.headers.get("x-requested-with") == "XMLHttpRequest"
+
+
+def _user_tag(request):
+    user = getattr(request, "user", None)
+    user_pk = user.pk if user is not None and user.is_authenticated else 0
+    # The secret behind the token the page will embed; get_token() creates
+    # it on a first visit, as rendering the page would. Hashed, because the
+    # ETag is sent in the clear.
+    get_token(request)
+    csrf = hashlib.sha1(request.META["CSRF_COOKIE"].encode()).hexdigest()[:12]
+    return f"{user_pk}:{csrf}"
+
+
+def catalog_etag(request, *args, **kwargs):
+    version = caching.catalog_version()
+    if is_json_request(request):
+        return make_etag("json", version)
+    return make_etag("html", version, _user_tag(request), template_fingerprint())
+
+
+def catalog_last_modified(request, *args, **kwargs):
+    return caching.catalog_modified()
+
+
+def _product_updated_at(request, pk):
+    # condition() asks for the ETag and Last-Modified separately; look the
+    # timestamp up once per request.
+    memo = request.__dict__.setdefault("_product_updated_at", {})
+    if pk not in memo:
+        memo[pk] = Product.objects.filter(pk=pk).values_list("updated_at", flat=True).first()
+    return memo[pk]
+
+
+def product_etag(request, pk, *args, **kwargs):
+    updated_at = _product_updated_at(request, pk)
+    if updated_at is None:
+        return None  # let the view answer 404
+    return make_etag("product", pk, updated_at.timestamp(), _user_tag(request), template_fingerprint())
+
+
+def product_last_modified(request, pk, *args, **kwargs):
+    return _product_updated_at(request, pk)
@@ -0,0 +1,134 @@
+# idempotency.py
+"""
+Idempotency keys for payment initialization.
+
+The client sends a key with each payment form (``Idempotency-Key`` header
+or ``idempotency_key`` field). The first request for a (user, product,
+scope, key) claims an IdempotencyKey row, which the unique constraint
+makes atomic across every worker process, and makes the PayChangu call.
+Concurrent duplicates poll that row and return the first request's
+response, and so do repeats of a successful initialization within
+PAYMENT_IDEMPOTENCY_TTL. Either way PayChangu sees one initialization and
+the customer gets one prompt.
+
+The row also stores a fingerprint of the form fields. Reusing a key with
+different fields (another phone number, say) is answered with 422 rather
+than with the first request's response. A failed initialization releases
+the key, so the corrected form can be resent with it.
+"""
+import asyncio
+import json
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.crypto import salted_hmac
+
+from .models import IdempotencyKey
+
+HEADER = "Idempotency-Key"
+FIELD = "idempotency_key"
+MAX_KEY_LENGTH = 255
+UNHASHED_FIELDS = (FIELD, "csrfmiddlewaretoken")
+POLL_INTERVAL = 0.1
+# An in-flight claim older than this belongs to a worker that died.
+# Comfortably above the slowest PayChangu initialization timeout.
+LOCK_TIMEOUT = timedelta(seconds=60)
+
+_sleep = asyncio.sleep
+
+
+def request_key(request):
+    key = request.headers.get(HEADER) or request.POST.get(FIELD) or ""
+    return key.strip()[:MAX_KEY_LENGTH]
+
+
+def fingerprint(request):
+    """Keyed hash of the form fields (card forms carry the card number)."""
+    fields = sorted((name, request.POST.getlist(name)) for name in request.POST if name not in UNHASHED_FIELDS)
+    return salted_hmac("core.idempotency.fingerprint", json.dumps(fields), algorithm="sha256").hexdigest()
+
+
+def claim(user_id, product_id, scope, key, fingerprint=""):
+    """(True, record) if the caller now owns the key, else (False, record)."""
+    record, created = IdempotencyKey.objects.get_or_create(
+        user_id=user_id, product_id=product_id, scope=scope, key=key, defaults={"fingerprint": fingerprint},
+    )
+    if created:
+        return True, record
+
+    now = timezone.now()
+    if record.status_code is None:
+        stale = record.created_at < now - LOCK_TIMEOUT
+    elif record.status_code >= 400:
+        # Failures are shared with concurrent duplicates only; a deliberate
+        # retry gets a fresh attempt.
+        stale = True
+    else:
+        stale = record.created_at < now - timedelta(seconds=settings.PAYMENT_IDEMPOTENCY_TTL)
+    if stale:
+        # Take it over; matching on created_at lets only one caller win.
+        taken = IdempotencyKey.objects.filter(pk=record.pk, created_at=record.created_at).update(
+            created_at=now, status_code=None, response=None, fingerprint=fingerprint,
+        )
+        if taken:
+            record.created_at, record.status_code, record.response = now, None, None
+            record.fingerprint = fingerprint
+            return True, record
+        record.refresh_from_db()
+    return False, record
+
+
+def replay(record):
+    response = JsonResponse(record.response, status=record.status_code)
+    response["Idempotent-Replayed"] = "true"
+    return response
+
+
+async def wait_for(record):
+    """Wait for the owner of ``record`` to finish, then replay its response."""
+    deadline = record.created_at + LOCK_TIMEOUT
+    while True:
+        row = await IdempotencyKey.objects.filter(pk=record.pk).values("status_code", "response").afirst()
+        if row is None:
+            # The owner failed and released the key.
+            return JsonResponse({"status": "failed", "message": "Previous attempt failed, please retry."},
+                                status=409)
+        if row["status_code"] is not None:
+            record.status_code, record.response = row["status_code"], row["response"]
+            return replay(record)
+        if timezone.now() > deadline:
+            return JsonResponse({"status": "failed", "message": "Payment is still being processed."}, status=409)
+        await _sleep(POLL_INTERVAL)
+
+
+async def run_once(request, user, product, scope, handler):
+    """
+    Return ``await handler()`` (a JsonResponse), computing it at most once
+    per idempotency key. Requests without a key are not deduplicated.
+    """
+    key = request_key(request)
+    if not key:
+        return await handler()
+
+    request_fingerprint = fingerprint(request)
+    owner, record = await sync_to_async(claim)(user.pk, product.pk, scope, key, request_fingerprint)
+    if not owner:
+        if record.fingerprint != request_fingerprint:
+            return JsonResponse({"status": "failed", "message": "Idempotency key reused with different details."},
+                                status=422)
+        if record.status_code is not None:
+            return replay(record)
+        return await wait_for(record)
+
+    try:
+        response = await handler()
+    except BaseException:
+        await IdempotencyKey.objects.filter(pk=record.pk).adelete()
+        raise
+    await IdempotencyKey.objects.filter(pk=record.pk).aupdate(
+        status_code=response.status_code, response=json.loads(response.content),
+    )
+    return response
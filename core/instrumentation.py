@@ -0,0 +1,231 @@
+# instrumentation.py
+"""
+Per-request performance instrumentation.
+
+RequestTimingMiddleware measures every request: the SQL statements and
+the time spent in them, template rendering time, marketplace cache hits
+and misses, and total latency. It sends them to the browser in a
+Server-Timing header, adds them to per-view histograms (labelled with
+the URL name) rendered at /metrics/, and logs any request slower than
+SLOW_REQUEST_MS with its slowest SQL statements (without parameters).
+
+SQL is timed by sql_timer, an execute wrapper signals.py installs on
+every connection. It finds the current request's RequestStats through a
+ContextVar, which asgiref carries into sync_to_async threads, so async
+views are measured too. Templates are timed by TimedDjangoTemplates,
+the template backend configured in settings, and cache lookups arrive
+through a caching.stats listener. Outside a request each of these costs
+one ContextVar lookup. Metric updates go through a metrics.Buffer, so a
+request costs a few dictionary updates rather than cache round trips;
+``manage.py bench_instrumentation`` measures the overhead.
+"""
+import functools
+import logging
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.template.backends.django import DjangoTemplates, Template, reraise
+from django.template.exceptions import TemplateDoesNotExist
+
+from . import caching, metrics
+
+logger = logging.getLogger(__name__)
+
+current = ContextVar("request_stats", default=None)
+
+MAX_STATEMENTS = 500  # per request, kept for the slow-request log
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class RequestStats:
+    __slots__ = ("started", "queries", "sql_seconds", "template_seconds", "cache_hits", "cache_misses",
+                 "statements", "total")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.sql_seconds = 0.0
+        self.template_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.statements = []  # (seconds, sql); parameters are not kept
+        self.total = None
+
+    def server_timing(self):
+        return (
+            f'sql;dur={self.sql_seconds * 1000:.1f};desc="{self.queries} queries", '
+            f"tpl;dur={self.template_seconds * 1000:.1f}, "
+            f'cache;desc="{self.cache_hits} hit {self.cache_misses} miss", '
+            f"total;dur={self.total * 1000:.1f}"
+        )
+
+    def slowest(self, n):
+        return sorted(self.statements, key=lambda statement: statement[0], reverse=True)[:n]
+
+
+# ----------------------------
+# Probes
+# ----------------------------
+def sql_timer(execute, sql, params, many, context):
+    stats = current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        stats.queries += 1
+        stats.sql_seconds += elapsed
+        if len(stats.statements) < MAX_STATEMENTS:
+            stats.statements.append((elapsed, sql))
+
+
+def record_cache(hit):
+    stats = current.get()
+    if stats is not None:
+        if hit:
+            stats.cache_hits += 1
+        else:
+            stats.cache_misses += 1
+
+
+caching.stats.listeners.append(record_cache)
+
+
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        stats = current.get()
+        if stats is None:
+            return super().render(context, request)
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            stats.template_seconds += time.perf_counter() - started
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """The Django template backend, timing each render() for the current request."""
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return TimedTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
+
+
+# ----------------------------
+# Metrics
+# ----------------------------
+@functools.cache
+def view_names():
+    """Label values for ``view``: every named route in core.urls, plus admin and other."""
+    from .urls import urlpatterns
+
+    return tuple(pattern.name for pattern in urlpatterns if pattern.name) + ("admin", "other")
+
+
+def view_label(request):
+    match = request.resolver_match
+    if match is None:
+        return "other"
+    if "admin" in match.namespaces:
+        return "admin"
+    return match.url_name if not match.namespaces and match.url_name in view_names() else "other"
+
+
+BUFFER = metrics.Buffer()
+VIEW = {"view": view_names}
+REQUEST_SECONDS = metrics.Histogram(
+    "http_request_duration_seconds", "Request latency by view.", LATENCY_BUCKETS, VIEW, BUFFER)
+SQL_SECONDS = metrics.Histogram(
+    "http_request_sql_seconds", "Time spent in SQL per request, by view.", LATENCY_BUCKETS, VIEW, BUFFER)
+TEMPLATE_SECONDS = metrics.Histogram(
+    "http_request_template_seconds", "Template rendering time per request, by view.", LATENCY_BUCKETS, VIEW, BUFFER)
+QUERIES = metrics.Histogram(
+    "http_request_queries", "SQL statements per request, by view.", QUERY_BUCKETS, VIEW, BUFFER)
+CACHE_LOOKUPS = metrics.Counter(
+    "http_request_cache_lookups_total", "Marketplace cache lookups by view and result.",
+    {"view": view_names, "result": ("hit", "miss")}, BUFFER)
+
+
+def observe(view, stats):
+    REQUEST_SECONDS.observe(stats.total, view=view)
+    SQL_SECONDS.observe(stats.sql_seconds, view=view)
+    TEMPLATE_SECONDS.observe(stats.template_seconds, view=view)
+    QUERIES.observe(stats.queries, view=view)
+    if stats.cache_hits:
+        CACHE_LOOKUPS.inc(stats.cache_hits, view=view, result="hit")
+    if stats.cache_misses:
+        CACHE_LOOKUPS.inc(stats.cache_misses, view=view, result="miss")
+
+
+def log_slow_request(request, view, stats):
+    lines = [
+        f"Slow request: {request.method} {request.path} ({view}) {stats.total * 1000:.0f}ms; "
+        f"{stats.queries} queries in {stats.sql_seconds * 1000:.0f}ms, "
+        f"templates {stats.template_seconds * 1000:.0f}ms"
+    ]
+    # Only the SQL with its placeholders: parameters carry session keys,
+    # phone numbers, emails and password hashes.
+    for seconds, sql in stats.slowest(settings.SLOW_REQUEST_SQL):
+        lines.append(f"  {seconds * 1000:.1f}ms {sql}")
+    logger.warning("\n".join(lines))
+
+
+# ----------------------------
+# Middleware
+# ----------------------------
+class RequestTimingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        stats = RequestStats()
+        token = current.set(stats)
+        try:
+            response = self.get_response(request)
+        finally:
+            current.reset(token)
+        self.finish(request, response, stats)
+        self.record(request, stats)
+        return response
+
+    async def __acall__(self, request):
+        stats = RequestStats()
+        token = current.set(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current.reset(token)
+        self.finish(request, response, stats)
+        # Observing may flush the metrics buffer into the cache: keep that off the loop.
+        await sync_to_async(self.record)(request, stats)
+        return response
+
+    def finish(self, request, response, stats):
+        # A streamed body is still being produced; this is time to first byte.
+        stats.total = time.perf_counter() - stats.started
+        if settings.SERVER_TIMING:
+            response["Server-Timing"] = stats.server_timing()
+
+    def record(self, request, stats):
+        view = view_label(request)
+        observe(view, stats)
+        if stats.total * 1000 >= settings.SLOW_REQUEST_MS:
+            log_slow_request(request, view, stats)
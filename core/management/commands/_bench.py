@@ -0,0 +1,245 @@
+"""
+Shared helpers for the bench_* and seed_catalog management commands.
+
+Benchmarks never touch the configured database: they run against a
+throwaway copy created the same way the test runner creates one, so the
+real migrations (FTS triggers, indexes) are in place. seed_data() fills
+whichever database is active with a synthetic shop: products, gallery
+items, customers, and orders with their items and payment attempts.
+"""
+import contextlib
+import itertools
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.db.models import Max
+from django.utils import timezone
+
+WORDS = (
+    "django react flutter laravel vue angular python kotlin swift node "
+    "dashboard ecommerce portfolio blog inventory booking school hospital "
+    "restaurant hotel church pos crm erp chat payroll library clinic "
+    "template theme landing responsive admin mobile api starter kit "
+    "authentication payments analytics realtime offline modern clean"
+).split()
+TECHNOLOGIES = (
+    "Django", "React", "Flutter", "Laravel", "Vue", "Tailwind", "Bootstrap",
+    "PostgreSQL", "SQLite", "Firebase", "Node.js", "Kotlin", "Swift",
+)
+CATEGORIES = ("code", "apps", "websites", "templates")
+
+
+@contextlib.contextmanager
+def temporary_database(verbosity=0):
+    """Create, migrate and finally drop an on-disk test database."""
+    fd, path = tempfile.mkstemp(prefix="ikpixels-bench-", suffix=".sqlite3")
+    os.close(fd)
+    os.unlink(path)
+    if connection.vendor == "sqlite":
+        connection.settings_dict.setdefault("TEST", {})["NAME"] = path
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=verbosity, autoclobber=True, serialize=False)
+    try:
+        yield connection
+    finally:
+        # Buffered product views belong to this database; flushed at exit
+        # they would land in the real one.
+        from core.viewcounter import counter
+
+        counter.flush()
+        connection.creation.destroy_test_db(old_name, verbosity=verbosity)
+        for leftover in (path, f"{path}-wal", f"{path}-shm"):
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(leftover)
+
+
+_SYLLABLES = ("ka", "lo", "mi", "ne", "ra", "to", "vu", "zi", "be", "do", "fa", "gu", "ps", "tr")
+
+
+def _vocabulary(size=5_000, seed=7):
+    """Domain words first, then pseudo-words, so frequencies follow Zipf's law."""
+    rng = random.Random(seed)
+    vocabulary = list(WORDS)
+    while len(vocabulary) < size:
+        vocabulary.append("".join(rng.choice(_SYLLABLES) for _ in range(rng.randrange(2, 5))))
+    return vocabulary
+
+
+VOCABULARY = _vocabulary()
+_ZIPF_CUM_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(VOCABULARY))))
+
+
+def sentence(rng, n):
+    return " ".join(rng.choices(VOCABULARY, cum_weights=_ZIPF_CUM_WEIGHTS, k=n))
+
+
+def fake_products(count, seed=1):
+    """Yield unsaved Product instances with plausible marketplace text."""
+    from core.models import Product
+
+    rng = random.Random(seed)
+    for i in range(count):
+        yield Product(
+            title=f"{sentence(rng, 3).title()} {i}",
+            price=Decimal(rng.randrange(5_000, 500_000)),
+            category=rng.choice(CATEGORIES),
+            description=sentence(rng, rng.randrange(40, 120)),
+            key_features="\n".join(f"• {sentence(rng, 4)}" for _ in range(5)),
+            technologies_used=", ".join(rng.sample(TECHNOLOGIES, 3)),
+            preview_gradient=Product.GRADIENT_CHOICES[0][0],
+            file_url=f"https://example.com/files/{i}.zip",
+            image=f"image/upload/v17608{i % 100000:05d}/bench/{i:07d}.jpg",
+            views=rng.randrange(0, 5_000),
+        )
+
+
+def bulk_create_batched(model, objects, batch_size=5_000):
+    """bulk_create any iterable of unsaved ``objects`` ``batch_size`` rows at a time; returns the count."""
+    created = 0
+    iterator = iter(objects)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        model.objects.bulk_create(batch)
+        created += len(batch)
+    return created
+
+
+def bulk_create_products(count, batch_size=5_000, seed=1):
+    from core.models import Product
+
+    return bulk_create_batched(Product, fake_products(count, seed=seed), batch_size)
+
+
+def fake_gallery(count, seed=1):
+    from core.models import Gallery
+
+    rng = random.Random(seed)
+    for i in range(count):
+        video = rng.random() < 0.1
+        yield Gallery(
+            title=sentence(rng, 3).title(),
+            description=sentence(rng, rng.randrange(10, 40)),
+            media=f"{'video' if video else 'image'}/upload/v17608{i % 100000:05d}/gallery/{i:07d}.jpg",
+            media_type="video" if video else "image",
+            is_active=rng.random() < 0.9,
+        )
+
+
+def fake_customers(count, seed=1):
+    """Yield (User, Client) pairs with unusable passwords; usernames continue from the highest user pk."""
+    from django.contrib.auth.models import User
+
+    from core.models import Client
+
+    rng = random.Random(seed)
+    start = (User.objects.aggregate(Max("pk"))["pk__max"] or 0) + 1
+    password = make_password(None)
+    for n in range(start, start + count):
+        user = User(username=f"customer{n}", email=f"customer{n}@example.com", password=password,
+                    first_name=sentence(rng, 1).title(), last_name=sentence(rng, 1).title())
+        yield user, Client(user=user, phone=f"099{rng.randrange(10**7):07d}",
+                           join_date=timezone.now() - timedelta(days=rng.randrange(730)))
+
+
+def bulk_create_customers(count, batch_size=5_000, seed=1):
+    from django.contrib.auth.models import User
+
+    from core.models import Client
+
+    created = 0
+    iterator = fake_customers(count, seed=seed)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        User.objects.bulk_create([user for user, _ in batch])
+        for user, client in batch:
+            client.user = user  # picks up the pk bulk_create just set
+        Client.objects.bulk_create([client for _, client in batch])
+        created += len(batch)
+    return created
+
+
+def bulk_create_orders(count, product_ids, client_ids, batch_size=5_000, seed=1):
+    """
+    ``count`` orders over the past year, each with one to three items and
+    one payment attempt: most are paid (attempt ``success``), the rest
+    still open with a ``pending`` or ``failed`` attempt.
+    """
+    from core.models import Order, OrderItem, PaymentAttempt
+
+    rng = random.Random(seed)
+    now = timezone.now()
+    created = 0
+    while created < count:
+        orders, lines = [], []
+        for _ in range(min(batch_size, count - created)):
+            items = [(rng.choice(product_ids), Decimal(rng.randrange(5_000, 500_000))) for _ in range(rng.randint(1, 3))]
+            paid = rng.random() < 0.8
+            orders.append(Order(client_id=rng.choice(client_ids), paid=paid,
+                                total=sum(price for _, price in items) if paid else 0,
+                                created_at=now - timedelta(seconds=rng.randrange(365 * 86400))))
+            lines.append(items)
+        Order.objects.bulk_create(orders)
+
+        OrderItem.objects.bulk_create(
+            OrderItem(order=order, product_id=product_id, price=price)
+            for order, items in zip(orders, lines) for product_id, price in items
+        )
+        PaymentAttempt.objects.bulk_create(
+            PaymentAttempt(
+                order=order, tx_ref=f"seed-{order.pk}", payment_type=rng.choice(("visa", "airtel", "mpamba")),
+                amount=sum(price for _, price in items),
+                status="success" if order.paid else rng.choice(("pending", "failed")),
+                created_at=order.created_at,
+            )
+            for order, items in zip(orders, lines)
+        )
+        created += len(orders)
+    return created
+
+
+def seed_data(products=1_000, gallery=100, customers=100, orders=1_000, batch_size=5_000, seed=1, report=None):
+    """Bulk-generate a synthetic shop in the active database; returns the rows created per model."""
+    from core.models import Client, Gallery, Product
+
+    report = report or (lambda line: None)
+    counts = {}
+
+    def step(name, create):
+        started = time.perf_counter()
+        counts[name] = create()
+        report(f"{name}: {counts[name]} in {time.perf_counter() - started:.1f}s")
+
+    step("products", lambda: bulk_create_products(products, batch_size, seed))
+    step("gallery", lambda: bulk_create_batched(Gallery, fake_gallery(gallery, seed), batch_size))
+    step("customers", lambda: bulk_create_customers(customers, batch_size, seed))
+    if orders:
+        product_ids = list(Product.objects.values_list("pk", flat=True))
+        client_ids = list(Client.objects.values_list("pk", flat=True))
+        if not product_ids or not client_ids:
+            raise ValueError("orders need at least one product and one customer")
+        step("orders", lambda: bulk_create_orders(orders, product_ids, client_ids, batch_size, seed))
+    return counts
+
+
+def timeit(fn, repeat):
+    """Run ``fn`` ``repeat`` times and return the samples in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        "p99_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))], 3),
+    }
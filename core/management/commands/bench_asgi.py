@@ -0,0 +1,141 @@
+import asyncio
+import socket
+import threading
+import time
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+import httpx
+from django.contrib.auth.models import User
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand
+from django.core.wsgi import get_wsgi_application
+from django.test import Client as TestClient
+from django.test.utils import override_settings
+
+from core import paychangu
+from core.models import Client, Product
+from core.simulator import PayChanguSimulator
+
+from ._bench import bulk_create_products, summarize, temporary_database
+from .page_weight import BENCH_SETTINGS
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def serve_wsgi(port):
+    """One single-threaded WSGI server: what a sync gunicorn worker amounts to."""
+    server = make_server("127.0.0.1", port, get_wsgi_application(), handler_class=QuietHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.shutdown
+
+
+def serve_asgi(port):
+    import uvicorn
+
+    config = uvicorn.Config(get_asgi_application(), host="127.0.0.1", port=port, lifespan="off", log_level="warning")
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+
+    def stop():
+        server.should_exit = True
+    return stop
+
+
+async def probe(http, url, count, interval=0.05):
+    """Sequential GETs of ``url``; latency samples in milliseconds."""
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        response = await http.get(url)
+        response.raise_for_status()
+        samples.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(interval)
+    return samples
+
+
+async def pay(http, url):
+    started = time.perf_counter()
+    response = await http.post(url, data={"phone-number": "0991000000", "provider": "Airtel Money"})
+    return response.json().get("status"), time.perf_counter() - started
+
+
+async def run_load(base_url, session_cookie, product_id, payments, probes):
+    timeout = httpx.Timeout(120)
+    limits = httpx.Limits(max_connections=payments + 5)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits,
+                                 cookies={"sessionid": session_cookie}) as http:
+        await http.get("/marketplace/")  # warm up
+        idle = await probe(http, "/marketplace/", probes)
+
+        started = time.perf_counter()
+        paying = [asyncio.create_task(pay(http, f"/pay/mobile/{product_id}/")) for _ in range(payments)]
+        await asyncio.sleep(0.1)
+        loaded = await probe(http, "/marketplace/", probes)
+        results = await asyncio.gather(*paying)
+        elapsed = time.perf_counter() - started
+    return idle, loaded, results, elapsed
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure marketplace latency while slow PayChangu payments are in flight, "
+        "under the ASGI app and under a single sync WSGI worker."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--payments", type=int, default=20, help="Concurrent mobile money payments.")
+        parser.add_argument("--latency", type=float, default=2.0, help="Simulated PayChangu latency (s).")
+        parser.add_argument("--probes", type=int, default=20, help="Marketplace requests per phase.")
+        parser.add_argument("--server", choices=("asgi", "wsgi", "both"), default="both")
+
+    def handle(self, *args, **options):
+        servers = ("asgi", "wsgi") if options["server"] == "both" else (options["server"],)
+
+        with PayChanguSimulator(latency=options["latency"]) as simulator, temporary_database(), \
+                override_settings(**BENCH_SETTINGS, PAYCHANGU_BASE_URL=simulator.base_url):
+            paychangu.reset_clients()
+            bulk_create_products(200)
+            user = User.objects.create_user("bench", "bench@example.com", "bench")
+            Client.objects.create(user=user)
+            browser = TestClient()
+            browser.force_login(user)
+            session_cookie = browser.cookies["sessionid"].value
+            product_id = Product.objects.values_list("pk", flat=True).first()
+
+            self.stdout.write(
+                f"{options['payments']} payments at {options['latency']:.1f}s PayChangu latency; "
+                f"{options['probes']} marketplace requests per phase"
+            )
+            self.stdout.write(
+                f"{'server':<8}{'idle p50':>10}{'idle p95':>10}{'busy p50':>10}{'busy p95':>10}"
+                f"{'paid':>7}{'wall s':>8}"
+            )
+            for kind in servers:
+                port = free_port()
+                stop = (serve_asgi if kind == "asgi" else serve_wsgi)(port)
+                try:
+                    idle, loaded, results, elapsed = asyncio.run(run_load(
+                        f"http://127.0.0.1:{port}", session_cookie, product_id,
+                        options["payments"], options["probes"],
+                    ))
+                finally:
+                    stop()
+                idle, loaded = summarize(idle), summarize(loaded)
+                paid = sum(status == "success" for status, _ in results)
+                self.stdout.write(
+                    f"{kind:<8}{idle['median_ms']:>10.1f}{idle['p95_ms']:>10.1f}"
+                    f"{loaded['median_ms']:>10.1f}{loaded['p95_ms']:>10.1f}"
+                    f"{paid:>7}{elapsed:>8.1f}"
+                )
+            paychangu.reset_clients()
@@ -0,0 +1,286 @@
+import asyncio
+import collections
+import json
+import multiprocessing
+import random
+import socket
+import tempfile
+import threading
+import time
+
+import httpx
+from django.contrib.auth.models import User
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connections
+from django.db.backends.signals import connection_created
+from django.test import Client as TestClient
+from django.test.utils import override_settings
+
+from core import paychangu
+from core.models import Client, PaymentAttempt, Product
+from core.simulator import PayChanguSimulator
+
+from ._bench import bulk_create_products, summarize, temporary_database
+from .page_weight import BENCH_SETTINGS
+
+WEBHOOK_SECRET = "bench-webhook-secret"
+WRITES = ("INSERT", "UPDATE", "DELETE")
+
+
+class WriteMonitor:
+    """Times every write statement and counts "database is locked" errors."""
+
+    def __init__(self):
+        self.samples = []
+        self.locked = 0
+
+    def install(self, sender, connection, **kwargs):
+        connection.execute_wrappers.append(self)
+
+    def __call__(self, execute, sql, params, many, context):
+        if not sql.lstrip()[:6].upper().startswith(WRITES):
+            return execute(sql, params, many, context)
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        except OperationalError as e:
+            if "locked" in str(e):
+                self.locked += 1
+            raise
+        finally:
+            # SQLite takes its write lock here, so busy waits land in this sample.
+            self.samples.append((time.perf_counter() - started) * 1000)
+
+
+def serve(sock, stop, results):
+    """Worker process: the ASGI app on the shared listening socket until ``stop`` is set."""
+    import uvicorn
+
+    monitor = WriteMonitor()
+    connection_created.connect(monitor.install)
+    config = uvicorn.Config(get_asgi_application(), lifespan="off", log_level="warning")
+    server = uvicorn.Server(config)
+    # Off the main thread uvicorn leaves signal handling alone.
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    stop.wait()
+    server.should_exit = True
+    thread.join()
+    results.put({"samples": monitor.samples, "locked": monitor.locked})
+
+
+class Shopper:
+    """One logged-in customer: pay, then poll verify_payment until the payment settles."""
+
+    def __init__(self, http, product_ids, options, rng):
+        self.http = http
+        self.product_ids = product_ids
+        self.options = options
+        self.rng = rng
+
+    async def call(self, name, url, data, stats):
+        started = time.perf_counter()
+        try:
+            response = await self.http.post(url, data=data)
+        except httpx.HTTPError:
+            stats.errors[name] += 1
+            return None
+        finally:
+            stats.samples[name].append((time.perf_counter() - started) * 1000)
+        if response.status_code >= 500:
+            stats.errors[name] += 1
+        return response.json() if response.headers.get("Content-Type") == "application/json" else None
+
+    async def checkout(self, number, stats):
+        product_id = self.rng.choice(self.product_ids)
+        if number % 2:
+            name, kind = "card_payment", "card"
+            data = {"card-number": "4000000000000002", "expiry": "12/30", "cvv": "123",
+                    "cardholder-name": "Bench Shopper"}
+        else:
+            name, kind = "mobile_money_payment", "mobile"
+            data = {"phone-number": "0991000000", "provider": self.rng.choice(("Airtel Money", "TNM Mpamba"))}
+        data["idempotency_key"] = f"{id(self)}-{number}"
+
+        reply = await self.call(name, f"/pay/{kind}/{product_id}/", data, stats)
+        if not reply or reply.get("status") != "success":
+            stats.outcomes["not initialized"] += 1
+            return
+
+        tx_ref = reply["tx_ref"]
+        if self.options["status"] == "events":
+            await self.watch(tx_ref, stats)
+            return
+        for _ in range(self.options["max_polls"]):
+            await asyncio.sleep(self.options["poll_interval"])
+            reply = await self.call("verify_payment", f"/pay/verify/{tx_ref}/", {"type": kind}, stats)
+            status = reply and reply.get("status")
+            if status in ("success", "failed"):
+                stats.outcomes[status] += 1
+                return
+        stats.outcomes["still pending"] += 1
+
+    async def watch(self, tx_ref, stats):
+        """Wait on the server-sent events stream instead of polling."""
+        started = time.perf_counter()
+        status = None
+        try:
+            async with self.http.stream("GET", f"/pay/events/{tx_ref}/") as response:
+                async for line in response.aiter_lines():
+                    if line.startswith("data: "):
+                        status = json.loads(line[6:])["status"]
+        except httpx.HTTPError:
+            stats.errors["payment_events"] += 1
+        stats.samples["payment_events"].append((time.perf_counter() - started) * 1000)
+        stats.outcomes[status if status in ("success", "failed") else "still pending"] += 1
+
+    async def run(self, stats):
+        for number in range(self.options["checkouts"]):
+            await self.checkout(number, stats)
+
+
+class LoadStats:
+    def __init__(self):
+        self.samples = collections.defaultdict(list)
+        self.errors = collections.Counter()
+        self.outcomes = collections.Counter()
+
+
+async def run_load(base_url, sessions, product_ids, options):
+    stats = LoadStats()
+    timeout = httpx.Timeout(120)
+    clients = [httpx.AsyncClient(base_url=base_url, timeout=timeout, cookies={"sessionid": session})
+               for session in sessions]
+    try:
+        shoppers = [Shopper(http, product_ids, options, random.Random(i)) for i, http in enumerate(clients)]
+        started = time.perf_counter()
+        await asyncio.gather(*(shopper.run(stats) for shopper in shoppers))
+        elapsed = time.perf_counter() - started
+    finally:
+        for http in clients:
+            await http.aclose()
+    return stats, elapsed
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test checkout end to end: concurrent shoppers pay by mobile money and card and "
+        "poll verify_payment against the ASGI app, with the PayChangu simulator completing "
+        "charges by webhook. Reports throughput, latency percentiles and SQLite write contention."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--shoppers", type=int, default=20, help="Concurrent customers.")
+        parser.add_argument("--checkouts", type=int, default=5, help="Payments per customer.")
+        parser.add_argument("--processes", type=int, default=2, help="ASGI worker processes.")
+        parser.add_argument("--latency", type=float, default=0.2, help="Simulated PayChangu latency (s).")
+        parser.add_argument("--jitter", type=float, default=0.1)
+        parser.add_argument("--error-rate", type=float, default=0.0)
+        parser.add_argument("--decline-rate", type=float, default=0.1)
+        parser.add_argument("--completion-delay", type=float, default=0.5,
+                            help="Seconds before a charge completes and its webhook is sent.")
+        parser.add_argument("--verify-after", type=int, default=2,
+                            help="PAYCHANGU_VERIFY_AFTER for the run: when verify asks PayChangu itself.")
+        parser.add_argument("--status", choices=("poll", "events"), default="poll",
+                            help="Follow each payment by polling verify_payment or over the SSE stream.")
+        parser.add_argument("--poll-interval", type=float, default=0.25)
+        parser.add_argument("--max-polls", type=int, default=40)
+        parser.add_argument("--seed", type=int, default=1)
+
+    def handle(self, *args, **options):
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        sock.listen(1024)
+        base_url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+        simulator = PayChanguSimulator(
+            latency=options["latency"], jitter=options["jitter"], error_rate=options["error_rate"],
+            completion_delay=options["completion_delay"], decline_rate=options["decline_rate"],
+            webhook_url=f"{base_url}/pay/webhook/", webhook_secret=WEBHOOK_SECRET, seed=options["seed"],
+        )
+        # Workers share payment notifications and metrics through the cache,
+        # so give them a common one, like the production file cache.
+        cache_dir = tempfile.TemporaryDirectory(prefix="ikpixels-bench-cache-")
+        caches = {"default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                              "LOCATION": cache_dir.name}}
+        with simulator, cache_dir, temporary_database(), override_settings(
+            **{**BENCH_SETTINGS, "CACHES": caches},
+            PAYCHANGU_BASE_URL=simulator.base_url,
+            PAYCHANGU_WEBHOOK_SECRET=WEBHOOK_SECRET,
+            PAYCHANGU_VERIFY_AFTER=options["verify_after"],
+        ):
+            paychangu.reset_clients()
+            sessions, product_ids = self.seed(options["shoppers"])
+            # Workers open their own connections; a shared SQLite handle across fork is unsafe.
+            connections.close_all()
+
+            context = multiprocessing.get_context("fork")
+            stop, results = context.Event(), context.Queue()
+            workers = [context.Process(target=serve, args=(sock, stop, results)) for _ in range(options["processes"])]
+            for worker in workers:
+                worker.start()
+            try:
+                stats, elapsed = asyncio.run(run_load(base_url, sessions, product_ids, options))
+            finally:
+                stop.set()
+                db = [results.get(timeout=30) for _ in workers]
+                for worker in workers:
+                    worker.join()
+                sock.close()
+            settled = PaymentAttempt.objects.exclude(status="pending").count()
+            self.report(options, stats, elapsed, simulator.stats(), db, settled)
+        paychangu.reset_clients()
+
+    def seed(self, shoppers):
+        bulk_create_products(50)
+        sessions = []
+        for i in range(shoppers):
+            user = User.objects.create_user(f"shopper{i}", f"shopper{i}@example.com", "bench")
+            Client.objects.create(user=user)
+            browser = TestClient()
+            browser.force_login(user)
+            sessions.append(browser.cookies["sessionid"].value)
+        return sessions, list(Product.objects.values_list("pk", flat=True))
+
+    def report(self, options, stats, elapsed, upstream, db, settled):
+        self.stdout.write(
+            f"{options['shoppers']} shoppers x {options['checkouts']} checkouts on {options['processes']} "
+            f"ASGI processes; PayChangu {options['latency']:.2f}s +{options['jitter']:.2f}s, "
+            f"{options['error_rate']:.0%} errors, completes after {options['completion_delay']:.1f}s"
+        )
+        self.stdout.write(f"{'endpoint':<24}{'requests':>9}{'5xx':>6}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+        rows = [(name, stats.samples[name], stats.errors[name])
+                for name in ("mobile_money_payment", "card_payment", "verify_payment", "payment_events")]
+        webhook_ms = [seconds * 1000 for seconds in upstream["webhook_latencies"]]
+        rows.append(("paychangu_webhook", webhook_ms, upstream["webhook_failures"]))
+        for name, samples, errors in rows:
+            if not samples:
+                continue
+            summary = summarize(samples)
+            self.stdout.write(
+                f"{name:<24}{len(samples):>9}{errors:>6}{summary['median_ms']:>9.1f}"
+                f"{summary['p95_ms']:>9.1f}{summary['p99_ms']:>9.1f}"
+            )
+
+        requests = sum(len(samples) for samples in stats.samples.values())
+        outcomes = ", ".join(f"{count} {outcome}" for outcome, count in sorted(stats.outcomes.items()))
+        self.stdout.write(
+            f"throughput: {requests / elapsed:.1f} req/s, {sum(stats.outcomes.values()) / elapsed:.1f} "
+            f"checkouts/s over {elapsed:.1f}s ({outcomes}); {settled} attempts settled in the DB"
+        )
+        checkouts = sum(stats.outcomes.values()) or 1
+        self.stdout.write(
+            f"per checkout: {requests / checkouts:.1f} app requests, "
+            f"{upstream['requests'] / checkouts:.1f} PayChangu calls"
+        )
+
+        writes = [sample for worker in db for sample in worker["samples"]]
+        locked = sum(worker["locked"] for worker in db)
+        if writes:
+            summary = summarize(writes)
+            self.stdout.write(
+                f"db writes: {len(writes)} statements, p50 {summary['median_ms']:.2f}ms "
+                f"p95 {summary['p95_ms']:.2f}ms p99 {summary['p99_ms']:.2f}ms max {max(writes):.1f}ms; "
+                f"{locked} 'database is locked' errors"
+            )
@@ -0,0 +1,184 @@
+import asyncio
+import collections
+import json
+import multiprocessing
+import platform
+import random
+import socket
+import time
+
+import django
+import httpx
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client as TestClient
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+
+from core import caching
+from core.models import Product
+
+from ._bench import CATEGORIES, WORDS, seed_data, summarize, temporary_database
+from .bench_checkout import serve
+from .page_weight import BENCH_SETTINGS
+
+FEED = {"X-Requested-With": "XMLHttpRequest"}
+
+# name -> (url for a random request, extra headers)
+ENDPOINTS = {
+    "index": (lambda rng, ids: "/", {}),
+    "marketplace": (lambda rng, ids: f"/marketplace/?page={rng.randint(1, 50)}", {}),
+    "marketplace_category": (
+        lambda rng, ids: f"/marketplace/?category={rng.choice(CATEGORIES)}&page={rng.randint(1, 20)}", {}),
+    "marketplace_search": (lambda rng, ids: f"/marketplace/?search={rng.choice(WORDS)}", {}),
+    "marketplace_feed": (lambda rng, ids: f"/marketplace/?category={rng.choice(CATEGORIES)}", FEED),
+    "product_detail": (lambda rng, ids: f"/product/{rng.choice(ids)}/", {}),
+    "gallery": (lambda rng, ids: "/gallery/", {}),
+}
+
+
+def query_counts(url, headers):
+    """Queries one request to ``url`` runs with an empty cache, then again with it warm."""
+    browser = TestClient(headers=headers)
+    caching.get_cache().clear()
+    counts = []
+    for _ in range(2):
+        with CaptureQueriesContext(connection) as ctx:
+            browser.get(url)
+        counts.append(len(ctx.captured_queries))
+    return counts
+
+
+async def hammer(base_url, make_url, headers, product_ids, concurrency, duration, seed):
+    """``concurrency`` clients GET fresh URLs back to back for ``duration`` seconds."""
+    samples, errors = [], collections.Counter()
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=30) as http:
+        async def user(rng, deadline):
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await http.get(make_url(rng, product_ids))
+                except httpx.HTTPError as e:
+                    errors[type(e).__name__] += 1
+                    continue
+                samples.append((time.perf_counter() - started) * 1000)
+                if response.status_code >= 400:
+                    errors[str(response.status_code)] += 1
+
+        rngs = [random.Random(seed + i) for i in range(concurrency)]
+        # One untimed request per client opens the connections and warms each worker.
+        await asyncio.gather(*(http.get(make_url(rng, product_ids)) for rng in rngs), return_exceptions=True)
+        started = time.perf_counter()
+        await asyncio.gather(*(user(rng, started + duration) for rng in rngs))
+        elapsed = time.perf_counter() - started
+    return samples, errors, elapsed
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway database at the given scale, drive the catalog views concurrently over "
+        "HTTP through the ASGI app, and report req/s, latency percentiles and SQL queries per "
+        "request for each endpoint as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--products", type=int, default=10_000)
+        parser.add_argument("--orders", type=int, help="Default: as many as products.")
+        parser.add_argument("--endpoints", nargs="+", choices=ENDPOINTS, default=list(ENDPOINTS))
+        parser.add_argument("--concurrency", type=int, default=16, help="Concurrent HTTP clients.")
+        parser.add_argument("--duration", type=float, default=5.0, help="Seconds per endpoint.")
+        parser.add_argument("--processes", type=int, default=2, help="ASGI worker processes.")
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--output", help="Write the JSON report here and print a summary table.")
+
+    def handle(self, *args, **options):
+        if options["products"] < 1:
+            raise CommandError("--products must be at least 1")
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        sock.listen(1024)
+        base_url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+        products = options["products"]
+
+        with temporary_database(), override_settings(**BENCH_SETTINGS):
+            started = time.perf_counter()
+            dataset = seed_data(
+                products=products, gallery=max(12, products // 10), customers=max(1, products // 10),
+                orders=products if options["orders"] is None else options["orders"], seed=options["seed"],
+            )
+            seed_seconds = time.perf_counter() - started
+            product_ids = list(Product.objects.values_list("pk", flat=True))
+            rng = random.Random(options["seed"])
+            queries = {name: query_counts(ENDPOINTS[name][0](rng, product_ids), ENDPOINTS[name][1])
+                       for name in options["endpoints"]}
+            # Workers open their own connections; a shared SQLite handle across fork is unsafe.
+            connections.close_all()
+
+            context = multiprocessing.get_context("fork")
+            stop, results = context.Event(), context.Queue()
+            workers = [context.Process(target=serve, args=(sock, stop, results)) for _ in range(options["processes"])]
+            for worker in workers:
+                worker.start()
+            endpoints = {}
+            try:
+                for name in options["endpoints"]:
+                    make_url, headers = ENDPOINTS[name]
+                    samples, errors, elapsed = asyncio.run(hammer(
+                        base_url, make_url, headers, product_ids,
+                        options["concurrency"], options["duration"], options["seed"],
+                    ))
+                    endpoints[name] = self.endpoint_report(samples, errors, elapsed, queries[name])
+            finally:
+                stop.set()
+                for _ in workers:
+                    results.get(timeout=30)
+                for worker in workers:
+                    worker.join()
+                sock.close()
+
+        report = {
+            "benchmark": "bench_http",
+            "timestamp": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "config": {key: options[key] for key in ("concurrency", "duration", "processes", "seed")},
+            "dataset": {**dataset, "seed_seconds": round(seed_seconds, 1)},
+            "endpoints": endpoints,
+        }
+        if not options["output"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+        with open(options["output"], "w") as f:
+            json.dump(report, f, indent=2)
+        self.print_table(report)
+        self.stdout.write(f"report written to {options['output']}")
+
+    def endpoint_report(self, samples, errors, elapsed, queries):
+        summary = summarize(samples) if samples else {"median_ms": None, "p95_ms": None, "p99_ms": None}
+        return {
+            "requests": len(samples),
+            "errors": dict(errors),
+            "rps": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+            "p50_ms": summary["median_ms"],
+            "p95_ms": summary["p95_ms"],
+            "p99_ms": summary["p99_ms"],
+            "max_ms": round(max(samples), 3) if samples else None,
+            "queries_cold": queries[0],
+            "queries_warm": queries[1],
+        }
+
+    def print_table(self, report):
+        dataset = report["dataset"]
+        self.stdout.write(
+            f"{dataset['products']} products, {dataset.get('orders', 0)} orders; "
+            f"{report['config']['concurrency']} clients on {report['config']['processes']} ASGI processes"
+        )
+        self.stdout.write(f"{'endpoint':<22}{'req/s':>9}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+                          f"{'queries':>9}")
+        for name, row in report["endpoints"].items():
+            self.stdout.write(
+                f"{name:<22}{row['rps']:>9.1f}{sum(row['errors'].values()):>8}{row['p50_ms'] or 0:>9.1f}"
+                f"{row['p95_ms'] or 0:>9.1f}{row['p99_ms'] or 0:>9.1f}"
+                f"{row['queries_cold']:>5}/{row['queries_warm']:<3}"
+            )
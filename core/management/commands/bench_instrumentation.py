@@ -0,0 +1,68 @@
+import statistics
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from core.models import Product
+
+from ._bench import seed_data, temporary_database, timeit
+from .page_weight import BENCH_SETTINGS
+
+MIDDLEWARE = "core.instrumentation.RequestTimingMiddleware"
+PAGES = ("index", "marketplace", "gallery", "product_detail")
+
+
+def client(instrumented):
+    """
+    A test client whose middleware chain has RequestTimingMiddleware or
+    not. The chain is built on the first request, so the two can then be
+    driven alternately under the same settings. Without the middleware the
+    SQL and template probes still run, at one ContextVar lookup each.
+    """
+    browser = Client()
+    middleware = [path for path in settings.MIDDLEWARE if instrumented or path != MIDDLEWARE]
+    with override_settings(MIDDLEWARE=middleware):
+        browser.get("/")
+    return browser
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure what RequestTimingMiddleware (SQL, template and cache probes, Server-Timing, "
+        "buffered metrics) adds to a request, against the same pages without it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=500, help="Requests per page and mode.")
+        parser.add_argument("--budget-us", type=float, default=250.0,
+                            help="Fail if the median overhead of any page exceeds this (microseconds).")
+
+    def handle(self, *args, **options):
+        with temporary_database(), override_settings(**BENCH_SETTINGS):
+            seed_data(products=500, gallery=50, customers=10, orders=100)
+            urls = {name: reverse(name) for name in PAGES if name != "product_detail"}
+            urls["product_detail"] = reverse("product_detail", args=[Product.objects.first().pk])
+
+            clients = {"off": client(False), "on": client(True)}
+            samples = {(name, mode): [] for name in PAGES for mode in clients}
+            for name, url in urls.items():
+                for mode, browser in clients.items():
+                    timeit(lambda: browser.get(url), 20)  # warm templates and the cache
+                # Interleave request by request so drift hits both modes alike.
+                for _ in range(options["repeat"]):
+                    for mode, browser in clients.items():
+                        samples[name, mode] += timeit(lambda: browser.get(url), 1)
+
+        self.stdout.write(f"{'page':<16}{'off µs':>10}{'on µs':>10}{'overhead µs':>13}{'overhead':>10}")
+        worst = 0.0
+        for name in PAGES:
+            off = statistics.median(samples[name, "off"]) * 1000
+            on = statistics.median(samples[name, "on"]) * 1000
+            worst = max(worst, on - off)
+            self.stdout.write(f"{name:<16}{off:>10.0f}{on:>10.0f}{on - off:>13.0f}{(on - off) / off:>10.1%}")
+        if worst > options["budget_us"]:
+            raise CommandError(f"Instrumentation overhead {worst:.0f}µs exceeds the {options['budget_us']:.0f}µs budget")
+        self.stdout.write(self.style.SUCCESS(f"worst overhead {worst:.0f}µs, within {options['budget_us']:.0f}µs"))
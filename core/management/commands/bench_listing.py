@@ -0,0 +1,58 @@
+import json
+
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+
+from core.models import Product
+from core.serializers import dumps, product_listing_item, product_listing_values
+
+from ._bench import bulk_create_products, summarize, temporary_database, timeit
+
+PAGE_SIZES = (8, 50, 200)
+
+
+def model_page(queryset, size):
+    """The marketplace JSON branch before the lean serializer."""
+    products_data = []
+    for product in queryset[:size]:
+        products_data.append({
+            'id': product.id,
+            'title': product.title,
+            'price': str(product.price),
+            'description': product.description[:100],
+            'rating': product.views,
+            'views': product.views,
+            'category': product.category,
+            'image': product.image.url if product.image else '',
+        })
+    return json.dumps({'products': products_data}, cls=DjangoJSONEncoder).encode()
+
+
+def lean_page(queryset, size):
+    rows = product_listing_values(queryset)[:size]
+    return dumps({'products': [product_listing_item(row) for row in rows]})
+
+
+class Command(BaseCommand):
+    help = "Compare model-instance and values() serialization of marketplace JSON pages."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--products", type=int, default=2_000)
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def handle(self, *args, **options):
+        with temporary_database():
+            bulk_create_products(options["products"])
+            queryset = Product.objects.order_by("-created_at", "-id")
+
+            self.stdout.write(f"{'page size':<12}{'model ms':>10}{'lean ms':>10}{'speed-up':>10}")
+            for size in PAGE_SIZES:
+                before_items = json.loads(model_page(queryset, size))["products"]
+                after_items = json.loads(lean_page(queryset, size))["products"]
+                assert [{k: a[k] for k in b} for a, b in zip(after_items, before_items)] == before_items
+                before = summarize(timeit(lambda: model_page(queryset, size), options["repeat"]))
+                after = summarize(timeit(lambda: lean_page(queryset, size), options["repeat"]))
+                self.stdout.write(
+                    f"{size:<12}{before['median_ms']:>10.2f}{after['median_ms']:>10.2f}"
+                    f"{before['median_ms'] / after['median_ms']:>9.1f}x"
+                )
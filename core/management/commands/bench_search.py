@@ -0,0 +1,53 @@
+import time
+from unittest import mock
+
+from django.core.management.base import BaseCommand
+
+from core import search
+from core.models import Product
+
+from ._bench import bulk_create_products, summarize, temporary_database, timeit
+
+QUERIES = ("dashboard", "hosp", "booking template", "flutter clinic app", "no such product")
+
+
+class Command(BaseCommand):
+    help = "Compare icontains scans with the FTS5 index on a synthetic catalog."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--products", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        with temporary_database():
+            started = time.perf_counter()
+            bulk_create_products(options["products"])
+            self.stdout.write(
+                f"Seeded {options['products']} products in {time.perf_counter() - started:.1f}s "
+                f"(FTS5: {'yes' if search.is_installed() else 'no'})"
+            )
+
+            self.stdout.write(
+                f"{'query':<22}{'icontains ms':>14}{'fts all ms':>12}{'fts ms':>10}{'matches':>9}{'ranked':>8}"
+            )
+            for query in QUERIES:
+                def scan():
+                    qs = Product.objects.filter(title__icontains=query)
+                    qs.count()
+                    list(qs[:8])
+
+                def indexed():
+                    qs = search.search_products(Product.objects.all(), query)
+                    list(qs[:8])
+
+                before = summarize(timeit(scan, options["repeat"]))
+                # Every match ranked, as before RANK_LIMIT.
+                with mock.patch.object(search, "RANK_LIMIT", options["products"]):
+                    unbounded = summarize(timeit(indexed, options["repeat"]))
+                    matches = search.search_products(Product.objects.all(), query).count()
+                after = summarize(timeit(indexed, options["repeat"]))
+                ranked = search.search_products(Product.objects.all(), query).count()
+                self.stdout.write(
+                    f"{query:<22}{before['median_ms']:>14.2f}{unbounded['median_ms']:>12.2f}"
+                    f"{after['median_ms']:>10.2f}{matches:>9}{ranked:>8}"
+                )
@@ -0,0 +1,125 @@
+import multiprocessing
+import random
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connection, transaction
+from django.db.models import F
+from django.test.utils import override_settings
+
+from core import sqlite
+from core.models import PaymentAttempt, Product
+
+from ._bench import bulk_create_products, summarize, temporary_database
+
+# "stock" is SQLite as Django configures it out of the box; "tuned" is
+# what settings.py now sets up.
+PROFILES = {
+    "stock": {"pragmas": {}, "transaction_mode": None, "persistent": False},
+    "tuned": {"pragmas": None, "transaction_mode": "IMMEDIATE", "persistent": True},
+}
+
+
+def read(rng, product_ids):
+    """A marketplace page: the newest 24 products plus the total."""
+    list(Product.objects.order_by("-created_at").values("id", "title", "price", "views")[:24])
+    Product.objects.count()
+
+
+def write(rng, product_ids):
+    """A checkout step: read a product, count a view and record a payment attempt."""
+    with transaction.atomic():
+        product = Product.objects.only("price").get(pk=rng.choice(product_ids))
+        Product.objects.filter(pk=product.pk).update(views=F("views") + 1)
+        PaymentAttempt.objects.create(tx_ref=f"bench-{rng.getrandbits(64):x}", payment_type="airtel",
+                                      amount=product.price)
+
+
+def worker(number, profile, duration, write_ratio, product_ids, results):
+    if profile["transaction_mode"]:
+        connection.settings_dict["OPTIONS"]["transaction_mode"] = profile["transaction_mode"]
+    else:
+        connection.settings_dict["OPTIONS"].pop("transaction_mode", None)
+    rng = random.Random(number)
+    samples = {"read": [], "write": []}
+    locked = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        kind = "write" if rng.random() < write_ratio else "read"
+        started = time.perf_counter()
+        try:
+            (write if kind == "write" else read)(rng, product_ids)
+        except OperationalError as e:
+            if "locked" not in str(e):
+                raise
+            locked += 1
+        else:
+            samples[kind].append((time.perf_counter() - started) * 1000)
+        if not profile["persistent"]:
+            connection.close()  # CONN_MAX_AGE = 0: a new connection per request
+    connection.close()
+    results.put((samples, locked))
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure SQLite read/write throughput with N concurrent worker processes, "
+        "with stock settings and with the tuned pragmas and persistent connections."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+        parser.add_argument("--duration", type=float, default=3.0, help="Seconds per run.")
+        parser.add_argument("--write-ratio", type=float, default=0.2)
+        parser.add_argument("--products", type=int, default=2000)
+        parser.add_argument("--profile", choices=(*PROFILES, "both"), default="both")
+
+    def handle(self, *args, **options):
+        profiles = list(PROFILES) if options["profile"] == "both" else [options["profile"]]
+        self.stdout.write(
+            f"{options['duration']:.0f}s per run, {options['write_ratio']:.0%} writes "
+            f"(tuned pragmas: {settings.SQLITE_PRAGMAS})"
+        )
+        self.stdout.write(
+            f"{'profile':<8}{'workers':>8}{'reads/s':>9}{'writes/s':>9}{'read p95':>10}{'read p99':>10}"
+            f"{'write p95':>11}{'write p99':>11}{'locked':>8}"
+        )
+        for name in profiles:
+            for workers in options["workers"]:
+                self.run(name, workers, options)
+
+    def run(self, name, workers, options):
+        profile = PROFILES[name]
+        pragmas = settings.SQLITE_PRAGMAS if profile["pragmas"] is None else profile["pragmas"]
+        # A fresh database each run: journal_mode=wal sticks to the file.
+        with override_settings(SQLITE_PRAGMAS=pragmas), temporary_database():
+            bulk_create_products(options["products"])
+            product_ids = list(Product.objects.values_list("pk", flat=True))
+            journal = sqlite.pragma(connection, "journal_mode")
+            connection.close()
+
+            context = multiprocessing.get_context("fork")
+            results = context.Queue()
+            processes = [
+                context.Process(target=worker, args=(i, profile, options["duration"], options["write_ratio"],
+                                                     product_ids, results))
+                for i in range(workers)
+            ]
+            for process in processes:
+                process.start()
+            collected = [results.get() for _ in processes]
+            for process in processes:
+                process.join()
+
+        reads = [ms for samples, _ in collected for ms in samples["read"]]
+        writes = [ms for samples, _ in collected for ms in samples["write"]]
+        locked = sum(count for _, count in collected)
+        read_summary = summarize(reads) if reads else {"p95_ms": 0, "p99_ms": 0}
+        write_summary = summarize(writes) if writes else {"p95_ms": 0, "p99_ms": 0}
+        self.stdout.write(
+            f"{name:<8}{workers:>8}{len(reads) / options['duration']:>9.0f}{len(writes) / options['duration']:>9.0f}"
+            f"{read_summary['p95_ms']:>10.2f}{read_summary['p99_ms']:>10.2f}"
+            f"{write_summary['p95_ms']:>11.2f}{write_summary['p99_ms']:>11.2f}{locked:>8}"
+            f"  ({journal})"
+        )
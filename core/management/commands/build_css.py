@@ -0,0 +1,43 @@
+import gzip
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core import tailwind
+
+CORE_DIR = Path(__file__).resolve().parents[2]
+SOURCES = (
+    (CORE_DIR / "templates", "*.html"),
+    (CORE_DIR / "static" / "core" / "js", "*.js"),
+)
+OUTPUT = CORE_DIR / "static" / "core" / "css" / "tailwind.css"
+
+
+class Command(BaseCommand):
+    help = "Compile the Tailwind utilities used by the templates into core/css/tailwind.css."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default=str(OUTPUT))
+        parser.add_argument(
+            "--check", action="store_true",
+            help="Exit non-zero if the stylesheet on disk is out of date instead of writing it.",
+        )
+
+    def handle(self, *args, **options):
+        paths = sorted(p for root, pattern in SOURCES for p in root.rglob(pattern))
+        css = tailwind.generate(tailwind.scan(paths))
+        output = Path(options["output"])
+
+        if options["check"]:
+            current = output.read_text(encoding="utf-8") if output.exists() else ""
+            if current != css:
+                raise CommandError(f"{output} is stale; run `manage.py build_css`.")
+            self.stdout.write(self.style.SUCCESS(f"{output} is up to date."))
+            return
+
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(css, encoding="utf-8")
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {output} from {len(paths)} files: {len(css.encode())} bytes, "
+            f"{len(gzip.compress(css.encode()))} gzipped."
+        ))
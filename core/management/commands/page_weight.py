@@ -0,0 +1,38 @@
+import gzip
+
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from core.models import Product
+
+from ._bench import bulk_create_products, temporary_database
+
+PAGES = ("index", "about", "services", "contact", "marketplace", "gallery")
+
+# Render without touching the configured cache or the collected manifest.
+BENCH_SETTINGS = {
+    "CACHES": {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    "STORAGES": {
+        "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    },
+    "VIEW_COUNT_FLUSH_INTERVAL": 0,
+}
+
+
+class Command(BaseCommand):
+    help = "Report the HTML bytes (raw and gzipped) each public page sends."
+
+    def handle(self, *args, **options):
+        with temporary_database(), override_settings(**BENCH_SETTINGS):
+            bulk_create_products(24)
+            client = Client()
+            urls = [(name, reverse(name)) for name in PAGES]
+            urls.append(("product_detail", reverse("product_detail", args=[Product.objects.first().pk])))
+
+            self.stdout.write(f"{'page':<16}{'html bytes':>12}{'gzip bytes':>12}")
+            for name, url in urls:
+                body = client.get(url).content
+                self.stdout.write(f"{name:<16}{len(body):>12}{len(gzip.compress(body)):>12}")
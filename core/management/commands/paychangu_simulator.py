@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+
+from core.simulator import PayChanguSimulator
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the PayChangu simulator as a local HTTP server. Point the app at it with "
+        "PAYCHANGU_BASE_URL=http://HOST:PORT."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument("--latency", type=float, default=0.3, help="Seconds before every reply.")
+        parser.add_argument("--jitter", type=float, default=0.2, help="Up to this many extra seconds, at random.")
+        parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of calls answered with a 500.")
+        parser.add_argument("--completion-delay", type=float, default=5.0,
+                            help="Seconds a charge stays pending before it completes.")
+        parser.add_argument("--decline-rate", type=float, default=0.0, help="Fraction of charges that fail.")
+        parser.add_argument("--webhook-url", help="Where to POST completion webhooks, e.g. "
+                                                  "http://127.0.0.1:8000/pay/webhook/ (signed with "
+                                                  "PAYCHANGU_WEBHOOK_SECRET).")
+        parser.add_argument("--seed", type=int, default=None)
+
+    def handle(self, *args, **options):
+        simulator = PayChanguSimulator(
+            host=options["host"],
+            port=options["port"],
+            latency=options["latency"],
+            jitter=options["jitter"],
+            error_rate=options["error_rate"],
+            completion_delay=options["completion_delay"],
+            decline_rate=options["decline_rate"],
+            webhook_url=options["webhook_url"],
+            seed=options["seed"],
+        )
+        self.stdout.write(f"PayChangu simulator on {simulator.base_url} (Ctrl-C to stop)")
+        try:
+            simulator.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        stats = simulator.stats()
+        self.stdout.write(
+            f"{stats['requests']} requests ({stats['errors']} simulated errors), {stats['charges']} charges, "
+            f"{stats['webhooks']} webhook deliveries ({stats['webhook_failures']} given up)"
+        )
@@ -0,0 +1,52 @@
+import asyncio
+import contextlib
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.paychangu import AsyncPayChanguClient
+from core.payouts import PayoutEngine, summary
+from core.simulator import PayChanguSimulator
+
+
+class Command(BaseCommand):
+    help = "Pay out queued WithdrawalRequests through PayChangu in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument("--concurrency", type=int, default=5, help="Payouts in flight at once.")
+        parser.add_argument("--rate", type=float, default=10, help="Max payouts per second (0: no cap).")
+        parser.add_argument("--loop", action="store_true", help="Keep running, one pass every --interval seconds.")
+        parser.add_argument("--interval", type=int, default=60)
+        parser.add_argument("--base-url", help="PayChangu API root (default PAYCHANGU_BASE_URL).")
+        parser.add_argument("--simulate", type=float, metavar="LATENCY", default=None,
+                            help="Pay out against an in-process PayChangu simulator with this latency (s).")
+
+    def handle(self, *args, **options):
+        with contextlib.ExitStack() as stack:
+            base_url = options["base_url"]
+            if options["simulate"] is not None:
+                base_url = stack.enter_context(PayChanguSimulator(latency=options["simulate"])).base_url
+                self.stdout.write(f"Using PayChangu simulator at {base_url}")
+
+            while True:
+                self.pay_out(base_url, options)
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
+
+    def pay_out(self, base_url, options):
+        engine = PayoutEngine(
+            client=AsyncPayChanguClient(base_url=base_url),
+            batch_size=options["batch_size"],
+            concurrency=options["concurrency"],
+            rate=options["rate"],
+        )
+        started = time.perf_counter()
+        reports = asyncio.run(engine.run(report=self.stdout.write))
+        totals = summary(reports, time.perf_counter() - started)
+        self.stdout.write(self.style.SUCCESS(
+            f"Claimed {totals['claimed']} withdrawals in {totals['batches']} batches: "
+            f"{totals['processed']} processed, {totals['failed']} failed, {totals['requeued']} requeued, "
+            f"{totals['unknown']} unknown (left processing for review); {totals['throughput']:.1f}/s."
+        ))
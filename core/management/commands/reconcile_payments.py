@@ -0,0 +1,56 @@
+import asyncio
+import contextlib
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.paychangu import AsyncPayChanguClient
+from core.reconcile import Reconciler, summary
+from core.simulator import PayChanguSimulator
+
+
+class Command(BaseCommand):
+    help = "Verify pending PaymentAttempts against PayChangu and settle the ones that finished."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=200)
+        parser.add_argument("--concurrency", type=int, default=10, help="Verify calls in flight at once.")
+        parser.add_argument("--rate", type=float, default=20, help="Max verify calls per second (0: no cap).")
+        parser.add_argument("--min-age", type=int, default=None,
+                            help="Skip attempts younger than this many seconds (default PAYCHANGU_VERIFY_AFTER).")
+        parser.add_argument("--loop", action="store_true", help="Keep running, one pass every --interval seconds.")
+        parser.add_argument("--interval", type=int, default=60)
+        parser.add_argument("--base-url", help="PayChangu API root (default PAYCHANGU_BASE_URL).")
+        parser.add_argument("--simulate", type=float, metavar="LATENCY", default=None,
+                            help="Verify against an in-process PayChangu simulator with this latency (s).")
+
+    def handle(self, *args, **options):
+        with contextlib.ExitStack() as stack:
+            base_url = options["base_url"]
+            if options["simulate"] is not None:
+                base_url = stack.enter_context(PayChanguSimulator(latency=options["simulate"])).base_url
+                self.stdout.write(f"Using PayChangu simulator at {base_url}")
+
+            while True:
+                self.reconcile(base_url, options)
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
+
+    def reconcile(self, base_url, options):
+        reconciler = Reconciler(
+            client=AsyncPayChanguClient(base_url=base_url),
+            batch_size=options["batch_size"],
+            concurrency=options["concurrency"],
+            rate=options["rate"],
+            min_age=options["min_age"],
+        )
+        started = time.perf_counter()
+        reports = asyncio.run(reconciler.run(report=self.stdout.write))
+        totals = summary(reports, time.perf_counter() - started)
+        self.stdout.write(self.style.SUCCESS(
+            f"Checked {totals['checked']} pending attempts in {totals['batches']} batches: "
+            f"{totals['success']} success, {totals['failed']} failed, {totals['unknown']} unknown, "
+            f"{totals['applied']} applied; {totals['throughput']:.1f}/s, "
+            f"upstream median {totals['upstream_median_ms']:.0f}ms."
+        ))
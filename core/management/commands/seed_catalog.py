@@ -0,0 +1,48 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from core import caching
+
+from ._bench import seed_data
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill the configured database with a synthetic shop for load testing: products, gallery "
+        "items, customers, and orders with their items and payment attempts, via bulk_create."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--products", type=int, default=10_000)
+        parser.add_argument("--gallery", type=int, help="Gallery items (default: products / 10).")
+        parser.add_argument("--customers", type=int, help="Users with a Client profile (default: products / 10).")
+        parser.add_argument("--orders", type=int, help="Orders, each with items and a payment attempt "
+                                                       "(default: as many as products).")
+        parser.add_argument("--batch-size", type=int, default=5_000)
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--force", action="store_true", help="Seed even though DEBUG is off.")
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options["force"]:
+            raise CommandError("DEBUG is off; this may be a live database. Pass --force to seed it anyway.")
+
+        products = options["products"]
+        started = time.perf_counter()
+        with transaction.atomic():
+            counts = seed_data(
+                products=products,
+                gallery=products // 10 if options["gallery"] is None else options["gallery"],
+                customers=max(1, products // 10) if options["customers"] is None else options["customers"],
+                orders=products if options["orders"] is None else options["orders"],
+                batch_size=options["batch_size"],
+                seed=options["seed"],
+                report=self.stdout.write,
+            )
+        # bulk_create sends no post_save, so drop the cached listings here.
+        caching.bump_catalog_version()
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {sum(counts.values())} top-level rows in {time.perf_counter() - started:.1f}s"
+        ))
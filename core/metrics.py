@@ -0,0 +1,209 @@
+# metrics.py
+"""
+Counters and histograms shared by every worker process, rendered in the
+Prometheus text format at /metrics/.
+
+Values live in the marketplace cache (caching.get_cache()), so a scrape
+sees the totals of all workers rather than of whichever one answered.
+Updates are cache ``incr`` calls: atomic on Redis and locmem; on the
+file backend concurrent increments can occasionally be lost, which is
+fine for monitoring. Label values are declared up front (a callable
+works too, read at render time), so rendering is one get_many() per
+metric.
+
+Metrics updated on every request take a Buffer: increments add up in
+process and reach the cache at most every METRICS_FLUSH_INTERVAL seconds
+(and before this process renders a scrape, and at exit).
+"""
+import atexit
+import bisect
+import itertools
+import math
+import os
+import threading
+import time
+from collections import Counter as Tally
+
+from django.conf import settings
+
+from . import caching
+
+PREFIX = "metrics"
+REGISTRY = []
+
+
+def _incr(cache, key, n=1):
+    try:
+        cache.incr(key, n)
+    except ValueError:
+        if not cache.add(key, n, timeout=None):
+            cache.incr(key, n)
+
+
+class Buffer:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = Tally()
+        self._pid = os.getpid()
+        self._due = 0.0  # monotonic time of the next flush
+        BUFFERS.append(self)
+
+    def incr(self, key, n=1):
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked: the parent still owns what it had buffered.
+                self._pid, self._pending = os.getpid(), Tally()
+            self._pending[key] += n
+            due = time.monotonic() >= self._due
+        if due:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, Tally()
+            self._due = time.monotonic() + settings.METRICS_FLUSH_INTERVAL
+        if batch:
+            cache = caching.get_cache()
+            for key, n in batch.items():
+                _incr(cache, key, n)
+
+
+BUFFERS = []
+
+
+def flush():
+    for buffer in BUFFERS:
+        buffer.flush()
+
+
+atexit.register(flush)
+
+
+def _label_str(labels):
+    return ",".join(f'{name}="{value}"' for name, value in labels)
+
+
+class Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labels=None, buffer=None):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels or {}
+        self.buffer = buffer
+        REGISTRY.append(self)
+
+    def label_sets(self):
+        names = list(self.labels)
+        values = [self.labels[name]() if callable(self.labels[name]) else self.labels[name] for name in names]
+        for combination in itertools.product(*values):
+            yield tuple(zip(names, combination))
+
+    def _add(self, key, n=1):
+        if self.buffer is None:
+            _incr(caching.get_cache(), key, n)
+        else:
+            self.buffer.incr(key, n)
+
+    def _key(self, labels, suffix=""):
+        label_part = ",".join(str(value) for _, value in sorted(labels))
+        return f"{PREFIX}:{self.name}:{label_part}:{suffix}"
+
+    def _labels(self, values):
+        unknown = set(values) - set(self.labels)
+        if unknown:
+            raise ValueError(f"Unknown labels for {self.name}: {sorted(unknown)}")
+        return tuple((name, values[name]) for name in self.labels)
+
+    def header(self):
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, n=1, **labels):
+        self._add(self._key(self._labels(labels)), n)
+
+    def render(self):
+        label_sets = list(self.label_sets())
+        values = caching.get_cache().get_many([self._key(labels) for labels in label_sets])
+        lines = self.header()
+        for labels in label_sets:
+            lines.append(f"{self.name}{{{_label_str(labels)}}} {values.get(self._key(labels), 0)}")
+        return lines
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, buckets, labels=None, buffer=None):
+        super().__init__(name, documentation, labels, buffer)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, seconds, **labels):
+        """Record one observation (seconds, or any other unit the buckets use)."""
+        labels = self._labels(labels)
+        bucket = bisect.bisect_left(self.buckets, seconds)  # first bound >= seconds
+        self._add(self._key(labels, f"b{bucket}"))
+        self._add(self._key(labels, "sum_us"), round(seconds * 1_000_000))
+
+    def snapshot(self, **labels):
+        """{"buckets": [(le, cumulative count)], "count": n, "sum": seconds} for one label set."""
+        labels = self._labels(labels)
+        return self._snapshot(labels, caching.get_cache().get_many(self._keys(labels)))
+
+    def _keys(self, labels):
+        return [self._key(labels, f"b{i}") for i in range(len(self.buckets) + 1)] + [self._key(labels, "sum_us")]
+
+    def _snapshot(self, labels, values):
+        cumulative, buckets = 0, []
+        for i, bound in enumerate(self.buckets + (math.inf,)):
+            cumulative += values.get(self._key(labels, f"b{i}"), 0)
+            buckets.append((bound, cumulative))
+        return {"buckets": buckets, "count": cumulative,
+                "sum": values.get(self._key(labels, "sum_us"), 0) / 1_000_000}
+
+    def render(self):
+        label_sets = list(self.label_sets())
+        values = caching.get_cache().get_many([key for labels in label_sets for key in self._keys(labels)])
+        lines = self.header()
+        for labels in label_sets:
+            snap = self._snapshot(labels, values)
+            prefix = _label_str(labels)
+            sep = "," if prefix else ""
+            for bound, count in snap["buckets"]:
+                le = "+Inf" if bound == math.inf else f"{bound:g}"
+                lines.append(f'{self.name}_bucket{{{prefix}{sep}le="{le}"}} {count}')
+            lines.append(f"{self.name}_count{{{prefix}}} {snap['count']}")
+            lines.append(f"{self.name}_sum{{{prefix}}} {snap['sum']:.6f}")
+        return lines
+
+
+class Gauge(Metric):
+    """
+    Values computed at scrape time by ``callback(label_sets)``, which gets
+    every label set (as dicts) at once, so it can batch its lookups, and
+    returns their values in the same order.
+    """
+    kind = "gauge"
+
+    def __init__(self, name, documentation, callback, labels=None):
+        super().__init__(name, documentation, labels)
+        self.callback = callback
+
+    def render(self):
+        lines = self.header()
+        label_sets = list(self.label_sets())
+        values = self.callback([dict(labels) for labels in label_sets])
+        for labels, value in zip(label_sets, values):
+            lines.append(f"{self.name}{{{_label_str(labels)}}} {value}")
+        return lines
+
+
+def render():
+    flush()
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,25 @@
+from django.db import migrations
+
+
+def create_index(apps, schema_editor):
+    from core import search
+
+    if search.install(schema_editor.connection):
+        search.rebuild(schema_editor.connection)
+
+
+def drop_index(apps, schema_editor):
+    from core import search
+
+    search.uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_alter_gallery_media'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
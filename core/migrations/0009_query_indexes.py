@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_withdrawal_payouts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='gallery',
+            index=models.Index(fields=['-uploaded_at'], name='gallery_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gallery',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-uploaded_at'], name='gallery_active_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['client', 'paid'], name='order_client_paid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='paymentattempt',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['created_at', 'id'], name='payment_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['-created_at', '-id'], name='product_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['category', '-created_at', '-id'], name='product_category_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='withdrawalrequest',
+            index=models.Index(condition=models.Q(('status', 'queued')), fields=['created_at', 'id'], name='withdrawal_queued_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BreakerState',
+            fields=[
+                ('name', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('failures', models.PositiveIntegerField(default=0)),
+                ('opened_at', models.FloatField(blank=True, null=True)),
+                ('probe_until', models.FloatField(blank=True, null=True)),
+            ],
+        ),
+    ]
@@ -48,6 +48,8 @@ class WithdrawalRequest(models.Model):
     ]
     STATUS_CHOICES = [
         ("pending", "Pending"),
+        ("queued", "Queued for payout"),
+        ("processing", "Processing"),
         ("processed", "Processed"),
         ("failed", "Failed"),
     ]
@@ -59,6 +61,19 @@ class WithdrawalRequest(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
     created_at = models.DateTimeField(default=timezone.now)
 
+    # Payout engine bookkeeping (see payouts.py)
+    claimed_by = models.CharField(max_length=64, blank=True, default="", editable=False)
+    claimed_at = models.DateTimeField(blank=True, null=True, editable=False)
+    processed_at = models.DateTimeField(blank=True, null=True, editable=False)
+    raw_response = models.JSONField(blank=True, null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # The payout engine claims queued rows oldest first.
+            models.Index(fields=["created_at", "id"], condition=models.Q(status="queued"),
+                         name="withdrawal_queued_idx"),
+        ]
+
     def __str__(self):
         return f"Withdrawal {self.pk} - {self.client or 'Anonymous'}"
 
@@ -107,6 +122,12 @@ class Product(models.Model):
     image = CloudinaryField('image', blank=True, null=True)
     file_url = models.URLField(help_text="URL to download product/file")
     
+    # Low-quality placeholder for the image, filled on upload (see placeholders.py)
+    placeholder = models.TextField(blank=True, default="", editable=False)
+    dominant_color = models.CharField(max_length=7, blank=True, default="", editable=False)
+    image_width = models.PositiveIntegerField(blank=True, null=True, editable=False)
+    image_height = models.PositiveIntegerField(blank=True, null=True, editable=False)
+
     # New tracking fields
     views = models.PositiveIntegerField(default=0)
     sold_count = models.PositiveIntegerField(default=0)
@@ -115,6 +136,13 @@ class Product(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Marketplace listings: newest first, optionally within one category.
+            models.Index(fields=["-created_at", "-id"], name="product_recent_idx"),
+            models.Index(fields=["category", "-created_at", "-id"], name="product_category_recent_idx"),
+        ]
+
     def mark_sold(self, quantity=1):
         """Call this when the product is sold"""
         self.sold_count += quantity
@@ -132,6 +160,12 @@ class Order(models.Model):
     paid = models.BooleanField(default=False)
     total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
 
+    class Meta:
+        indexes = [
+            # The customer's open order: get_or_create(client=..., paid=False).
+            models.Index(fields=["client", "paid"], name="order_client_paid_idx"),
+        ]
+
     def __str__(self):
         return f"Order #{self.pk} - {self.client or 'Guest'}"
 
@@ -163,9 +197,56 @@ class PaymentAttempt(models.Model):
     raw_response = models.JSONField(blank=True, null=True)
     created_at = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        indexes = [
+            # The reconciler walks pending attempts oldest first; settled ones stay out of the index.
+            models.Index(fields=["created_at", "id"], condition=models.Q(status="pending"),
+                         name="payment_pending_idx"),
+        ]
+
     def __str__(self):
         return f"{self.tx_ref} - {self.payment_type} - {self.status}"
 
+
+class IdempotencyKey(models.Model):
+    """
+    One payment initialization per (user, product, scope, client key).
+    ``status_code`` is null while the first request is still talking to
+    PayChangu; afterwards the stored response is replayed to repeats.
+    ``fingerprint`` identifies the request body the key was first used with.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    product = models.ForeignKey(Product, on_delete=models.CASCADE)
+    scope = models.CharField(max_length=20)
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64, blank=True, default="")
+    status_code = models.PositiveSmallIntegerField(blank=True, null=True)
+    response = models.JSONField(blank=True, null=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "product", "scope", "key"], name="unique_idempotency_key"),
+        ]
+
+    def __str__(self):
+        return f"{self.scope} {self.key} ({self.status_code or 'in flight'})"
+
+
+class BreakerState(models.Model):
+    """
+    Circuit breaker state for one PayChangu endpoint, shared by every
+    worker (see breaker.py). Times are Unix timestamps.
+    """
+    name = models.CharField(max_length=64, primary_key=True)
+    failures = models.PositiveIntegerField(default=0)
+    opened_at = models.FloatField(blank=True, null=True)
+    probe_until = models.FloatField(blank=True, null=True)
+
+    def __str__(self):
+        return f"{self.name} ({'open' if self.opened_at else 'closed'}, {self.failures} failures)"
+
+
 class Gallery(models.Model):
     MEDIA_TYPE_CHOICES = (
         ('image', 'Image'),
@@ -176,11 +257,20 @@ class Gallery(models.Model):
     description = models.TextField(blank=True, null=True)
     media = CloudinaryField('image', blank=True, null=True)
     media_type = models.CharField(max_length=10, choices=MEDIA_TYPE_CHOICES, default='image')
+    placeholder = models.TextField(blank=True, default="", editable=False)
+    dominant_color = models.CharField(max_length=7, blank=True, default="", editable=False)
+    image_width = models.PositiveIntegerField(blank=True, null=True, editable=False)
+    image_height = models.PositiveIntegerField(blank=True, null=True, editable=False)
     uploaded_at = models.DateTimeField(auto_now_add=True)
     is_active = models.BooleanField(default=True)
 
     class Meta:
         ordering = ['-uploaded_at']
+        indexes = [
+            models.Index(fields=['-uploaded_at'], name='gallery_recent_idx'),
+            models.Index(fields=['-uploaded_at'], condition=models.Q(is_active=True),
+                         name='gallery_active_recent_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -0,0 +1,81 @@
+# notifier.py
+"""
+Payment status change notifications for the server-sent events stream.
+
+payments.settle() calls publish(tx_ref) once the transition commits.
+That wakes every stream waiting on that tx_ref in this process at once,
+and also stamps a marker in the shared cache, which streams in other
+worker processes (or a change made by the reconciler in its own process)
+pick up within SHARED_POLL_INTERVAL. A notification only says "look
+again": the waiter reads the authoritative status from the database.
+"""
+import asyncio
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+
+from . import caching
+
+SHARED_POLL_INTERVAL = 1.0
+MARKER_TIMEOUT = 15 * 60
+
+
+def marker_key(tx_ref):
+    return f"payments:changed:{tx_ref}"
+
+
+class Notifier:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waiters = {}  # tx_ref -> {(loop, asyncio.Event)}
+
+    def publish(self, tx_ref):
+        """Safe to call from any thread."""
+        caching.get_cache().set(marker_key(tx_ref), time.time(), MARKER_TIMEOUT)
+        with self._lock:
+            waiters = list(self._waiters.get(tx_ref, ()))
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # that loop has closed
+
+    def marker(self, tx_ref):
+        return caching.get_cache().get(marker_key(tx_ref))
+
+    async def amarker(self, tx_ref):
+        # A cache read can block (file or redis backend): keep it off the loop.
+        return await sync_to_async(self.marker)(tx_ref)
+
+    async def wait(self, tx_ref, timeout, since=None):
+        """
+        Wait up to ``timeout`` seconds for a change to ``tx_ref``. ``since``
+        is the marker the caller last saw. Returns (changed, marker).
+        """
+        loop = asyncio.get_running_loop()
+        waiter = (loop, asyncio.Event())
+        with self._lock:
+            self._waiters.setdefault(tx_ref, set()).add(waiter)
+        try:
+            deadline = loop.time() + timeout
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False, since
+                try:
+                    await asyncio.wait_for(waiter[1].wait(), min(remaining, SHARED_POLL_INTERVAL))
+                except asyncio.TimeoutError:
+                    pass
+                current = await self.amarker(tx_ref)
+                if waiter[1].is_set() or current != since:
+                    return True, current
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(tx_ref)
+                waiters.discard(waiter)
+                if not waiters:
+                    del self._waiters[tx_ref]
+
+
+notifier = Notifier()
@@ -0,0 +1,94 @@
+# pagination.py
+"""
+Keyset (cursor) pagination for the marketplace feed.
+
+Each page is fetched with a WHERE clause on the sort key of the last row
+the client saw, so a page costs the same no matter how deep the user has
+scrolled and no COUNT(*) is ever issued. The cursor handed to the client
+is opaque: URL-safe base64 of a small JSON document.
+
+Browsing is ordered by (-created_at, -id). Search results keep their
+relevance order, so their cursor carries (search_rank, id) instead.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from django.db.models import Q
+
+from . import search
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class KeysetPage:
+    def __init__(self, items, next_cursor):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+
+def encode_cursor(row):
+    """Cursor pointing just past ``row`` (a model instance or values() dict)."""
+    if isinstance(row, dict):
+        rank, pk, created_at = row.get("search_rank"), row["id"], row.get("created_at")
+    else:
+        rank, pk, created_at = getattr(row, "search_rank", None), row.pk, row.created_at
+    if rank is not None:
+        position = {"r": rank, "id": pk}
+    else:
+        position = {"t": created_at.isoformat(), "id": pk}
+    raw = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor):
+    """Parse a cursor from the client. Raises InvalidCursor on anything malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position = json.loads(raw)
+        pk = int(position["id"])
+        if "r" in position:
+            return {"rank": float(position["r"]), "id": pk}
+        return {"created_at": datetime.fromisoformat(position["t"]), "id": pk}
+    except (binascii.Error, ValueError, TypeError, KeyError, AttributeError) as exc:
+        raise InvalidCursor("Malformed cursor") from exc
+
+
+def keyset_page(queryset, cursor=None, per_page=8):
+    """
+    Return the page of ``queryset`` that follows ``cursor``.
+
+    ``queryset`` must be in listing order: either plain browse order
+    (-created_at, -id) or the relevance order from search.search_products().
+    It may be a values() queryset as long as the sort keys are selected.
+    One extra row is fetched to know whether another page exists.
+    """
+    ranked = "search_rank" in queryset.query.extra_select
+    if cursor:
+        position = decode_cursor(cursor)
+        if ranked != ("rank" in position):
+            raise InvalidCursor("Cursor does not belong to this listing")
+        if ranked:
+            queryset = search.after_rank(queryset, position["rank"], position["id"])
+        else:
+            queryset = queryset.filter(
+                Q(created_at__lt=position["created_at"])
+                | Q(created_at=position["created_at"], id__lt=position["id"])
+            )
+
+    rows = list(queryset[: per_page + 1])
+    items = rows[:per_page]
+    next_cursor = encode_cursor(items[-1]) if len(rows) > per_page else None
+    return KeysetPage(items, next_cursor)
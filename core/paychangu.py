@@ -1,6 +1,45 @@
 # paychangu.py
-import requests
+"""
+PayChangu API client.
+
+All calls go through one PayChanguClient per process, which keeps a pooled
+keep-alive ``requests.Session`` to the API host, so a payment reuses an
+open TCP+TLS connection instead of handshaking every time. Each endpoint
+has its own (connect, read) timeout, and idempotent calls (verification)
+are retried a bounded number of times with jittered exponential backoff.
+Initialisation and payout POSTs are only retried when the connection could
+not be established, i.e. when PayChangu cannot have seen the request.
+
+AsyncPayChanguClient is the asyncio counterpart used by the async payment
+views under ASGI: one pooled httpx.AsyncClient per event loop, the same
+timeouts and the same retry policy, so a slow PayChangu response only
+parks a coroutine instead of a whole worker.
+
+Every call is timed into per-endpoint latency histograms and outcome
+counters (see metrics.py) and guarded by a per-endpoint circuit breaker
+(see breaker.py): once PayChangu keeps failing, calls return an
+``unavailable`` reply at once instead of waiting out the timeout.
+
+The module-level functions (and their ``a``-prefixed async twins) are the
+interface the views use; they are thin wrappers over the shared clients.
+"""
+import asyncio
+import os
+import random
+import threading
+import time
 import uuid
+import weakref
+
+import httpx
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import metrics
+from .breaker import CircuitBreaker, CircuitOpen, states as breaker_states
 
 # 🔑 API Keys
 PUB_KEY = "PUB-TEST-WW4IESP3O5ngh9whOMlCEqz18Pos4wl2"
@@ -10,41 +49,121 @@ SEC_KEY = "SEC-TEST-nKVP4zxxiVt2sGC5t4gTadn0i6tdxioO"
 AIRTEL_REF_ID = "20be6c20-adeb-4b5b-a7ba-0769820df4fb"
 TNM_REF_ID = "27494cb5-ba9e-437f-a114-4e7a7686bcca"
 
+# (connect, read) seconds per endpoint. Connecting is fast or hopeless;
+# reads allow for PayChangu talking to the card network / mobile operator.
+TIMEOUTS = {
+    "verify": (3.05, 10),
+    "mobile_initialize": (3.05, 20),
+    "card_initialize": (3.05, 25),
+    "payout": (3.05, 20),
+}
+
+POOL_MAXSIZE = 20
+MAX_RETRIES = 3
+RETRY_STATUSES = (429, 502, 503, 504)
+BACKOFF_MAX = 2
+
+
+def backoff_delay(attempt, factor):
+    """Exponential backoff with jitter, as urllib3's Retry computes it."""
+    if not factor:
+        return 0
+    return min(BACKOFF_MAX, factor * 2 ** attempt) + random.uniform(0, factor)
+
+
+def _headers(secret_key):
+    return {"accept": "application/json", "Authorization": f"Bearer {secret_key}"}
+
+
 # ----------------------------
-# Verification Function
+# Instrumentation and circuit breakers (shared by both clients)
 # ----------------------------
-def verify_paychangu_payment(charge_id, payment_type="card"):
-    headers = {
-        "accept": "application/json",
-        "Authorization": f"Bearer {SEC_KEY}",
-    }
+ENDPOINTS = tuple(TIMEOUTS)
+OUTCOMES = ("success", "client_error", "server_error", "transport_error", "rejected")
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+UNAVAILABLE = "PayChangu is temporarily unavailable, please try again in {}s."
+
+BREAKERS = {endpoint: CircuitBreaker(f"paychangu:{endpoint}") for endpoint in ENDPOINTS}
+
+REQUEST_SECONDS = metrics.Histogram(
+    "paychangu_request_duration_seconds", "PayChangu API call latency, retries included.",
+    LATENCY_BUCKETS, labels={"endpoint": ENDPOINTS},
+)
+REQUESTS = metrics.Counter(
+    "paychangu_requests_total", "PayChangu API calls by outcome; rejected = short-circuited by the breaker.",
+    labels={"endpoint": ENDPOINTS, "outcome": OUTCOMES},
+)
+metrics.Gauge(
+    "paychangu_circuit_state", "Circuit breaker state: 0 closed, 1 open, 2 half-open.",
+    lambda label_sets: breaker_states([BREAKERS[labels["endpoint"]] for labels in label_sets]),
+    labels={"endpoint": ENDPOINTS},
+)
 
-    if payment_type == "card":
-        url = f"https://api.paychangu.com/charge-card/verify/{charge_id}"
-    else:
-        url = f"https://api.paychangu.com/mobile-money/payments/{charge_id}/verify"
 
+def _outcome(status_code):
+    if status_code is None:
+        return "transport_error"
+    if status_code == 429 or status_code >= 500:
+        return "server_error"
+    if status_code >= 400:
+        return "client_error"
+    return "success"
+
+
+def _admit(endpoint):
     try:
-        response = requests.get(url, headers=headers, timeout=30)
-        return response.json()
-    except Exception as e:
-        return {"status": "error", "message": str(e)}
+        return BREAKERS[endpoint].before_call()
+    except CircuitOpen:
+        REQUESTS.inc(endpoint=endpoint, outcome="rejected")
+        raise
+
+
+def _record(endpoint, started, status_code=None, clean=False):
+    """
+    Account for a finished call; ``status_code`` is None when no response
+    arrived and ``clean`` is what _admit() returned.
+    """
+    outcome = _outcome(status_code)
+    REQUEST_SECONDS.observe(time.perf_counter() - started, endpoint=endpoint)
+    REQUESTS.inc(endpoint=endpoint, outcome=outcome)
+    # 4xx means PayChangu is up and said no; only outages count against it.
+    if outcome in ("server_error", "transport_error"):
+        BREAKERS[endpoint].record_failure()
+    else:
+        BREAKERS[endpoint].record_success(clean)
+
+
+def _unavailable(error, initialize=False):
+    message = UNAVAILABLE.format(error.retry_after)
+    if initialize:
+        reply = {"init_status": "failed", "init_message": message}
+    else:
+        reply = {"status": "error", "message": message}
+    reply.update(unavailable=True, retry_after=error.retry_after)
+    return reply
+
 
 # ----------------------------
-# Mobile Money Payment Initialization
+# Requests and replies (shared by both clients)
 # ----------------------------
-def mobile_initialize_payment(mobile: str, operator: str, amount: float, email: str):
+def _verify_path(charge_id, payment_type):
+    if payment_type == "card":
+        return f"/charge-card/verify/{charge_id}"
+    return f"/mobile-money/payments/{charge_id}/verify"
+
+
+def _mobile_payload(mobile, operator, amount, email):
+    """Request body for a mobile money charge, or None for an unknown operator."""
     operator = operator.lower()
     if operator == "airtel money":
         ref_id = AIRTEL_REF_ID
     elif operator == "tnm mpamba":
         ref_id = TNM_REF_ID
     else:
-        return {"init_status": "failed", "init_message": "Invalid operator selected"}
+        return None
 
-    charge_id = str(uuid.uuid4())
-    payload = {
-        "charge_id": charge_id,
+    return {
+        "charge_id": str(uuid.uuid4()),
         "mobile": mobile,
         "mobile_money_operator_ref_id": ref_id,
         "amount": amount,
@@ -53,46 +172,27 @@ def mobile_initialize_payment(mobile: str, operator: str, amount: float, email:
         "metadata": {"platform": "ikpixels"},
     }
 
-    headers = {
-        "accept": "application/json",
-        "content-type": "application/json",
-        "Authorization": f"Bearer {SEC_KEY}",
-    }
-
-    try:
-        response = requests.post(
-            "https://api.paychangu.com/mobile-money/payments/initialize",
-            json=payload,
-            headers=headers,
-            timeout=30
-        )
-        results = response.json()
-
-        if results.get("status") != "success":
-            return {
-                "init_status": "failed",
-                "init_message": results.get("message", "Payment initialization failed"),
-            }
 
-        data = results["data"]
+def _mobile_result(results, mobile):
+    if results.get("status") != "success":
         return {
-            "init_status": "success",
-            "charge_id": data["charge_id"],
-            "amount": data.get("amount"),
-            "mobile": mobile,
-            "operator": data.get("mobile_money", {}).get("name"),
-            "message": results.get("message", "Payment initialized successfully")
+            "init_status": "failed",
+            "init_message": results.get("message", "Payment initialization failed"),
         }
 
-    except Exception as e:
-        return {"init_status": "failed", "init_message": str(e)}
+    data = results["data"]
+    return {
+        "init_status": "success",
+        "charge_id": data["charge_id"],
+        "amount": data.get("amount"),
+        "mobile": mobile,
+        "operator": data.get("mobile_money", {}).get("name"),
+        "message": results.get("message", "Payment initialized successfully")
+    }
 
-# ----------------------------
-# Card Payment Initialization
-# ----------------------------
-def card_initialize_payment(card_number, expiry, cvv, cardholder_name, amount, currency, email, redirect_url):
-    charge_id = f"charge_{uuid.uuid4()}"
-    payload = {
+
+def _card_payload(card_number, expiry, cvv, cardholder_name, amount, currency, email, redirect_url):
+    return {
         "card_number": card_number,
         "expiry": expiry,
         "cvv": cvv,
@@ -100,72 +200,355 @@ def card_initialize_payment(card_number, expiry, cvv, cardholder_name, amount, c
         "amount": str(amount),
         "currency": currency,
         "email": email,
-        "charge_id": charge_id,
+        "charge_id": f"charge_{uuid.uuid4()}",
         "redirect_url": redirect_url,
     }
 
-    headers = {
-        "accept": "application/json",
-        "content-type": "application/json",
-        "Authorization": f"Bearer {SEC_KEY}",
-    }
-
-    try:
-        response = requests.post(
-            "https://api.paychangu.com/charge-card/payments",
-            json=payload,
-            headers=headers,
-            timeout=30
-        )
-        result = response.json()
-
-        if result.get("status") != "success":
-            return {
-                "init_status": "failed",
-                "init_message": result.get("message", "Card payment initialization failed"),
-            }
 
-        data = result.get("data", {})
+def _card_result(result, payload, amount):
+    if result.get("status") != "success":
         return {
-            "init_status": "success",
-            "charge_id": charge_id,
-            "amount": amount,
-            "email": email,
-            "cardholder_name": cardholder_name,
-            "message": result.get("message", "Card payment initialized successfully"),
-            "redirect_url": redirect_url
+            "init_status": "failed",
+            "init_message": result.get("message", "Card payment initialization failed"),
         }
 
-    except Exception as e:
-        return {"init_status": "failed", "init_message": str(e)}
-
-# ---------------------------------------------------------------------
-# 💸 Payout / Withdraw to Mobile
-# ---------------------------------------------------------------------
-def process_withdrawal(operator_ref_id, phone_number, amount):
-    """Send money to mobile user via PayChangu."""
-    headers = {
-        "accept": "application/json",
-        "content-type": "application/json",
-        "Authorization": f"Bearer {SEC_KEY}",
+    return {
+        "init_status": "success",
+        "charge_id": payload["charge_id"],
+        "amount": amount,
+        "email": payload["email"],
+        "cardholder_name": payload["cardholder_name"],
+        "message": result.get("message", "Card payment initialized successfully"),
+        "redirect_url": payload["redirect_url"]
     }
 
-    charge_id = str(uuid.uuid4())
-    payload = {
+
+def _payout_payload(operator_ref_id, phone_number, amount, charge_id=None):
+    return {
         "amount": float(amount),
         "mobile": phone_number,
         "mobile_money_operator_ref_id": operator_ref_id,
         "currency": "MWK",
-        "charge_id": charge_id,
+        "charge_id": charge_id or str(uuid.uuid4()),
     }
 
-    try:
-        response = requests.post(
-            "https://api.paychangu.com/mobile-money/payouts/initialize",
-            json=payload,
-            headers=headers,
-            timeout=30
+
+def answered(reply):
+    """
+    True if PayChangu answered ``reply`` with a 2xx. Only such a body says
+    what happened to the charge: a 429, 5xx or other error may come from a
+    proxy or an overloaded API that has still taken, or will still take,
+    the request.
+    """
+    return 200 <= reply.get("http_status", 0) < 300
+
+
+def _reply(response):
+    reply = response.json()
+    reply["http_status"] = response.status_code
+    return reply
+
+
+INVALID_OPERATOR = {"init_status": "failed", "init_message": "Invalid operator selected"}
+
+
+class PayChanguClient:
+    def __init__(self, secret_key=SEC_KEY, base_url=None, timeouts=None,
+                 pool_maxsize=POOL_MAXSIZE, max_retries=MAX_RETRIES, backoff_factor=0.25):
+        self.secret_key = secret_key
+        self.base_url = (base_url or settings.PAYCHANGU_BASE_URL).rstrip("/")
+        self.timeouts = {**TIMEOUTS, **(timeouts or {})}
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._lock = threading.Lock()
+        self._session = None
+        self._pid = None
+
+    # ----------------------------
+    # Transport
+    # ----------------------------
+    @property
+    def session(self):
+        # A forked worker must not share the parent's sockets.
+        if self._session is None or self._pid != os.getpid():
+            with self._lock:
+                if self._session is None or self._pid != os.getpid():
+                    self._session = self._build_session()
+                    self._pid = os.getpid()
+        return self._session
+
+    def _build_session(self):
+        retry = Retry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=self.max_retries,
+            status=self.max_retries,
+            allowed_methods=frozenset({"GET"}),  # read/status retries only for idempotent calls
+            status_forcelist=RETRY_STATUSES,
+            backoff_factor=self.backoff_factor,
+            backoff_jitter=self.backoff_factor,
+            backoff_max=BACKOFF_MAX,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(_headers(self.secret_key))
+        return session
+
+    def request(self, endpoint, method, path, **kwargs):
+        """Send a request for ``endpoint`` and return the decoded JSON body, plus ``http_status``."""
+        clean = _admit(endpoint)
+        kwargs.setdefault("timeout", self.timeouts[endpoint])
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, self.base_url + path, **kwargs)
+        except requests.RequestException:
+            _record(endpoint, started)
+            raise
+        _record(endpoint, started, response.status_code, clean)
+        return _reply(response)
+
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+
+    # ----------------------------
+    # API
+    # ----------------------------
+    def verify_payment(self, charge_id, payment_type="card"):
+        try:
+            return self.request("verify", "GET", _verify_path(charge_id, payment_type))
+        except CircuitOpen as e:
+            return _unavailable(e)
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+    def mobile_initialize_payment(self, mobile, operator, amount, email):
+        payload = _mobile_payload(mobile, operator, amount, email)
+        if payload is None:
+            return dict(INVALID_OPERATOR)
+        try:
+            results = self.request("mobile_initialize", "POST", "/mobile-money/payments/initialize", json=payload)
+            return _mobile_result(results, mobile)
+        except CircuitOpen as e:
+            return _unavailable(e, initialize=True)
+        except Exception as e:
+            return {"init_status": "failed", "init_message": str(e)}
+
+    def card_initialize_payment(self, card_number, expiry, cvv, cardholder_name, amount, currency, email,
+                                redirect_url):
+        payload = _card_payload(card_number, expiry, cvv, cardholder_name, amount, currency, email, redirect_url)
+        try:
+            result = self.request("card_initialize", "POST", "/charge-card/payments", json=payload)
+            return _card_result(result, payload, amount)
+        except CircuitOpen as e:
+            return _unavailable(e, initialize=True)
+        except Exception as e:
+            return {"init_status": "failed", "init_message": str(e)}
+
+    def process_withdrawal(self, operator_ref_id, phone_number, amount, charge_id=None):
+        """Send money to mobile user via PayChangu. Resending a ``charge_id`` cannot pay twice."""
+        payload = _payout_payload(operator_ref_id, phone_number, amount, charge_id)
+        try:
+            return self.request("payout", "POST", "/mobile-money/payouts/initialize", json=payload)
+        except CircuitOpen as e:
+            return _unavailable(e)
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+
+class AsyncPayChanguClient:
+    def __init__(self, secret_key=SEC_KEY, base_url=None, timeouts=None,
+                 pool_maxsize=POOL_MAXSIZE, max_retries=MAX_RETRIES, backoff_factor=0.25):
+        self.secret_key = secret_key
+        self.base_url = (base_url or settings.PAYCHANGU_BASE_URL).rstrip("/")
+        self.timeouts = {**TIMEOUTS, **(timeouts or {})}
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        # httpx connections belong to the loop that opened them. Under an
+        # ASGI server (the Procfile's) that is one loop per process; a WSGI
+        # server running an async view gets a fresh loop, and so a fresh
+        # pool and TLS handshake, per request.
+        self._clients = weakref.WeakKeyDictionary()
+
+    # ----------------------------
+    # Transport
+    # ----------------------------
+    @property
+    def http(self):
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = self._build_http()
+        return client
+
+    def _build_http(self):
+        # The transport retries only failed connects, which is safe for POSTs too.
+        transport = httpx.AsyncHTTPTransport(
+            retries=self.max_retries,
+            limits=httpx.Limits(max_connections=self.pool_maxsize, max_keepalive_connections=self.pool_maxsize),
         )
-        return response.json()
-    except Exception as e:
-        return {"status": "error", "message": str(e)}
+        return httpx.AsyncClient(base_url=self.base_url, headers=_headers(self.secret_key), transport=transport)
+
+    async def request(self, endpoint, method, path, **kwargs):
+        """Send a request for ``endpoint`` and return the decoded JSON body, plus ``http_status``."""
+        # The breaker reads and writes the database: keep that off the loop.
+        clean = await sync_to_async(_admit)(endpoint)
+        connect, read = self.timeouts[endpoint]
+        kwargs.setdefault("timeout", httpx.Timeout(read, connect=connect))
+        started = time.perf_counter()
+        try:
+            response = await self._send(method, path, **kwargs)
+        except httpx.HTTPError:
+            await sync_to_async(_record)(endpoint, started)
+            raise
+        await sync_to_async(_record)(endpoint, started, response.status_code, clean)
+        return _reply(response)
+
+    async def _send(self, method, path, **kwargs):
+        attempts = 1 + (self.max_retries if method == "GET" else 0)
+        for attempt in range(attempts):
+            last = attempt + 1 == attempts
+            try:
+                response = await self.http.request(method, path, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                raise  # already retried by the transport
+            except httpx.TransportError:
+                if last:
+                    raise
+            else:
+                if last or response.status_code not in RETRY_STATUSES:
+                    return response
+            await asyncio.sleep(backoff_delay(attempt, self.backoff_factor))
+
+    async def aclose(self):
+        loop = asyncio.get_running_loop()
+        client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    # ----------------------------
+    # API
+    # ----------------------------
+    async def verify_payment(self, charge_id, payment_type="card"):
+        try:
+            return await self.request("verify", "GET", _verify_path(charge_id, payment_type))
+        except CircuitOpen as e:
+            return _unavailable(e)
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+    async def mobile_initialize_payment(self, mobile, operator, amount, email):
+        payload = _mobile_payload(mobile, operator, amount, email)
+        if payload is None:
+            return dict(INVALID_OPERATOR)
+        try:
+            results = await self.request(
+                "mobile_initialize", "POST", "/mobile-money/payments/initialize", json=payload
+            )
+            return _mobile_result(results, mobile)
+        except CircuitOpen as e:
+            return _unavailable(e, initialize=True)
+        except Exception as e:
+            return {"init_status": "failed", "init_message": str(e)}
+
+    async def card_initialize_payment(self, card_number, expiry, cvv, cardholder_name, amount, currency, email,
+                                      redirect_url):
+        payload = _card_payload(card_number, expiry, cvv, cardholder_name, amount, currency, email, redirect_url)
+        try:
+            result = await self.request("card_initialize", "POST", "/charge-card/payments", json=payload)
+            return _card_result(result, payload, amount)
+        except CircuitOpen as e:
+            return _unavailable(e, initialize=True)
+        except Exception as e:
+            return {"init_status": "failed", "init_message": str(e)}
+
+    async def process_withdrawal(self, operator_ref_id, phone_number, amount, charge_id=None):
+        """Send money to mobile user via PayChangu. Resending a ``charge_id`` cannot pay twice."""
+        payload = _payout_payload(operator_ref_id, phone_number, amount, charge_id)
+        try:
+            return await self.request("payout", "POST", "/mobile-money/payouts/initialize", json=payload)
+        except CircuitOpen as e:
+            return _unavailable(e)
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+
+_client = None
+_async_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """The process-wide client (created on first use)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = PayChanguClient()
+    return _client
+
+
+def get_async_client():
+    global _async_client
+    if _async_client is None:
+        with _client_lock:
+            if _async_client is None:
+                _async_client = AsyncPayChanguClient()
+    return _async_client
+
+
+def reset_clients():
+    """Drop the shared clients, e.g. after changing PAYCHANGU_BASE_URL."""
+    global _client, _async_client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = _async_client = None
+
+
+# ----------------------------
+# Module-level interface
+# ----------------------------
+def verify_paychangu_payment(charge_id, payment_type="card"):
+    return get_client().verify_payment(charge_id, payment_type)
+
+
+def mobile_initialize_payment(mobile: str, operator: str, amount: float, email: str):
+    return get_client().mobile_initialize_payment(mobile, operator, amount, email)
+
+
+def card_initialize_payment(card_number, expiry, cvv, cardholder_name, amount, currency, email, redirect_url):
+    return get_client().card_initialize_payment(
+        card_number, expiry, cvv, cardholder_name, amount, currency, email, redirect_url
+    )
+
+
+def process_withdrawal(operator_ref_id, phone_number, amount, charge_id=None):
+    """Send money to mobile user via PayChangu."""
+    return get_client().process_withdrawal(operator_ref_id, phone_number, amount, charge_id)
+
+
+async def averify_paychangu_payment(charge_id, payment_type="card"):
+    return await get_async_client().verify_payment(charge_id, payment_type)
+
+
+async def amobile_initialize_payment(mobile: str, operator: str, amount: float, email: str):
+    return await get_async_client().mobile_initialize_payment(mobile, operator, amount, email)
+
+
+async def acard_initialize_payment(card_number, expiry, cvv, cardholder_name, amount, currency, email,
+                                   redirect_url):
+    return await get_async_client().card_initialize_payment(
+        card_number, expiry, cvv, cardholder_name, amount, currency, email, redirect_url
+    )
+
+
+async def aprocess_withdrawal(operator_ref_id, phone_number, amount, charge_id=None):
+    return await get_async_client().process_withdrawal(operator_ref_id, phone_number, amount, charge_id)
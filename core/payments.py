@@ -0,0 +1,145 @@
+# payments.py
+"""
+PaymentAttempt state transitions and PayChangu webhook checks.
+
+An attempt leaves ``pending`` exactly once. The transition is a conditional
+UPDATE on ``status='pending'`` inside the same transaction that settles the
+order, so a webhook, a browser-driven verify and the reconciler racing on
+the same attempt mark the order paid (and the items sold) only once.
+"""
+import hashlib
+import hmac
+import logging
+from collections import defaultdict
+from functools import partial
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Case, F, Value, When
+from django.utils import timezone
+
+from . import caching
+from .notifier import notifier
+from .models import Order, OrderItem, PaymentAttempt, Product
+from .paychangu import answered
+
+logger = logging.getLogger(__name__)
+
+SETTLED = ("success", "failed")
+WEBHOOK_FAILED = ("failed", "cancelled", "canceled", "expired")
+
+
+def verified_status(result):
+    """Attempt status implied by a PayChangu verify reply; None if it is unknown."""
+    if not answered(result):
+        return None  # transport failure or upstream error: the charge may still go through
+    if result.get("status") != "success":
+        return "failed"
+    # The call succeeded; the charge itself may still be awaiting the customer.
+    charge = str((result.get("data") or {}).get("status", "success")).lower()
+    if charge == "success":
+        return "success"
+    if charge in WEBHOOK_FAILED:
+        return "failed"
+    return None
+
+
+def webhook_status(payload):
+    """Attempt status announced by a webhook; None for non-final events."""
+    status = str(payload.get("status", "")).lower()
+    if status == "success":
+        return "success"
+    if status in WEBHOOK_FAILED:
+        return "failed"
+    return None
+
+
+def settle(attempt, status, raw_response):
+    """
+    Move ``attempt`` from pending to ``status``. Returns True if this call
+    made the transition, False if something else already had.
+
+    On success the order is marked paid and every product's sold_count is
+    raised by its quantity in a single UPDATE, so settling costs the same
+    handful of queries whatever the order size.
+    """
+    with transaction.atomic():
+        updated = PaymentAttempt.objects.filter(pk=attempt.pk, status="pending").update(
+            status=status, raw_response=raw_response
+        )
+        if not updated:
+            return False
+        attempt.status, attempt.raw_response = status, raw_response
+        transaction.on_commit(partial(notifier.publish, attempt.tx_ref))
+
+        if status == "success" and attempt.order_id:
+            # Another attempt on the same order (a retry with a new tx_ref)
+            # may have paid it already; its items are sold only once.
+            if Order.objects.filter(pk=attempt.order_id, paid=False).update(paid=True, total=attempt.amount):
+                mark_products_sold(OrderItem.objects.filter(order_id=attempt.order_id))
+    return True
+
+
+def mark_products_sold(items):
+    """``sold_count += qty`` (and booked) for every product in ``items``, in one UPDATE."""
+    quantities = defaultdict(int)
+    for product_id, qty in items.values_list("product_id", "qty"):
+        quantities[product_id] += qty
+    if not quantities:
+        return
+
+    Product.objects.filter(pk__in=quantities).update(
+        sold_count=F("sold_count") + Case(
+            *(When(pk=pk, then=Value(qty)) for pk, qty in quantities.items()),
+            output_field=models.PositiveIntegerField(),
+        ),
+        booked=True,
+        updated_at=timezone.now(),  # product pages revalidate on updated_at
+    )
+    # .update() sends no post_save, so invalidate the listings here.
+    transaction.on_commit(caching.bump_catalog_version)
+
+
+def settle_many(outcomes):
+    """
+    Apply ``(attempt, status, raw_response)`` transitions in one transaction:
+    all failures as a single UPDATE, successes through settle(). Returns the
+    number of attempts this call moved out of pending.
+    """
+    failed = [(attempt, raw) for attempt, status, raw in outcomes if status == "failed"]
+    succeeded = [(attempt, raw) for attempt, status, raw in outcomes if status == "success"]
+    applied = 0
+
+    with transaction.atomic():
+        if failed:
+            applied += PaymentAttempt.objects.filter(
+                pk__in=[attempt.pk for attempt, _ in failed], status="pending"
+            ).update(
+                status="failed",
+                raw_response=Case(
+                    *(When(pk=attempt.pk, then=Value(raw, output_field=models.JSONField())) for attempt, raw in failed),
+                    default=F("raw_response"),
+                ),
+            )
+            # Attempts settled meanwhile are republished too; listeners re-read the row.
+            for attempt, _ in failed:
+                transaction.on_commit(partial(notifier.publish, attempt.tx_ref))
+        for attempt, raw in succeeded:
+            applied += settle(attempt, "success", raw)
+    return applied
+
+
+# ----------------------------
+# Webhooks
+# ----------------------------
+def webhook_signature(body, secret=None):
+    """Hex HMAC-SHA256 of the raw request body, as PayChangu signs it."""
+    secret = settings.PAYCHANGU_WEBHOOK_SECRET if secret is None else secret
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def valid_signature(body, signature):
+    if not settings.PAYCHANGU_WEBHOOK_SECRET:
+        logger.warning("PAYCHANGU_WEBHOOK_SECRET is not set; rejecting webhook")
+        return False
+    return hmac.compare_digest(webhook_signature(body), signature or "")
@@ -0,0 +1,182 @@
+# payouts.py
+"""
+Batch payout engine for WithdrawalRequests.
+
+Staff queue withdrawals from the admin (pending -> queued). The engine
+claims queued rows oldest first in batches with one conditional UPDATE
+(queued -> processing, stamped with a per-batch worker token), so two
+engines running at once can never claim the same row and never pay
+twice. The claimed batch is sent to PayChangu concurrently through the
+async client, bounded by a semaphore and a requests-per-second cap, and
+the results are written back with one bulk_update per batch.
+
+Each payout's charge_id is derived from the withdrawal's pk, so even a
+resend after a crash is recognised by PayChangu as the same payout. A
+payout whose outcome is unknown (the request went out but no answer, or
+only a non-2xx one, came back) stays ``processing`` for a human to check,
+rather than being sent again. Run it with ``manage.py process_payouts``.
+"""
+import asyncio
+import os
+import socket
+import time
+import uuid
+
+from asgiref.sync import sync_to_async
+from django.db import connections
+from django.utils import timezone
+
+from .models import WithdrawalRequest
+from .paychangu import AIRTEL_REF_ID, TNM_REF_ID, AsyncPayChanguClient, answered
+from .reconcile import RateLimiter
+
+OPERATORS = {"airtel": AIRTEL_REF_ID, "mpamba": TNM_REF_ID}
+
+
+def enqueue(queryset):
+    """Queue the pending mobile money withdrawals in ``queryset``; returns how many."""
+    return queryset.filter(status="pending", method__in=OPERATORS).update(status="queued")
+
+
+def payout_ref(withdrawal):
+    return f"ikpixels-payout-{withdrawal.pk}"
+
+
+def worker_token():
+    return f"{socket.gethostname()[:40]}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def claim_batch(size, token):
+    """
+    Claim up to ``size`` queued withdrawals for ``token``. Returns
+    (found, claimed): whether any were queued, and the rows this worker
+    now owns (fewer than found if another worker got there first).
+    """
+    ids = list(
+        WithdrawalRequest.objects.filter(status="queued")
+        .order_by("created_at", "pk")
+        .values_list("pk", flat=True)[:size]
+    )
+    if not ids:
+        return False, []
+    WithdrawalRequest.objects.filter(pk__in=ids, status="queued").update(
+        status="processing", claimed_by=token, claimed_at=timezone.now(),
+    )
+    claimed = WithdrawalRequest.objects.filter(pk__in=ids, status="processing", claimed_by=token)
+    return True, list(claimed.order_by("created_at", "pk"))
+
+
+def payout_status(result):
+    """New status for a withdrawal after a payout reply; None if the outcome is unknown."""
+    if result.get("unavailable"):
+        return "queued"  # the circuit breaker stopped it before it was sent
+    if not answered(result):
+        return None  # no answer, or an upstream error: PayChangu may still have paid it
+    if result.get("status") == "success":
+        return "processed"
+    return "failed"
+
+
+def record_results(outcomes):
+    """Write back [(withdrawal, status, result)] with one bulk UPDATE."""
+    now = timezone.now()
+    for withdrawal, status, result in outcomes:
+        withdrawal.raw_response = result
+        if status is None:
+            continue  # leave it processing for review
+        withdrawal.status = status
+        if status == "queued":
+            withdrawal.claimed_by, withdrawal.claimed_at = "", None
+        else:
+            withdrawal.processed_at = now
+    WithdrawalRequest.objects.bulk_update(
+        [withdrawal for withdrawal, _, _ in outcomes],
+        ["status", "raw_response", "claimed_by", "claimed_at", "processed_at"],
+    )
+
+
+class PayoutReport:
+    def __init__(self, number, outcomes, elapsed, latencies):
+        self.number = number
+        self.claimed = len(outcomes)
+        self.processed = sum(status == "processed" for _, status, _ in outcomes)
+        self.failed = sum(status == "failed" for _, status, _ in outcomes)
+        self.requeued = sum(status == "queued" for _, status, _ in outcomes)
+        self.unknown = sum(status is None for _, status, _ in outcomes)
+        self.elapsed = elapsed
+        self.latencies = latencies
+
+    @property
+    def throughput(self):
+        return self.claimed / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        return (
+            f"batch {self.number}: {self.claimed} claimed, {self.processed} processed, {self.failed} failed, "
+            f"{self.requeued} requeued, {self.unknown} unknown | {self.throughput:.1f}/s"
+        )
+
+
+class PayoutEngine:
+    def __init__(self, client=None, batch_size=50, concurrency=5, rate=10):
+        self.client = client or AsyncPayChanguClient()
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.rate = rate
+
+    async def pay_all(self, withdrawals):
+        """[(withdrawal, result, seconds)] for every withdrawal, at most ``concurrency`` in flight."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limiter = RateLimiter(self.rate)
+
+        async def pay(withdrawal):
+            async with semaphore:
+                await limiter.wait()
+                started = time.perf_counter()
+                result = await self.client.process_withdrawal(
+                    OPERATORS[withdrawal.method], withdrawal.account_info, withdrawal.amount,
+                    charge_id=payout_ref(withdrawal),
+                )
+                return withdrawal, result, time.perf_counter() - started
+
+        return await asyncio.gather(*(pay(withdrawal) for withdrawal in withdrawals))
+
+    async def run(self, report=print):
+        """Pay out everything queued. Returns the batch reports."""
+        reports = []
+        try:
+            while True:
+                found, batch = await sync_to_async(claim_batch)(self.batch_size, worker_token())
+                if not found:
+                    break
+                if not batch:
+                    continue  # another worker took this batch; try the next one
+
+                started = time.perf_counter()
+                paid = await self.pay_all(batch)
+                outcomes = [(withdrawal, payout_status(result), result) for withdrawal, result, _ in paid]
+                await sync_to_async(record_results)(outcomes)
+
+                batch_report = PayoutReport(len(reports) + 1, outcomes, time.perf_counter() - started,
+                                            [seconds for _, _, seconds in paid])
+                reports.append(batch_report)
+                report(str(batch_report))
+                if batch_report.requeued:
+                    break  # PayChangu is unavailable; the requeued rows wait for the next run
+        finally:
+            await self.client.aclose()
+            await sync_to_async(connections.close_all)()
+        return reports
+
+
+def summary(reports, elapsed):
+    claimed = sum(r.claimed for r in reports)
+    return {
+        "batches": len(reports),
+        "claimed": claimed,
+        "processed": sum(r.processed for r in reports),
+        "failed": sum(r.failed for r in reports),
+        "requeued": sum(r.requeued for r in reports),
+        "unknown": sum(r.unknown for r in reports),
+        "throughput": claimed / elapsed if elapsed else 0.0,
+    }
@@ -0,0 +1,79 @@
+# placeholders.py
+"""
+Low-quality image placeholders for Product and Gallery media.
+
+For every upload we store, next to the Cloudinary reference, a tiny JPEG
+as a data URI, the dominant colour and the intrinsic width/height. Pages
+paint the placeholder (and reserve the right box) before the real image
+arrives. New uploads are processed from the uploaded file in a pre_save
+signal; existing rows are filled by the backfill_placeholders command.
+"""
+import base64
+import io
+
+import requests
+from PIL import ExifTags, Image, ImageOps
+
+from .media import media_url, stored_value
+
+# Longest side of the embedded thumbnail; ~300-600 bytes as base64 JPEG.
+THUMBNAIL_SIZE = 16
+JPEG_QUALITY = 40
+DOWNLOAD_TIMEOUT = (5, 30)
+
+EMPTY = {"placeholder": "", "dominant_color": "", "image_width": None, "image_height": None}
+
+
+def compute(fp):
+    """Placeholder fields for the image in file object ``fp``."""
+    with Image.open(fp) as img:
+        width, height = img.size
+        if img.getexif().get(ExifTags.Base.Orientation, 1) in (5, 6, 7, 8):
+            width, height = height, width  # stored rotated by 90 degrees
+        # JPEG can decode at 1/2, 1/4 or 1/8 scale, which is all we need.
+        img.draft("RGB", (THUMBNAIL_SIZE * 8, THUMBNAIL_SIZE * 8))
+        thumb = ImageOps.exif_transpose(img).convert("RGB")
+        thumb.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE), Image.Resampling.LANCZOS)
+
+    buffer = io.BytesIO()
+    thumb.save(buffer, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+    data_uri = "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+    return {
+        "placeholder": data_uri,
+        "dominant_color": dominant_color(thumb),
+        "image_width": width,
+        "image_height": height,
+    }
+
+
+def dominant_color(img):
+    """Most common colour of a small RGB image as ``#rrggbb``."""
+    paletted = img.quantize(colors=5, method=Image.Quantize.MEDIANCUT)
+    palette = paletted.getpalette()
+    _, index = max(paletted.getcolors())
+    r, g, b = palette[index * 3: index * 3 + 3]
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def compute_from_upload(uploaded):
+    """Placeholder fields for an UploadedFile, leaving it rewound for the upload."""
+    try:
+        uploaded.seek(0)
+        return compute(uploaded)
+    except (OSError, Image.DecompressionBombError):
+        return dict(EMPTY)
+    finally:
+        uploaded.seek(0)
+
+
+def compute_from_cloudinary(value, session=None):
+    """Download the original of a stored Cloudinary value and compute its fields."""
+    response = (session or requests).get(media_url(stored_value(value)), timeout=DOWNLOAD_TIMEOUT)
+    response.raise_for_status()
+    return compute(io.BytesIO(response.content))
+
+
+def apply(instance, fields):
+    for name, value in fields.items():
+        setattr(instance, name, value)
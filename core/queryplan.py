@@ -0,0 +1,47 @@
+# queryplan.py
+"""
+EXPLAIN QUERY PLAN checks for SQLite.
+
+full_scans() runs a statement's plan and returns the steps that read a
+whole table: ``SCAN <table>`` with no index. Two kinds of scan are not
+reported. Scans through an index are allowed, because with a LIMIT they
+stop early and a COUNT(*) has to read every entry anyway. A bare rowid
+scan is also allowed when the statement has a LIMIT, no WHERE clause
+and no temporary sort, since it stops after the first rows.
+CaptureQueriesContext gives the statements with their parameters
+inlined, which is the form explain() expects.
+"""
+import re
+
+from django.db import connection as default_connection
+
+EXPLAINABLE = ("SELECT", "UPDATE", "DELETE", "WITH")
+SCAN = re.compile(r"^SCAN (?P<table>\w+)(?P<rest>.*)$")
+
+
+def explain(sql, connection=None):
+    """The plan's detail lines for ``sql``, e.g. ``SEARCH core_order USING INDEX ...``."""
+    connection = connection or default_connection
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def bounded(sql, plan):
+    upper = sql.upper()
+    return " LIMIT " in upper and " WHERE " not in upper and not any("TEMP B-TREE" in step for step in plan)
+
+
+def full_scans(sql, connection=None):
+    """Plan steps of ``sql`` that scan a table without an index ([] if none, or not a query)."""
+    if not sql.lstrip().upper().startswith(EXPLAINABLE):
+        return []
+    plan = explain(sql, connection)
+    scans = []
+    for step in plan:
+        match = SCAN.match(step)
+        if not match or match["table"] == "CONSTANT" or "INDEX" in match["rest"]:
+            continue  # a SEARCH, an index scan, a virtual table (FTS5) or SCAN CONSTANT ROW
+        if not bounded(sql, plan):
+            scans.append(step)
+    return scans
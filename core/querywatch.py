@@ -0,0 +1,132 @@
+# querywatch.py
+"""
+Query budgets and repeated-query (N+1) detection.
+
+A view declares the most queries one request to it may run with
+``@query_budget(n)``; the tests request every view in core/urls.py and
+hold it to that (see ViewQueryTests).
+
+A query's shape is its SQL without the parameters (Django passes those
+separately) and with IN (...) lists collapsed, so loading ``item.product``
+for each item of an order is one shape run N times. While a
+QueryRecorder is active, query_watcher (an execute wrapper signals.py
+installs on every connection) notes each statement's shape and the first
+frame of application code that sent it. Like instrumentation.py it finds
+the recorder through a ContextVar, so async views are covered.
+RepeatedQueryMiddleware records every request this way and logs repeated
+shapes and blown budgets; settings.py enables it in development only,
+since walking the stack for each query is slow.
+"""
+import logging
+import re
+import sys
+from collections import defaultdict
+from contextvars import ContextVar
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+current = ContextVar("query_recorder", default=None)
+
+IN_LIST = re.compile(r"IN \((?:%s, )*%s\)")
+PROJECT = str(Path(__file__).resolve().parent.parent)
+SKIP = (str(Path(__file__).resolve()), str(Path(__file__).resolve().parent / "instrumentation.py"))
+
+
+def query_budget(n):
+    """Declare that one request to the decorated view runs at most ``n`` queries."""
+    def decorator(view):
+        view.query_budget = n
+        return view
+    return decorator
+
+
+def shape(sql):
+    return IN_LIST.sub("IN (...)", sql)
+
+
+def call_site():
+    """``path:line in function`` of the innermost project frame outside this module."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(PROJECT) and filename not in SKIP and "site-packages" not in filename:
+            return f"{Path(filename).relative_to(PROJECT)}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+class QueryRecorder:
+    """Context manager collecting the shapes and call sites of the queries run inside it."""
+
+    def __init__(self):
+        self.count = 0
+        self.shapes = defaultdict(list)  # shape -> [call site per execution]
+
+    def __enter__(self):
+        self._token = current.set(self)
+        return self
+
+    def __exit__(self, *exc):
+        current.reset(self._token)
+
+    def record(self, sql):
+        self.count += 1
+        self.shapes[shape(sql)].append(call_site())
+
+    def repeated(self, threshold=None):
+        """[(shape, times, distinct call sites)] for shapes run at least ``threshold`` times."""
+        threshold = threshold or settings.QUERY_REPEAT_THRESHOLD
+        return [
+            (sql, len(sites), sorted(set(sites)))
+            for sql, sites in self.shapes.items() if len(sites) >= threshold
+        ]
+
+    def report(self, threshold=None):
+        return "\n".join(
+            f"{times}x {sql}\n    from {', '.join(sites)}" for sql, times, sites in self.repeated(threshold)
+        )
+
+
+def query_watcher(execute, sql, params, many, context):
+    recorder = current.get()
+    if recorder is not None:
+        recorder.record(sql)
+    return execute(sql, params, many, context)
+
+
+class RepeatedQueryMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        with QueryRecorder() as recorder:
+            response = self.get_response(request)
+        self.check(request, recorder)
+        return response
+
+    async def __acall__(self, request):
+        with QueryRecorder() as recorder:
+            response = await self.get_response(request)
+        self.check(request, recorder)
+        return response
+
+    def check(self, request, recorder):
+        if recorder.repeated():
+            logger.warning("Repeated queries in %s %s:\n%s", request.method, request.path, recorder.report())
+        match = request.resolver_match
+        budget = getattr(match.func, "query_budget", None) if match else None
+        if budget is not None and recorder.count > budget:
+            logger.warning("%s %s ran %d queries; its budget is %d", request.method, request.path,
+                           recorder.count, budget)
@@ -0,0 +1,153 @@
+# reconcile.py
+"""
+Background reconciliation of PaymentAttempts stuck in ``pending``.
+
+If the customer closes the tab and the webhook never arrives, nothing else
+asks PayChangu about the attempt. The reconciler walks pending attempts
+oldest first, in keyset batches, verifies each batch concurrently through
+the async PayChangu client (bounded by a semaphore and a requests-per-second
+cap), and applies the results with payments.settle_many(). Attempts younger
+than PAYCHANGU_VERIFY_AFTER are left alone, since their webhook may still
+be on its way. Run it with ``manage.py reconcile_payments``.
+"""
+import asyncio
+import statistics
+import time
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import PaymentAttempt
+from .paychangu import AsyncPayChanguClient
+from .payments import settle_many, verified_status
+
+
+class RateLimiter:
+    """Spaces call starts at least 1/rate seconds apart."""
+
+    def __init__(self, rate):
+        self.interval = 1 / rate if rate else 0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class BatchReport:
+    def __init__(self, number, checked, outcomes, applied, elapsed, latencies):
+        self.number = number
+        self.checked = checked
+        self.succeeded = sum(status == "success" for _, status, _ in outcomes)
+        self.failed = sum(status == "failed" for _, status, _ in outcomes)
+        self.unknown = checked - len(outcomes)
+        self.applied = applied
+        self.elapsed = elapsed
+        self.latencies = latencies
+
+    @property
+    def throughput(self):
+        return self.checked / self.elapsed if self.elapsed else 0.0
+
+    def latency_ms(self, quantile):
+        if not self.latencies:
+            return 0.0
+        samples = sorted(self.latencies)
+        return samples[min(len(samples) - 1, int(len(samples) * quantile))] * 1000
+
+    def __str__(self):
+        return (
+            f"batch {self.number}: {self.checked} checked, {self.succeeded} success, "
+            f"{self.failed} failed, {self.unknown} unknown, {self.applied} applied | "
+            f"{self.throughput:.1f}/s | upstream p50 {self.latency_ms(0.5):.0f}ms "
+            f"p95 {self.latency_ms(0.95):.0f}ms"
+        )
+
+
+class Reconciler:
+    def __init__(self, client=None, batch_size=200, concurrency=10, rate=20, min_age=None):
+        self.client = client or AsyncPayChanguClient()
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.rate = rate
+        if min_age is None:
+            min_age = settings.PAYCHANGU_VERIFY_AFTER
+        self.min_age = timedelta(seconds=min_age)
+
+    def pending_batch(self, cutoff, after=None):
+        """Next batch of pending attempts created before ``cutoff``, oldest first."""
+        queryset = PaymentAttempt.objects.filter(status="pending", created_at__lte=cutoff)
+        if after is not None:
+            created_at, pk = after
+            queryset = queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, pk__gt=pk))
+        return list(queryset.order_by("created_at", "pk")[: self.batch_size])
+
+    async def verify_all(self, attempts):
+        """[(attempt, result, seconds)] for every attempt, at most ``concurrency`` in flight."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limiter = RateLimiter(self.rate)
+
+        async def verify(attempt):
+            async with semaphore:
+                await limiter.wait()
+                payment_type = "card" if attempt.payment_type == "visa" else "mobile"
+                started = time.perf_counter()
+                result = await self.client.verify_payment(attempt.tx_ref, payment_type)
+                return attempt, result, time.perf_counter() - started
+
+        return await asyncio.gather(*(verify(attempt) for attempt in attempts))
+
+    async def run(self, report=print):
+        """One pass over everything currently due. Returns the batch reports."""
+        cutoff = timezone.now() - self.min_age
+        reports, after = [], None
+        try:
+            while True:
+                attempts = await sync_to_async(self.pending_batch)(cutoff, after)
+                if not attempts:
+                    break
+                after = (attempts[-1].created_at, attempts[-1].pk)
+
+                started = time.perf_counter()
+                verified = await self.verify_all(attempts)
+                outcomes = []
+                for attempt, result, _ in verified:
+                    status = verified_status(result)
+                    if status is not None:
+                        outcomes.append((attempt, status, result))
+                applied = await sync_to_async(settle_many)(outcomes)
+
+                batch = BatchReport(len(reports) + 1, len(attempts), outcomes, applied,
+                                    time.perf_counter() - started, [seconds for _, _, seconds in verified])
+                reports.append(batch)
+                report(str(batch))
+        finally:
+            await self.client.aclose()
+            await sync_to_async(connections.close_all)()
+        return reports
+
+
+def summary(reports, elapsed):
+    checked = sum(r.checked for r in reports)
+    latencies = [seconds for r in reports for seconds in r.latencies]
+    return {
+        "batches": len(reports),
+        "checked": checked,
+        "success": sum(r.succeeded for r in reports),
+        "failed": sum(r.failed for r in reports),
+        "unknown": sum(r.unknown for r in reports),
+        "applied": sum(r.applied for r in reports),
+        "throughput": checked / elapsed if elapsed else 0.0,
+        "upstream_median_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+    }
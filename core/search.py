@@ -0,0 +1,217 @@
+# search.py
+"""
+Full-text search over the Product catalog.
+
+On SQLite the catalog is indexed by an FTS5 external-content table
+(``core_product_fts``) that mirrors title, description, key_features and
+technologies_used. Triggers on ``core_product`` keep it in sync on every
+insert, update and delete, so bulk_create() and queryset.update() are
+covered as well as model.save(). Other database backends fall back to
+icontains filtering.
+"""
+import re
+
+from django.db import connection as default_connection
+from django.db.models import Q
+
+FTS_TABLE = "core_product_fts"
+INDEXED_FIELDS = ("title", "description", "key_features", "technologies_used")
+
+# bm25() column weights, in INDEXED_FIELDS order: a hit in the title
+# outranks one in the technologies list, which outranks the long texts.
+RANK_WEIGHTS = (10.0, 2.0, 3.0, 5.0)
+
+# Longest query we turn into MATCH terms; the rest is ignored.
+MAX_TERMS = 8
+
+# bm25 scores every match before the LIMIT applies, so a common term
+# ("dashboard" hits most of a large catalog) would rank tens of thousands
+# of rows per page. Only the newest RANK_LIMIT matches are ranked.
+RANK_LIMIT = 1000
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+_cols = ", ".join(INDEXED_FIELDS)
+_new_cols = ", ".join(f"new.{f}" for f in INDEXED_FIELDS)
+_old_cols = ", ".join(f"old.{f}" for f in INDEXED_FIELDS)
+_changed = " OR ".join(f"old.{f} IS NOT new.{f}" for f in INDEXED_FIELDS)
+
+CREATE_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        {_cols},
+        content='core_product',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON core_product BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, {_cols}) VALUES (new.id, {_new_cols});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON core_product BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_cols}) VALUES ('delete', old.id, {_old_cols});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON core_product
+    WHEN {_changed} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_cols}) VALUES ('delete', old.id, {_old_cols});
+        INSERT INTO {FTS_TABLE}(rowid, {_cols}) VALUES (new.id, {_new_cols});
+    END
+    """,
+]
+
+DROP_SQL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def is_supported(connection=None):
+    """True when the database can host the FTS5 index."""
+    connection = connection or default_connection
+    if connection.vendor != "sqlite":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        return bool(cursor.fetchone()[0])
+
+
+def is_installed(connection=None):
+    """True when the FTS table exists. Cached on the connection wrapper."""
+    connection = connection or default_connection
+    if connection.vendor != "sqlite":
+        return False
+    installed = getattr(connection, "_core_fts_installed", None)
+    if installed is None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE]
+            )
+            installed = cursor.fetchone() is not None
+        connection._core_fts_installed = installed
+    return installed
+
+
+def install(connection=None):
+    """
+    Create the FTS table and its triggers if they are missing.
+
+    Safe to call repeatedly. Django remakes ``core_product`` (dropping its
+    triggers) for some schema changes on SQLite, so this also runs after
+    every migrate.
+    """
+    connection = connection or default_connection
+    if not is_supported(connection):
+        return False
+    with connection.cursor() as cursor:
+        for sql in CREATE_SQL:
+            cursor.execute(sql)
+        weights = ", ".join(str(w) for w in RANK_WEIGHTS)
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES ('rank', %s)",
+            [f"bm25({weights})"],
+        )
+    connection._core_fts_installed = True
+    return True
+
+
+def uninstall(connection=None):
+    connection = connection or default_connection
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        for sql in DROP_SQL:
+            cursor.execute(sql)
+    connection._core_fts_installed = False
+
+
+def rebuild(connection=None):
+    """Re-read every Product row into the index. Returns the number of rows indexed."""
+    connection = connection or default_connection
+    if not install(connection):
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+        cursor.execute("SELECT COUNT(*) FROM core_product")
+        return cursor.fetchone()[0]
+
+
+def tokenize(query):
+    """Split a user query into lower-cased word tokens."""
+    return [t.lower() for t in _TOKEN_RE.findall(query or "")][:MAX_TERMS]
+
+
+def match_expression(query):
+    """
+    Build an FTS5 MATCH expression from free text.
+
+    Every token must match (implicit AND) and the last one is treated as a
+    prefix so results show up while the user is still typing. Tokens are
+    quoted, so FTS5 operators in user input are never interpreted.
+    """
+    tokens = tokenize(query)
+    if not tokens:
+        return ""
+    terms = [f'"{t}"' for t in tokens]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def search_products(queryset, query):
+    """
+    Restrict a Product queryset to rows matching ``query``, best match first.
+
+    Matching rows get a ``search_rank`` attribute (lower is better). When
+    more than RANK_LIMIT rows of ``queryset`` match, only the newest
+    RANK_LIMIT of them (by id) are returned. A subquery over the same
+    filtered queryset finds the lowest id among those, and FTS5 applies
+    ``rowid >= it`` before ranking. An empty query returns the queryset
+    unchanged.
+    """
+    expression = match_expression(query)
+    if not expression:
+        return queryset
+
+    connection = default_connection
+    if not is_installed(connection):
+        return _fallback_search(queryset, query)
+
+    matches = queryset.extra(
+        tables=[FTS_TABLE],
+        where=[f"{FTS_TABLE}.rowid = core_product.id", f"{FTS_TABLE} MATCH %s"],
+        params=[expression],
+    )
+    newest = matches.extra(order_by=[f"-{FTS_TABLE}.rowid"]).values_list("id", flat=True)[:RANK_LIMIT]
+    newest_sql, newest_params = newest.query.sql_with_params()
+    return matches.extra(
+        select={"search_rank": f"{FTS_TABLE}.rank"},
+        where=[f"{FTS_TABLE}.rowid >= (SELECT COALESCE(MIN(id), 0) FROM ({newest_sql}))"],
+        params=list(newest_params),
+        order_by=["search_rank", "-id"],
+    )
+
+
+def after_rank(queryset, rank, pk):
+    """Rows of a search_products() queryset that sort after (rank, pk)."""
+    return queryset.extra(
+        where=[f"({FTS_TABLE}.rank > %s OR ({FTS_TABLE}.rank = %s AND core_product.id < %s))"],
+        params=[rank, rank, pk],
+    )
+
+
+def _fallback_search(queryset, query):
+    condition = Q()
+    for token in tokenize(query):
+        term = Q()
+        for field in INDEXED_FIELDS:
+            term |= Q(**{f"{field}__icontains": token})
+        condition &= term
+    return queryset.filter(condition).order_by("-created_at", "-id")
@@ -0,0 +1,63 @@
+# serializers.py
+"""
+Lean serializers for JSON listings.
+
+The marketplace feed only needs a handful of columns and the first 100
+characters of the description, so rows are fetched with values() and the
+truncation happens in SQL. Image URLs are built from the raw column value
+(see media.py), together with the responsive thumbnail and srcset the
+grid renders, and the payload is encoded straight to bytes, with orjson
+when it is installed.
+"""
+import json
+
+from django.db.models import CharField, ExpressionWrapper, F
+from django.db.models.functions import Substr
+
+from .media import media_url, sized_url, srcset
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+DESCRIPTION_EXCERPT = 100
+
+# Raw column value, so values() does not build a CloudinaryResource per row.
+_RAW_IMAGE = ExpressionWrapper(F("image"), output_field=CharField())
+
+
+def product_listing_values(queryset):
+    """Project a Product queryset onto the columns the listing needs."""
+    fields = ["id", "title", "price", "category", "views", "created_at", "dominant_color"]
+    if "search_rank" in queryset.query.extra_select:
+        fields.append("search_rank")
+    return queryset.values(
+        *fields,
+        excerpt=Substr("description", 1, DESCRIPTION_EXCERPT),
+        image_path=_RAW_IMAGE,
+    )
+
+
+def product_listing_item(row):
+    image = row["image_path"] or ""
+    return {
+        "id": row["id"],
+        "title": row["title"],
+        "price": str(row["price"]),
+        "description": row["excerpt"],
+        "rating": row["views"],
+        "views": row["views"],
+        "category": row["category"],
+        "image": media_url(image),
+        "thumbnail": sized_url(image),
+        "srcset": srcset(image),
+        "color": row["dominant_color"],
+    }
+
+
+def dumps(payload):
+    """Encode a JSON payload to bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
@@ -0,0 +1,49 @@
+# signals.py
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.core.files.uploadedfile import UploadedFile
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_save
+from django.dispatch import receiver
+
+from . import caching, instrumentation, placeholders, querywatch, search, sqlite
+from .models import Gallery, Product
+
+
+@receiver(post_migrate)
+def ensure_search_index(sender, using, **kwargs):
+    """Re-create FTS triggers that a table remake may have dropped."""
+    if sender.name != "core":
+        return
+    search.install(connections[using])
+
+
+@receiver(connection_created)
+def configure_sqlite(sender, connection, **kwargs):
+    sqlite.apply_pragmas(connection)
+
+
+@receiver(connection_created)
+def time_queries(sender, connection, **kwargs):
+    # The wrapper list outlives a reconnect, so only add it once.
+    for wrapper in (instrumentation.sql_timer, querywatch.query_watcher):
+        if wrapper not in connection.execute_wrappers:
+            connection.execute_wrappers.append(wrapper)
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=Gallery)
+@receiver(post_delete, sender=Gallery)
+def invalidate_catalog(sender, **kwargs):
+    caching.bump_catalog_version()
+
+
+@receiver(pre_save, sender=Product)
+@receiver(pre_save, sender=Gallery)
+def compute_placeholder(sender, instance, **kwargs):
+    """Derive the placeholder from a fresh upload before Cloudinary takes the file."""
+    value = instance.image if sender is Product else instance.media
+    if isinstance(value, UploadedFile):
+        placeholders.apply(instance, placeholders.compute_from_upload(value))
+    elif not value:
+        placeholders.apply(instance, placeholders.EMPTY)
@@ -0,0 +1,236 @@
+# simulator.py
+"""
+Local stand-in for the PayChangu API, for load tests and benchmarks.
+
+It answers the endpoints core.paychangu uses after a configurable delay
+(``latency`` plus up to ``jitter`` seconds), and fails a fraction
+``error_rate`` of calls with a 500. Requests are served on threads, so a
+slow reply never holds up the others, like the real API.
+
+Charges complete asynchronously, as real ones do: a charge verifies as
+``pending`` until ``completion_delay`` seconds after initialization, then
+as ``success`` (or ``failed``, for a fraction ``decline_rate``). With a
+``webhook_url`` the simulator also POSTs a signed notification at that
+moment and retries it while the app answers with an error, so the
+webhook path is exercised too. Point the app at it with
+``PAYCHANGU_BASE_URL``; ``manage.py paychangu_simulator`` runs it on its
+own.
+"""
+import heapq
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import requests
+
+from .paychangu import AIRTEL_REF_ID, TNM_REF_ID
+from .payments import webhook_signature
+
+OPERATORS = {AIRTEL_REF_ID: "Airtel Money", TNM_REF_ID: "TNM Mpamba"}
+VERIFY_PATH = re.compile(r"^/(?:charge-card/verify/(?P<card>[^/]+)|mobile-money/payments/(?P<mobile>[^/]+)/verify)$")
+
+WEBHOOK_ATTEMPTS = 5
+WEBHOOK_RETRY_DELAY = 0.5
+
+
+class PayChanguSimulator:
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, error_rate=0.0,
+                 completion_delay=None, decline_rate=0.0, webhook_url=None, webhook_secret=None,
+                 webhook_workers=4, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        # None completes charges on the spot, which is what verify-only callers expect.
+        self.completion_delay = completion_delay
+        self.decline_rate = decline_rate
+        self.webhook_url = webhook_url
+        self.webhook_secret = webhook_secret
+        self.random = random.Random(seed)
+
+        self.charges = {}  # charge_id -> (outcome, monotonic completion time)
+        self.counts = {"requests": 0, "errors": 0, "webhooks": 0, "webhook_failures": 0}
+        self.webhook_latencies = []
+        self._lock = threading.Lock()
+
+        self._due = []  # heap of (when, seq, charge_id, attempt)
+        self._seq = itertools.count()
+        self._due_changed = threading.Condition()
+        self._stopping = False
+        self._webhooks = ThreadPoolExecutor(webhook_workers, thread_name_prefix="paychangu-webhook")
+        self._http = requests.Session()
+
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self.server.block_on_close = False
+        self._threads = []
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    # ----------------------------
+    # Replies
+    # ----------------------------
+    def reply(self, method, path, body):
+        """(status, payload) for one API call."""
+        if method == "POST" and path == "/mobile-money/payments/initialize":
+            self.register(body["charge_id"])
+            return 200, {
+                "status": "success",
+                "message": "Payment initiated, awaiting customer authorization.",
+                "data": {
+                    "charge_id": body["charge_id"],
+                    "amount": body["amount"],
+                    "mobile_money": {"name": OPERATORS.get(body["mobile_money_operator_ref_id"])},
+                },
+            }
+        if method == "POST" and path == "/charge-card/payments":
+            self.register(body["charge_id"])
+            return 200, {"status": "success", "message": "Card charge created.",
+                         "data": {"charge_id": body["charge_id"]}}
+        if method == "POST" and path == "/mobile-money/payouts/initialize":
+            return 200, {"status": "success", "message": "Payout queued.",
+                         "data": {"charge_id": body["charge_id"], "status": "pending"}}
+        match = VERIFY_PATH.match(path) if method == "GET" else None
+        if match:
+            charge_id = match["card"] or match["mobile"]
+            return 200, {"status": "success", "data": {"charge_id": charge_id, "status": self.status(charge_id)}}
+        return 404, {"status": "failed", "message": f"No route for {method} {path}"}
+
+    # ----------------------------
+    # Charges
+    # ----------------------------
+    def register(self, charge_id):
+        outcome = "failed" if self.random.random() < self.decline_rate else "success"
+        delay = self.completion_delay or 0
+        with self._lock:
+            self.charges[charge_id] = (outcome, time.monotonic() + delay)
+        if self.webhook_url:
+            self._schedule(delay, charge_id, 1)
+
+    def status(self, charge_id):
+        """pending, success or failed. Charges made elsewhere count as paid."""
+        with self._lock:
+            outcome, completes_at = self.charges.get(charge_id, ("success", 0))
+        return "pending" if time.monotonic() < completes_at else outcome
+
+    def _schedule(self, delay, charge_id, attempt):
+        with self._due_changed:
+            heapq.heappush(self._due, (time.monotonic() + delay, next(self._seq), charge_id, attempt))
+            self._due_changed.notify()
+
+    def _dispatch_webhooks(self):
+        while True:
+            with self._due_changed:
+                while not self._stopping and (not self._due or self._due[0][0] > time.monotonic()):
+                    timeout = self._due[0][0] - time.monotonic() if self._due else None
+                    self._due_changed.wait(timeout)
+                if self._stopping:
+                    return
+                _, _, charge_id, attempt = heapq.heappop(self._due)
+            self._webhooks.submit(self._send_webhook, charge_id, attempt)
+
+    def _send_webhook(self, charge_id, attempt):
+        with self._lock:
+            outcome = self.charges[charge_id][0]
+        raw = json.dumps({"event_type": "api.charge.payment", "charge_id": charge_id,
+                          "tx_ref": charge_id, "status": outcome}).encode()
+        headers = {"Content-Type": "application/json", "Signature": webhook_signature(raw, self.webhook_secret)}
+        started = time.perf_counter()
+        try:
+            delivered = self._http.post(self.webhook_url, data=raw, headers=headers, timeout=10).ok
+        except requests.RequestException:
+            delivered = False
+        with self._lock:
+            self.webhook_latencies.append(time.perf_counter() - started)
+            self.counts["webhooks"] += 1
+            if not delivered and attempt >= WEBHOOK_ATTEMPTS:
+                self.counts["webhook_failures"] += 1
+        # A 404 usually means the notification beat the PaymentAttempt insert.
+        if not delivered and attempt < WEBHOOK_ATTEMPTS:
+            self._schedule(WEBHOOK_RETRY_DELAY * attempt, charge_id, attempt + 1)
+
+    def stats(self):
+        with self._lock:
+            return {**self.counts, "charges": len(self.charges), "webhook_latencies": list(self.webhook_latencies)}
+
+    def _handler_class(self):
+        simulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def handle_one(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                delay = simulator.latency + (simulator.random.uniform(0, simulator.jitter) if simulator.jitter else 0)
+                if delay:
+                    time.sleep(delay)
+                failed = simulator.error_rate and simulator.random.random() < simulator.error_rate
+                with simulator._lock:
+                    simulator.counts["requests"] += 1
+                    simulator.counts["errors"] += bool(failed)
+                if failed:
+                    status, payload = 500, {"status": "failed", "message": "Simulated upstream error"}
+                else:
+                    status, payload = simulator.reply(self.command, urlsplit(self.path).path, body)
+                raw = json.dumps(payload).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(raw)))
+                    self.end_headers()
+                    self.wfile.write(raw)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # the client timed out
+
+            do_GET = do_POST = handle_one
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    # ----------------------------
+    # Lifecycle
+    # ----------------------------
+    def start(self):
+        self._threads = [
+            threading.Thread(target=self.server.serve_forever, name="paychangu-simulator", daemon=True),
+            threading.Thread(target=self._dispatch_webhooks, name="paychangu-webhooks", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def serve_forever(self):
+        """Run in the foreground until interrupted."""
+        self._threads = [threading.Thread(target=self._dispatch_webhooks, name="paychangu-webhooks", daemon=True)]
+        self._threads[0].start()
+        try:
+            self.server.serve_forever()
+        finally:
+            self.stop()
+
+    def stop(self):
+        with self._due_changed:
+            self._stopping = True
+            self._due_changed.notify()
+        if self._threads:
+            self.server.shutdown()
+        self.server.server_close()
+        self._webhooks.shutdown(wait=True, cancel_futures=True)
+        self._http.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,30 @@
+# sqlite.py
+"""
+Per-connection SQLite tuning.
+
+signals.py applies settings.SQLITE_PRAGMAS to every new SQLite
+connection. With several worker processes the important ones are WAL
+(readers no longer wait for a writer, and a writer no longer waits for
+readers) and busy_timeout (a writer queues for the lock instead of
+failing with "database is locked"). The rest trade a little durability
+or memory for speed: synchronous=NORMAL is safe under WAL (a power cut
+can lose the last commits, never corrupt the file), and mmap_size,
+cache_size and temp_store keep hot pages and temporary b-trees in memory.
+"""
+from django.conf import settings
+
+
+def apply_pragmas(connection, pragmas=None):
+    """Run ``PRAGMA name = value`` for each configured pragma on ``connection``."""
+    if connection.vendor != "sqlite":
+        return
+    pragmas = settings.SQLITE_PRAGMAS if pragmas is None else pragmas
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+
+
+def pragma(connection, name):
+    with connection.cursor() as cursor:
+        cursor.execute(f"PRAGMA {name}")
+        return cursor.fetchone()[0]
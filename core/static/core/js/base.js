@@ -0,0 +1,3513 @@
+        // Sample product data
+        const products = [
+            {
+                id: 1,
+                title: "E-Commerce Website Template",
+                category: "websites",
+                price: 299,
+                image: "linear-gradient(135deg, #667eea 0%, #764ba2 100%)",
+                description: "Complete e-commerce solution with shopping cart, payment integration, and admin panel.",
+                features: ["Responsive Design", "Payment Gateway", "Admin Dashboard", "SEO Optimized"],
+                technologies: ["React", "Node.js", "MongoDB", "Stripe"],
+                demo: "https://demo.example.com",
+                rating: 4.8,
+                reviews: 124
+            },
+            {
+                id: 2,
+                title: "React Admin Dashboard",
+                category: "code",
+                price: 199,
+                image: "linear-gradient(135deg, #f093fb 0%, #f5576c 100%)",
+                description: "Modern admin dashboard with charts, tables, and user management features.",
+                features: ["Dark/Light Mode", "Charts & Analytics", "User Management", "Responsive"],
+                technologies: ["React", "TypeScript", "Chart.js", "Tailwind CSS"],
+                demo: "https://demo.example.com",
+                rating: 4.9,
+                reviews: 89
+            },
+            {
+                id: 3,
+                title: "Fitness Mobile App UI",
+                category: "apps",
+                price: 149,
+                image: "linear-gradient(135deg, #4facfe 0%, #00f2fe 100%)",
+                description: "Complete fitness app design with workout tracking and nutrition features.",
+                features: ["Workout Tracker", "Nutrition Guide", "Progress Charts", "Social Features"],
+                technologies: ["React Native", "Firebase", "Redux", "Expo"],
+                demo: "https://demo.example.com",
+                rating: 4.7,
+                reviews: 67
+            },
+            {
+                id: 4,
+                title: "Landing Page Template",
+                category: "templates",
+                price: 79,
+                image: "linear-gradient(135deg, #fa709a 0%, #fee140 100%)",
+                description: "Modern landing page template perfect for startups and businesses.",
+                features: ["Conversion Optimized", "Mobile Responsive", "Fast Loading", "SEO Ready"],
+                technologies: ["HTML5", "CSS3", "JavaScript", "Bootstrap"],
+                demo: "https://demo.example.com",
+                rating: 4.6,
+                reviews: 156
+            },
+            {
+                id: 5,
+                title: "Restaurant Management System",
+                category: "websites",
+                price: 399,
+                image: "linear-gradient(135deg, #a8edea 0%, #fed6e3 100%)",
+                description: "Complete restaurant management system with ordering and inventory features.",
+                features: ["Online Ordering", "Inventory Management", "Staff Portal", "Analytics"],
+                technologies: ["Vue.js", "Laravel", "MySQL", "PayPal API"],
+                demo: "https://demo.example.com",
+                rating: 4.8,
+                reviews: 43
+            },
+            {
+                id: 6,
+                title: "Social Media App Template",
+                category: "apps",
+                price: 249,
+                image: "linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%)",
+                description: "Social media app template with messaging, posts, and user profiles.",
+                features: ["Real-time Chat", "Photo Sharing", "User Profiles", "Push Notifications"],
+                technologies: ["Flutter", "Firebase", "Cloud Functions", "FCM"],
+                demo: "https://demo.example.com",
+                rating: 4.5,
+                reviews: 78
+            }
+        ];
+
+        let currentFilter = 'all';
+        let currentProducts = products;
+
+        // Page navigation
+        function showPage(pageName) {
+            // Hide all pages
+            document.querySelectorAll('.page-content').forEach(page => {
+                page.classList.add('hidden');
+            });
+
+            // Show selected page
+            if (pageName === 'home') {
+                document.getElementById('home-page').classList.remove('hidden');
+            } else if (pageName === 'about') {
+                document.getElementById('about-page').classList.remove('hidden');
+            } else if (pageName === 'marketplace') {
+                document.getElementById('marketplace-page').classList.remove('hidden');
+                renderProducts(currentProducts);
+            } else if (pageName === 'product-detail') {
+                document.getElementById('product-detail-page').classList.remove('hidden');
+            } else if (pageName === 'contact') {
+                document.getElementById('contact-page').classList.remove('hidden');
+            } else if (pageName === 'admin') {
+                document.getElementById('admin-page').classList.remove('hidden');
+                renderTransactions();
+                renderUsefulLinks();
+                renderClients();
+            } else if (pageName === 'customer-dashboard') {
+                if (!isLoggedIn) {
+                    showLoginModal();
+                    return;
+                }
+                document.getElementById('customer-dashboard-page').classList.remove('hidden');
+                renderRecentOrders();
+            }
+
+            // Close mobile menu
+            document.getElementById('mobile-menu').classList.add('hidden');
+        }
+
+        // Mobile menu toggle
+        document.getElementById('mobile-menu-btn').addEventListener('click', function() {
+            const mobileMenu = document.getElementById('mobile-menu');
+            mobileMenu.classList.toggle('hidden');
+        });
+
+
+        // Filter products by category
+        function filterProducts(category) {
+            currentFilter = category;
+
+            // Update filter buttons
+            document.querySelectorAll('.filter-btn').forEach(btn => {
+                btn.classList.remove('active', 'bg-purple-600', 'text-white');
+                btn.classList.add('bg-gray-200', 'text-gray-700');
+            });
+
+            event.target.classList.add('active', 'bg-purple-600', 'text-white');
+            event.target.classList.remove('bg-gray-200', 'text-gray-700');
+
+            // Filter products
+            if (category === 'all') {
+                currentProducts = products;
+            } else {
+                currentProducts = products.filter(product => product.category === category);
+            }
+
+            renderProducts(currentProducts);
+        }
+
+        // Search products
+        function searchProducts() {
+            const searchTerm = document.getElementById('search-input').value.toLowerCase();
+
+            if (searchTerm === '') {
+                currentProducts = currentFilter === 'all' ? products : products.filter(p => p.category === currentFilter);
+            } else {
+                let filteredProducts = products.filter(product => 
+                    product.title.toLowerCase().includes(searchTerm) ||
+                    product.description.toLowerCase().includes(searchTerm) ||
+                    product.technologies.some(tech => tech.toLowerCase().includes(searchTerm))
+                );
+
+                if (currentFilter !== 'all') {
+                    filteredProducts = filteredProducts.filter(p => p.category === currentFilter);
+                }
+
+                currentProducts = filteredProducts;
+            }
+
+            renderProducts(currentProducts);
+        }
+
+
+        // Purchase product with payment options
+function purchaseProduct(button) {
+    // Get product info from the button's data attributes
+    const product = {
+        id: button.dataset.id,
+        title: button.dataset.title,
+        price: button.dataset.price
+    };
+
+    const modal = document.getElementById('service-modal');
+    const title = document.getElementById('modal-title');
+    const content = document.getElementById('modal-content');
+
+    title.textContent = 'Choose Payment Method';
+    content.innerHTML = `
+        <div class="space-y-6">
+            <div class="text-center">
+                <h3 class="text-xl font-semibold text-gray-900 mb-2">${product.title}</h3>
+                <p class="text-3xl font-bold text-green-600">$${product.price}</p>
+            </div>
+
+            <div class="space-y-4">
+                <h4 class="font-semibold text-gray-900">Select Payment Method:</h4>
+
+                <!-- Visa Card Payment -->
+                <div class="border-2 border-gray-200 rounded-lg p-4 hover:border-blue-500 cursor-pointer transition-colors" onclick="selectPaymentMethod('visa')">
+                    <div class="flex items-center justify-between">
+                        <div class="flex items-center">
+                            <div class="w-12 h-8 bg-blue-600 rounded flex items-center justify-center mr-3">
+                                <span class="text-white font-bold text-xs">VISA</span>
+                            </div>
+                            <div>
+                                <p class="font-semibold text-gray-900">Visa Card</p>
+                                <p class="text-gray-600 text-sm">Pay with your Visa debit/credit card</p>
+                            </div>
+                        </div>
+                        <input type="radio" name="payment" value="visa" class="text-blue-600">
+                    </div>
+                </div>
+
+                <!-- Airtel Money -->
+                <div class="border-2 border-gray-200 rounded-lg p-4 hover:border-red-500 cursor-pointer transition-colors" onclick="selectPaymentMethod('airtel')">
+                    <div class="flex items-center justify-between">
+                        <div class="flex items-center">
+                            <div class="w-12 h-8 bg-red-600 rounded flex items-center justify-center mr-3">
+                                <span class="text-white font-bold text-xs">AM</span>
+                            </div>
+                            <div>
+                                <p class="font-semibold text-gray-900">Airtel Money</p>
+                                <p class="text-gray-600 text-sm">Pay with your Airtel Money wallet</p>
+                            </div>
+                        </div>
+                        <input type="radio" name="payment" value="airtel" class="text-red-600">
+                    </div>
+                </div>
+
+                <!-- TNM Mpamba -->
+                <div class="border-2 border-gray-200 rounded-lg p-4 hover:border-yellow-500 cursor-pointer transition-colors" onclick="selectPaymentMethod('mpamba')">
+                    <div class="flex items-center justify-between">
+                        <div class="flex items-center">
+                            <div class="w-12 h-8 bg-yellow-600 rounded flex items-center justify-center mr-3">
+                                <span class="text-white font-bold text-xs">TNM</span>
+                            </div>
+                            <div>
+                                <p class="font-semibold text-gray-900">TNM Mpamba</p>
+                                <p class="text-gray-600 text-sm">Pay with your TNM Mpamba wallet</p>
+                            </div>
+                        </div>
+                        <input type="radio" name="payment" value="mpamba" class="text-yellow-600">
+                    </div>
+                </div>
+            </div>
+
+            <div class="flex gap-3">
+                <button onclick="closeModal()" class="flex-1 border border-gray-300 text-gray-700 py-3 rounded-lg hover:bg-gray-50 transition-colors">
+                    Cancel
+                </button>
+               <button id="proceed-payment" 
+    onclick="proceedWithPayment(IKPIXELS.product)"
+    disabled
+    class="flex-1 bg-purple-600 text-white py-3 rounded-lg hover:bg-purple-700 transition-colors disabled:bg-gray-300 disabled:cursor-not-allowed">
+    Proceed to Payment
+</button>
+
+            </div>
+        </div>
+    `;
+
+    modal.classList.remove('hidden');
+}
+
+        let selectedPaymentMethod = null;
+
+        // Select payment method
+        function selectPaymentMethod(method) {
+            selectedPaymentMethod = method;
+
+            // Update radio buttons
+            document.querySelectorAll('input[name="payment"]').forEach(radio => {
+                radio.checked = radio.value === method;
+            });
+
+            // Update border colors
+            document.querySelectorAll('[onclick^="selectPaymentMethod"]').forEach(div => {
+                div.classList.remove('border-blue-500', 'border-red-500', 'border-yellow-500');
+                div.classList.add('border-gray-200');
+            });
+
+            const selectedDiv = document.querySelector(`[onclick="selectPaymentMethod('${method}')"]`);
+            if (method === 'visa') {
+                selectedDiv.classList.add('border-blue-500');
+            } else if (method === 'airtel') {
+                selectedDiv.classList.add('border-red-500');
+            } else if (method === 'mpamba') {
+                selectedDiv.classList.add('border-yellow-500');
+            }
+
+            // Enable proceed button
+            document.getElementById('proceed-payment').disabled = false;
+        }
+
+      // Proceed with payment
+function proceedWithPayment(product) {
+    if (!selectedPaymentMethod) return;
+
+    const modal = document.getElementById('service-modal');
+    const title = document.getElementById('modal-title');
+    const content = document.getElementById('modal-content');
+
+    if (selectedPaymentMethod === 'visa') {
+        showVisaPaymentForm(product);
+    } else if (selectedPaymentMethod === 'airtel') {
+        showMobileMoneyForm(product, 'Airtel Money', 'red');
+    } else if (selectedPaymentMethod === 'mpamba') {
+        showMobileMoneyForm(product, 'TNM Mpamba', 'yellow');
+    }
+}
+
+
+        // Show Visa payment form
+        function showVisaPaymentForm(product) {
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = 'Visa Card Payment';
+            content.innerHTML = `
+                <form id="visa-payment-form" class="space-y-6">
+                    <div class="text-center mb-6">
+                        <h3 class="text-lg font-semibold text-gray-900">${product.title}</h3>
+                        <p class="text-2xl font-bold text-green-600">MKW${product.price}</p>
+                    </div>
+
+                    <div>
+                        <label for="card-number" class="block text-sm font-medium text-gray-700 mb-2">Card Number</label>
+                        <input type="text" id="card-number" placeholder="1234 5678 9012 3456" maxlength="19" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent" required>
+                    </div>
+
+                    <div class="grid grid-cols-2 gap-4">
+                        <div>
+                            <label for="expiry" class="block text-sm font-medium text-gray-700 mb-2">Expiry Date</label>
+                            <input type="text" id="expiry" placeholder="MM/YY" maxlength="5" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent" required>
+                        </div>
+                        <div>
+                            <label for="cvv" class="block text-sm font-medium text-gray-700 mb-2">CVV</label>
+                            <input type="text" id="cvv" placeholder="123" maxlength="4" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent" required>
+                        </div>
+                    </div>
+
+                    <div>
+                        <label for="cardholder-name" class="block text-sm font-medium text-gray-700 mb-2">Cardholder Name</label>
+                        <input type="text" id="cardholder-name" placeholder="John Doe" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent" required>
+                    </div>
+
+                    <div class="bg-blue-50 p-4 rounded-lg">
+                        <div class="flex items-center">
+                            <svg class="w-5 h-5 text-blue-600 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 15v2m-6 4h12a2 2 0 002-2v-6a2 2 0 00-2-2H6a2 2 0 00-2 2v6a2 2 0 002 2zm10-10V7a4 4 0 00-8 0v4h8z"></path>
+                            </svg>
+                            <p class="text-blue-800 text-sm">Your payment is secured with 256-bit SSL encryption</p>
+                        </div>
+                    </div>
+
+                    <div class="flex gap-3">
+                        <button type="button" onclick="purchaseProduct(${product.id})" class="flex-1 border border-gray-300 text-gray-700 py-3 rounded-lg hover:bg-gray-50 transition-colors">
+                            Back
+                        </button>
+                        <button type="submit" class="flex-1 bg-blue-600 text-white py-3 rounded-lg hover:bg-blue-700 transition-colors">
+                            Pay MKW${product.price}
+                        </button>
+                    </div>
+                </form>
+            `;
+
+            // Handle form submission
+            document.getElementById('visa-payment-form').addEventListener('submit', function(e) {
+                e.preventDefault();
+                processPayment(product, 'Visa Card');
+            });
+
+            // Format card number input
+            document.getElementById('card-number').addEventListener('input', function(e) {
+                let value = e.target.value.replace(/\s/g, '').replace(/[^0-9]/gi, '');
+                let formattedValue = value.match(/.{1,4}/g)?.join(' ') || value;
+                e.target.value = formattedValue;
+            });
+
+            // Format expiry date input
+            document.getElementById('expiry').addEventListener('input', function(e) {
+                let value = e.target.value.replace(/\D/g, '');
+                if (value.length >= 2) {
+                    value = value.substring(0, 2) + '/' + value.substring(2, 4);
+                }
+                e.target.value = value;
+            });
+
+            // CVV input validation
+            document.getElementById('cvv').addEventListener('input', function(e) {
+                e.target.value = e.target.value.replace(/[^0-9]/g, '');
+            });
+        }
+
+function showMobileMoneyForm(product, provider, color) {
+    const title = document.getElementById('modal-title');
+    // One key per opened form: double clicks and retries of this form
+    // reuse the first initialization instead of prompting the phone again.
+    const idempotencyKey = (window.crypto && crypto.randomUUID)
+        ? crypto.randomUUID()
+        : `${Date.now()}-${Math.random().toString(36).slice(2)}`;
+    const content = document.getElementById('modal-content');
+
+    title.textContent = `${provider} Payment`;
+
+    // Build form HTML
+    content.innerHTML = `
+        <form id="mobile-money-form" class="space-y-6">
+            <div class="text-center mb-6">
+                <h3 class="text-lg font-semibold text-gray-900">${product.title}</h3>
+                <p class="text-2xl font-bold text-green-600">MKW ${product.price}</p>
+            </div>
+
+            <div>
+                <label for="phone-number" class="block text-sm font-medium text-gray-700 mb-2">Phone Number</label>
+                <div class="relative">
+                    <span class="absolute left-3 top-3 text-gray-500">+265</span>
+                    <input name="phone-number" type="tel" id="phone-number" placeholder="881234567" class="w-full pl-16 pr-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-${color}-500 focus:border-transparent" required>
+                </div>
+                <p class="text-gray-500 text-sm mt-1">Enter your ${provider} registered number</p>
+                <input name="provider" type="hidden" value="${provider}">
+            </div>
+
+            <div class="bg-${color}-50 p-4 rounded-lg">
+                <h4 class="font-semibold text-${color}-900 mb-2">Payment Instructions:</h4>
+                <ol class="text-${color}-800 text-sm space-y-1">
+                    <li>1. You will receive an SMS prompt on your phone</li>
+                    <li>2. Enter your ${provider} PIN to confirm payment</li>
+                    <li>3. You'll receive a confirmation SMS</li>
+                    <li>4. Your download will be available immediately</li>
+                </ol>
+            </div>
+
+            <div class="flex gap-3">
+                <button type="button" onclick="purchaseProduct(${product.id})" class="flex-1 border border-gray-300 text-gray-700 py-3 rounded-lg hover:bg-gray-50 transition-colors">
+                    Back
+                </button>
+                <button type="submit" class="flex-1 bg-${color}-600 text-white py-3 rounded-lg hover:bg-${color}-700 transition-colors">
+                    Send Payment Request
+                </button>
+            </div>
+        </form>
+    `;
+
+    // Allow only numbers in phone input
+    $("#phone-number").on('input', function() {
+        this.value = this.value.replace(/[^0-9]/g, '');
+    });
+
+    // Handle form submission with jQuery AJAX
+    $("#mobile-money-form").submit(function (event) {
+        event.preventDefault();
+
+        const phoneNumber = $("#phone-number").val().trim();
+        const csrfToken = $("#csrf-token").val(); // Hidden input in main HTML
+        const providerVal = $("input[name='provider']").val();
+
+        if (phoneNumber.length < 9) {
+            alert('Please enter a valid phone number');
+            return;
+        }
+
+        $.ajax({
+            type: "POST",
+            url: `/pay/mobile/${product.id}/`,
+            data: {
+                'phone-number': phoneNumber,
+                'provider': providerVal,
+                'idempotency_key': idempotencyKey,
+                'csrfmiddlewaretoken': csrfToken
+            },
+            success: function(data) {
+                if (data.status === "success") {
+                    // Show the payment processing modal view
+                    processMobileMoneyPayment(product, providerVal, phoneNumber, data.tx_ref,);
+                } else {
+                    alert(`Payment failed: ${data.message || 'Please try again.'}`);
+                }
+            },
+            error: function(xhr, status, error) {
+                console.error(xhr, status, error);
+                alert(`Unexpected error: ${error}`);
+            }
+        });
+    });
+}
+
+
+
+        // Process regular payment
+        function processPayment(product, paymentMethod) {
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = 'Payment Processing...';
+            content.innerHTML = `
+                <div class="text-center space-y-6">
+                    <div class="w-16 h-16 bg-blue-100 rounded-full flex items-center justify-center mx-auto">
+                        <div class="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600"></div>
+                    </div>
+                    <p class="text-gray-600">Processing your ${paymentMethod} payment...</p>
+                </div>
+            `;
+
+            // Simulate payment processing
+            setTimeout(() => {
+                showPaymentSuccess(product, paymentMethod);
+            }, 3000);
+        }
+
+        // Process mobile money payment
+        function processMobileMoneyPayment(product, provider, phoneNumber,tx_ref) {
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = 'Payment Request Sent';
+            content.innerHTML = `
+                <div class="text-center space-y-6">
+                    <div class="w-16 h-16 bg-yellow-100 rounded-full flex items-center justify-center mx-auto">
+                        <svg class="w-8 h-8 text-yellow-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 18h.01M8 21h8a2 2 0 002-2V5a2 2 0 00-2-2H8a2 2 0 00-2 2v14a2 2 0 002 2z"></path>
+                        </svg>
+                    </div>
+
+                    <div>
+                        <h3 class="text-xl font-semibold text-gray-900 mb-2">Check Your Phone</h3>
+                        <p class="text-gray-600">We've sent a payment request to <strong>+265${phoneNumber}</strong></p>
+                        <p class="text-gray-500 text-sm mt-2">Please check your phone and enter your ${provider} PIN to complete the payment</p>
+                    </div>
+
+                    <div class="bg-yellow-50 p-4 rounded-lg">
+                        <p class="text-yellow-800 text-sm">
+                            <strong>Waiting for payment confirmation...</strong><br>
+                            This usually takes 30-60 seconds
+                        </p>
+                    </div>
+
+                    <div class="animate-pulse">
+                        <div class="flex justify-center space-x-1">
+                            <div class="w-2 h-2 bg-yellow-600 rounded-full"></div>
+                            <div class="w-2 h-2 bg-yellow-600 rounded-full"></div>
+                            <div class="w-2 h-2 bg-yellow-600 rounded-full"></div>
+                        </div>
+                    </div>
+
+                    <button 
+                        id="payment-success-btn"
+                        data-tx-ref="${tx_ref}" 
+                        style="display: none; padding:10px;"
+                        type="button" 
+                        class="flex-1 border border-gray-300 text-gray-700 py-3 px-4 rounded-lg hover:bg-gray-50 transition-colors">
+                        Verify Payment
+                    </button>
+                </div>
+            `;
+
+            // Simulate mobile money confirmation
+            setTimeout(() => {
+                 const successButton = document.getElementById('payment-success-btn');
+                 if (successButton) {
+                 successButton.style.display = 'inline-block'; // Show the button
+             }
+                //showPaymentSuccess(product, provider, phoneNumber);
+            }, 5000);
+
+            // The server pushes the status once the payment settles; the
+            // Verify button above stays as a fallback.
+            watchPaymentStatus(tx_ref, function(update) {
+                if (update.status === "success") {
+                    showPaymentSuccess(product, provider, phoneNumber);
+                } else {
+                    alert("❌ " + update.message);
+                }
+            });
+
+
+           $(document).on("click", "#payment-success-btn", function() {
+    const txRef = $(this).data("tx-ref");
+    console.log("Verifying:", txRef);
+
+    $.ajax({
+        url: `/pay/verify/${txRef}/`,
+        type: "POST",
+        data: { 'type': 'mobile' },
+        success: function(response) {
+            console.log("Response:", response);
+            if (response.status === "success") {
+                showPaymentSuccess(product, provider, phoneNumber);
+                //alert("✅ " + response.message);
+            } else {
+                alert("❌ " + response.message);
+            }
+        },
+        error: function(xhr, status, error) {
+            console.error("AJAX Error:", error);
+            alert("⚠️ Something went wrong. Try again.");
+        }
+    });
+});
+        }
+
+
+
+        // Show payment success
+        function showPaymentSuccess(product, paymentMethod, phoneNumber = null) {
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = 'Payment Successful!';
+            content.innerHTML = `
+                <div class="text-center space-y-6">
+                    <div class="w-16 h-16 bg-green-100 rounded-full flex items-center justify-center mx-auto">
+                        <svg class="w-8 h-8 text-green-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
+                        </svg>
+                    </div>
+
+                    <div>
+                        <h3 class="text-xl font-semibold text-gray-900 mb-2">Purchase Complete!</h3>
+                        <p class="text-gray-600">You've successfully purchased <strong>${product.title}</strong></p>
+                        <p class="text-gray-500 text-sm mt-2">Payment method: ${paymentMethod}${phoneNumber ? ` (+265${phoneNumber})` : ''}</p>
+                        <p class="text-gray-500 text-sm">This is a demo - no actual payment was processed</p>
+                    </div>
+
+                    <div class="bg-gray-50 p-4 rounded-lg">
+                        <p class="text-sm text-gray-700 mb-2"><strong>What you would receive:</strong></p>
+                        <ul class="text-sm text-gray-600 space-y-1">
+                            <li>• Complete source code</li>
+                            <li>• Documentation & setup guide</li>
+                            <li>• Commercial license</li>
+                            <li>• 6 months of support</li>
+                            <li>• Instant download link</li>
+                        </ul>
+                    </div>
+
+                    <div class="flex gap-3">
+                        <button onclick="closeModal()" class="flex-1 border border-gray-300 text-gray-700 py-3 rounded-lg hover:bg-gray-50 transition-colors">
+                            Continue Browsing
+                        </button>
+                        <button onclick="downloadProduct(${product.id})" class="flex-1 bg-green-600 text-white py-3 rounded-lg hover:bg-green-700 transition-colors">
+                            Download Now
+                        </button>
+                    </div>
+                </div>
+            `;
+        }
+
+        // Download product (demo)
+        function downloadProduct(productId) {
+            const product = products.find(p => p.id === productId);
+
+            // Create a simple download simulation
+            const link = document.createElement('a');
+            link.href = 'data:text/plain;charset=utf-8,' + encodeURIComponent(`Thank you for purchasing ${product.title}!\n\nThis is a demo download.\nIn a real scenario, you would receive:\n- Complete source code\n- Documentation\n- Setup instructions\n- Commercial license\n\nSupport: hello@techcraft.com`);
+            link.download = `${product.title.replace(/\s+/g, '_')}_Demo.txt`;
+            link.click();
+
+            closeModal();
+        }
+
+        // Smooth scrolling
+        function scrollToSection(sectionId) {
+            document.getElementById(sectionId).scrollIntoView({
+                behavior: 'smooth'
+            });
+        }
+
+        // Service modal functionality
+        function openServiceModal(serviceType) {
+            const modal = document.getElementById('service-modal');
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            if (serviceType === 'web-dev') {
+                title.textContent = 'Web Development Services';
+                content.innerHTML = `
+                    <div class="space-y-6">
+                        <p class="text-gray-700">Our web development team creates modern, scalable, and user-friendly applications tailored to your business needs.</p>
+
+                        <div class="grid md:grid-cols-2 gap-6">
+                            <div>
+                                <h4 class="font-semibold text-gray-900 mb-3">Frontend Development</h4>
+                                <ul class="space-y-2 text-gray-700">
+                                    <li>• React, Vue.js, Angular</li>
+                                    <li>• Responsive Design</li>
+                                    <li>• Progressive Web Apps</li>
+                                    <li>• Performance Optimization</li>
+                                </ul>
+                            </div>
+                            <div>
+                                <h4 class="font-semibold text-gray-900 mb-3">Backend Development</h4>
+                                <ul class="space-y-2 text-gray-700">
+                                    <li>• Node.js, Python, PHP</li>
+                                    <li>• Database Design</li>
+                                    <li>• API Development</li>
+                                    <li>• Cloud Integration</li>
+                                </ul>
+                            </div>
+                        </div>
+
+                        <div class="bg-blue-50 p-4 rounded-lg">
+                            <h4 class="font-semibold text-blue-900 mb-2">Starting at $2,500</h4>
+                            <p class="text-blue-800">Custom quote based on project requirements</p>
+                        </div>
+
+                        <button onclick="showPage('contact'); closeModal();" class="w-full bg-blue-600 text-white py-3 rounded-lg hover:bg-blue-700 transition-colors">
+                            Get Started
+                        </button>
+                    </div>
+                `;
+            } else if (serviceType === 'app-dev') {
+                title.textContent = 'App Development Services';
+                content.innerHTML = `
+                    <div class="space-y-6">
+                        <p class="text-gray-700">Our mobile development team creates powerful, user-friendly applications for iOS and Android platforms using cutting-edge technologies.</p>
+
+                        <div class="grid md:grid-cols-2 gap-6">
+                            <div>
+                                <h4 class="font-semibold text-gray-900 mb-3">Native Development</h4>
+                                <ul class="space-y-2 text-gray-700">
+                                    <li>• iOS (Swift/SwiftUI)</li>
+                                    <li>• Android (Kotlin/Java)</li>
+                                    <li>• Platform-specific Features</li>
+                                    <li>• Optimal Performance</li>
+                                </ul>
+                            </div>
+                            <div>
+                                <h4 class="font-semibold text-gray-900 mb-3">Cross-Platform</h4>
+                                <ul class="space-y-2 text-gray-700">
+                                    <li>• React Native</li>
+                                    <li>• Flutter</li>
+                                    <li>• Code Reusability</li>
+                                    <li>• Faster Development</li>
+                                </ul>
+                            </div>
+                        </div>
+
+                        <div class="bg-green-50 p-4 rounded-lg">
+                            <h4 class="font-semibold text-green-900 mb-2">Starting at $3,500</h4>
+                            <p class="text-green-800">Simple apps from $3,500, complex apps from $8,000+</p>
+                        </div>
+
+                        <button onclick="showPage('contact'); closeModal();" class="w-full bg-green-600 text-white py-3 rounded-lg hover:bg-green-700 transition-colors">
+                            Get Started
+                        </button>
+                    </div>
+                `;
+            } else if (serviceType === 'graphic-design') {
+                title.textContent = 'Graphic Design Services';
+                content.innerHTML = `
+                    <div class="space-y-6">
+                        <p class="text-gray-700">Our creative team delivers stunning visual solutions that communicate your brand message effectively and memorably.</p>
+
+                        <div class="grid md:grid-cols-2 gap-6">
+                            <div>
+                                <h4 class="font-semibold text-gray-900 mb-3">Brand Identity</h4>
+                                <ul class="space-y-2 text-gray-700">
+                                    <li>• Logo Design</li>
+                                    <li>• Brand Guidelines</li>
+                                    <li>• Color Palettes</li>
+                                    <li>• Typography Selection</li>
+                                </ul>
+                            </div>
+                            <div>
+                                <h4 class="font-semibold text-gray-900 mb-3">Digital Design</h4>
+                                <ul class="space-y-2 text-gray-700">
+                                    <li>• UI/UX Design</li>
+                                    <li>• Social Media Graphics</li>
+                                    <li>• Web Graphics</li>
+                                    <li>• Marketing Materials</li>
+                                </ul>
+                            </div>
+                        </div>
+
+                        <div class="bg-purple-50 p-4 rounded-lg">
+                            <h4 class="font-semibold text-purple-900 mb-2">Starting at $500</h4>
+                            <p class="text-purple-800">Logo packages start at $500, full brand identity from $1,500</p>
+                        </div>
+
+                        <button onclick="showPage('contact'); closeModal();" class="w-full bg-purple-600 text-white py-3 rounded-lg hover:bg-purple-700 transition-colors">
+                            Get Started
+                        </button>
+                    </div>
+                `;
+            }
+
+            modal.classList.remove('hidden');
+        }
+
+        function closeModal() {
+            stopWatchingPayment();
+            document.getElementById('service-modal').classList.add('hidden');
+        }
+
+        // Payment status stream (server-sent events)
+        let paymentEvents = null;
+
+        function watchPaymentStatus(txRef, onSettled) {
+            stopWatchingPayment();
+            if (!window.EventSource || !txRef) {
+                return;
+            }
+            paymentEvents = new EventSource(`/pay/events/${txRef}/`);
+            paymentEvents.addEventListener('status', function(event) {
+                const update = JSON.parse(event.data);
+                if (update.status !== 'pending') {
+                    stopWatchingPayment();
+                    onSettled(update);
+                }
+            });
+        }
+
+        function stopWatchingPayment() {
+            if (paymentEvents) {
+                paymentEvents.close();
+                paymentEvents = null;
+            }
+        }
+
+        // Marketplace category functionality
+        function openMarketplaceCategory(category) {
+            const categories = {
+                'code': 'Source Code & Components',
+                'apps': 'Mobile Applications',
+                'websites': 'Complete Websites'
+            };
+
+            const modal = document.getElementById('service-modal');
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = categories[category];
+            content.innerHTML = `
+                <div class="space-y-6">
+                    <p class="text-gray-700">Browse our curated collection of premium ${category} ready for your projects.</p>
+
+                    <div class="grid gap-4">
+                        <div class="border border-gray-200 rounded-lg p-4 hover:shadow-md transition-shadow">
+                            <div class="flex justify-between items-start mb-2">
+                                <h4 class="font-semibold text-gray-900">Premium ${category.charAt(0).toUpperCase() + category.slice(1)} Package</h4>
+                                <span class="text-green-600 font-bold">$99</span>
+                            </div>
+                            <p class="text-gray-600 text-sm mb-3">High-quality, well-documented ${category} with full commercial license.</p>
+                            <div class="flex gap-2">
+                                <span class="bg-blue-100 text-blue-800 text-xs px-2 py-1 rounded">Premium</span>
+                                <span class="bg-green-100 text-green-800 text-xs px-2 py-1 rounded">Commercial License</span>
+                            </div>
+                        </div>
+
+                        <div class="border border-gray-200 rounded-lg p-4 hover:shadow-md transition-shadow">
+                            <div class="flex justify-between items-start mb-2">
+                                <h4 class="font-semibold text-gray-900">Starter ${category.charAt(0).toUpperCase() + category.slice(1)} Bundle</h4>
+                                <span class="text-green-600 font-bold">$49</span>
+                            </div>
+                            <p class="text-gray-600 text-sm mb-3">Essential ${category} collection perfect for getting started quickly.</p>
+                            <div class="flex gap-2">
+                                <span class="bg-gray-100 text-gray-800 text-xs px-2 py-1 rounded">Standard</span>
+                                <span class="bg-blue-100 text-blue-800 text-xs px-2 py-1 rounded">Personal License</span>
+                            </div>
+                        </div>
+                    </div>
+
+                    <div class="text-center">
+                        <p class="text-gray-600 mb-4">Coming Soon! Our marketplace will launch with hundreds of premium digital assets.</p>
+                        <button onclick="showPage('contact'); closeModal();" class="bg-purple-600 text-white px-6 py-3 rounded-lg hover:bg-purple-700 transition-colors">
+                            Get Notified When Available
+                        </button>
+                    </div>
+                </div>
+            `;
+
+            modal.classList.remove('hidden');
+        }
+
+        // Contact form handling
+        document.getElementById('contact-form').addEventListener('submit', function(e) {
+            e.preventDefault();
+
+            // Show success message
+            const successMessage = document.getElementById('success-message');
+            successMessage.classList.remove('hidden');
+
+            // Hide success message after 3 seconds
+            setTimeout(() => {
+                successMessage.classList.add('hidden');
+            }, 3000);
+
+            // Reset form
+            this.reset();
+        });
+
+        // Close modal when clicking outside
+        document.getElementById('service-modal').addEventListener('click', function(e) {
+            if (e.target === this) {
+                closeModal();
+            }
+        });
+
+        // Add search on Enter key
+        document.getElementById('search-input').addEventListener('keypress', function(e) {
+            if (e.key === 'Enter') {
+                searchProducts();
+            }
+        });
+
+        // Gallery carousel functionality
+        let currentSlide = 0;
+        const totalSlides = 3;
+        const galleryTrack = document.getElementById('gallery-track');
+        const prevBtn = document.getElementById('prev-btn');
+        const nextBtn = document.getElementById('next-btn');
+        const galleryDots = document.querySelectorAll('.gallery-dot');
+
+        function updateGallery() {
+            const translateX = -currentSlide * 100;
+            galleryTrack.style.transform = `translateX(${translateX}%)`;
+
+            // Update dots
+            galleryDots.forEach((dot, index) => {
+                if (index === currentSlide) {
+                    dot.classList.remove('bg-gray-300');
+                    dot.classList.add('bg-purple-600');
+                } else {
+                    dot.classList.remove('bg-purple-600');
+                    dot.classList.add('bg-gray-300');
+                }
+            });
+        }
+
+        function nextSlide() {
+            currentSlide = (currentSlide + 1) % totalSlides;
+            updateGallery();
+        }
+
+        function prevSlide() {
+            currentSlide = (currentSlide - 1 + totalSlides) % totalSlides;
+            updateGallery();
+        }
+
+        function goToSlide(slideIndex) {
+            currentSlide = slideIndex;
+            updateGallery();
+        }
+
+        // Event listeners for gallery
+        nextBtn.addEventListener('click', nextSlide);
+        prevBtn.addEventListener('click', prevSlide);
+
+        galleryDots.forEach((dot, index) => {
+            dot.addEventListener('click', () => goToSlide(index));
+        });
+
+        // Auto-play gallery
+        let galleryInterval = setInterval(nextSlide, 5000);
+
+        // Pause auto-play on hover
+        const gallerySection = document.querySelector('#gallery-track').parentElement.parentElement;
+        gallerySection.addEventListener('mouseenter', () => {
+            clearInterval(galleryInterval);
+        });
+
+        gallerySection.addEventListener('mouseleave', () => {
+            galleryInterval = setInterval(nextSlide, 5000);
+        });
+
+        // Sample client data
+        const clients = [
+            {
+                id: 1,
+                name: "John Smith",
+                email: "john.smith@example.com",
+                phone: "+1 555 0123",
+                company: "Tech Innovations Inc",
+                projectTitle: "E-Commerce Platform",
+                projectType: "Web Development",
+                budget: 15000,
+                status: "active",
+                startDate: "2024-01-10",
+                deadline: "2024-03-15",
+                progress: 65,
+                notes: "Client wants mobile-first design with payment integration. Regular weekly meetings scheduled.",
+                lastContact: "2024-01-20"
+            },
+            {
+                id: 2,
+                name: "Sarah Johnson",
+                email: "sarah@creativestudio.com",
+                phone: "+1 555 0456",
+                company: "Creative Studio",
+                projectTitle: "Brand Identity Design",
+                projectType: "Graphic Design",
+                budget: 3500,
+                status: "completed",
+                startDate: "2023-12-01",
+                deadline: "2024-01-15",
+                progress: 100,
+                notes: "Complete brand package delivered including logo, business cards, and brand guidelines.",
+                lastContact: "2024-01-16"
+            },
+            {
+                id: 3,
+                name: "Michael Chen",
+                email: "m.chen@healthapp.com",
+                phone: "+1 555 0789",
+                company: "HealthApp Solutions",
+                projectTitle: "Fitness Tracking App",
+                projectType: "Mobile App",
+                budget: 25000,
+                status: "active",
+                startDate: "2024-01-05",
+                deadline: "2024-04-30",
+                progress: 35,
+                notes: "iOS and Android app with wearable integration. Client very responsive and provides quick feedback.",
+                lastContact: "2024-01-18"
+            },
+            {
+                id: 4,
+                name: "Emily Davis",
+                email: "emily.davis@restaurant.com",
+                phone: "+1 555 0321",
+                company: "Bella Vista Restaurant",
+                projectTitle: "Restaurant Website",
+                projectType: "Web Development",
+                budget: 4500,
+                status: "pending",
+                startDate: "2024-01-25",
+                deadline: "2024-02-28",
+                progress: 10,
+                notes: "Waiting for final content and high-resolution images from client. Menu integration required.",
+                lastContact: "2024-01-22"
+            },
+            {
+                id: 5,
+                name: "David Wilson",
+                email: "david@startupco.com",
+                phone: "+1 555 0654",
+                company: "StartupCo",
+                projectTitle: "SaaS Dashboard",
+                projectType: "Web Development",
+                budget: 18000,
+                status: "active",
+                startDate: "2023-12-15",
+                deadline: "2024-02-20",
+                progress: 80,
+                notes: "Complex analytics dashboard with real-time data. Client is very technical and detail-oriented.",
+                lastContact: "2024-01-19"
+            },
+            {
+                id: 6,
+                name: "Lisa Brown",
+                email: "lisa@fashionbrand.com",
+                phone: "+1 555 0987",
+                company: "Fashion Forward",
+                projectTitle: "E-commerce Store",
+                projectType: "Web Development",
+                budget: 12000,
+                status: "completed",
+                startDate: "2023-11-01",
+                deadline: "2023-12-31",
+                progress: 100,
+                notes: "Beautiful fashion e-commerce site with inventory management. Client was very satisfied with results.",
+                lastContact: "2024-01-05"
+            },
+            {
+                id: 7,
+                name: "Robert Taylor",
+                email: "robert@consulting.com",
+                phone: "+1 555 0147",
+                company: "Taylor Consulting",
+                projectTitle: "Corporate Website",
+                projectType: "Web Development",
+                budget: 6500,
+                status: "pending",
+                startDate: "2024-02-01",
+                deadline: "2024-03-10",
+                progress: 5,
+                notes: "Professional consulting website with blog and case studies. Waiting for content approval.",
+                lastContact: "2024-01-21"
+            },
+            {
+                id: 8,
+                name: "Amanda White",
+                email: "amanda@nonprofit.org",
+                phone: "+1 555 0258",
+                company: "Hope Foundation",
+                projectTitle: "Donation Platform",
+                projectType: "Web Development",
+                budget: 8000,
+                status: "active",
+                startDate: "2024-01-12",
+                deadline: "2024-03-01",
+                progress: 45,
+                notes: "Non-profit donation platform with payment processing. Client needs regular progress updates.",
+                lastContact: "2024-01-20"
+            }
+        ];
+
+        let currentClientFilter = 'all';
+        let currentClients = clients;
+
+        // Sample useful links data
+        const usefulLinks = [
+            {
+                id: 1,
+                title: "GitHub",
+                url: "https://github.com",
+                reason: "Version control and code repository hosting platform. Essential for managing project source code and collaboration.",
+                category: "development",
+                dateAdded: "2024-01-15",
+                tags: ["git", "repository", "collaboration"]
+            },
+            {
+                id: 2,
+                title: "Stack Overflow",
+                url: "https://stackoverflow.com",
+                reason: "Programming Q&A community. Best resource for finding solutions to coding problems and learning from experienced developers.",
+                category: "learning",
+                dateAdded: "2024-01-14",
+                tags: ["programming", "help", "community"]
+            },
+            {
+                id: 3,
+                title: "Figma",
+                url: "https://figma.com",
+                reason: "Collaborative design tool for UI/UX design. Perfect for creating mockups, prototypes, and design systems.",
+                category: "design",
+                dateAdded: "2024-01-13",
+                tags: ["ui", "ux", "design", "prototyping"]
+            },
+            {
+                id: 4,
+                title: "Tailwind CSS",
+                url: "https://tailwindcss.com",
+                reason: "Utility-first CSS framework. Speeds up development with pre-built classes and responsive design utilities.",
+                category: "development",
+                dateAdded: "2024-01-12",
+                tags: ["css", "framework", "styling"]
+            },
+            {
+                id: 5,
+                title: "Unsplash",
+                url: "https://unsplash.com",
+                reason: "Free high-quality stock photos. Great resource for finding professional images for web projects and designs.",
+                category: "design",
+                dateAdded: "2024-01-11",
+                tags: ["photos", "stock", "free"]
+            },
+            {
+                id: 6,
+                title: "VS Code",
+                url: "https://code.visualstudio.com",
+                reason: "Powerful code editor with extensive extensions. My primary development environment for all programming tasks.",
+                category: "tools",
+                dateAdded: "2024-01-10",
+                tags: ["editor", "ide", "development"]
+            },
+            {
+                id: 7,
+                title: "MDN Web Docs",
+                url: "https://developer.mozilla.org",
+                reason: "Comprehensive web development documentation. The most reliable source for HTML, CSS, and JavaScript references.",
+                category: "learning",
+                dateAdded: "2024-01-09",
+                tags: ["documentation", "web", "reference"]
+            },
+            {
+                id: 8,
+                title: "Canva",
+                url: "https://canva.com",
+                reason: "Easy-to-use graphic design platform. Perfect for creating quick social media graphics and marketing materials.",
+                category: "design",
+                dateAdded: "2024-01-08",
+                tags: ["graphics", "templates", "marketing"]
+            },
+            {
+                id: 9,
+                title: "Postman",
+                url: "https://postman.com",
+                reason: "API development and testing tool. Essential for testing REST APIs and documenting API endpoints.",
+                category: "tools",
+                dateAdded: "2024-01-07",
+                tags: ["api", "testing", "development"]
+            },
+            {
+                id: 10,
+                title: "freeCodeCamp",
+                url: "https://freecodecamp.org",
+                reason: "Free coding education platform. Excellent resource for learning web development with hands-on projects.",
+                category: "learning",
+                dateAdded: "2024-01-06",
+                tags: ["education", "coding", "free"]
+            }
+        ];
+
+        let currentLinkFilter = 'all';
+        let currentLinks = usefulLinks;
+
+        // Sample transaction data for admin dashboard
+        const transactions = [
+            {
+                id: 1,
+                date: '2024-01-15',
+                type: 'income',
+                description: 'E-Commerce Website Template - Purchase by John Doe',
+                amount: 299.00,
+                status: 'completed',
+                paymentMethod: 'Visa Card'
+            },
+            {
+                id: 2,
+                date: '2024-01-14',
+                type: 'income',
+                description: 'React Admin Dashboard - Purchase by Sarah Smith',
+                amount: 199.00,
+                status: 'completed',
+                paymentMethod: 'Airtel Money'
+            },
+            {
+                id: 3,
+                date: '2024-01-13',
+                type: 'withdrawal',
+                description: 'Bank Transfer to Account ***1234',
+                amount: -2500.00,
+                status: 'completed',
+                paymentMethod: 'Bank Transfer'
+            },
+            {
+                id: 4,
+                date: '2024-01-12',
+                type: 'income',
+                description: 'Fitness Mobile App UI - Purchase by Mike Johnson',
+                amount: 149.00,
+                status: 'completed',
+                paymentMethod: 'TNM Mpamba'
+            },
+            {
+                id: 5,
+                date: '2024-01-11',
+                type: 'income',
+                description: 'Landing Page Template - Purchase by Lisa Brown',
+                amount: 79.00,
+                status: 'completed',
+                paymentMethod: 'Visa Card'
+            },
+            {
+                id: 6,
+                date: '2024-01-10',
+                type: 'withdrawal',
+                description: 'Airtel Money Transfer to +265881234567',
+                amount: -1200.00,
+                status: 'pending',
+                paymentMethod: 'Airtel Money'
+            },
+            {
+                id: 7,
+                date: '2024-01-09',
+                type: 'income',
+                description: 'Restaurant Management System - Purchase by David Wilson',
+                amount: 399.00,
+                status: 'completed',
+                paymentMethod: 'Visa Card'
+            },
+            {
+                id: 8,
+                date: '2024-01-08',
+                type: 'income',
+                description: 'Social Media App Template - Purchase by Emma Davis',
+                amount: 249.00,
+                status: 'completed',
+                paymentMethod: 'TNM Mpamba'
+            },
+            {
+                id: 9,
+                date: '2024-01-07',
+                type: 'withdrawal',
+                description: 'Bank Transfer to Account ***5678',
+                amount: -2000.00,
+                status: 'pending',
+                paymentMethod: 'Bank Transfer'
+            },
+            {
+                id: 10,
+                date: '2024-01-06',
+                type: 'income',
+                description: 'Custom Web Development Project - Client Payment',
+                amount: 3500.00,
+                status: 'completed',
+                paymentMethod: 'Bank Transfer'
+            }
+        ];
+
+        let currentTransactionFilter = 'all';
+
+        // Render transactions table
+        function renderTransactions() {
+            const tableBody = document.getElementById('transactions-table');
+            const filteredTransactions = currentTransactionFilter === 'all' 
+                ? transactions 
+                : transactions.filter(t => t.type === currentTransactionFilter);
+
+            tableBody.innerHTML = '';
+
+            filteredTransactions.forEach(transaction => {
+                const row = document.createElement('tr');
+                row.className = 'hover:bg-gray-50';
+
+                const statusColor = transaction.status === 'completed' ? 'green' : 
+                                  transaction.status === 'pending' ? 'orange' : 'red';
+
+                const typeColor = transaction.type === 'income' ? 'text-green-600' : 'text-red-600';
+                const amountPrefix = transaction.type === 'income' ? '+' : '';
+
+                row.innerHTML = `
+                    <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
+                        ${new Date(transaction.date).toLocaleDateString('en-US', { 
+                            year: 'numeric', 
+                            month: 'short', 
+                            day: 'numeric' 
+                        })}
+                    </td>
+                    <td class="px-6 py-4 whitespace-nowrap">
+                        <span class="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium ${transaction.type === 'income' ? 'bg-green-100 text-green-800' : 'bg-red-100 text-red-800'}">
+                            ${transaction.type === 'income' ? 'Income' : 'Withdrawal'}
+                        </span>
+                    </td>
+                    <td class="px-6 py-4 text-sm text-gray-900 max-w-xs truncate">
+                        ${transaction.description}
+                    </td>
+                    <td class="px-6 py-4 whitespace-nowrap text-sm font-medium ${typeColor}">
+                        ${amountPrefix}$${Math.abs(transaction.amount).toFixed(2)}
+                    </td>
+                    <td class="px-6 py-4 whitespace-nowrap">
+                        <span class="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-${statusColor}-100 text-${statusColor}-800">
+                            ${transaction.status.charAt(0).toUpperCase() + transaction.status.slice(1)}
+                        </span>
+                    </td>
+                `;
+
+                tableBody.appendChild(row);
+            });
+        }
+
+        // Filter transactions
+        function filterTransactions(type) {
+            currentTransactionFilter = type;
+
+            // Update filter buttons
+            document.querySelectorAll('.transaction-filter').forEach(btn => {
+                btn.classList.remove('active', 'bg-purple-600', 'text-white');
+                btn.classList.add('bg-gray-200', 'text-gray-700');
+            });
+
+            event.target.classList.add('active', 'bg-purple-600', 'text-white');
+            event.target.classList.remove('bg-gray-200', 'text-gray-700');
+
+            renderTransactions();
+        }
+
+        // Open withdrawal modal
+        function openWithdrawModal() {
+            const modal = document.getElementById('service-modal');
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = 'Withdraw Funds';
+            content.innerHTML = `
+                <form id="withdraw-form" class="space-y-6">
+                    <div class="text-center mb-6">
+                        <p class="text-lg text-gray-700 mb-2">Available Balance</p>
+                        <p class="text-3xl font-bold text-green-600">$8,750.00</p>
+                    </div>
+
+                    <div>
+                        <label for="withdraw-amount" class="block text-sm font-medium text-gray-700 mb-2">Withdrawal Amount</label>
+                        <div class="relative">
+                            <span class="absolute left-3 top-3 text-gray-500">$</span>
+                            <input type="number" id="withdraw-amount" min="10" max="8750" step="0.01" placeholder="0.00" class="w-full pl-8 pr-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-green-500 focus:border-transparent" required>
+                        </div>
+                        <p class="text-gray-500 text-sm mt-1">Minimum withdrawal: $10.00</p>
+                    </div>
+
+                    <div>
+                        <label for="withdraw-method" class="block text-sm font-medium text-gray-700 mb-2">Withdrawal Method</label>
+                        <select id="withdraw-method" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-green-500 focus:border-transparent" required>
+                            <option value="">Select withdrawal method</option>
+                            <option value="bank">Bank Transfer</option>
+                            <option value="airtel">Airtel Money</option>
+                            <option value="mpamba">TNM Mpamba</option>
+                            <option value="paypal">PayPal</option>
+                        </select>
+                    </div>
+
+                    <div id="account-details" class="hidden">
+                        <label for="account-info" class="block text-sm font-medium text-gray-700 mb-2">Account Details</label>
+                        <input type="text" id="account-info" placeholder="Enter account number or email" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-green-500 focus:border-transparent">
+                    </div>
+
+                    <div class="bg-yellow-50 p-4 rounded-lg">
+                        <div class="flex items-start">
+                            <svg class="w-5 h-5 text-yellow-600 mr-2 mt-0.5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 9v2m0 4h.01m-6.938 4h13.856c1.54 0 2.502-1.667 1.732-2.5L13.732 4c-.77-.833-1.964-.833-2.732 0L3.732 16.5c-.77.833.192 2.5 1.732 2.5z"></path>
+                            </svg>
+                            <div class="text-yellow-800 text-sm">
+                                <p class="font-semibold mb-1">Processing Information:</p>
+                                <ul class="space-y-1">
+                                    <li>• Bank transfers: 1-3 business days</li>
+                                    <li>• Mobile money: 5-30 minutes</li>
+                                    <li>• PayPal: Instant to 24 hours</li>
+                                    <li>• Processing fee: 2.5% (minimum $1)</li>
+                                </ul>
+                            </div>
+                        </div>
+                    </div>
+
+                    <div class="flex gap-3">
+                        <button type="button" onclick="closeModal()" class="flex-1 border border-gray-300 text-gray-700 py-3 rounded-lg hover:bg-gray-50 transition-colors">
+                            Cancel
+                        </button>
+                        <button type="submit" class="flex-1 bg-green-600 text-white py-3 rounded-lg hover:bg-green-700 transition-colors">
+                            Request Withdrawal
+                        </button>
+                    </div>
+                </form>
+            `;
+
+            modal.classList.remove('hidden');
+
+            // Show account details field when method is selected
+            document.getElementById('withdraw-method').addEventListener('change', function() {
+                const accountDetails = document.getElementById('account-details');
+                const accountInfo = document.getElementById('account-info');
+
+                if (this.value) {
+                    accountDetails.classList.remove('hidden');
+
+                    // Update placeholder based on method
+                    switch(this.value) {
+                        case 'bank':
+                            accountInfo.placeholder = 'Enter bank account number';
+                            break;
+                        case 'airtel':
+                            accountInfo.placeholder = 'Enter Airtel Money number (+265...)';
+                            break;
+                        case 'mpamba':
+                            accountInfo.placeholder = 'Enter TNM Mpamba number (+265...)';
+                            break;
+                        case 'paypal':
+                            accountInfo.placeholder = 'Enter PayPal email address';
+                            break;
+                    }
+                } else {
+                    accountDetails.classList.add('hidden');
+                }
+            });
+
+            // Handle withdrawal form submission
+            document.getElementById('withdraw-form').addEventListener('submit', function(e) {
+                e.preventDefault();
+                processWithdrawal();
+            });
+        }
+
+        // Process withdrawal request
+        function processWithdrawal() {
+            const amount = document.getElementById('withdraw-amount').value;
+            const method = document.getElementById('withdraw-method').value;
+            const account = document.getElementById('account-info').value;
+
+            if (!amount || !method || !account) {
+                alert('Please fill in all required fields');
+                return;
+            }
+
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = 'Withdrawal Request Submitted';
+            content.innerHTML = `
+                <div class="text-center space-y-6">
+                    <div class="w-16 h-16 bg-green-100 rounded-full flex items-center justify-center mx-auto">
+                        <svg class="w-8 h-8 text-green-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
+                        </svg>
+                    </div>
+
+                    <div>
+                        <h3 class="text-xl font-semibold text-gray-900 mb-2">Request Submitted Successfully!</h3>
+                        <p class="text-gray-600">Your withdrawal request has been submitted for processing.</p>
+                    </div>
+
+                    <div class="bg-gray-50 p-4 rounded-lg text-left">
+                        <h4 class="font-semibold text-gray-900 mb-2">Request Details:</h4>
+                        <div class="space-y-1 text-sm text-gray-700">
+                            <p><strong>Amount:</strong> $${parseFloat(amount).toFixed(2)}</p>
+                            <p><strong>Method:</strong> ${method.charAt(0).toUpperCase() + method.slice(1)}</p>
+                            <p><strong>Account:</strong> ${account}</p>
+                            <p><strong>Processing Fee:</strong> $${Math.max(1, parseFloat(amount) * 0.025).toFixed(2)}</p>
+                            <p><strong>Net Amount:</strong> $${(parseFloat(amount) - Math.max(1, parseFloat(amount) * 0.025)).toFixed(2)}</p>
+                        </div>
+                    </div>
+
+                    <div class="bg-blue-50 p-4 rounded-lg">
+                        <p class="text-blue-800 text-sm">
+                            <strong>What's Next?</strong><br>
+                            We'll process your request within 24 hours. You'll receive an email confirmation once the transfer is complete.
+                        </p>
+                    </div>
+
+                    <button onclick="closeModal(); updateDashboardAfterWithdrawal(${amount})" class="w-full bg-green-600 text-white py-3 rounded-lg hover:bg-green-700 transition-colors">
+                        Continue
+                    </button>
+                </div>
+            `;
+
+            // Add new withdrawal transaction to the list
+            const newTransaction = {
+                id: transactions.length + 1,
+                date: new Date().toISOString().split('T')[0],
+                type: 'withdrawal',
+                description: `${method.charAt(0).toUpperCase() + method.slice(1)} Transfer to ${account}`,
+                amount: -parseFloat(amount),
+                status: 'pending',
+                paymentMethod: method.charAt(0).toUpperCase() + method.slice(1)
+            };
+
+            transactions.unshift(newTransaction);
+        }
+
+        // Update dashboard after withdrawal
+        function updateDashboardAfterWithdrawal(amount) {
+            const availableBalance = document.getElementById('available-balance');
+            const pendingWithdrawals = document.getElementById('pending-withdrawals');
+
+            const currentAvailable = parseFloat(availableBalance.textContent.replace('$', '').replace(',', ''));
+            const currentPending = parseFloat(pendingWithdrawals.textContent.replace('$', '').replace(',', ''));
+
+            availableBalance.textContent = `$${(currentAvailable - parseFloat(amount)).toLocaleString('en-US', {minimumFractionDigits: 2, maximumFractionDigits: 2})}`;
+            pendingWithdrawals.textContent = `$${(currentPending + parseFloat(amount)).toLocaleString('en-US', {minimumFractionDigits: 2, maximumFractionDigits: 2})}`;
+
+            renderTransactions();
+        }
+
+        // Open post item modal
+        function openPostItemModal() {
+            const modal = document.getElementById('service-modal');
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = 'Post New Item to Marketplace';
+            content.innerHTML = `
+                <form  class="space-y-6" enctype="multipart/form-data" method="post" action="${IKPIXELS.productCreateUrl}">
+                    <input type="hidden" name="csrfmiddlewaretoken" value="${IKPIXELS.csrfToken}">
+                    <div class="grid md:grid-cols-2 gap-6">
+                        <div>
+                            <label for="item-title" class="block text-sm font-medium text-gray-700 mb-2">Product Title</label>
+                            <input name="item-title" type="text" id="item-title" placeholder="E.g., React Admin Dashboard" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent" required>
+                        </div>
+                        <div>
+                            <label for="item-price" class="block text-sm font-medium text-gray-700 mb-2">Price (MKW)</label>
+                            <div class="relative">
+                                <span class="absolute left-3 top-3 text-gray-500">$</span>
+                                <input name="item-price" type="number" id="item-price" min="1" step="0.01" placeholder="99.00" class="w-full pl-8 pr-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent" required>
+                            </div>
+                        </div>
+                    </div>
+
+                    <div>
+                        <label for="item-category" class="block text-sm font-medium text-gray-700 mb-2">Category</label>
+                        <select name="item-category" id="item-category" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent" required>
+                            <option value="">Select category</option>
+                            <option value="code">Source Code</option>
+                            <option value="apps">Mobile Apps</option>
+                            <option value="websites">Websites</option>
+                            <option value="templates">Templates</option>
+                        </select>
+                    </div>
+
+                    <div>
+                        <label for="item-description" class="block text-sm font-medium text-gray-700 mb-2">Description</label>
+                        <textarea name="item-description" id="item-description" rows="4" placeholder="Describe your product, its features, and what makes it special..." class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent" required></textarea>
+                    </div>
+
+                    <div>
+                        <label for="item-features" class="block text-sm font-medium text-gray-700 mb-2">Key Features</label>
+                        <textarea  name="item-features"  id="item-features" rows="3" placeholder="Enter each feature on a new line:
+• Responsive Design
+• Dark/Light Mode
+• User Authentication" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent" required></textarea>
+                        <p class="text-gray-500 text-sm mt-1">Enter each feature on a new line starting with •</p>
+                    </div>
+
+                    <div>
+                        <label for="item-technologies" class="block text-sm font-medium text-gray-700 mb-2">Technologies Used</label>
+                        <input name="item-technologies" type="text" id="item-technologies" placeholder="React, Node.js, MongoDB, Tailwind CSS" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent" required>
+                        <p class="text-gray-500 text-sm mt-1">Separate technologies with commas</p>
+                    </div>
+
+                    <div>
+                        <label for="item-demo" class="block text-sm font-medium text-gray-700 mb-2">Demo URL (Optional)</label>
+                        <input name="item-demo" type="url" id="item-demo" placeholder="https://demo.example.com" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent">
+                    </div>
+
+                    <div>
+                        <label for="item-image" class="block text-sm font-medium text-gray-700 mb-2">Product Image</label>
+                        <div class="space-y-4">
+                            <div class="flex items-center justify-center w-full">
+                                <label for="item-image-upload" class="flex flex-col items-center justify-center w-full h-32 border-2 border-gray-300 border-dashed rounded-lg cursor-pointer bg-gray-50 hover:bg-gray-100">
+                                    <div class="flex flex-col items-center justify-center pt-5 pb-6">
+                                        <svg class="w-8 h-8 mb-4 text-gray-500" aria-hidden="true" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 20 16">
+                                            <path stroke="currentColor" stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13 13h3a3 3 0 0 0 0-6h-.025A5.56 5.56 0 0 0 16 6.5 5.5 5.5 0 0 0 5.207 5.021C5.137 5.017 5.071 5 5 5a4 4 0 0 0 0 8h2.167M10 15V6m0 0L8 8m2-2 2 2"/>
+                                        </svg>
+                                        <p class="mb-2 text-sm text-gray-500"><span class="font-semibold">Click to upload</span> or drag and drop</p>
+                                        <p class="text-xs text-gray-500">PNG, JPG or GIF (MAX. 2MB)</p>
+                                    </div>
+                                    <input name="item-image" id="item-image-upload" type="file" accept="image/*" class="hidden" />
+                                </label>
+                            </div>
+
+                            <!-- Image Preview -->
+                            <div id="image-preview" class="hidden">
+                                <div class="relative">
+                                    <img id="preview-img" src="" alt="Preview" class="w-full h-48 object-cover rounded-lg">
+                                    <button type="button" onclick="removeImagePreview()" class="absolute top-2 right-2 bg-red-500 text-white rounded-full p-1 hover:bg-red-600">
+                                        <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M6 18L18 6M6 6l12 12"></path>
+                                        </svg>
+                                    </button>
+                                </div>
+                            </div>
+
+
+                    <div>
+                        <label for="item-file" class="block text-sm font-medium text-gray-700 mb-2">File URL (Optional)</label>
+                        <input name="item-file-url" type="url" id="item-demo" placeholder="https://demo.example.com" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent">
+                    </div>
+
+
+                    <div>
+                        <label for="item-gradient" class="block text-sm font-medium text-gray-700 mb-2">Preview Gradient</label>
+                        <select name="item-gradient" id="item-gradient" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent" required>
+                            <option value="">Select gradient style</option>
+                            <option value="linear-gradient(135deg, #667eea 0%, #764ba2 100%)">Purple Blue</option>
+                            <option value="linear-gradient(135deg, #f093fb 0%, #f5576c 100%)">Pink Red</option>
+                            <option value="linear-gradient(135deg, #4facfe 0%, #00f2fe 100%)">Blue Cyan</option>
+                            <option value="linear-gradient(135deg, #fa709a 0%, #fee140 100%)">Pink Yellow</option>
+                            <option value="linear-gradient(135deg, #a8edea 0%, #fed6e3 100%)">Mint Pink</option>
+                            <option value="linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%)">Orange Peach</option>
+                            <option value="linear-gradient(135deg, #667eea 0%, #764ba2 100%)">Indigo Purple</option>
+                        </select>
+                    </div>
+
+                    <div class="bg-blue-50 p-4 rounded-lg">
+                        <div class="flex items-start">
+                            <svg class="w-5 h-5 text-blue-600 mr-2 mt-0.5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13 16h-1v-4h-1m1-4h.01M21 12a9 9 0 11-18 0 9 9 0 0118 0z"></path>
+                            </svg>
+                            <div class="text-blue-800 text-sm">
+                                <p class="font-semibold mb-1">Posting Guidelines:</p>
+                                <ul class="space-y-1">
+                                    <li>• Ensure your product is original and high-quality</li>
+                                    <li>• Include clear documentation and setup instructions</li>
+                                    <li>• Test your code/app thoroughly before posting</li>
+                                    <li>• Provide accurate descriptions and feature lists</li>
+                                    <li>• All items are reviewed before going live</li>
+                                </ul>
+                            </div>
+                        </div>
+                    </div>
+
+                    <div class="flex gap-3">
+                        <button type="button" onclick="closeModal()" class="flex-1 border border-gray-300 text-gray-700 py-3 rounded-lg hover:bg-gray-50 transition-colors">
+                            Cancel
+                        </button>
+                        <button type="submit" class="flex-1 bg-blue-600 text-white py-3 rounded-lg hover:bg-blue-700 transition-colors">
+                            Post Item
+                        </button>
+                    </div>
+                </form>
+            `;
+
+            modal.classList.remove('hidden');
+
+
+            // Handle image upload
+            document.getElementById('item-image-upload').addEventListener('change', function(e) {
+                const file = e.target.files[0];
+                if (file) {
+                    // Check file size (2MB limit)
+                    if (file.size > 2 * 1024 * 1024) {
+                        alert('File size must be less than 2MB');
+                        e.target.value = '';
+                        return;
+                    }
+
+                    // Check file type
+                    if (!file.type.startsWith('image/')) {
+                        alert('Please select an image file');
+                        e.target.value = '';
+                        return;
+                    }
+
+                    // Show preview
+                    const reader = new FileReader();
+                    reader.onload = function(e) {
+                        document.getElementById('preview-img').src = e.target.result;
+                        document.getElementById('image-preview').classList.remove('hidden');
+                        // Disable gradient selection when image is uploaded
+                        document.getElementById('item-gradient').disabled = true;
+                        //document.getElementById('item-gradient').value = '';
+                    };
+                    reader.readAsDataURL(file);
+                }
+            });
+
+            // Handle form submission
+            document.getElementById('post-item-form').addEventListener('submit', function(e) {
+                e.preventDefault();
+                submitNewItem();
+            });
+        }
+
+
+        // Submit new item to marketplace
+        function submitNewItem() {
+            const formData = {
+                title: document.getElementById('item-title').value,
+                price: parseFloat(document.getElementById('item-price').value),
+                category: document.getElementById('item-category').value,
+                description: document.getElementById('item-description').value,
+                features: document.getElementById('item-features').value.split('\n').filter(f => f.trim()),
+                technologies: document.getElementById('item-technologies').value.split(',').map(t => t.trim()),
+                demo: document.getElementById('item-demo').value || 'https://demo.example.com',
+                gradient: document.getElementById('item-gradient').value
+            };
+
+            // Validate required fields
+            if (!formData.title || !formData.price || !formData.category || !formData.description || !formData.gradient) {
+                alert('Please fill in all required fields');
+                return;
+            }
+
+            // Create new product object
+            const newProduct = {
+                id: products.length + 1,
+                title: formData.title,
+                category: formData.category,
+                price: formData.price,
+                image: formData.gradient,
+                description: formData.description,
+                features: formData.features,
+                technologies: formData.technologies,
+                demo: formData.demo,
+                rating: 0,
+                reviews: 0
+            };
+
+            // Add to products array
+            products.push(newProduct);
+
+            // Show success message
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = 'Item Posted Successfully!';
+            content.innerHTML = `
+                <div class="text-center space-y-6">
+                    <div class="w-16 h-16 bg-green-100 rounded-full flex items-center justify-center mx-auto">
+                        <svg class="w-8 h-8 text-green-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
+                        </svg>
+                    </div>
+
+                    <div>
+                        <h3 class="text-xl font-semibold text-gray-900 mb-2">Your Item is Now Live!</h3>
+                        <p class="text-gray-600">Your product "${formData.title}" has been successfully added to the marketplace.</p>
+                    </div>
+
+                    <div class="bg-gray-50 p-4 rounded-lg text-left">
+                        <h4 class="font-semibold text-gray-900 mb-2">Item Details:</h4>
+                        <div class="space-y-1 text-sm text-gray-700">
+                            <p><strong>Title:</strong> ${formData.title}</p>
+                            <p><strong>Price:</strong> $${formData.price.toFixed(2)}</p>
+                            <p><strong>Category:</strong> ${formData.category.charAt(0).toUpperCase() + formData.category.slice(1)}</p>
+                            <p><strong>Technologies:</strong> ${formData.technologies.join(', ')}</p>
+                        </div>
+                    </div>
+
+                    <div class="bg-green-50 p-4 rounded-lg">
+                        <p class="text-green-800 text-sm">
+                            <strong>What's Next?</strong><br>
+                            Your item is now visible in the marketplace. Customers can purchase it immediately, and you'll receive notifications for each sale.
+                        </p>
+                    </div>
+
+                    <div class="flex gap-3">
+                        <button onclick="closeModal()" class="flex-1 border border-gray-300 text-gray-700 py-3 rounded-lg hover:bg-gray-50 transition-colors">
+                            Continue
+                        </button>
+                        <button onclick="showPage('marketplace'); closeModal();" class="flex-1 bg-green-600 text-white py-3 rounded-lg hover:bg-green-700 transition-colors">
+                            View in Marketplace
+                        </button>
+                    </div>
+                </div>
+            `;
+
+            // Add income transaction for demo
+            const newTransaction = {
+                id: transactions.length + 1,
+                date: new Date().toISOString().split('T')[0],
+                type: 'income',
+                description: `New marketplace listing: ${formData.title}`,
+                amount: 0, // No immediate income, just listing
+                status: 'completed',
+                paymentMethod: 'Marketplace Listing'
+            };
+
+            transactions.unshift(newTransaction);
+        }
+
+        // Generate financial report
+        function generateReport() {
+            const reportData = {
+                totalIncome: '$12,450.00',
+                availableBalance: '$8,750.00',
+                pendingWithdrawals: '$3,700.00',
+                totalTransactions: transactions.length,
+                incomeTransactions: transactions.filter(t => t.type === 'income').length,
+                withdrawalTransactions: transactions.filter(t => t.type === 'withdrawal').length,
+                generatedDate: new Date().toLocaleDateString('en-US', { 
+                    year: 'numeric', 
+                    month: 'long', 
+                    day: 'numeric' 
+                })
+            };
+
+            const reportContent = `
+ikpixels-invt Financial Report
+Generated: ${reportData.generatedDate}
+
+=== FINANCIAL SUMMARY ===
+Total Income: ${reportData.totalIncome}
+Available Balance: ${reportData.availableBalance}
+Pending Withdrawals: ${reportData.pendingWithdrawals}
+
+=== TRANSACTION SUMMARY ===
+Total Transactions: ${reportData.totalTransactions}
+Income Transactions: ${reportData.incomeTransactions}
+Withdrawal Transactions: ${reportData.withdrawalTransactions}
+
+=== RECENT TRANSACTIONS ===
+${transactions.slice(0, 10).map(t => 
+    `${t.date} | ${t.type.toUpperCase()} | $${Math.abs(t.amount).toFixed(2)} | ${t.status.toUpperCase()}`
+).join('\n')}
+
+=== NOTES ===
+- This is a demo report for ikpixels-invt dashboard
+- All financial data is simulated for demonstration purposes
+- For real financial reports, please contact support
+
+Report generated by ikpixels-invt Admin Dashboard
+Contact: hello@ikpixels-invt.com
+            `;
+
+            // Create and download the report
+            const blob = new Blob([reportContent], { type: 'text/plain' });
+            const url = URL.createObjectURL(blob);
+            const link = document.createElement('a');
+            link.href = url;
+            link.download = `ikpixels-invt_Financial_Report_${new Date().toISOString().split('T')[0]}.txt`;
+            link.click();
+            URL.revokeObjectURL(url);
+
+            // Show success message
+            const successMessage = document.getElementById('success-message');
+            successMessage.innerHTML = `
+                <div class="flex items-center">
+                    <svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 10v6m0 0l-3-3m3 3l3-3m2 8H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z"></path>
+                    </svg>
+                    Financial report downloaded successfully!
+                </div>
+            `;
+            successMessage.classList.remove('hidden');
+
+            setTimeout(() => {
+                successMessage.classList.add('hidden');
+            }, 3000);
+        }
+
+        // Render useful links
+        function renderUsefulLinks() {
+            const grid = document.getElementById('useful-links-grid');
+            if (!grid) return;
+
+            grid.innerHTML = '';
+
+            const filteredLinks = currentLinkFilter === 'all' 
+                ? usefulLinks 
+                : usefulLinks.filter(link => link.category === currentLinkFilter);
+
+            filteredLinks.forEach(link => {
+                const linkCard = document.createElement('div');
+                linkCard.className = 'bg-gray-50 rounded-xl p-6 hover:shadow-md transition-all duration-300 border border-gray-200';
+
+                const categoryColors = {
+                    development: 'bg-blue-100 text-blue-800',
+                    design: 'bg-purple-100 text-purple-800',
+                    tools: 'bg-green-100 text-green-800',
+                    learning: 'bg-orange-100 text-orange-800'
+                };
+
+                linkCard.innerHTML = `
+                    <div class="flex items-start justify-between mb-3">
+                        <div class="flex items-center">
+                            <div class="w-10 h-10 bg-white rounded-lg flex items-center justify-center mr-3 shadow-sm">
+                                <svg class="w-5 h-5 text-gray-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13.828 10.172a4 4 0 00-5.656 0l-4 4a4 4 0 105.656 5.656l1.102-1.101m-.758-4.899a4 4 0 005.656 0l4-4a4 4 0 00-5.656-5.656l-1.1 1.1"></path>
+                                </svg>
+                            </div>
+                            <div>
+                                <h3 class="font-bold text-gray-900 text-lg">${link.title}</h3>
+                                <p class="text-gray-500 text-sm">${new Date(link.dateAdded).toLocaleDateString()}</p>
+                            </div>
+                        </div>
+                        <div class="flex gap-2">
+                            <span class="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium ${categoryColors[link.category]}">
+                                ${link.category}
+                            </span>
+                            <button onclick="deleteLink(${link.id})" class="text-red-500 hover:text-red-700 p-1">
+                                <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 7l-.867 12.142A2 2 0 0116.138 21H7.862a2 2 0 01-1.995-1.858L5 7m5 4v6m4-6v6m1-10V4a1 1 0 00-1-1h-4a1 1 0 00-1 1v3M4 7h16"></path>
+                                </svg>
+                            </button>
+                        </div>
+                    </div>
+
+                    <p class="text-gray-700 text-sm mb-4 leading-relaxed">${link.reason}</p>
+
+                    <div class="flex items-center justify-between">
+                        <div class="flex flex-wrap gap-1">
+                            ${link.tags.map(tag => `
+                                <span class="bg-gray-200 text-gray-700 text-xs px-2 py-1 rounded">${tag}</span>
+                            `).join('')}
+                        </div>
+                        <a href="${link.url}" target="_blank" rel="noopener noreferrer" class="bg-orange-600 text-white px-4 py-2 rounded-lg hover:bg-orange-700 transition-colors text-sm font-medium">
+                            Visit Site
+                        </a>
+                    </div>
+                `;
+
+                grid.appendChild(linkCard);
+            });
+
+            // Show empty state if no links
+            if (filteredLinks.length === 0) {
+                grid.innerHTML = `
+                    <div class="col-span-full text-center py-12">
+                        <svg class="w-16 h-16 text-gray-300 mx-auto mb-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13.828 10.172a4 4 0 00-5.656 0l-4 4a4 4 0 105.656 5.656l1.102-1.101m-.758-4.899a4 4 0 005.656 0l4-4a4 4 0 00-5.656-5.656l-1.1 1.1"></path>
+                        </svg>
+                        <h3 class="text-lg font-medium text-gray-900 mb-2">No links found</h3>
+                        <p class="text-gray-500 mb-4">No useful links in the ${currentLinkFilter} category yet.</p>
+                        <button onclick="openAddUrlModal()" class="bg-orange-600 text-white px-4 py-2 rounded-lg hover:bg-orange-700 transition-colors">
+                            Add First Link
+                        </button>
+                    </div>
+                `;
+            }
+        }
+
+        // Filter links by category
+        function filterLinks(category) {
+            currentLinkFilter = category;
+
+            // Update filter buttons
+            document.querySelectorAll('.link-filter').forEach(btn => {
+                btn.classList.remove('active', 'bg-orange-600', 'text-white');
+                btn.classList.add('bg-gray-200', 'text-gray-700');
+            });
+
+            event.target.classList.add('active', 'bg-orange-600', 'text-white');
+            event.target.classList.remove('bg-gray-200', 'text-gray-700');
+
+            renderUsefulLinks();
+        }
+
+        // Open add URL modal
+        function openAddUrlModal() {
+            const modal = document.getElementById('service-modal');
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = 'Add Useful Web Link';
+            content.innerHTML = `
+                <form id="add-url-form" class="space-y-6">
+                    <div>
+                        <label for="url-title" class="block text-sm font-medium text-gray-700 mb-2">Link Title</label>
+                        <input type="text" id="url-title" placeholder="e.g., GitHub, Stack Overflow, Figma" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-orange-500 focus:border-transparent" required>
+                    </div>
+
+                    <div>
+                        <label for="url-link" class="block text-sm font-medium text-gray-700 mb-2">URL</label>
+                        <input type="url" id="url-link" placeholder="https://example.com" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-orange-500 focus:border-transparent" required>
+                    </div>
+
+                    <div>
+                        <label for="url-category" class="block text-sm font-medium text-gray-700 mb-2">Category</label>
+                        <select id="url-category" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-orange-500 focus:border-transparent" required>
+                            <option value="">Select category</option>
+                            <option value="development">Development</option>
+                            <option value="design">Design</option>
+                            <option value="tools">Tools</option>
+                            <option value="learning">Learning</option>
+                        </select>
+                    </div>
+
+                    <div>
+                        <label for="url-reason" class="block text-sm font-medium text-gray-700 mb-2">Why is this link useful?</label>
+                        <textarea id="url-reason" rows="4" placeholder="Explain why this link is valuable, what it's used for, and how it helps in your work..." class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-orange-500 focus:border-transparent" required></textarea>
+                    </div>
+
+                    <div>
+                        <label for="url-tags" class="block text-sm font-medium text-gray-700 mb-2">Tags (Optional)</label>
+                        <input type="text" id="url-tags" placeholder="css, framework, styling" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-orange-500 focus:border-transparent">
+                        <p class="text-gray-500 text-sm mt-1">Separate tags with commas</p>
+                    </div>
+
+                    <div class="bg-orange-50 p-4 rounded-lg">
+                        <div class="flex items-start">
+                            <svg class="w-5 h-5 text-orange-600 mr-2 mt-0.5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13 16h-1v-4h-1m1-4h.01M21 12a9 9 0 11-18 0 9 9 0 0118 0z"></path>
+                            </svg>
+                            <div class="text-orange-800 text-sm">
+                                <p class="font-semibold mb-1">Tips for adding useful links:</p>
+                                <ul class="space-y-1">
+                                    <li>• Choose links that you frequently use in your work</li>
+                                    <li>• Write clear reasons explaining the value of each link</li>
+                                    <li>• Use relevant tags to make links easier to find</li>
+                                    <li>• Organize links by appropriate categories</li>
+                                </ul>
+                            </div>
+                        </div>
+                    </div>
+
+                    <div class="flex gap-3">
+                        <button type="button" onclick="closeModal()" class="flex-1 border border-gray-300 text-gray-700 py-3 rounded-lg hover:bg-gray-50 transition-colors">
+                            Cancel
+                        </button>
+                        <button type="submit" class="flex-1 bg-orange-600 text-white py-3 rounded-lg hover:bg-orange-700 transition-colors">
+                            Add Link
+                        </button>
+                    </div>
+                </form>
+            `;
+
+            modal.classList.remove('hidden');
+
+            // Handle form submission
+            document.getElementById('add-url-form').addEventListener('submit', function(e) {
+                e.preventDefault();
+                addNewLink();
+            });
+        }
+
+        // Add new link
+        function addNewLink() {
+            const formData = {
+                title: document.getElementById('url-title').value,
+                url: document.getElementById('url-link').value,
+                category: document.getElementById('url-category').value,
+                reason: document.getElementById('url-reason').value,
+                tags: document.getElementById('url-tags').value.split(',').map(t => t.trim()).filter(t => t)
+            };
+
+            // Validate required fields
+            if (!formData.title || !formData.url || !formData.category || !formData.reason) {
+                alert('Please fill in all required fields');
+                return;
+            }
+
+            // Create new link object
+            const newLink = {
+                id: usefulLinks.length + 1,
+                title: formData.title,
+                url: formData.url,
+                reason: formData.reason,
+                category: formData.category,
+                dateAdded: new Date().toISOString().split('T')[0],
+                tags: formData.tags.length > 0 ? formData.tags : [formData.category]
+            };
+
+            // Add to links array
+            usefulLinks.unshift(newLink);
+
+            // Show success message
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = 'Link Added Successfully!';
+            content.innerHTML = `
+                <div class="text-center space-y-6">
+                    <div class="w-16 h-16 bg-green-100 rounded-full flex items-center justify-center mx-auto">
+                        <svg class="w-8 h-8 text-green-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
+                        </svg>
+                    </div>
+
+                    <div>
+                        <h3 class="text-xl font-semibold text-gray-900 mb-2">Link Saved Successfully!</h3>
+                        <p class="text-gray-600">Your useful link "${formData.title}" has been added to your collection.</p>
+                    </div>
+
+                    <div class="bg-gray-50 p-4 rounded-lg text-left">
+                        <h4 class="font-semibold text-gray-900 mb-2">Link Details:</h4>
+                        <div class="space-y-1 text-sm text-gray-700">
+                            <p><strong>Title:</strong> ${formData.title}</p>
+                            <p><strong>URL:</strong> ${formData.url}</p>
+                            <p><strong>Category:</strong> ${formData.category.charAt(0).toUpperCase() + formData.category.slice(1)}</p>
+                            <p><strong>Tags:</strong> ${newLink.tags.join(', ')}</p>
+                        </div>
+                    </div>
+
+                    <div class="bg-orange-50 p-4 rounded-lg">
+                        <p class="text-orange-800 text-sm">
+                            <strong>Quick Access:</strong><br>
+                            Your link is now available in the Useful Links section. You can filter by category or search through your saved links anytime.
+                        </p>
+                    </div>
+
+                    <div class="flex gap-3">
+                        <button onclick="closeModal(); renderUsefulLinks();" class="flex-1 border border-gray-300 text-gray-700 py-3 rounded-lg hover:bg-gray-50 transition-colors">
+                            Continue
+                        </button>
+                        <a href="${formData.url}" target="_blank" rel="noopener noreferrer" onclick="closeModal(); renderUsefulLinks();" class="flex-1 bg-orange-600 text-white py-3 rounded-lg hover:bg-orange-700 transition-colors text-center">
+                            Visit Link
+                        </a>
+                    </div>
+                </div>
+            `;
+        }
+
+        // Delete link
+        function deleteLink(linkId) {
+            const link = usefulLinks.find(l => l.id === linkId);
+            if (!link) return;
+
+            const modal = document.getElementById('service-modal');
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = 'Delete Link';
+            content.innerHTML = `
+                <div class="text-center space-y-6">
+                    <div class="w-16 h-16 bg-red-100 rounded-full flex items-center justify-center mx-auto">
+                        <svg class="w-8 h-8 text-red-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 7l-.867 12.142A2 2 0 0116.138 21H7.862a2 2 0 01-1.995-1.858L5 7m5 4v6m4-6v6m1-10V4a1 1 0 00-1-1h-4a1 1 0 00-1 1v3M4 7h16"></path>
+                        </svg>
+                    </div>
+
+                    <div>
+                        <h3 class="text-xl font-semibold text-gray-900 mb-2">Delete "${link.title}"?</h3>
+                        <p class="text-gray-600">Are you sure you want to delete this link? This action cannot be undone.</p>
+                    </div>
+
+                    <div class="bg-gray-50 p-4 rounded-lg text-left">
+                        <div class="space-y-1 text-sm text-gray-700">
+                            <p><strong>Title:</strong> ${link.title}</p>
+                            <p><strong>URL:</strong> ${link.url}</p>
+                            <p><strong>Category:</strong> ${link.category.charAt(0).toUpperCase() + link.category.slice(1)}</p>
+                        </div>
+                    </div>
+
+                    <div class="flex gap-3">
+                        <button onclick="closeModal()" class="flex-1 border border-gray-300 text-gray-700 py-3 rounded-lg hover:bg-gray-50 transition-colors">
+                            Cancel
+                        </button>
+                        <button onclick="confirmDeleteLink(${linkId})" class="flex-1 bg-red-600 text-white py-3 rounded-lg hover:bg-red-700 transition-colors">
+                            Delete Link
+                        </button>
+                    </div>
+                </div>
+            `;
+
+            modal.classList.remove('hidden');
+        }
+
+        // Confirm delete link
+        function confirmDeleteLink(linkId) {
+            const linkIndex = usefulLinks.findIndex(l => l.id === linkId);
+            if (linkIndex > -1) {
+                usefulLinks.splice(linkIndex, 1);
+            }
+
+            closeModal();
+            renderUsefulLinks();
+
+            // Show success message
+            const successMessage = document.getElementById('success-message');
+            successMessage.innerHTML = `
+                <div class="flex items-center">
+                    <svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
+                    </svg>
+                    Link deleted successfully!
+                </div>
+            `;
+            successMessage.classList.remove('hidden');
+
+            setTimeout(() => {
+                successMessage.classList.add('hidden');
+            }, 3000);
+        }
+
+        // Render clients
+        function renderClients() {
+            const grid = document.getElementById('clients-grid');
+            if (!grid) return;
+
+            grid.innerHTML = '';
+
+            const filteredClients = currentClientFilter === 'all' 
+                ? clients 
+                : clients.filter(client => client.status === currentClientFilter);
+
+            filteredClients.forEach(client => {
+                const clientCard = document.createElement('div');
+                clientCard.className = 'bg-gray-50 rounded-xl p-6 hover:shadow-md transition-all duration-300 border border-gray-200';
+
+                const statusColors = {
+                    active: 'bg-green-100 text-green-800',
+                    completed: 'bg-blue-100 text-blue-800',
+                    pending: 'bg-yellow-100 text-yellow-800'
+                };
+
+                const progressColor = client.progress >= 80 ? 'bg-green-500' : 
+                                    client.progress >= 50 ? 'bg-blue-500' : 
+                                    client.progress >= 25 ? 'bg-yellow-500' : 'bg-red-500';
+
+                clientCard.innerHTML = `
+                    <div class="flex items-start justify-between mb-4">
+                        <div class="flex items-center">
+                            <div class="w-12 h-12 bg-indigo-100 rounded-full flex items-center justify-center mr-4">
+                                <span class="text-indigo-600 font-bold text-lg">${client.name.split(' ').map(n => n[0]).join('')}</span>
+                            </div>
+                            <div>
+                                <h3 class="font-bold text-gray-900 text-lg">${client.name}</h3>
+                                <p class="text-gray-600 text-sm">${client.company}</p>
+                            </div>
+                        </div>
+                        <div class="flex gap-2">
+                            <span class="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium ${statusColors[client.status]}">
+                                ${client.status.charAt(0).toUpperCase() + client.status.slice(1)}
+                            </span>
+                            <button onclick="editClient(${client.id})" class="text-indigo-600 hover:text-indigo-800 p-1">
+                                <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M11 5H6a2 2 0 00-2 2v11a2 2 0 002 2h11a2 2 0 002-2v-5m-1.414-9.414a2 2 0 112.828 2.828L11.828 15H9v-2.828l8.586-8.586z"></path>
+                                </svg>
+                            </button>
+                            <button onclick="deleteClient(${client.id})" class="text-red-500 hover:text-red-700 p-1">
+                                <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 7l-.867 12.142A2 2 0 0116.138 21H7.862a2 2 0 01-1.995-1.858L5 7m5 4v6m4-6v6m1-10V4a1 1 0 00-1-1h-4a1 1 0 00-1 1v3M4 7h16"></path>
+                                </svg>
+                            </button>
+                        </div>
+                    </div>
+
+                    <div class="mb-4">
+                        <h4 class="font-semibold text-gray-900 mb-1">${client.projectTitle}</h4>
+                        <p class="text-gray-600 text-sm mb-2">${client.projectType} • $${client.budget.toLocaleString()}</p>
+                        <p class="text-gray-700 text-sm leading-relaxed">${client.notes}</p>
+                    </div>
+
+                    <div class="mb-4">
+                        <div class="flex justify-between items-center mb-2">
+                            <span class="text-sm font-medium text-gray-700">Progress</span>
+                            <span class="text-sm font-medium text-gray-900">${client.progress}%</span>
+                        </div>
+                        <div class="w-full bg-gray-200 rounded-full h-2">
+                            <div class="${progressColor} h-2 rounded-full transition-all duration-300" style="width: ${client.progress}%"></div>
+                        </div>
+                    </div>
+
+                    <div class="flex items-center justify-between text-sm text-gray-500">
+                        <div>
+                            <p><strong>Deadline:</strong> ${new Date(client.deadline).toLocaleDateString()}</p>
+                            <p><strong>Last Contact:</strong> ${new Date(client.lastContact).toLocaleDateString()}</p>
+                        </div>
+                        <div class="flex gap-2">
+                            <a href="mailto:${client.email}" class="bg-indigo-600 text-white px-3 py-1 rounded text-xs hover:bg-indigo-700 transition-colors">
+                                Email
+                            </a>
+                            <a href="tel:${client.phone}" class="bg-green-600 text-white px-3 py-1 rounded text-xs hover:bg-green-700 transition-colors">
+                                Call
+                            </a>
+                        </div>
+                    </div>
+                `;
+
+                grid.appendChild(clientCard);
+            });
+
+            // Show empty state if no clients
+            if (filteredClients.length === 0) {
+                grid.innerHTML = `
+                    <div class="col-span-full text-center py-12">
+                        <svg class="w-16 h-16 text-gray-300 mx-auto mb-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 4.354a4 4 0 110 5.292M15 21H3v-1a6 6 0 0112 0v1zm0 0h6v-1a6 6 0 00-9-5.197m13.5-9a2.5 2.5 0 11-5 0 2.5 2.5 0 015 0z"></path>
+                        </svg>
+                        <h3 class="text-lg font-medium text-gray-900 mb-2">No clients found</h3>
+                        <p class="text-gray-500 mb-4">No clients with ${currentClientFilter} status yet.</p>
+                        <button onclick="openAddClientModal()" class="bg-indigo-600 text-white px-4 py-2 rounded-lg hover:bg-indigo-700 transition-colors">
+                            Add First Client
+                        </button>
+                    </div>
+                `;
+            }
+        }
+
+        // Filter clients by status
+        function filterClients(status) {
+            currentClientFilter = status;
+
+            // Update filter buttons
+            document.querySelectorAll('.client-filter').forEach(btn => {
+                btn.classList.remove('active', 'bg-indigo-600', 'text-white');
+                btn.classList.add('bg-gray-200', 'text-gray-700');
+            });
+
+            event.target.classList.add('active', 'bg-indigo-600', 'text-white');
+            event.target.classList.remove('bg-gray-200', 'text-gray-700');
+
+            renderClients();
+        }
+
+        // Open add client modal
+        function openAddClientModal() {
+            const modal = document.getElementById('service-modal');
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = 'Add New Client';
+            content.innerHTML = `
+                <form id="add-client-form" class="space-y-6">
+                    <div class="grid md:grid-cols-2 gap-6">
+                        <div>
+                            <label for="client-name" class="block text-sm font-medium text-gray-700 mb-2">Full Name</label>
+                            <input type="text" id="client-name" placeholder="John Smith" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                        </div>
+                        <div>
+                            <label for="client-email" class="block text-sm font-medium text-gray-700 mb-2">Email Address</label>
+                            <input type="email" id="client-email" placeholder="john@example.com" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                        </div>
+                    </div>
+
+                    <div class="grid md:grid-cols-2 gap-6">
+                        <div>
+                            <label for="client-phone" class="block text-sm font-medium text-gray-700 mb-2">Phone Number</label>
+                            <input type="tel" id="client-phone" placeholder="+1 555 0123" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                        </div>
+                        <div>
+                            <label for="client-company" class="block text-sm font-medium text-gray-700 mb-2">Company</label>
+                            <input type="text" id="client-company" placeholder="Company Name" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                        </div>
+                    </div>
+
+                    <div class="grid md:grid-cols-2 gap-6">
+                        <div>
+                            <label for="project-title" class="block text-sm font-medium text-gray-700 mb-2">Project Title</label>
+                            <input type="text" id="project-title" placeholder="E-Commerce Website" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                        </div>
+                        <div>
+                            <label for="project-type" class="block text-sm font-medium text-gray-700 mb-2">Project Type</label>
+                            <select id="project-type" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                                <option value="">Select project type</option>
+                                <option value="Web Development">Web Development</option>
+                                <option value="Mobile App">Mobile App</option>
+                                <option value="Graphic Design">Graphic Design</option>
+                                <option value="UI/UX Design">UI/UX Design</option>
+                                <option value="Consultation">Consultation</option>
+                            </select>
+                        </div>
+                    </div>
+
+                    <div class="grid md:grid-cols-2 gap-6">
+                        <div>
+                            <label for="project-budget" class="block text-sm font-medium text-gray-700 mb-2">Budget (USD)</label>
+                            <div class="relative">
+                                <span class="absolute left-3 top-3 text-gray-500">$</span>
+                                <input type="number" id="project-budget" min="100" step="100" placeholder="5000" class="w-full pl-8 pr-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                            </div>
+                        </div>
+                        <div>
+                            <label for="project-status" class="block text-sm font-medium text-gray-700 mb-2">Status</label>
+                            <select id="project-status" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                                <option value="pending">Pending</option>
+                                <option value="active">Active</option>
+                                <option value="completed">Completed</option>
+                            </select>
+                        </div>
+                    </div>
+
+                    <div class="grid md:grid-cols-2 gap-6">
+                        <div>
+                            <label for="start-date" class="block text-sm font-medium text-gray-700 mb-2">Start Date</label>
+                            <input type="date" id="start-date" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                        </div>
+                        <div>
+                            <label for="deadline" class="block text-sm font-medium text-gray-700 mb-2">Deadline</label>
+                            <input type="date" id="deadline" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                        </div>
+                    </div>
+
+                    <div>
+                        <label for="project-notes" class="block text-sm font-medium text-gray-700 mb-2">Project Notes</label>
+                        <textarea id="project-notes" rows="4" placeholder="Project requirements, client preferences, important notes..." class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required></textarea>
+                    </div>
+
+                    <div class="bg-indigo-50 p-4 rounded-lg">
+                        <div class="flex items-start">
+                            <svg class="w-5 h-5 text-indigo-600 mr-2 mt-0.5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13 16h-1v-4h-1m1-4h.01M21 12a9 9 0 11-18 0 9 9 0 0118 0z"></path>
+                            </svg>
+                            <div class="text-indigo-800 text-sm">
+                                <p class="font-semibold mb-1">Client Management Tips:</p>
+                                <ul class="space-y-1">
+                                    <li>• Keep detailed notes about client preferences and requirements</li>
+                                    <li>• Set realistic deadlines and communicate them clearly</li>
+                                    <li>• Regular check-ins help maintain good client relationships</li>
+                                    <li>• Document all project changes and approvals</li>
+                                </ul>
+                            </div>
+                        </div>
+                    </div>
+
+                    <div class="flex gap-3">
+                        <button type="button" onclick="closeModal()" class="flex-1 border border-gray-300 text-gray-700 py-3 rounded-lg hover:bg-gray-50 transition-colors">
+                            Cancel
+                        </button>
+                        <button type="submit" class="flex-1 bg-indigo-600 text-white py-3 rounded-lg hover:bg-indigo-700 transition-colors">
+                            Add Client
+                        </button>
+                    </div>
+                </form>
+            `;
+
+            modal.classList.remove('hidden');
+
+            // Set default dates
+            const today = new Date().toISOString().split('T')[0];
+            document.getElementById('start-date').value = today;
+
+            const nextMonth = new Date();
+            nextMonth.setMonth(nextMonth.getMonth() + 1);
+            document.getElementById('deadline').value = nextMonth.toISOString().split('T')[0];
+
+            // Handle form submission
+            document.getElementById('add-client-form').addEventListener('submit', function(e) {
+                e.preventDefault();
+                addNewClient();
+            });
+        }
+
+        // Add new client
+        function addNewClient() {
+            const formData = {
+                name: document.getElementById('client-name').value,
+                email: document.getElementById('client-email').value,
+                phone: document.getElementById('client-phone').value,
+                company: document.getElementById('client-company').value,
+                projectTitle: document.getElementById('project-title').value,
+                projectType: document.getElementById('project-type').value,
+                budget: parseFloat(document.getElementById('project-budget').value),
+                status: document.getElementById('project-status').value,
+                startDate: document.getElementById('start-date').value,
+                deadline: document.getElementById('deadline').value,
+                notes: document.getElementById('project-notes').value
+            };
+
+            // Validate required fields
+            if (!formData.name || !formData.email || !formData.phone || !formData.company || 
+                !formData.projectTitle || !formData.projectType || !formData.budget || 
+                !formData.startDate || !formData.deadline || !formData.notes) {
+                alert('Please fill in all required fields');
+                return;
+            }
+
+            // Create new client object
+            const newClient = {
+                id: clients.length + 1,
+                name: formData.name,
+                email: formData.email,
+                phone: formData.phone,
+                company: formData.company,
+                projectTitle: formData.projectTitle,
+                projectType: formData.projectType,
+                budget: formData.budget,
+                status: formData.status,
+                startDate: formData.startDate,
+                deadline: formData.deadline,
+                progress: formData.status === 'completed' ? 100 : formData.status === 'active' ? 25 : 0,
+                notes: formData.notes,
+                lastContact: new Date().toISOString().split('T')[0]
+            };
+
+            // Add to clients array
+            clients.unshift(newClient);
+
+            // Show success message
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = 'Client Added Successfully!';
+            content.innerHTML = `
+                <div class="text-center space-y-6">
+                    <div class="w-16 h-16 bg-green-100 rounded-full flex items-center justify-center mx-auto">
+                        <svg class="w-8 h-8 text-green-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
+                        </svg>
+                    </div>
+
+                    <div>
+                        <h3 class="text-xl font-semibold text-gray-900 mb-2">Client Added Successfully!</h3>
+                        <p class="text-gray-600">${formData.name} from ${formData.company} has been added to your client list.</p>
+                    </div>
+
+                    <div class="bg-gray-50 p-4 rounded-lg text-left">
+                        <h4 class="font-semibold text-gray-900 mb-2">Client Details:</h4>
+                        <div class="space-y-1 text-sm text-gray-700">
+                            <p><strong>Name:</strong> ${formData.name}</p>
+                            <p><strong>Company:</strong> ${formData.company}</p>
+                            <p><strong>Project:</strong> ${formData.projectTitle}</p>
+                            <p><strong>Budget:</strong> $${formData.budget.toLocaleString()}</p>
+                            <p><strong>Deadline:</strong> ${new Date(formData.deadline).toLocaleDateString()}</p>
+                        </div>
+                    </div>
+
+                    <div class="bg-indigo-50 p-4 rounded-lg">
+                        <p class="text-indigo-800 text-sm">
+                            <strong>Next Steps:</strong><br>
+                            The client is now in your management system. You can track progress, update status, and maintain communication records.
+                        </p>
+                    </div>
+
+                    <div class="flex gap-3">
+                        <button onclick="closeModal(); renderClients();" class="flex-1 border border-gray-300 text-gray-700 py-3 rounded-lg hover:bg-gray-50 transition-colors">
+                            Continue
+                        </button>
+                        <a href="mailto:${formData.email}" onclick="closeModal(); renderClients();" class="flex-1 bg-indigo-600 text-white py-3 rounded-lg hover:bg-indigo-700 transition-colors text-center">
+                            Send Email
+                        </a>
+                    </div>
+                </div>
+            `;
+        }
+
+        // Edit client
+        function editClient(clientId) {
+            const client = clients.find(c => c.id === clientId);
+            if (!client) return;
+
+            const modal = document.getElementById('service-modal');
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = 'Edit Client';
+            content.innerHTML = `
+                <form id="edit-client-form" class="space-y-6">
+                    <div class="grid md:grid-cols-2 gap-6">
+                        <div>
+                            <label for="edit-client-name" class="block text-sm font-medium text-gray-700 mb-2">Full Name</label>
+                            <input type="text" id="edit-client-name" value="${client.name}" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                        </div>
+                        <div>
+                            <label for="edit-client-email" class="block text-sm font-medium text-gray-700 mb-2">Email Address</label>
+                            <input type="email" id="edit-client-email" value="${client.email}" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                        </div>
+                    </div>
+
+                    <div class="grid md:grid-cols-2 gap-6">
+                        <div>
+                            <label for="edit-client-phone" class="block text-sm font-medium text-gray-700 mb-2">Phone Number</label>
+                            <input type="tel" id="edit-client-phone" value="${client.phone}" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                        </div>
+                        <div>
+                            <label for="edit-client-company" class="block text-sm font-medium text-gray-700 mb-2">Company</label>
+                            <input type="text" id="edit-client-company" value="${client.company}" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                        </div>
+                    </div>
+
+                    <div class="grid md:grid-cols-2 gap-6">
+                        <div>
+                            <label for="edit-project-title" class="block text-sm font-medium text-gray-700 mb-2">Project Title</label>
+                            <input type="text" id="edit-project-title" value="${client.projectTitle}" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                        </div>
+                        <div>
+                            <label for="edit-project-type" class="block text-sm font-medium text-gray-700 mb-2">Project Type</label>
+                            <select id="edit-project-type" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                                <option value="Web Development" ${client.projectType === 'Web Development' ? 'selected' : ''}>Web Development</option>
+                                <option value="Mobile App" ${client.projectType === 'Mobile App' ? 'selected' : ''}>Mobile App</option>
+                                <option value="Graphic Design" ${client.projectType === 'Graphic Design' ? 'selected' : ''}>Graphic Design</option>
+                                <option value="UI/UX Design" ${client.projectType === 'UI/UX Design' ? 'selected' : ''}>UI/UX Design</option>
+                                <option value="Consultation" ${client.projectType === 'Consultation' ? 'selected' : ''}>Consultation</option>
+                            </select>
+                        </div>
+                    </div>
+
+                    <div class="grid md:grid-cols-3 gap-6">
+                        <div>
+                            <label for="edit-project-budget" class="block text-sm font-medium text-gray-700 mb-2">Budget (USD)</label>
+                            <div class="relative">
+                                <span class="absolute left-3 top-3 text-gray-500">$</span>
+                                <input type="number" id="edit-project-budget" value="${client.budget}" min="100" step="100" class="w-full pl-8 pr-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                            </div>
+                        </div>
+                        <div>
+                            <label for="edit-project-status" class="block text-sm font-medium text-gray-700 mb-2">Status</label>
+                            <select id="edit-project-status" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                                <option value="pending" ${client.status === 'pending' ? 'selected' : ''}>Pending</option>
+                                <option value="active" ${client.status === 'active' ? 'selected' : ''}>Active</option>
+                                <option value="completed" ${client.status === 'completed' ? 'selected' : ''}>Completed</option>
+                            </select>
+                        </div>
+                        <div>
+                            <label for="edit-progress" class="block text-sm font-medium text-gray-700 mb-2">Progress (%)</label>
+                            <input type="number" id="edit-progress" value="${client.progress}" min="0" max="100" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                        </div>
+                    </div>
+
+                    <div class="grid md:grid-cols-2 gap-6">
+                        <div>
+                            <label for="edit-start-date" class="block text-sm font-medium text-gray-700 mb-2">Start Date</label>
+                            <input type="date" id="edit-start-date" value="${client.startDate}" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                        </div>
+                        <div>
+                            <label for="edit-deadline" class="block text-sm font-medium text-gray-700 mb-2">Deadline</label>
+                            <input type="date" id="edit-deadline" value="${client.deadline}" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>
+                        </div>
+                    </div>
+
+                    <div>
+                        <label for="edit-project-notes" class="block text-sm font-medium text-gray-700 mb-2">Project Notes</label>
+                        <textarea id="edit-project-notes" rows="4" class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent" required>${client.notes}</textarea>
+                    </div>
+
+                    <div class="flex gap-3">
+                        <button type="button" onclick="closeModal()" class="flex-1 border border-gray-300 text-gray-700 py-3 rounded-lg hover:bg-gray-50 transition-colors">
+                            Cancel
+                        </button>
+                        <button type="submit" class="flex-1 bg-indigo-600 text-white py-3 rounded-lg hover:bg-indigo-700 transition-colors">
+                            Update Client
+                        </button>
+                    </div>
+                </form>
+            `;
+
+            modal.classList.remove('hidden');
+
+            // Handle form submission
+            document.getElementById('edit-client-form').addEventListener('submit', function(e) {
+                e.preventDefault();
+                updateClient(clientId);
+            });
+        }
+
+        // Update client
+        function updateClient(clientId) {
+            const clientIndex = clients.findIndex(c => c.id === clientId);
+            if (clientIndex === -1) return;
+
+            const formData = {
+                name: document.getElementById('edit-client-name').value,
+                email: document.getElementById('edit-client-email').value,
+                phone: document.getElementById('edit-client-phone').value,
+                company: document.getElementById('edit-client-company').value,
+                projectTitle: document.getElementById('edit-project-title').value,
+                projectType: document.getElementById('edit-project-type').value,
+                budget: parseFloat(document.getElementById('edit-project-budget').value),
+                status: document.getElementById('edit-project-status').value,
+                progress: parseInt(document.getElementById('edit-progress').value),
+                startDate: document.getElementById('edit-start-date').value,
+                deadline: document.getElementById('edit-deadline').value,
+                notes: document.getElementById('edit-project-notes').value
+            };
+
+            // Update client object
+            clients[clientIndex] = {
+                ...clients[clientIndex],
+                ...formData,
+                lastContact: new Date().toISOString().split('T')[0]
+            };
+
+            closeModal();
+            renderClients();
+
+            // Show success message
+            const successMessage = document.getElementById('success-message');
+            successMessage.innerHTML = `
+                <div class="flex items-center">
+                    <svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
+                    </svg>
+                    Client updated successfully!
+                </div>
+            `;
+            successMessage.classList.remove('hidden');
+
+            setTimeout(() => {
+                successMessage.classList.add('hidden');
+            }, 3000);
+        }
+
+        // Delete client
+        function deleteClient(clientId) {
+            const client = clients.find(c => c.id === clientId);
+            if (!client) return;
+
+            const modal = document.getElementById('service-modal');
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = 'Delete Client';
+            content.innerHTML = `
+                <div class="text-center space-y-6">
+                    <div class="w-16 h-16 bg-red-100 rounded-full flex items-center justify-center mx-auto">
+                        <svg class="w-8 h-8 text-red-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 7l-.867 12.142A2 2 0 0116.138 21H7.862a2 2 0 01-1.995-1.858L5 7m5 4v6m4-6v6m1-10V4a1 1 0 00-1-1h-4a1 1 0 00-1 1v3M4 7h16"></path>
+                        </svg>
+                    </div>
+
+                    <div>
+                        <h3 class="text-xl font-semibold text-gray-900 mb-2">Delete "${client.name}"?</h3>
+                        <p class="text-gray-600">Are you sure you want to delete this client? This action cannot be undone and will remove all project information.</p>
+                    </div>
+
+                    <div class="bg-gray-50 p-4 rounded-lg text-left">
+                        <div class="space-y-1 text-sm text-gray-700">
+                            <p><strong>Name:</strong> ${client.name}</p>
+                            <p><strong>Company:</strong> ${client.company}</p>
+                            <p><strong>Project:</strong> ${client.projectTitle}</p>
+                            <p><strong>Budget:</strong> $${client.budget.toLocaleString()}</p>
+                        </div>
+                    </div>
+
+                    <div class="flex gap-3">
+                        <button onclick="closeModal()" class="flex-1 border border-gray-300 text-gray-700 py-3 rounded-lg hover:bg-gray-50 transition-colors">
+                            Cancel
+                        </button>
+                        <button onclick="confirmDeleteClient(${clientId})" class="flex-1 bg-red-600 text-white py-3 rounded-lg hover:bg-red-700 transition-colors">
+                            Delete Client
+                        </button>
+                    </div>
+                </div>
+            `;
+
+            modal.classList.remove('hidden');
+        }
+
+        // Confirm delete client
+        function confirmDeleteClient(clientId) {
+            const clientIndex = clients.findIndex(c => c.id === clientId);
+            if (clientIndex > -1) {
+                clients.splice(clientIndex, 1);
+            }
+
+            closeModal();
+            renderClients();
+
+            // Show success message
+            const successMessage = document.getElementById('success-message');
+            successMessage.innerHTML = `
+                <div class="flex items-center">
+                    <svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
+                    </svg>
+                    Client deleted successfully!
+                </div>
+            `;
+            successMessage.classList.remove('hidden');
+
+            setTimeout(() => {
+                successMessage.classList.add('hidden');
+            }, 3000);
+        }
+
+        // Admin tab switching functionality
+        let currentAdminTab = 'overview';
+
+        function switchAdminTab(tabName) {
+            // Hide all tab contents
+            document.querySelectorAll('.admin-tab-content').forEach(tab => {
+                tab.classList.add('hidden');
+            });
+
+            // Show selected tab content
+            document.getElementById(tabName + '-tab').classList.remove('hidden');
+
+            // Update tab buttons
+            document.querySelectorAll('.admin-tab').forEach(btn => {
+                btn.classList.remove('active', 'border-indigo-500', 'text-indigo-600');
+                btn.classList.add('border-transparent', 'text-gray-500');
+            });
+
+            // Activate selected tab button
+            event.target.closest('.admin-tab').classList.add('active', 'border-indigo-500', 'text-indigo-600');
+            event.target.closest('.admin-tab').classList.remove('border-transparent', 'text-gray-500');
+
+            currentAdminTab = tabName;
+
+            // Render content based on tab
+            if (tabName === 'clients') {
+                renderClients();
+            } else if (tabName === 'transactions') {
+                renderTransactions();
+            } else if (tabName === 'links') {
+                renderUsefulLinks();
+            }
+        }
+
+        // Authentication and Shopping Cart State
+        let isLoggedIn = false;
+        let currentUser = null;
+        let shoppingCart = [];
+        let customerOrders = [];
+        let customerDownloads = [];
+
+        // Sample customer orders data
+        const sampleOrders = [
+            {
+                id: 'ORD-001',
+                date: '2024-01-20',
+                status: 'completed',
+                total: 299.00,
+                items: [
+                    { id: 1, title: 'E-Commerce Website Template', price: 299.00, quantity: 1 }
+                ]
+            },
+            {
+                id: 'ORD-002',
+                date: '2024-01-18',
+                status: 'completed',
+                total: 348.00,
+                items: [
+                    { id: 2, title: 'React Admin Dashboard', price: 199.00, quantity: 1 },
+                    { id: 3, title: 'Fitness Mobile App UI', price: 149.00, quantity: 1 }
+                ]
+            },
+            {
+                id: 'ORD-003',
+                date: '2024-01-15',
+                status: 'processing',
+                total: 79.00,
+                items: [
+                    { id: 4, title: 'Landing Page Template', price: 79.00, quantity: 1 }
+                ]
+            }
+        ];
+
+        // Authentication Functions
+        function showLoginModal() {
+            document.getElementById('login-modal').classList.remove('hidden');
+        }
+
+        function closeLoginModal() {
+            document.getElementById('login-modal').classList.add('hidden');
+        }
+
+        function showRegisterModal() {
+            document.getElementById('register-modal').classList.remove('hidden');
+        }
+
+        function closeRegisterModal() {
+            document.getElementById('register-modal').classList.add('hidden');
+        }
+
+        function toggleUserMenu() {
+            const dropdown = document.getElementById('user-menu-dropdown');
+            dropdown.classList.toggle('hidden');
+        }
+
+        function login(userData) {
+            isLoggedIn = true;
+            currentUser = userData;
+
+            // Update UI
+            document.getElementById('auth-buttons').classList.add('hidden');
+            document.getElementById('user-dropdown').classList.remove('hidden');
+            document.getElementById('mobile-auth-buttons').classList.add('hidden');
+            document.getElementById('mobile-user-menu').classList.remove('hidden');
+
+            // Update user display
+            document.getElementById('user-name').textContent = `${userData.firstName} ${userData.lastName}`;
+            document.getElementById('user-initials').textContent = `${userData.firstName[0]}${userData.lastName[0]}`;
+
+            // Load user data
+            customerOrders = sampleOrders;
+            customerDownloads = sampleOrders.filter(order => order.status === 'completed')
+                .flatMap(order => order.items.map(item => ({
+                    ...item,
+                    orderId: order.id,
+                    downloadDate: order.date
+                })));
+        }
+
+        function logout() {
+            isLoggedIn = false;
+            currentUser = null;
+            shoppingCart = [];
+
+            // Update UI
+            document.getElementById('auth-buttons').classList.remove('hidden');
+            document.getElementById('user-dropdown').classList.add('hidden');
+            document.getElementById('mobile-auth-buttons').classList.remove('hidden');
+            document.getElementById('mobile-user-menu').classList.add('hidden');
+
+            // Clear cart
+            updateCartDisplay();
+
+            // Redirect to home
+            showPage('home');
+        }
+
+        // Shopping Cart Functions
+        function toggleCart() {
+            const sidebar = document.getElementById('cart-sidebar');
+            const overlay = document.getElementById('cart-overlay');
+
+            if (sidebar.classList.contains('translate-x-full')) {
+                sidebar.classList.remove('translate-x-full');
+                overlay.classList.remove('hidden');
+            } else {
+                sidebar.classList.add('translate-x-full');
+                overlay.classList.add('hidden');
+            }
+        }
+
+        function addToCart(productId) {
+            const product = products.find(p => p.id === productId);
+            if (!product) return;
+
+            const existingItem = shoppingCart.find(item => item.id === productId);
+
+            if (existingItem) {
+                existingItem.quantity += 1;
+            } else {
+                shoppingCart.push({
+                    id: product.id,
+                    title: product.title,
+                    price: product.price,
+                    image: product.image,
+                    quantity: 1
+                });
+            }
+
+            updateCartDisplay();
+
+            // Show success message
+            const successMessage = document.getElementById('success-message');
+            successMessage.innerHTML = `
+                <div class="flex items-center">
+                    <svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
+                    </svg>
+                    Added to cart: ${product.title}
+                </div>
+            `;
+            successMessage.classList.remove('hidden');
+
+            setTimeout(() => {
+                successMessage.classList.add('hidden');
+            }, 3000);
+        }
+
+        function removeFromCart(productId) {
+            shoppingCart = shoppingCart.filter(item => item.id !== productId);
+            updateCartDisplay();
+        }
+
+        function updateCartQuantity(productId, newQuantity) {
+            const item = shoppingCart.find(item => item.id === productId);
+            if (item) {
+                if (newQuantity <= 0) {
+                    removeFromCart(productId);
+                } else {
+                    item.quantity = newQuantity;
+                    updateCartDisplay();
+                }
+            }
+        }
+
+        function updateCartDisplay() {
+            const cartItems = document.getElementById('cart-items');
+            const emptyCart = document.getElementById('empty-cart');
+            const cartFooter = document.getElementById('cart-footer');
+            const cartCount = document.getElementById('cart-count');
+            const cartTotal = document.getElementById('cart-total');
+
+            // Update cart count
+            const totalItems = shoppingCart.reduce((sum, item) => sum + item.quantity, 0);
+            if (totalItems > 0) {
+                cartCount.textContent = totalItems;
+                cartCount.classList.remove('hidden');
+            } else {
+                cartCount.classList.add('hidden');
+            }
+
+            // Show/hide empty state
+            if (shoppingCart.length === 0) {
+                emptyCart.classList.remove('hidden');
+                cartFooter.classList.add('hidden');
+                cartItems.innerHTML = '';
+                return;
+            }
+
+            emptyCart.classList.add('hidden');
+            cartFooter.classList.remove('hidden');
+
+            // Render cart items
+            cartItems.innerHTML = '';
+            let total = 0;
+
+            shoppingCart.forEach(item => {
+                total += item.price * item.quantity;
+
+                const cartItem = document.createElement('div');
+                cartItem.className = 'flex items-center space-x-4 p-4 bg-gray-50 rounded-lg';
+                cartItem.innerHTML = `
+                    <div class="w-16 h-16 bg-gradient-to-br rounded-lg flex-shrink-0" style="background: ${item.image}"></div>
+                    <div class="flex-1 min-w-0">
+                        <h3 class="font-semibold text-gray-900 truncate">${item.title}</h3>
+                        <p class="text-green-600 font-bold">$${item.price.toFixed(2)}</p>
+                    </div>
+                    <div class="flex items-center space-x-2">
+                        <button onclick="updateCartQuantity(${item.id}, ${item.quantity - 1})" class="w-8 h-8 bg-gray-200 rounded-full flex items-center justify-center hover:bg-gray-300">
+                            <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M20 12H4"></path>
+                            </svg>
+                        </button>
+                        <span class="w-8 text-center font-semibold">${item.quantity}</span>
+                        <button onclick="updateCartQuantity(${item.id}, ${item.quantity + 1})" class="w-8 h-8 bg-gray-200 rounded-full flex items-center justify-center hover:bg-gray-300">
+                            <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 6v6m0 0v6m0-6h6m-6 0H6"></path>
+                            </svg>
+                        </button>
+                    </div>
+                    <button onclick="removeFromCart(${item.id})" class="text-red-500 hover:text-red-700">
+                        <svg class="w-5 h-5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 7l-.867 12.142A2 2 0 0116.138 21H7.862a2 2 0 01-1.995-1.858L5 7m5 4v6m4-6v6m1-10V4a1 1 0 00-1-1h-4a1 1 0 00-1 1v3M4 7h16"></path>
+                        </svg>
+                    </button>
+                `;
+                cartItems.appendChild(cartItem);
+            });
+
+            // Update total
+            cartTotal.textContent = `$${total.toFixed(2)}`;
+        }
+
+        function proceedToCheckout() {
+            if (!isLoggedIn) {
+                toggleCart();
+                showLoginModal();
+                return;
+            }
+
+            if (shoppingCart.length === 0) return;
+
+            // Create new order
+            const newOrder = {
+                id: `ORD-${String(customerOrders.length + 1).padStart(3, '0')}`,
+                date: new Date().toISOString().split('T')[0],
+                status: 'completed',
+                total: shoppingCart.reduce((sum, item) => sum + (item.price * item.quantity), 0),
+                items: shoppingCart.map(item => ({
+                    id: item.id,
+                    title: item.title,
+                    price: item.price,
+                    quantity: item.quantity
+                }))
+            };
+
+            customerOrders.unshift(newOrder);
+
+            // Add to downloads
+            newOrder.items.forEach(item => {
+                customerDownloads.unshift({
+                    ...item,
+                    orderId: newOrder.id,
+                    downloadDate: newOrder.date
+                });
+            });
+
+            // Clear cart
+            shoppingCart = [];
+            updateCartDisplay();
+            toggleCart();
+
+            // Show success and redirect to dashboard
+            const successMessage = document.getElementById('success-message');
+            successMessage.innerHTML = `
+                <div class="flex items-center">
+                    <svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
+                    </svg>
+                    Order placed successfully! Order ID: ${newOrder.id}
+                </div>
+            `;
+            successMessage.classList.remove('hidden');
+
+            setTimeout(() => {
+                successMessage.classList.add('hidden');
+                showPage('customer-dashboard');
+                switchCustomerTab('orders');
+            }, 2000);
+        }
+
+        // Customer Dashboard Functions
+        let currentCustomerTab = 'overview';
+
+        function switchCustomerTab(tabName) {
+            // Hide all tab contents
+            document.querySelectorAll('.customer-tab-content').forEach(tab => {
+                tab.classList.add('hidden');
+            });
+
+            // Show selected tab content
+            document.getElementById('customer-' + tabName + '-tab').classList.remove('hidden');
+
+            // Update tab buttons
+            document.querySelectorAll('.customer-tab').forEach(btn => {
+                btn.classList.remove('active', 'border-blue-500', 'text-blue-600');
+                btn.classList.add('border-transparent', 'text-gray-500');
+            });
+
+            // Activate selected tab button
+            event.target.closest('.customer-tab').classList.add('active', 'border-blue-500', 'text-blue-600');
+            event.target.closest('.customer-tab').classList.remove('border-transparent', 'text-gray-500');
+
+            currentCustomerTab = tabName;
+
+            // Render content based on tab
+            if (tabName === 'overview') {
+                renderRecentOrders();
+            } else if (tabName === 'orders') {
+                renderCustomerOrders();
+            } else if (tabName === 'downloads') {
+                renderCustomerDownloads();
+            }
+        }
+
+        function renderRecentOrders() {
+            const container = document.getElementById('recent-orders-list');
+            if (!container) return;
+
+            const recentOrders = customerOrders.slice(0, 3);
+
+            if (recentOrders.length === 0) {
+                container.innerHTML = `
+                    <div class="text-center py-8">
+                        <p class="text-gray-500">No orders yet. Start shopping to see your orders here!</p>
+                        <button onclick="showPage('marketplace')" class="mt-4 bg-blue-600 text-white px-6 py-2 rounded-lg hover:bg-blue-700 transition-colors">
+                            Browse Products
+                        </button>
+                    </div>
+                `;
+                return;
+            }
+
+            container.innerHTML = '';
+            recentOrders.forEach(order => {
+                const orderElement = document.createElement('div');
+                orderElement.className = 'flex items-center justify-between p-4 bg-gray-50 rounded-lg';
+                orderElement.innerHTML = `
+                    <div>
+                        <h3 class="font-semibold text-gray-900">${order.id}</h3>
+                        <p class="text-gray-600 text-sm">${new Date(order.date).toLocaleDateString()} • ${order.items.length} item(s)</p>
+                    </div>
+                    <div class="text-right">
+                        <p class="font-bold text-green-600">$${order.total.toFixed(2)}</p>
+                        <span class="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium ${
+                            order.status === 'completed' ? 'bg-green-100 text-green-800' : 
+                            order.status === 'processing' ? 'bg-yellow-100 text-yellow-800' : 
+                            'bg-gray-100 text-gray-800'
+                        }">
+                            ${order.status.charAt(0).toUpperCase() + order.status.slice(1)}
+                        </span>
+                    </div>
+                `;
+                container.appendChild(orderElement);
+            });
+        }
+
+        function renderCustomerOrders() {
+            const container = document.getElementById('customer-orders-list');
+            if (!container) return;
+
+            if (customerOrders.length === 0) {
+                container.innerHTML = `
+                    <div class="text-center py-12">
+                        <svg class="w-16 h-16 text-gray-300 mx-auto mb-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M16 11V7a4 4 0 00-8 0v4M5 9h14l1 12H4L5 9z"></path>
+                        </svg>
+                        <h3 class="text-lg font-medium text-gray-900 mb-2">No orders yet</h3>
+                        <p class="text-gray-500 mb-4">Start shopping to see your orders here</p>
+                        <button onclick="showPage('marketplace')" class="bg-blue-600 text-white px-6 py-2 rounded-lg hover:bg-blue-700 transition-colors">
+                            Browse Products
+                        </button>
+                    </div>
+                `;
+                return;
+            }
+
+            container.innerHTML = '';
+            customerOrders.forEach(order => {
+                const orderElement = document.createElement('div');
+                orderElement.className = 'p-6';
+                orderElement.innerHTML = `
+                    <div class="flex items-center justify-between mb-4">
+                        <div>
+                            <h3 class="text-lg font-semibold text-gray-900">${order.id}</h3>
+                            <p class="text-gray-600">Placed on ${new Date(order.date).toLocaleDateString()}</p>
+                        </div>
+                        <div class="text-right">
+                            <p class="text-2xl font-bold text-green-600">$${order.total.toFixed(2)}</p>
+                            <span class="inline-flex items-center px-3 py-1 rounded-full text-sm font-medium ${
+                                order.status === 'completed' ? 'bg-green-100 text-green-800' : 
+                                order.status === 'processing' ? 'bg-yellow-100 text-yellow-800' : 
+                                'bg-gray-100 text-gray-800'
+                            }">
+                                ${order.status.charAt(0).toUpperCase() + order.status.slice(1)}
+                            </span>
+                        </div>
+                    </div>
+
+                    <div class="space-y-3">
+                        ${order.items.map(item => `
+                            <div class="flex items-center justify-between p-3 bg-gray-50 rounded-lg">
+                                <div>
+                                    <h4 class="font-medium text-gray-900">${item.title}</h4>
+                                    <p class="text-gray-600 text-sm">Quantity: ${item.quantity}</p>
+                                </div>
+                                <div class="text-right">
+                                    <p class="font-semibold text-gray-900">$${(item.price * item.quantity).toFixed(2)}</p>
+                                    ${order.status === 'completed' ? `
+                                        <button onclick="downloadProduct(${item.id})" class="text-blue-600 hover:text-blue-700 text-sm font-medium">
+                                            Download
+                                        </button>
+                                    ` : ''}
+                                </div>
+                            </div>
+                        `).join('')}
+                    </div>
+                `;
+                container.appendChild(orderElement);
+            });
+        }
+
+        function renderCustomerDownloads() {
+            const container = document.getElementById('customer-downloads-grid');
+            if (!container) return;
+
+            if (customerDownloads.length === 0) {
+                container.innerHTML = `
+                    <div class="col-span-full text-center py-12">
+                        <svg class="w-16 h-16 text-gray-300 mx-auto mb-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 10v6m0 0l-3-3m3 3l3-3m2 8H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z"></path>
+                        </svg>
+                        <h3 class="text-lg font-medium text-gray-900 mb-2">No downloads available</h3>
+                        <p class="text-gray-500 mb-4">Purchase products to access downloads</p>
+                        <button onclick="showPage('marketplace')" class="bg-purple-600 text-white px-6 py-2 rounded-lg hover:bg-purple-700 transition-colors">
+                            Browse Products
+                        </button>
+                    </div>
+                `;
+                return;
+            }
+
+            container.innerHTML = '';
+            customerDownloads.forEach(download => {
+                const product = products.find(p => p.id === download.id);
+                const downloadElement = document.createElement('div');
+                downloadElement.className = 'bg-gray-50 rounded-xl p-6 hover:shadow-md transition-shadow';
+                downloadElement.innerHTML = `
+                    <div class="w-full h-32 bg-gradient-to-br rounded-lg mb-4" style="background: ${product ? product.image : 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)'}"></div>
+                    <h3 class="font-bold text-gray-900 mb-2">${download.title}</h3>
+                    <p class="text-gray-600 text-sm mb-4">Order: ${download.orderId} • Downloaded: ${new Date(download.downloadDate).toLocaleDateString()}</p>
+                    <div class="flex gap-2">
+                        <button onclick="downloadProduct(${download.id})" class="flex-1 bg-purple-600 text-white py-2 px-4 rounded-lg hover:bg-purple-700 transition-colors text-sm font-medium">
+                            Download Again
+                        </button>
+                        ${product ? `
+                            <button onclick="showProductDetail(${download.id})" class="flex-1 border border-gray-300 text-gray-700 py-2 px-4 rounded-lg hover:bg-gray-50 transition-colors text-sm font-medium">
+                                View Details
+                            </button>
+                        ` : ''}
+                    </div>
+                `;
+                container.appendChild(downloadElement);
+            });
+        }
+
+        function deleteAccount() {
+            const modal = document.getElementById('service-modal');
+            const title = document.getElementById('modal-title');
+            const content = document.getElementById('modal-content');
+
+            title.textContent = 'Delete Account';
+            content.innerHTML = `
+                <div class="text-center space-y-6">
+                    <div class="w-16 h-16 bg-red-100 rounded-full flex items-center justify-center mx-auto">
+                        <svg class="w-8 h-8 text-red-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 9v2m0 4h.01m-6.938 4h13.856c1.54 0 2.502-1.667 1.732-2.5L13.732 4c-.77-.833-1.964-.833-2.732 0L3.732 16.5c-.77.833.192 2.5 1.732 2.5z"></path>
+                        </svg>
+                    </div>
+
+                    <div>
+                        <h3 class="text-xl font-semibold text-gray-900 mb-2">Are you sure?</h3>
+                        <p class="text-gray-600">This action cannot be undone. All your data, orders, and downloads will be permanently deleted.</p>
+                    </div>
+
+                    <div class="bg-red-50 p-4 rounded-lg">
+                        <p class="text-red-800 text-sm">
+                            <strong>This will delete:</strong><br>
+                            • Your account and profile information<br>
+                            • All order history and downloads<br>
+                            • Saved preferences and settings
+                        </p>
+                    </div>
+
+                    <div class="flex gap-3">
+                        <button onclick="closeModal()" class="flex-1 border border-gray-300 text-gray-700 py-3 rounded-lg hover:bg-gray-50 transition-colors">
+                            Cancel
+                        </button>
+                        <button onclick="confirmDeleteAccount()" class="flex-1 bg-red-600 text-white py-3 rounded-lg hover:bg-red-700 transition-colors">
+                            Delete Account
+                        </button>
+                    </div>
+                </div>
+            `;
+
+            modal.classList.remove('hidden');
+        }
+
+        function confirmDeleteAccount() {
+            logout();
+            closeModal();
+
+            const successMessage = document.getElementById('success-message');
+            successMessage.innerHTML = `
+                <div class="flex items-center">
+                    <svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
+                    </svg>
+                    Account deleted successfully
+                </div>
+            `;
+            successMessage.classList.remove('hidden');
+
+            setTimeout(() => {
+                successMessage.classList.add('hidden');
+            }, 3000);
+        }
+
+        // Form Handlers
+        document.addEventListener('DOMContentLoaded', function() {
+            // Login form handler
+            document.getElementById('login-form').addEventListener('submit', function(e) {
+                e.preventDefault();
+
+                const email = document.getElementById('login-email').value;
+                const password = document.getElementById('login-password').value;
+
+                // Simulate login (in real app, this would be an API call)
+                const userData = {
+                    firstName: 'John',
+                    lastName: 'Doe',
+                    email: email
+                };
+
+                login(userData);
+                closeLoginModal();
+
+                const successMessage = document.getElementById('success-message');
+                successMessage.innerHTML = `
+                    <div class="flex items-center">
+                        <svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
+                        </svg>
+                        Welcome back, ${userData.firstName}!
+                    </div>
+                `;
+                successMessage.classList.remove('hidden');
+
+                setTimeout(() => {
+                    successMessage.classList.add('hidden');
+                }, 3000);
+            });
+
+            // Register form handler
+            document.getElementById('register-form').addEventListener('submit', function(e) {
+                e.preventDefault();
+
+                const firstName = document.getElementById('register-first-name').value;
+                const lastName = document.getElementById('register-last-name').value;
+                const email = document.getElementById('register-email').value;
+                const password = document.getElementById('register-password').value;
+                const confirmPassword = document.getElementById('register-confirm-password').value;
+
+                if (password !== confirmPassword) {
+                    alert('Passwords do not match');
+                    return;
+                }
+
+                // Simulate registration (in real app, this would be an API call)
+                const userData = {
+                    firstName: firstName,
+                    lastName: lastName,
+                    email: email
+                };
+
+                login(userData);
+                closeRegisterModal();
+
+                const successMessage = document.getElementById('success-message');
+                successMessage.innerHTML = `
+                    <div class="flex items-center">
+                        <svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
+                        </svg>
+                        Account created successfully! Welcome, ${userData.firstName}!
+                    </div>
+                `;
+                successMessage.classList.remove('hidden');
+
+                setTimeout(() => {
+                    successMessage.classList.add('hidden');
+                }, 3000);
+            });
+
+            // Profile form handler
+            document.getElementById('profile-form').addEventListener('submit', function(e) {
+                e.preventDefault();
+
+                const successMessage = document.getElementById('success-message');
+                successMessage.innerHTML = `
+                    <div class="flex items-center">
+                        <svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
+                        </svg>
+                        Profile updated successfully!
+                    </div>
+                `;
+                successMessage.classList.remove('hidden');
+
+                setTimeout(() => {
+                    successMessage.classList.add('hidden');
+                }, 3000);
+            });
+
+            // Password form handler
+            document.getElementById('password-form').addEventListener('submit', function(e) {
+                e.preventDefault();
+
+                const currentPassword = document.getElementById('current-password').value;
+                const newPassword = document.getElementById('new-password').value;
+                const confirmPassword = document.getElementById('confirm-password').value;
+
+                if (newPassword !== confirmPassword) {
+                    alert('New passwords do not match');
+                    return;
+                }
+
+                // Clear form
+                this.reset();
+
+                const successMessage = document.getElementById('success-message');
+                successMessage.innerHTML = `
+                    <div class="flex items-center">
+                        <svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
+                        </svg>
+                        Password changed successfully!
+                    </div>
+                `;
+                successMessage.classList.remove('hidden');
+
+                setTimeout(() => {
+                    successMessage.classList.add('hidden');
+                }, 3000);
+            });
+
+            // Initialize marketplace
+            renderProducts(products);
+            updateCartDisplay();
+        });
+
+        // Smooth scroll for navigation links
+        document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+            anchor.addEventListener('click', function (e) {
+                e.preventDefault();
+                const target = document.querySelector(this.getAttribute('href'));
+                if (target) {
+                    target.scrollIntoView({
+                        behavior: 'smooth'
+                    });
+                }
+
+                // Close mobile menu if open
+                document.getElementById('mobile-menu').classList.add('hidden');
+            });
+        });
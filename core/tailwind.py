@@ -0,0 +1,638 @@
+# tailwind.py
+"""
+Offline generator for the Tailwind CSS utilities the site actually uses.
+
+The pages used to load the Tailwind Play CDN, which ships a compiler to
+the browser and builds CSS on every page load. Instead, ``build_css``
+scans the templates (and the static JS that injects markup) for class
+names, and this module turns the recognised ones into plain CSS that
+matches Tailwind v3 output: preflight, the utilities, then the hover /
+focus / disabled / group-hover variants, then the sm/md/lg/xl breakpoints.
+
+Only the utility families and theme values this project uses are
+implemented; unknown class names (custom classes, Font Awesome, ...) are
+ignored.
+"""
+import re
+from pathlib import Path
+
+# --------------------------------------------------------------------------
+# Theme (Tailwind v3 defaults)
+# --------------------------------------------------------------------------
+
+PALETTE = {
+    "gray": ["#f9fafb", "#f3f4f6", "#e5e7eb", "#d1d5db", "#9ca3af", "#6b7280", "#4b5563", "#374151", "#1f2937", "#111827"],
+    "red": ["#fef2f2", "#fee2e2", "#fecaca", "#fca5a5", "#f87171", "#ef4444", "#dc2626", "#b91c1c", "#991b1b", "#7f1d1d"],
+    "orange": ["#fff7ed", "#ffedd5", "#fed7aa", "#fdba74", "#fb923c", "#f97316", "#ea580c", "#c2410c", "#9a3412", "#7c2d12"],
+    "yellow": ["#fefce8", "#fef9c3", "#fef08a", "#fde047", "#facc15", "#eab308", "#ca8a04", "#a16207", "#854d0e", "#713f12"],
+    "green": ["#f0fdf4", "#dcfce7", "#bbf7d0", "#86efac", "#4ade80", "#22c55e", "#16a34a", "#15803d", "#166534", "#14532d"],
+    "emerald": ["#ecfdf5", "#d1fae5", "#a7f3d0", "#6ee7b7", "#34d399", "#10b981", "#059669", "#047857", "#065f46", "#064e3b"],
+    "cyan": ["#ecfeff", "#cffafe", "#a5f3fc", "#67e8f9", "#22d3ee", "#06b6d4", "#0891b2", "#0e7490", "#155e75", "#164e63"],
+    "blue": ["#eff6ff", "#dbeafe", "#bfdbfe", "#93c5fd", "#60a5fa", "#3b82f6", "#2563eb", "#1d4ed8", "#1e40af", "#1e3a8a"],
+    "indigo": ["#eef2ff", "#e0e7ff", "#c7d2fe", "#a5b4fc", "#818cf8", "#6366f1", "#4f46e5", "#4338ca", "#3730a3", "#312e81"],
+    "purple": ["#faf5ff", "#f3e8ff", "#e9d5ff", "#d8b4fe", "#c084fc", "#a855f7", "#9333ea", "#7e22ce", "#6b21a8", "#581c87"],
+    "pink": ["#fdf2f8", "#fce7f3", "#fbcfe8", "#f9a8d4", "#f472b6", "#ec4899", "#db2777", "#be185d", "#9d174d", "#831843"],
+}
+SHADES = ("50", "100", "200", "300", "400", "500", "600", "700", "800", "900")
+COLORS = {"black": "#000000", "white": "#ffffff"}
+for _name, _values in PALETTE.items():
+    for _shade, _hex in zip(SHADES, _values):
+        COLORS[f"{_name}-{_shade}"] = _hex
+SPECIAL_COLORS = {"transparent": "transparent", "current": "currentColor", "inherit": "inherit"}
+
+SCREENS = {"sm": "640px", "md": "768px", "lg": "1024px", "xl": "1280px", "2xl": "1536px"}
+
+FONT_SIZES = {
+    "xs": ("0.75rem", "1rem"),
+    "sm": ("0.875rem", "1.25rem"),
+    "base": ("1rem", "1.5rem"),
+    "lg": ("1.125rem", "1.75rem"),
+    "xl": ("1.25rem", "1.75rem"),
+    "2xl": ("1.5rem", "2rem"),
+    "3xl": ("1.875rem", "2.25rem"),
+    "4xl": ("2.25rem", "2.5rem"),
+    "5xl": ("3rem", "1"),
+    "6xl": ("3.75rem", "1"),
+    "7xl": ("4.5rem", "1"),
+}
+FONT_WEIGHTS = {
+    "thin": "100", "extralight": "200", "light": "300", "normal": "400", "medium": "500",
+    "semibold": "600", "bold": "700", "extrabold": "800", "black": "900",
+}
+LEADING = {"none": "1", "tight": "1.25", "snug": "1.375", "normal": "1.5", "relaxed": "1.625", "loose": "2"}
+TRACKING = {
+    "tighter": "-0.05em", "tight": "-0.025em", "normal": "0em",
+    "wide": "0.025em", "wider": "0.05em", "widest": "0.1em",
+}
+RADII = {
+    "none": "0px", "sm": "0.125rem", "": "0.25rem", "md": "0.375rem", "lg": "0.5rem",
+    "xl": "0.75rem", "2xl": "1rem", "3xl": "1.5rem", "full": "9999px",
+}
+MAX_WIDTHS = {
+    "none": "none", "xs": "20rem", "sm": "24rem", "md": "28rem", "lg": "32rem", "xl": "36rem",
+    "2xl": "42rem", "3xl": "48rem", "4xl": "56rem", "5xl": "64rem", "6xl": "72rem", "7xl": "80rem",
+    "full": "100%", "screen-xl": "1280px",
+}
+SHADOWS = {
+    "sm": ("0 1px 2px 0 rgb(0 0 0 / 0.05)", "0 1px 2px 0 var(--tw-shadow-color)"),
+    "": ("0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)",
+         "0 1px 3px 0 var(--tw-shadow-color), 0 1px 2px -1px var(--tw-shadow-color)"),
+    "md": ("0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)",
+           "0 4px 6px -1px var(--tw-shadow-color), 0 2px 4px -2px var(--tw-shadow-color)"),
+    "lg": ("0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)",
+           "0 10px 15px -3px var(--tw-shadow-color), 0 4px 6px -4px var(--tw-shadow-color)"),
+    "xl": ("0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)",
+           "0 20px 25px -5px var(--tw-shadow-color), 0 8px 10px -6px var(--tw-shadow-color)"),
+    "2xl": ("0 25px 50px -12px rgb(0 0 0 / 0.25)", "0 25px 50px -12px var(--tw-shadow-color)"),
+    "none": ("0 0 #0000", "0 0 #0000"),
+}
+TRANSITIONS = {
+    "": "color, background-color, border-color, text-decoration-color, fill, stroke, opacity, "
+        "box-shadow, transform, filter, backdrop-filter",
+    "all": "all",
+    "colors": "color, background-color, border-color, text-decoration-color, fill, stroke",
+    "opacity": "opacity",
+    "shadow": "box-shadow",
+    "transform": "transform",
+}
+EASINGS = {
+    "linear": "linear", "in": "cubic-bezier(0.4, 0, 1, 1)",
+    "out": "cubic-bezier(0, 0, 0.2, 1)", "in-out": "cubic-bezier(0.4, 0, 0.2, 1)",
+}
+ANIMATIONS = {
+    "spin": ("spin 1s linear infinite", "@keyframes spin{to{transform:rotate(360deg)}}"),
+    "ping": ("ping 1s cubic-bezier(0, 0, 0.2, 1) infinite",
+             "@keyframes ping{75%,100%{transform:scale(2);opacity:0}}"),
+    "pulse": ("pulse 2s cubic-bezier(0.4, 0, 0.6, 1) infinite", "@keyframes pulse{50%{opacity:.5}}"),
+    "bounce": ("bounce 1s infinite",
+               "@keyframes bounce{0%,100%{transform:translateY(-25%);"
+               "animation-timing-function:cubic-bezier(0.8,0,1,1)}"
+               "50%{transform:none;animation-timing-function:cubic-bezier(0,0,0.2,1)}}"),
+}
+GRADIENT_DIRECTIONS = {
+    "t": "to top", "tr": "to top right", "r": "to right", "br": "to bottom right",
+    "b": "to bottom", "bl": "to bottom left", "l": "to left", "tl": "to top left",
+}
+
+TRANSFORM = (
+    "translate(var(--tw-translate-x), var(--tw-translate-y)) rotate(var(--tw-rotate)) "
+    "skewX(var(--tw-skew-x)) skewY(var(--tw-skew-y)) scaleX(var(--tw-scale-x)) scaleY(var(--tw-scale-y))"
+)
+SIBLINGS = " > :not([hidden]) ~ :not([hidden])"
+
+PREFLIGHT = """\
+*,::before,::after{box-sizing:border-box;border-width:0;border-style:solid;border-color:#e5e7eb}
+::before,::after{--tw-content:''}
+html,:host{line-height:1.5;-webkit-text-size-adjust:100%;-moz-tab-size:4;tab-size:4;font-family:ui-sans-serif,system-ui,sans-serif,"Apple Color Emoji","Segoe UI Emoji","Segoe UI Symbol","Noto Color Emoji";font-feature-settings:normal;font-variation-settings:normal;-webkit-tap-highlight-color:transparent}
+body{margin:0;line-height:inherit}
+hr{height:0;color:inherit;border-top-width:1px}
+abbr:where([title]){-webkit-text-decoration:underline dotted;text-decoration:underline dotted}
+h1,h2,h3,h4,h5,h6{font-size:inherit;font-weight:inherit}
+a{color:inherit;text-decoration:inherit}
+b,strong{font-weight:bolder}
+code,kbd,samp,pre{font-family:ui-monospace,SFMono-Regular,Menlo,Monaco,Consolas,"Liberation Mono","Courier New",monospace;font-feature-settings:normal;font-variation-settings:normal;font-size:1em}
+small{font-size:80%}
+sub,sup{font-size:75%;line-height:0;position:relative;vertical-align:baseline}
+sub{bottom:-0.25em}
+sup{top:-0.5em}
+table{text-indent:0;border-color:inherit;border-collapse:collapse}
+button,input,optgroup,select,textarea{font-family:inherit;font-feature-settings:inherit;font-variation-settings:inherit;font-size:100%;font-weight:inherit;line-height:inherit;letter-spacing:inherit;color:inherit;margin:0;padding:0}
+button,select{text-transform:none}
+button,input:where([type='button']),input:where([type='reset']),input:where([type='submit']){-webkit-appearance:button;background-color:transparent;background-image:none}
+:-moz-focusring{outline:auto}
+:-moz-ui-invalid{box-shadow:none}
+progress{vertical-align:baseline}
+::-webkit-inner-spin-button,::-webkit-outer-spin-button{height:auto}
+[type='search']{-webkit-appearance:textfield;outline-offset:-2px}
+::-webkit-search-decoration{-webkit-appearance:none}
+::-webkit-file-upload-button{-webkit-appearance:button;font:inherit}
+summary{display:list-item}
+blockquote,dl,dd,h1,h2,h3,h4,h5,h6,hr,figure,p,pre{margin:0}
+fieldset{margin:0;padding:0}
+legend{padding:0}
+ol,ul,menu{list-style:none;margin:0;padding:0}
+dialog{padding:0}
+textarea{resize:vertical}
+input::placeholder,textarea::placeholder{opacity:1;color:#9ca3af}
+button,[role="button"]{cursor:pointer}
+:disabled{cursor:default}
+img,svg,video,canvas,audio,iframe,embed,object{display:block;vertical-align:middle}
+img,video{max-width:100%;height:auto}
+[hidden]:where(:not([hidden="until-found"])){display:none}
+*,::before,::after,::backdrop{--tw-translate-x:0;--tw-translate-y:0;--tw-rotate:0;--tw-skew-x:0;--tw-skew-y:0;--tw-scale-x:1;--tw-scale-y:1;--tw-gradient-from-position: ;--tw-gradient-via-position: ;--tw-gradient-to-position: ;--tw-ring-inset: ;--tw-ring-offset-width:0px;--tw-ring-offset-color:#fff;--tw-ring-color:rgb(59 130 246 / 0.5);--tw-ring-offset-shadow:0 0 #0000;--tw-ring-shadow:0 0 #0000;--tw-shadow:0 0 #0000;--tw-shadow-colored:0 0 #0000}
+"""
+
+# --------------------------------------------------------------------------
+# Utilities
+# --------------------------------------------------------------------------
+
+# Tailwind's core plugin order; later groups win over earlier ones.
+ORDER = [
+    "position", "inset", "z", "col", "margin", "line-clamp", "display", "aspect", "height",
+    "max-height", "min-height", "width", "min-width", "max-width", "flex", "flex-shrink",
+    "translate", "scale", "transform", "animation", "cursor", "grid-cols", "flex-direction",
+    "flex-wrap", "items", "justify", "gap", "space", "divide-width", "divide-style", "divide-color",
+    "overflow", "text-overflow", "whitespace", "rounded", "border-width", "border-style",
+    "border-color", "bg-color", "bg-opacity", "bg-image", "gradient", "bg-clip", "object-fit",
+    "padding", "text-align", "font-size", "font-weight", "text-transform", "leading", "tracking",
+    "text-color", "placeholder", "opacity", "shadow", "outline", "ring-width", "ring-color",
+    "ring-offset", "transition", "duration", "ease",
+]
+_ORDER_INDEX = {name: i for i, name in enumerate(ORDER)}
+
+VARIANTS = ("hover", "focus", "disabled", "group-hover")
+
+
+class Rule:
+    def __init__(self, group, declarations, suffix="", keyframes=None):
+        self.group = group
+        self.declarations = declarations
+        self.suffix = suffix  # appended to the selector, e.g. "::placeholder"
+        self.keyframes = keyframes
+
+
+def _rem(n):
+    value = float(n) * 0.25
+    return "0px" if value == 0 else f"{value:g}rem"
+
+
+def _spacing(key):
+    if key == "px":
+        return "1px"
+    if key == "0":
+        return "0px"
+    if re.fullmatch(r"\d+(\.5)?", key):
+        return _rem(key)
+    return None
+
+
+def _fraction(key):
+    m = re.fullmatch(r"(\d+)/(\d+)", key)
+    if m:
+        return f"{int(m.group(1)) / int(m.group(2)) * 100:g}%"
+    return None
+
+
+def _arbitrary(key):
+    m = re.fullmatch(r"\[([^\]\s]+)\]", key)
+    return m.group(1).replace("_", " ") if m else None
+
+
+def _size(key, axis):
+    named = {"full": "100%", "auto": "auto", "min": "min-content", "max": "max-content", "fit": "fit-content",
+             "screen": "100vw" if axis == "w" else "100vh"}
+    return named.get(key) or _spacing(key) or _fraction(key) or _arbitrary(key)
+
+
+def _rgb(hex_value):
+    h = hex_value.lstrip("#")
+    return " ".join(str(int(h[i:i + 2], 16)) for i in (0, 2, 4))
+
+
+def _color(key, prop, opacity_var=None):
+    if key in SPECIAL_COLORS:
+        return {prop: SPECIAL_COLORS[key]}
+    if key not in COLORS:
+        return None
+    if opacity_var is None:
+        return {prop: COLORS[key]}
+    return {opacity_var: "1", prop: f"rgb({_rgb(COLORS[key])} / var({opacity_var}))"}
+
+
+_STATIC = {
+    "static": ("position", {"position": "static"}),
+    "fixed": ("position", {"position": "fixed"}),
+    "absolute": ("position", {"position": "absolute"}),
+    "relative": ("position", {"position": "relative"}),
+    "sticky": ("position", {"position": "sticky"}),
+    "block": ("display", {"display": "block"}),
+    "inline-block": ("display", {"display": "inline-block"}),
+    "inline": ("display", {"display": "inline"}),
+    "flex": ("display", {"display": "flex"}),
+    "inline-flex": ("display", {"display": "inline-flex"}),
+    "grid": ("display", {"display": "grid"}),
+    "table": ("display", {"display": "table"}),
+    "hidden": ("display", {"display": "none"}),
+    "aspect-square": ("aspect", {"aspect-ratio": "1 / 1"}),
+    "aspect-video": ("aspect", {"aspect-ratio": "16 / 9"}),
+    "flex-1": ("flex", {"flex": "1 1 0%"}),
+    "flex-auto": ("flex", {"flex": "1 1 auto"}),
+    "flex-none": ("flex", {"flex": "none"}),
+    "flex-shrink-0": ("flex-shrink", {"flex-shrink": "0"}),
+    "shrink-0": ("flex-shrink", {"flex-shrink": "0"}),
+    "transform": ("transform", {"transform": TRANSFORM}),
+    "cursor-pointer": ("cursor", {"cursor": "pointer"}),
+    "cursor-not-allowed": ("cursor", {"cursor": "not-allowed"}),
+    "col-span-full": ("col", {"grid-column": "1 / -1"}),
+    "flex-row": ("flex-direction", {"flex-direction": "row"}),
+    "flex-col": ("flex-direction", {"flex-direction": "column"}),
+    "flex-wrap": ("flex-wrap", {"flex-wrap": "wrap"}),
+    "items-start": ("items", {"align-items": "flex-start"}),
+    "items-end": ("items", {"align-items": "flex-end"}),
+    "items-center": ("items", {"align-items": "center"}),
+    "items-baseline": ("items", {"align-items": "baseline"}),
+    "justify-start": ("justify", {"justify-content": "flex-start"}),
+    "justify-end": ("justify", {"justify-content": "flex-end"}),
+    "justify-center": ("justify", {"justify-content": "center"}),
+    "justify-between": ("justify", {"justify-content": "space-between"}),
+    "justify-around": ("justify", {"justify-content": "space-around"}),
+    "overflow-hidden": ("overflow", {"overflow": "hidden"}),
+    "overflow-auto": ("overflow", {"overflow": "auto"}),
+    "overflow-x-auto": ("overflow", {"overflow-x": "auto"}),
+    "overflow-y-auto": ("overflow", {"overflow-y": "auto"}),
+    "truncate": ("text-overflow", {"overflow": "hidden", "text-overflow": "ellipsis", "white-space": "nowrap"}),
+    "whitespace-nowrap": ("whitespace", {"white-space": "nowrap"}),
+    "border-solid": ("border-style", {"border-style": "solid"}),
+    "border-dashed": ("border-style", {"border-style": "dashed"}),
+    "bg-clip-text": ("bg-clip", {"-webkit-background-clip": "text", "background-clip": "text"}),
+    "object-cover": ("object-fit", {"object-fit": "cover"}),
+    "object-contain": ("object-fit", {"object-fit": "contain"}),
+    "text-left": ("text-align", {"text-align": "left"}),
+    "text-center": ("text-align", {"text-align": "center"}),
+    "text-right": ("text-align", {"text-align": "right"}),
+    "uppercase": ("text-transform", {"text-transform": "uppercase"}),
+    "lowercase": ("text-transform", {"text-transform": "lowercase"}),
+    "capitalize": ("text-transform", {"text-transform": "capitalize"}),
+    "outline-none": ("outline", {"outline": "2px solid transparent", "outline-offset": "2px"}),
+    "line-clamp-none": ("line-clamp", {"overflow": "visible", "display": "block",
+                                       "-webkit-box-orient": "horizontal", "-webkit-line-clamp": "none"}),
+}
+
+_INSET_SIDES = {
+    "inset": ("top", "right", "bottom", "left"), "inset-x": ("left", "right"), "inset-y": ("top", "bottom"),
+    "top": ("top",), "right": ("right",), "bottom": ("bottom",), "left": ("left",),
+}
+_BOX_SIDES = {
+    "": ("",), "x": ("-left", "-right"), "y": ("-top", "-bottom"),
+    "t": ("-top",), "r": ("-right",), "b": ("-bottom",), "l": ("-left",),
+}
+_BORDER_SIDES = {"": "", "t": "-top", "r": "-right", "b": "-bottom", "l": "-left"}
+_RADIUS_SIDES = {
+    "": ("border-radius",),
+    "t": ("border-top-left-radius", "border-top-right-radius"),
+    "b": ("border-bottom-right-radius", "border-bottom-left-radius"),
+    "l": ("border-top-left-radius", "border-bottom-left-radius"),
+    "r": ("border-top-right-radius", "border-bottom-right-radius"),
+}
+
+
+def utility(name):
+    """Rule for a bare utility name (no variants), or None if unsupported."""
+    if name in _STATIC:
+        group, decls = _STATIC[name]
+        return Rule(group, decls)
+
+    negative = name.startswith("-")
+    body = name[1:] if negative else name
+
+    def signed(value):
+        if value is None:
+            return None
+        if not negative:
+            return value
+        return value if value == "0px" else f"-{value}" if not value.startswith("calc") else None
+
+    # Position offsets: inset-0, -top-2, top-1/2, right-0
+    m = re.fullmatch(r"(inset-x|inset-y|inset|top|right|bottom|left)-(.+)", body)
+    if m:
+        value = signed(_spacing(m.group(2)) or _fraction(m.group(2)) or
+                       {"full": "100%", "auto": "auto"}.get(m.group(2)))
+        if value:
+            return Rule("inset", {side: value for side in _INSET_SIDES[m.group(1)]})
+
+    m = re.fullmatch(r"z-(\d+|auto)", name)
+    if m:
+        return Rule("z", {"z-index": m.group(1)})
+
+    # Margin / padding: mx-auto, -mt-2, py-0.5
+    m = re.fullmatch(r"([mp])([xytrbl]?)-(.+)", body)
+    if m:
+        prop = "margin" if m.group(1) == "m" else "padding"
+        key = m.group(3)
+        value = "auto" if key == "auto" and prop == "margin" and not negative else signed(_spacing(key))
+        if value and (prop == "margin" or not negative):
+            return Rule(prop, {f"{prop}{side}": value for side in _BOX_SIDES[m.group(2)]})
+
+    m = re.fullmatch(r"line-clamp-(\d+)", name)
+    if m:
+        return Rule("line-clamp", {"overflow": "hidden", "display": "-webkit-box",
+                                   "-webkit-box-orient": "vertical", "-webkit-line-clamp": m.group(1)})
+
+    m = re.fullmatch(r"(min-|max-)?([wh])-(.+)", name)
+    if m:
+        bound, axis, key = m.group(1) or "", m.group(2), m.group(3)
+        prop = {"w": "width", "h": "height"}[axis]
+        if bound == "max-" and axis == "w":
+            value = MAX_WIDTHS.get(key) or _arbitrary(key)
+            group = "max-width"
+        elif bound == "min-":
+            value = {"0": "0px", "full": "100%", "screen": "100vw" if axis == "w" else "100vh"}.get(key) or _arbitrary(key)
+            group = f"min-{prop}"
+        else:
+            value = _size(key, axis)
+            group = f"{bound}{prop}"
+        if value:
+            return Rule(group, {f"{bound}{prop}": value})
+
+    # Transforms: -translate-y-1/2, translate-x-full, scale-105
+    m = re.fullmatch(r"translate-([xy])-(.+)", body)
+    if m:
+        value = signed(_spacing(m.group(2)) or _fraction(m.group(2)) or {"full": "100%"}.get(m.group(2)))
+        if value:
+            return Rule("translate", {f"--tw-translate-{m.group(1)}": value, "transform": TRANSFORM})
+    m = re.fullmatch(r"scale-(\d+)", name)
+    if m:
+        value = f"{int(m.group(1)) / 100:g}"
+        return Rule("scale", {"--tw-scale-x": value, "--tw-scale-y": value, "transform": TRANSFORM})
+
+    m = re.fullmatch(r"animate-(\w+)", name)
+    if m and m.group(1) in ANIMATIONS:
+        animation, keyframes = ANIMATIONS[m.group(1)]
+        return Rule("animation", {"animation": animation}, keyframes=keyframes)
+
+    m = re.fullmatch(r"grid-cols-(\d+)", name)
+    if m:
+        return Rule("grid-cols", {"grid-template-columns": f"repeat({m.group(1)}, minmax(0, 1fr))"})
+
+    m = re.fullmatch(r"gap-(x-|y-)?(.+)", name)
+    if m and _spacing(m.group(2)):
+        prop = {"": "gap", "x-": "column-gap", "y-": "row-gap"}[m.group(1) or ""]
+        return Rule("gap", {prop: _spacing(m.group(2))})
+
+    m = re.fullmatch(r"space-([xy])-(.+)", body)
+    if m and _spacing(m.group(2)):
+        value = signed(_spacing(m.group(2)))
+        if m.group(1) == "x":
+            decls = {"margin-right": "0px", "margin-left": value}
+        else:
+            decls = {"margin-top": value, "margin-bottom": "0px"}
+        return Rule("space", decls, suffix=SIBLINGS)
+
+    m = re.fullmatch(r"divide-([xy])(?:-(\d+))?", name)
+    if m:
+        width = f"{m.group(2) or 1}px"
+        if m.group(1) == "y":
+            decls = {"border-top-width": width, "border-bottom-width": "0px"}
+        else:
+            decls = {"border-right-width": "0px", "border-left-width": width}
+        return Rule("divide-width", decls, suffix=SIBLINGS)
+    m = re.fullmatch(r"divide-(.+)", name)
+    if m:
+        decls = _color(m.group(1), "border-color", "--tw-divide-opacity")
+        if decls:
+            return Rule("divide-color", decls, suffix=SIBLINGS)
+
+    m = re.fullmatch(r"rounded(?:-([trbl]))?(?:-(none|sm|md|lg|xl|2xl|3xl|full))?", name)
+    if m:
+        value = RADII[m.group(2) or ""]
+        return Rule("rounded", {prop: value for prop in _RADIUS_SIDES[m.group(1) or ""]})
+
+    m = re.fullmatch(r"border(?:-([trbl]))?(?:-(\d+))?", name)
+    if m:
+        side = _BORDER_SIDES[m.group(1) or ""]
+        return Rule("border-width", {f"border{side}-width": f"{m.group(2) or 1}px"})
+    m = re.fullmatch(r"border-(.+)", name)
+    if m:
+        decls = _color(m.group(1), "border-color", "--tw-border-opacity")
+        if decls:
+            return Rule("border-color", decls)
+
+    m = re.fullmatch(r"bg-opacity-(\d+)", name)
+    if m:
+        return Rule("bg-opacity", {"--tw-bg-opacity": f"{int(m.group(1)) / 100:g}"})
+    m = re.fullmatch(r"bg-gradient-to-(\w+)", name)
+    if m and m.group(1) in GRADIENT_DIRECTIONS:
+        return Rule("bg-image", {"background-image": f"linear-gradient({GRADIENT_DIRECTIONS[m.group(1)]}, var(--tw-gradient-stops))"})
+    m = re.fullmatch(r"bg-(.+)", name)
+    if m:
+        decls = _color(m.group(1), "background-color", "--tw-bg-opacity")
+        if decls:
+            return Rule("bg-color", decls)
+
+    m = re.fullmatch(r"(from|via|to)-(.+)", name)
+    if m and m.group(2) in COLORS:
+        hex_value = COLORS[m.group(2)]
+        clear = f"rgb({_rgb(hex_value)} / 0)"
+        if m.group(1) == "from":
+            decls = {
+                "--tw-gradient-from": f"{hex_value} var(--tw-gradient-from-position)",
+                "--tw-gradient-to": f"{clear} var(--tw-gradient-to-position)",
+                "--tw-gradient-stops": "var(--tw-gradient-from), var(--tw-gradient-to)",
+            }
+        elif m.group(1) == "via":
+            decls = {
+                "--tw-gradient-to": f"{clear} var(--tw-gradient-to-position)",
+                "--tw-gradient-stops": f"var(--tw-gradient-from), {hex_value} var(--tw-gradient-via-position), var(--tw-gradient-to)",
+            }
+        else:
+            decls = {"--tw-gradient-to": f"{hex_value} var(--tw-gradient-to-position)"}
+        return Rule("gradient", decls)
+
+    m = re.fullmatch(r"text-(.+)", name)
+    if m:
+        key = m.group(1)
+        if key in FONT_SIZES:
+            size, line_height = FONT_SIZES[key]
+            return Rule("font-size", {"font-size": size, "line-height": line_height})
+        decls = _color(key, "color", "--tw-text-opacity")
+        if decls:
+            return Rule("text-color", decls)
+
+    m = re.fullmatch(r"font-(\w+)", name)
+    if m and m.group(1) in FONT_WEIGHTS:
+        return Rule("font-weight", {"font-weight": FONT_WEIGHTS[m.group(1)]})
+    m = re.fullmatch(r"leading-(\w+)", name)
+    if m and m.group(1) in LEADING:
+        return Rule("leading", {"line-height": LEADING[m.group(1)]})
+    m = re.fullmatch(r"tracking-(\w+)", name)
+    if m and m.group(1) in TRACKING:
+        return Rule("tracking", {"letter-spacing": TRACKING[m.group(1)]})
+
+    m = re.fullmatch(r"placeholder-(.+)", name)
+    if m:
+        decls = _color(m.group(1), "color", "--tw-placeholder-opacity")
+        if decls:
+            return Rule("placeholder", decls, suffix="::placeholder")
+
+    m = re.fullmatch(r"opacity-(\d+)", name)
+    if m:
+        return Rule("opacity", {"opacity": f"{int(m.group(1)) / 100:g}"})
+
+    m = re.fullmatch(r"shadow(?:-(sm|md|lg|xl|2xl|none))?", name)
+    if m:
+        shadow, colored = SHADOWS[m.group(1) or ""]
+        return Rule("shadow", {
+            "--tw-shadow": shadow,
+            "--tw-shadow-colored": colored,
+            "box-shadow": "var(--tw-ring-offset-shadow, 0 0 #0000), var(--tw-ring-shadow, 0 0 #0000), var(--tw-shadow)",
+        })
+
+    m = re.fullmatch(r"ring(?:-(\d+))?", name)
+    if m:
+        width = f"{m.group(1) or 3}px"
+        return Rule("ring-width", {
+            "--tw-ring-offset-shadow": "var(--tw-ring-inset) 0 0 0 var(--tw-ring-offset-width) var(--tw-ring-offset-color)",
+            "--tw-ring-shadow": f"var(--tw-ring-inset) 0 0 0 calc({width} + var(--tw-ring-offset-width)) var(--tw-ring-color)",
+            "box-shadow": "var(--tw-ring-offset-shadow), var(--tw-ring-shadow), var(--tw-shadow, 0 0 #0000)",
+        })
+    m = re.fullmatch(r"ring-offset-(\d+)", name)
+    if m:
+        return Rule("ring-offset", {"--tw-ring-offset-width": f"{m.group(1)}px"})
+    m = re.fullmatch(r"ring-(.+)", name)
+    if m and m.group(1) in COLORS:
+        return Rule("ring-color", {
+            "--tw-ring-opacity": "1",
+            "--tw-ring-color": f"rgb({_rgb(COLORS[m.group(1)])} / var(--tw-ring-opacity))",
+        })
+
+    m = re.fullmatch(r"transition(?:-(\w+))?", name)
+    if m and (m.group(1) or "") in TRANSITIONS:
+        return Rule("transition", {
+            "transition-property": TRANSITIONS[m.group(1) or ""],
+            "transition-timing-function": "cubic-bezier(0.4, 0, 0.2, 1)",
+            "transition-duration": "150ms",
+        })
+    m = re.fullmatch(r"duration-(\d+)", name)
+    if m:
+        return Rule("duration", {"transition-duration": f"{m.group(1)}ms"})
+    m = re.fullmatch(r"ease-([\w-]+)", name)
+    if m and m.group(1) in EASINGS:
+        return Rule("ease", {"transition-timing-function": EASINGS[m.group(1)]})
+
+    return None
+
+
+# --------------------------------------------------------------------------
+# Class names -> CSS
+# --------------------------------------------------------------------------
+
+def escape(class_name):
+    return re.sub(r"([^a-zA-Z0-9_-])", r"\\\1", class_name)
+
+
+def parse(class_name):
+    """Split ``md:hover:bg-x`` into (screen, variant, Rule); None if unsupported."""
+    *prefixes, name = class_name.split(":")
+    screen = variant = None
+    for prefix in prefixes:
+        if prefix in SCREENS and screen is None and variant is None:
+            screen = prefix
+        elif prefix in VARIANTS and variant is None:
+            variant = prefix
+        else:
+            return None
+    rule = utility(name)
+    if rule is None:
+        return None
+    return screen, variant, rule
+
+
+def selector(class_name, variant, rule):
+    base = "." + escape(class_name)
+    if variant == "group-hover":
+        return f".group:hover {base}{rule.suffix}"
+    if variant:
+        return f"{base}:{variant}{rule.suffix}"
+    return base + rule.suffix
+
+
+def generate(class_names):
+    """CSS (preflight included) for every supported class in ``class_names``."""
+    parsed = []
+    for class_name in set(class_names):
+        result = parse(class_name)
+        if result:
+            parsed.append((class_name, *result))
+
+    screen_rank = {name: i for i, name in enumerate(SCREENS)}
+    variant_rank = {name: i for i, name in enumerate(VARIANTS)}
+
+    def sort_key(item):
+        class_name, screen, variant, rule = item
+        return (
+            -1 if screen is None else screen_rank[screen],
+            -1 if variant is None else variant_rank[variant],
+            _ORDER_INDEX[rule.group],
+            class_name,
+        )
+
+    lines = [PREFLIGHT.rstrip("\n")]
+    keyframes = []
+    current_screen = None
+    for class_name, screen, variant, rule in sorted(parsed, key=sort_key):
+        if screen != current_screen:
+            if current_screen is not None:
+                lines.append("}")
+            lines.append(f"@media (min-width:{SCREENS[screen]}){{")
+            current_screen = screen
+        declarations = ";".join(f"{prop}:{value}" for prop, value in rule.declarations.items())
+        lines.append(f"{selector(class_name, variant, rule)}{{{declarations}}}")
+        if rule.keyframes and rule.keyframes not in keyframes:
+            keyframes.append(rule.keyframes)
+    if current_screen is not None:
+        lines.append("}")
+    return "\n".join(lines + keyframes) + "\n"
+
+
+# --------------------------------------------------------------------------
+# Scanning
+# --------------------------------------------------------------------------
+
+_CANDIDATE_RE = re.compile(r"[A-Za-z0-9_:./\[\]%-]+")
+# JS builds some class names from a colour variable: bg-${statusColor}-100.
+_TEMPLATED_COLOR_RE = re.compile(r"((?:[a-z-]+:)*-?[a-z-]+-)\$\{[^}]+\}(-\d{2,3})")
+
+
+def candidates(text):
+    """Every token in ``text`` that could be a class name."""
+    found = set(_CANDIDATE_RE.findall(text))
+    for prefix, shade in _TEMPLATED_COLOR_RE.findall(text):
+        found.update(f"{prefix}{color}{shade}" for color in PALETTE)
+    return found
+
+
+def scan(paths):
+    found = set()
+    for path in paths:
+        found |= candidates(Path(path).read_text(encoding="utf-8"))
+    return found
@@ -0,0 +1,67 @@
+from django import template
+from django.utils.html import format_html, format_html_join
+
+from core import media
+
+register = template.Library()
+
+# Card grids are 1 column on phones, 2-4 on larger screens.
+CARD_SIZES = "(min-width: 1280px) 25vw, (min-width: 1024px) 33vw, (min-width: 768px) 50vw, 100vw"
+
+
+@register.filter
+def cloudinary_width(value, width=media.DEFAULT_WIDTH):
+    """{{ product.image|cloudinary_width:960 }} -> width-bounded, auto format/quality URL."""
+    return media.sized_url(media.stored_value(value), int(width))
+
+
+@register.filter
+def cloudinary_srcset(value):
+    """{{ product.image|cloudinary_srcset }} -> srcset covering media.BREAKPOINTS."""
+    return media.srcset(media.stored_value(value))
+
+
+@register.filter
+def placeholder_style(source):
+    """Inline CSS painting a record's placeholder and dominant colour behind its image."""
+    if not source or not (source.placeholder or source.dominant_color):
+        return ""
+    style = f"background:{source.dominant_color or 'transparent'}"
+    if source.placeholder:
+        style += f" url({source.placeholder}) center/cover no-repeat"
+    return style + ";"
+
+
+@register.simple_tag
+def responsive_img(value, alt="", css_class="", sizes=CARD_SIZES, width=media.DEFAULT_WIDTH,
+                   loading="lazy", source=None):
+    """
+    <img> with a width-bounded src, a breakpoint srcset and ``sizes``.
+
+    Pass the owning Product/Gallery as ``source`` to add its intrinsic
+    width/height (no layout shift) and paint its placeholder underneath.
+
+        {% responsive_img product.image alt=product.title source=product css_class="w-full h-full object-cover" %}
+    """
+    path = media.stored_value(value)
+    if not path:
+        return ""
+
+    extra = []
+    if source is not None:
+        if source.image_width and source.image_height:
+            extra += [("width", source.image_width), ("height", source.image_height)]
+        style = placeholder_style(source)
+        if style:
+            extra.append(("style", style))
+
+    return format_html(
+        '<img src="{}" srcset="{}" sizes="{}" alt="{}" class="{}" loading="{}" decoding="async"{}>',
+        media.sized_url(path, int(width)),
+        media.srcset(path),
+        sizes,
+        alt,
+        css_class,
+        loading,
+        format_html_join("", ' {}="{}"', extra),
+    )
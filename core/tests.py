@@ -1,3 +1,1486 @@
-from django.test import TestCase
+import asyncio
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import connection, connections
+from django.template import Context, Template
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from . import (
+    breaker, caching, idempotency, instrumentation, media, metrics, notifier, paychangu, payments, payouts,
+    placeholders, queryplan, querywatch, search, sqlite, tailwind, views,
+)
+from .models import BreakerState, Client, ExternalLink, Gallery, IdempotencyKey, Order, PaymentAttempt, Product, WithdrawalRequest
+from .pagination import InvalidCursor, decode_cursor
+from .reconcile import Reconciler
+from .signals import compute_placeholder
+from .simulator import PayChanguSimulator
+from .urls import urlpatterns
+from .viewcounter import ViewCounter, counter as view_counter
+
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHES,
+    VIEW_COUNT_FLUSH_INTERVAL=0,
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    },
+)
+class CoreTestCase(TestCase):
+    def setUp(self):
+        caching.get_cache().clear()
+        caching.stats.reset()
+        view_counter.flush()
+
+
+def make_product(**kwargs):
+    fields = {
+        "title": "Sample product",
+        "price": Decimal("1000.00"),
+        "category": "code",
+        "description": "A sample product.",
+        "key_features": "• Fast",
+        "technologies_used": "Django, Tailwind",
+        "preview_gradient": Product.GRADIENT_CHOICES[0][0],
+        "file_url": "https://example.com/file.zip",
+    }
+    fields.update(kwargs)
+    return Product.objects.create(**fields)
+
+
+class ProductSearchTests(CoreTestCase):
+    def setUp(self):
+        super().setUp()
+        self.school = make_product(title="School management system", technologies_used="Laravel")
+        self.hotel = make_product(
+            title="Hotel booking app",
+            description="Bookings for a school trip lodge.",
+            technologies_used="Flutter, Firebase",
+        )
+
+    def search(self, query):
+        return list(search.search_products(Product.objects.all(), query))
+
+    def test_index_installed_by_migrations(self):
+        self.assertTrue(search.is_installed())
+
+    def test_prefix_match_on_last_term(self):
+        self.assertEqual(self.search("manag"), [self.school])
+        self.assertEqual(self.search("flut"), [self.hotel])
+
+    def test_title_hits_rank_above_description_hits(self):
+        self.assertEqual(self.search("school"), [self.school, self.hotel])
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(self.search("hotel flutter"), [self.hotel])
+        self.assertEqual(self.search("hotel laravel"), [])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.school.title = "Clinic records"
+        self.school.save()
+        self.assertEqual(self.search("clinic"), [self.school])
+        self.assertEqual(self.search("school"), [self.hotel])
+
+        self.hotel.delete()
+        self.assertEqual(self.search("school"), [])
+
+    def test_common_terms_rank_only_the_newest_matches(self):
+        newest = make_product(title="School timetable")
+        with mock.patch.object(search, "RANK_LIMIT", 2):
+            self.assertEqual(self.search("school"), [newest, self.hotel])
+
+    def test_rank_limit_applies_within_filters(self):
+        app = make_product(title="School app", category="apps")
+        for i in range(3):
+            make_product(title=f"School template {i}")
+        with mock.patch.object(search, "RANK_LIMIT", 3):
+            response = self.client.get(
+                reverse("marketplace"), {"category": "apps", "search": "school"},
+                HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+            )
+        self.assertEqual([p["id"] for p in response.json()["products"]], [app.id])
+
+    def test_query_syntax_is_not_interpreted(self):
+        self.assertEqual(self.search('school" OR title:*'), [])
+        self.assertEqual(search.match_expression("   "), "")
+
+    def test_rebuild_reindexes_every_row(self):
+        self.assertEqual(search.rebuild(), 2)
+        self.assertEqual(self.search("booking"), [self.hotel])
+
+    def test_marketplace_json_uses_index(self):
+        response = self.client.get(
+            reverse("marketplace"),
+            {"search": "firebase"},
+            HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+        )
+        self.assertEqual([p["id"] for p in response.json()["products"]], [self.hotel.id])
+
+
+class MarketplaceCursorTests(CoreTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.products = [
+            make_product(title=f"Starter kit {i}", category="code" if i % 2 else "apps")
+            for i in range(20)
+        ]
+
+    def fetch_all(self, **params):
+        ids, cursor, pages = [], None, 0
+        while True:
+            query = dict(params, **({"cursor": cursor} if cursor else {}))
+            data = self.client.get(
+                reverse("marketplace"), query, HTTP_X_REQUESTED_WITH="XMLHttpRequest"
+            ).json()
+            self.assertNotIn("has_next", data)
+            ids += [p["id"] for p in data["products"]]
+            pages += 1
+            cursor = data["next_cursor"]
+            if not cursor:
+                return ids, pages
+
+    def test_walks_catalog_newest_first_without_gaps(self):
+        ids, pages = self.fetch_all()
+        self.assertEqual(ids, [p.id for p in reversed(self.products)])
+        self.assertEqual(pages, 3)
+
+    def test_cursor_respects_category_and_search(self):
+        ids, _ = self.fetch_all(category="code")
+        self.assertEqual(ids, [p.id for p in reversed(self.products) if p.category == "code"])
+
+        ids, _ = self.fetch_all(search="starter", category="apps")
+        self.assertEqual(sorted(ids), sorted(p.id for p in self.products if p.category == "apps"))
+        self.assertEqual(len(set(ids)), len(ids))
+
+    def test_json_feed_never_counts_or_offsets(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.fetch_all(search="kit")
+            self.fetch_all()
+        for query in ctx.captured_queries:
+            self.assertNotIn("COUNT(", query["sql"].upper())
+            self.assertNotIn("OFFSET", query["sql"].upper())
+
+    def test_malformed_cursor_is_rejected(self):
+        response = self.client.get(
+            reverse("marketplace"), {"cursor": "not-a-cursor"}, HTTP_X_REQUESTED_WITH="XMLHttpRequest"
+        )
+        self.assertEqual(response.status_code, 400)
+        with self.assertRaises(InvalidCursor):
+            decode_cursor("e30")  # "{}"
+
+    def test_html_page_hands_its_cursor_to_the_feed(self):
+        response = self.client.get(reverse("marketplace"))
+        cursor = response.context["next_cursor"]
+        self.assertEqual(decode_cursor(cursor)["id"], self.products[12].id)
+
+
+class MarketplaceCacheTests(CoreTestCase):
+    def setUp(self):
+        super().setUp()
+        self.product = make_product(title="Invoice generator")
+
+    def get_json(self, **params):
+        return self.client.get(reverse("marketplace"), params, HTTP_X_REQUESTED_WITH="XMLHttpRequest")
+
+    def test_repeat_requests_are_served_from_cache(self):
+        first = self.get_json(search="invoice")
+        with self.assertNumQueries(0):
+            second = self.get_json(search="invoice")
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(caching.stats.snapshot()["hits"], 1)
+
+        self.client.get(reverse("marketplace"))
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("marketplace"))
+        self.assertEqual(list(response.context["products"]), [self.product])
+
+    def test_evicted_version_restarts_from_the_clock(self):
+        caching.bump_catalog_version()
+        started = time.time_ns() // 1_000_000
+        caching.get_cache().delete(caching.VERSION_KEY)  # as culling would
+        self.assertGreaterEqual(caching.catalog_version(), started)
+
+    def test_product_changes_bump_the_catalog_version(self):
+        self.get_json()
+        version = caching.catalog_version()
+
+        self.product.title = "Receipt generator"
+        self.product.save()
+        self.assertGreater(caching.catalog_version(), version)
+        titles = [p["title"] for p in self.get_json().json()["products"]]
+        self.assertEqual(titles, ["Receipt generator"])
+
+        self.product.delete()
+        self.assertEqual(self.get_json().json()["products"], [])
+        self.assertEqual(caching.stats.snapshot()["misses"], 3)
+
+    def test_keys_separate_category_query_and_cursor(self):
+        keys = {
+            caching.listing_key("json", "all", "", ""),
+            caching.listing_key("json", "code", "", ""),
+            caching.listing_key("json", "all", "invoice", ""),
+            caching.listing_key("json", "all", "", "abc"),
+        }
+        self.assertEqual(len(keys), 4)
+
+
+class ViewCounterTests(CoreTestCase):
+    def setUp(self):
+        super().setUp()
+        self.product = make_product(views=3)
+        self.other = make_product()
+
+    def test_product_detail_does_not_write(self):
+        url = reverse("product_detail", args=[self.product.pk])
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.context["product"].views, 4)
+        self.assertFalse([q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")])
+        self.assertEqual(view_counter.pending(), 1)
+
+    def test_flush_applies_batched_increments(self):
+        counter = ViewCounter()
+        for _ in range(5):
+            counter.record(self.product.pk)
+        counter.record(self.other.pk, n=5)
+        self.assertEqual(counter.pending(), 10)
+
+        with self.assertNumQueries(3):  # SAVEPOINT, one UPDATE for n=5, RELEASE
+            self.assertEqual(counter.flush(), 10)
+        self.assertEqual(counter.pending(), 0)
+        self.product.refresh_from_db()
+        self.other.refresh_from_db()
+        self.assertEqual((self.product.views, self.other.views), (8, 5))
+
+    def test_failed_flush_keeps_counts(self):
+        counter = ViewCounter()
+        counter.record(self.product.pk, n=2)
+        with self.assertRaises(Exception):
+            counter.flush(using="missing")
+        self.assertEqual(counter.pending_for(self.product.pk), 2)
+
+    def test_shutdown_writes_remaining_views(self):
+        counter = ViewCounter()
+        counter.record(self.product.pk)
+        self.assertEqual(counter.shutdown(), 1)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.views, 4)
+
+
+class ConditionalGetTests(CoreTestCase):
+    def setUp(self):
+        super().setUp()
+        self.product = make_product(title="Portfolio theme")
+        Gallery.objects.create(title="Launch event")
+
+    def revalidate(self, url, queries, **headers):
+        first = self.client.get(url, **headers)
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first.has_header("Last-Modified"))
+        with self.assertNumQueries(queries):
+            second = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"], **headers)
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.content, b"")
+        return first
+
+    def test_catalog_pages_answer_304_without_queries(self):
+        for name in ("index", "gallery", "marketplace"):
+            with self.subTest(name):
+                self.revalidate(reverse(name), queries=0)
+        self.revalidate(reverse("marketplace"), queries=0, HTTP_X_REQUESTED_WITH="XMLHttpRequest")
+
+    def test_html_and_json_marketplace_have_distinct_etags(self):
+        html = self.client.get(reverse("marketplace"))
+        feed = self.client.get(reverse("marketplace"), HTTP_X_REQUESTED_WITH="XMLHttpRequest")
+        self.assertNotEqual(html["ETag"], feed["ETag"])
+        self.assertIn("X-Requested-With", feed["Vary"])
+
+    def test_product_detail_304_reads_only_updated_at(self):
+        url = reverse("product_detail", args=[self.product.pk])
+        first = self.client.get(url)
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIn('SELECT "core_product"."updated_at"', ctx.captured_queries[0]["sql"])
+
+    def test_changes_invalidate_etags(self):
+        product_url = reverse("product_detail", args=[self.product.pk])
+        old_product = self.client.get(product_url)["ETag"]
+        old_catalog = self.client.get(reverse("gallery"))["ETag"]
+
+        self.product.title = "Portfolio theme v2"
+        self.product.save()
+
+        response = self.client.get(product_url, HTTP_IF_NONE_MATCH=old_product)
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(reverse("gallery"), HTTP_IF_NONE_MATCH=old_catalog)
+        self.assertEqual(response.status_code, 200)
+
+    def test_new_csrf_token_invalidates_html_etags(self):
+        self.client.force_login(User.objects.create_user("shopper"))
+        urls = [reverse("index"), reverse("product_detail", args=[self.product.pk])]
+        etags = [self.client.get(url)["ETag"] for url in urls]
+        # What logging in again does: rotate_token() sends a new cookie.
+        self.client.cookies[settings.CSRF_COOKIE_NAME] = "rotated1" * 4
+        for url, etag in zip(urls, etags):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_missing_product_is_still_404(self):
+        response = self.client.get(reverse("product_detail", args=[999]))
+        self.assertEqual(response.status_code, 404)
+
+
+class SQLiteTuningTests(CoreTestCase):
+    def test_pragmas_are_applied_to_new_connections(self):
+        self.assertEqual(sqlite.pragma(connection, "synchronous"), 1)  # NORMAL
+        self.assertEqual(sqlite.pragma(connection, "busy_timeout"), 5000)
+        self.assertEqual(sqlite.pragma(connection, "temp_store"), 2)  # MEMORY
+        self.assertEqual(sqlite.pragma(connection, "cache_size"), -32000)
+
+    def test_file_database_switches_to_wal(self):
+        with tempfile.TemporaryDirectory() as directory:
+            other = connection.copy()
+            other.settings_dict["NAME"] = os.path.join(directory, "db.sqlite3")
+            try:
+                self.assertEqual(sqlite.pragma(other, "journal_mode"), "wal")
+            finally:
+                other.close()
+
+
+class ViewQueryTests(CoreTestCase):
+    """
+    Every query sent by a page or a background job runs through EXPLAIN
+    QUERY PLAN against a seeded database; a table scan fails the test. So
+    does a query shape repeated within one request (an N+1), and a view
+    running more queries than its declared budget.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        categories = [code for code, _ in Product.CATEGORY_CHOICES]
+        cls.products = [make_product(title=f"Product {i}", category=categories[i % len(categories)])
+                        for i in range(40)]
+        for i in range(15):
+            Gallery.objects.create(title=f"Shot {i}", is_active=bool(i % 3))
+        cls.user = User.objects.create_user("shopper", "shopper@example.com", "pw")
+        cls.client_profile = Client.objects.create(user=cls.user)
+        for paid in (True, True, False):
+            Order.objects.create(client=cls.client_profile, paid=paid)
+        order = Order.objects.filter(paid=False).get()
+        order.items.create(product=cls.products[0], price=cls.products[0].price)
+        long_ago = timezone.now() - timedelta(hours=1)
+        for i, status in enumerate(("success", "failed", "pending", "pending")):
+            PaymentAttempt.objects.create(order=order, tx_ref=f"qp-{i}", payment_type="airtel",
+                                          amount=Decimal("1000"), status=status, created_at=long_ago)
+        for status in ("pending", "queued", "queued", "processed"):
+            WithdrawalRequest.objects.create(client=cls.client_profile, amount=Decimal("500"), method="airtel",
+                                             account_info="0991000000", status=status)
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.user)
+
+    def assertIndexed(self, label, action):
+        caching.get_cache().clear()  # cached listings would hide their queries
+        with CaptureQueriesContext(connection) as ctx, querywatch.QueryRecorder() as recorder:
+            result = action()
+        problems = [f"{query['sql']}\n    -> {'; '.join(scans)}"
+                    for query in ctx.captured_queries if (scans := queryplan.full_scans(query["sql"]))]
+        self.assertFalse(problems, f"{label} scans a whole table:\n" + "\n".join(problems))
+        self.assertFalse(recorder.repeated(), f"{label} repeats queries:\n{recorder.report()}")
+        if match := getattr(result, "resolver_match", None):
+            self.assertLessEqual(len(ctx.captured_queries), match.func.query_budget,
+                                 f"{label} is over its query budget")
+        return result
+
+    def stub(self, responses):
+        stub = self.enterContext(StubPayChangu(responses))
+        self.enterContext(override_settings(PAYCHANGU_BASE_URL=stub.base_url, PAYCHANGU_WEBHOOK_SECRET="whsec-test"))
+        paychangu.reset_clients()
+        self.addCleanup(paychangu.reset_clients)
+        return stub
+
+    def test_pages(self):
+        product = self.products[0].pk
+        pages = [
+            ("index", [], {}), ("about", [], {}), ("contact", [], {}), ("services", [], {}),
+            ("gallery", [], {}), ("register", [], {}), ("login", [], {}), ("admin_dashboard", [], {}),
+            ("product_detail", [product], {}),
+            ("marketplace", [], {}), ("marketplace", [], {"page": 2}),
+            ("marketplace", [], {"category": "apps"}), ("marketplace", [], {"category": "Code", "page": 2}),
+            ("marketplace", [], {"search": "product"}),
+        ]
+        for name, args, params in pages:
+            with self.subTest(name, **params):
+                response = self.assertIndexed(name, lambda: self.client.get(reverse(name, args=args), params))
+                self.assertLess(response.status_code, 400)
+
+        ajax = {"headers": {"x-requested-with": "XMLHttpRequest"}}
+        url = reverse("marketplace")
+        first = self.client.get(url, {"category": "websites"}, **ajax).json()
+        self.assertIndexed("marketplace feed", lambda: self.client.get(
+            url, {"category": "websites", "cursor": first["next_cursor"]}, **ajax))
+        self.assertIndexed("marketplace feed", lambda: self.client.get(
+            url, {"cursor": first["next_cursor"]}, **ajax))
+
+    def test_payment_flow(self):
+        product = self.products[1].pk
+        mobile = {"status": "success", "message": "Check your phone",
+                  "data": {"charge_id": "qp-mm", "amount": 1000, "mobile_money": {"name": "Airtel Money"}}}
+        self.stub({
+            "/mobile-money/payments/initialize": [(200, mobile, 0)],
+            "/charge-card/payments": [(200, {"status": "success", "data": {"charge_id": "qp-card"}}, 0)],
+            "/mobile-money/payments/qp-2/verify": [(200, VERIFIED, 0)],
+        })
+        responses = [
+            self.assertIndexed("mobile_money_payment", lambda: self.client.post(
+                reverse("mobile_money_payment", args=[product]),
+                {"phone-number": "0991000000", "provider": "Airtel Money", "idempotency_key": "qp-1"})),
+            self.assertIndexed("card_payment", lambda: self.client.post(
+                reverse("card_payment", args=[product]),
+                {"card-number": "4000000000000002", "expiry": "12/30", "cvv": "123", "cardholder-name": "Q P"})),
+            # Settles the attempt: marks its order paid and its products sold.
+            self.assertIndexed("verify_payment", lambda: self.client.post(
+                reverse("verify_payment", args=["qp-2"]), {"type": "mobile"})),
+        ]
+        for response in responses:
+            self.assertEqual(response.json()["status"], "success", response.content)
+
+        body = json.dumps({"tx_ref": "qp-3", "status": "success"}).encode()
+        self.assertIndexed("paychangu_webhook", lambda: self.client.post(
+            reverse("paychangu_webhook"), body, content_type="application/json",
+            headers={"Signature": payments.webhook_signature(body)}))
+        # The stream of a settled attempt sends its status without further queries.
+        self.assertIndexed("payment_events", lambda: self.client.get(reverse("payment_events", args=["qp-0"])))
+        self.assertIndexed("logout", lambda: self.client.get(reverse("logout")))
+
+    def test_background_jobs(self):
+        reconciler = Reconciler(client=mock.Mock(), batch_size=1)
+        cutoff = timezone.now()
+        self.assertIndexed("reconciler", lambda: reconciler.pending_batch(cutoff))
+        first = reconciler.pending_batch(cutoff)[0]
+        self.assertIndexed("reconciler", lambda: reconciler.pending_batch(cutoff, (first.created_at, first.pk)))
+        self.assertIndexed("payouts", lambda: payouts.claim_batch(10, payouts.worker_token()))
+
+        counter = ViewCounter()
+        counter.record(self.products[2].pk)
+        self.assertIndexed("view counter", counter.flush)
+
+    def test_every_view_declares_a_budget(self):
+        missing = [pattern.name for pattern in urlpatterns if not hasattr(pattern.callback, "query_budget")]
+        self.assertFalse(missing, "views without @query_budget")
+
+    def test_account_pages(self):
+        self.client.logout()
+        self.assertIndexed("register", lambda: self.client.post(
+            reverse("register"), {"username": "shopper", "password": "pw", "confirm_password": "pw"}))
+        User.objects.create_superuser("root", "root@example.com", "pw")
+        self.assertIndexed("login", lambda: self.client.post(
+            reverse("login"), {"username": "root", "password": "pw"}))
+        self.assertIndexed("metrics", lambda: self.client.get(reverse("metrics")))
+        self.assertIndexed("product_create", lambda: self.client.post(reverse("product_create"), {
+            "item-title": "New", "item-price": "10", "item-category": "apps", "item-description": "d",
+            "item-features": "f", "item-technologies": "t", "item-file-url": "https://example.com/new.zip",
+        }))
+
+    def test_admin_changelists(self):
+        for i in range(3):
+            user = User.objects.create_user(f"buyer{i}")
+            Order.objects.create(client=Client.objects.create(user=user))
+            ExternalLink.objects.create(title=f"Link {i}", url="https://example.com", created_by=self.client_profile)
+            Order.objects.first().items.create(product=self.products[i], price=self.products[i].price)
+        self.client.force_login(User.objects.create_superuser("root", "root@example.com", "pw"))
+        for model in ("client", "withdrawalrequest", "externallink", "order", "orderitem", "paymentattempt"):
+            with self.subTest(model):
+                with querywatch.QueryRecorder() as recorder:
+                    self.assertEqual(self.client.get(reverse(f"admin:core_{model}_changelist")).status_code, 200)
+                self.assertFalse(recorder.repeated(), f"{model} changelist repeats queries:\n{recorder.report()}")
+
+
+class QueryWatchTests(CoreTestCase):
+    def test_shape_ignores_in_list_length(self):
+        self.assertEqual(querywatch.shape('SELECT 1 FROM t WHERE id IN (%s, %s, %s)'),
+                         querywatch.shape('SELECT 1 FROM t WHERE id IN (%s)'))
+
+    def test_repeats_are_reported_with_their_call_site(self):
+        products = [make_product(title=f"P{i}") for i in range(3)]
+        with querywatch.QueryRecorder() as recorder:
+            Product.objects.get(pk=products[0].pk)
+            for product in products:
+                Product.objects.get(pk=product.pk)
+        ((sql, times, sites),) = recorder.repeated()
+        self.assertEqual(times, 4)
+        self.assertEqual(len(sites), 2)
+        self.assertTrue(all(site.startswith("core/tests.py:") for site in sites))
+        self.assertTrue(sites[0].endswith("in test_repeats_are_reported_with_their_call_site"))
+        self.assertFalse(recorder.repeated(threshold=5))
+
+    def test_middleware_logs_n_plus_one_and_budget(self):
+        middleware = list(settings.MIDDLEWARE)
+        middleware.insert(middleware.index("core.instrumentation.RequestTimingMiddleware") + 1,
+                          "core.querywatch.RepeatedQueryMiddleware")
+        self.client.force_login(User.objects.create_superuser("root", "root@example.com", "pw"))
+        for i in range(3):
+            Order.objects.create(client=Client.objects.create(user=User.objects.create_user(f"buyer{i}")))
+        with override_settings(MIDDLEWARE=middleware), \
+                mock.patch("core.admin.OrderAdmin.list_select_related", False), \
+                self.assertLogs("core.querywatch", "WARNING") as logs:
+            self.client.get(reverse("admin:core_order_changelist"))
+        self.assertIn('3x SELECT "core_client"', logs.output[0])
+        self.assertIn("from core/models.py:", logs.output[0])
+
+        with override_settings(MIDDLEWARE=middleware), mock.patch.object(views.about, "query_budget", 1), \
+                self.assertLogs("core.querywatch", "WARNING") as logs:
+            self.client.get(reverse("about"))
+        self.assertIn("GET /about/ ran 2 queries; its budget is 1", logs.output[0])
+
+
+class SeedCatalogTests(CoreTestCase):
+    def test_seeds_related_rows_in_batches(self):
+        out = io.StringIO()
+        call_command("seed_catalog", products=30, gallery=5, customers=4, orders=12, batch_size=7, force=True,
+                     stdout=out)
+        self.assertEqual(Product.objects.count(), 30)
+        self.assertEqual(Gallery.objects.count(), 5)
+        self.assertEqual(Client.objects.filter(user__username__startswith="customer").count(), 4)
+        self.assertEqual(Order.objects.count(), 12)
+        self.assertEqual(PaymentAttempt.objects.count(), 12)
+        for order in Order.objects.filter(paid=True).prefetch_related("items"):
+            self.assertEqual(order.total, sum(item.price for item in order.items.all()))
+        self.assertFalse(PaymentAttempt.objects.filter(order__paid=True).exclude(status="success").exists())
+        self.assertEqual(search.search_products(Product.objects.all(), Product.objects.first().title).count(), 1)
+
+        # A second run adds customers instead of clashing on usernames.
+        call_command("seed_catalog", products=1, orders=0, customers=2, force=True, stdout=out)
+        self.assertEqual(Client.objects.count(), 6)
+
+    def test_refuses_without_debug(self):
+        with self.assertRaisesMessage(CommandError, "--force"):
+            call_command("seed_catalog", products=1)
+        self.assertFalse(Product.objects.exists())
+
+
+class ListingSerializerTests(CoreTestCase):
+    def test_feed_matches_model_rendering(self):
+        product = make_product(
+            description="x" * 150, image="image/upload/v1760803354/fduft0zeqfl7uyx90it1.png"
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            data = self.client.get(reverse("marketplace"), HTTP_X_REQUESTED_WITH="XMLHttpRequest").json()
+        sql = ctx.captured_queries[-1]["sql"]
+        self.assertIn('SUBSTR("core_product"."description", 1, 100)', sql)
+        self.assertNotIn('"core_product"."key_features"', sql)
+
+        product.refresh_from_db()
+        self.assertEqual(data["products"], [{
+            "id": product.id,
+            "title": product.title,
+            "price": str(product.price),
+            "description": product.description[:100],
+            "rating": product.views,
+            "views": product.views,
+            "category": product.category,
+            "image": product.image.url,
+            "thumbnail": media.sized_url(product.image.get_prep_value()),
+            "srcset": media.srcset(product.image.get_prep_value()),
+            "color": "",
+        }])
+
+    def test_media_url_matches_sdk_for_odd_values(self):
+        from cloudinary.models import CloudinaryField
+
+        for value in ("image/upload/v1/a/b.jpg", "plain_public_id", "video/upload/v12/clip.mp4"):
+            with self.subTest(value):
+                expected = CloudinaryField().parse_cloudinary_resource(value).url
+                self.assertEqual(media.media_url(value), expected)
+        self.assertEqual(media.media_url(None), "")
+
+
+class ResponsiveImageTests(SimpleTestCase):
+    value = "image/upload/v1760803354/fduft0zeqfl7uyx90it1.png"
+
+    def test_sized_url_is_bounded_and_auto_formatted(self):
+        self.assertEqual(
+            media.sized_url(self.value, 320),
+            "http://res.cloudinary.com/dpkicrcxm/image/upload/"
+            "c_limit,f_auto,q_auto,w_320/v1760803354/fduft0zeqfl7uyx90it1.png",
+        )
+        self.assertEqual(media.srcset(self.value).count(" "), 2 * len(media.BREAKPOINTS) - 1)
+
+    def test_urls_are_memoized(self):
+        media.sized_url.cache_clear()
+        media.sized_url(self.value, 480)
+        media.sized_url(self.value, 480)
+        self.assertEqual(media.sized_url.cache_info().hits, 1)
+
+    def test_template_tags(self):
+        from cloudinary.models import CloudinaryField
+
+        resource = CloudinaryField().parse_cloudinary_resource(self.value)
+        html = Template(
+            "{% load media_tags %}{% responsive_img image alt=title css_class='cover' %}"
+            "|{{ image|cloudinary_width:960 }}|{% responsive_img None %}"
+        ).render(Context({"image": resource, "title": "A <b>"}))
+        tag, url, empty = html.split("|")
+        self.assertIn(f'srcset="{media.srcset(self.value)}"', tag)
+        self.assertIn('alt="A &lt;b&gt;"', tag)
+        self.assertIn('loading="lazy"', tag)
+        self.assertIn("w_960", url)
+        self.assertEqual(empty, "")
+
+
+def png_bytes(size=(200, 100), color=(200, 30, 30)):
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class PlaceholderTests(CoreTestCase):
+    def test_compute_reads_size_color_and_thumbnail(self):
+        fields = placeholders.compute(io.BytesIO(png_bytes()))
+        self.assertEqual((fields["image_width"], fields["image_height"]), (200, 100))
+        self.assertEqual(fields["dominant_color"], "#c81e1e")
+        self.assertTrue(fields["placeholder"].startswith("data:image/jpeg;base64,"))
+        self.assertLess(len(fields["placeholder"]), 1000)
+
+    def test_upload_is_processed_and_rewound(self):
+        upload = SimpleUploadedFile("a.png", png_bytes((40, 80)), content_type="image/png")
+        product = Product(image=upload)
+        compute_placeholder(Product, product)
+        self.assertEqual((product.image_width, product.image_height), (40, 80))
+        self.assertEqual(upload.tell(), 0)
+
+        product.image = None
+        compute_placeholder(Product, product)
+        self.assertEqual(product.placeholder, "")
+
+    def test_backfill_fills_missing_rows_in_batches(self):
+        products = [make_product(image=f"image/upload/v1/p{i}.jpg") for i in range(3)]
+        make_product(image=None)
+        fields = placeholders.compute(io.BytesIO(png_bytes()))
+        with mock.patch.object(placeholders, "compute_from_cloudinary", return_value=fields) as fetch:
+            call_command("backfill_placeholders", batch_size=2, stdout=io.StringIO())
+        self.assertEqual(fetch.call_count, 3)
+        for product in products:
+            product.refresh_from_db()
+            self.assertEqual(product.dominant_color, "#c81e1e")
+
+    def test_cards_reserve_space_and_paint_placeholder(self):
+        make_product(image="image/upload/v1/p.jpg", dominant_color="#123456",
+                     placeholder="data:image/jpeg;base64,AAAA", image_width=400, image_height=300)
+        html = self.client.get(reverse("marketplace")).content.decode()
+        self.assertIn('width="400" height="300"', html)
+        self.assertIn("background:#123456 url(data:image/jpeg;base64,AAAA)", html)
+
+
+class StylesheetTests(SimpleTestCase):
+    def test_generates_variants_and_breakpoints_in_cascade_order(self):
+        css = tailwind.generate(["md:flex", "hidden", "hover:bg-purple-700", "top-1/2", "not-a-utility"])
+        self.assertIn(".hidden{display:none}", css)
+        self.assertIn(".top-1\\/2{top:50%}", css)
+        self.assertIn(".hover\\:bg-purple-700:hover{--tw-bg-opacity:1;"
+                      "background-color:rgb(126 34 206 / var(--tw-bg-opacity))}", css)
+        self.assertLess(css.index(".hidden{"), css.index("@media (min-width:768px){\n.md\\:flex{"))
+        self.assertNotIn("not-a-utility", css)
+
+    def test_scanner_expands_colors_built_in_javascript(self):
+        found = tailwind.candidates("el.className = `bg-${statusColor}-100 hover:bg-${color}-700`;")
+        self.assertIn("bg-green-100", found)
+        self.assertIn("hover:bg-red-700", found)
+
+    def test_committed_stylesheet_is_up_to_date(self):
+        call_command("build_css", check=True, stdout=io.StringIO())
+
+
+class StubPayChangu:
+    """
+    Minimal local stand-in for the PayChangu API. ``responses`` maps a path
+    to a list of (status, body, delay) replies, served in order (the last
+    one repeats). Every request and every new TCP connection is recorded.
+    """
+
+    def __init__(self, responses):
+        self.responses = {path: list(replies) for path, replies in responses.items()}
+        self.requests = []
+        self.connections = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                stub.connections += 1
+
+            def handle_one(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                stub.requests.append((self.command, self.path, dict(self.headers), body))
+                replies = stub.responses[self.path]
+                status, payload, delay = replies.pop(0) if len(replies) > 1 else replies[0]
+                time.sleep(delay)
+                raw = json.dumps(payload).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(raw)))
+                    self.end_headers()
+                    self.wfile.write(raw)
+                except BrokenPipeError:
+                    pass  # the client gave up (timeout tests)
+
+            do_GET = do_POST = handle_one
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.server.block_on_close = False
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+VERIFIED = {"status": "success", "data": {"status": "success"}}
+VERIFIED_REPLY = {**VERIFIED, "http_status": 200}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PayChanguClientTests(TestCase):
+    def setUp(self):
+        caching.get_cache().clear()
+
+    def client_for(self, stub, **kwargs):
+        client = paychangu.PayChanguClient(base_url=stub.base_url, backoff_factor=0, **kwargs)
+        self.addCleanup(client.close)
+        return client
+
+    def test_reuses_one_keep_alive_connection(self):
+        with StubPayChangu({"/charge-card/verify/c1": [(200, VERIFIED, 0)]}) as stub:
+            client = self.client_for(stub)
+            for _ in range(3):
+                self.assertEqual(client.verify_payment("c1"), VERIFIED_REPLY)
+        self.assertEqual(len(stub.requests), 3)
+        self.assertEqual(stub.connections, 1)
+        self.assertEqual(stub.requests[0][2]["Authorization"], f"Bearer {paychangu.SEC_KEY}")
+
+    def test_verify_is_retried_on_upstream_errors(self):
+        path = "/mobile-money/payments/c1/verify"
+        with StubPayChangu({path: [(503, {}, 0), (502, {}, 0), (200, VERIFIED, 0)]}) as stub:
+            result = self.client_for(stub).verify_payment("c1", payment_type="mobile")
+        self.assertEqual(result, VERIFIED_REPLY)
+        self.assertEqual(len(stub.requests), 3)
+
+    def test_initialize_is_not_retried_once_sent(self):
+        path = "/mobile-money/payments/initialize"
+        failed = {"status": "failed", "message": "Upstream unavailable"}
+        with StubPayChangu({path: [(503, failed, 0), (200, {"status": "success"}, 0)]}) as stub:
+            result = self.client_for(stub).mobile_initialize_payment("0991000000", "Airtel Money", 500, "a@b.mw")
+        self.assertEqual(result, {"init_status": "failed", "init_message": "Upstream unavailable"})
+        self.assertEqual(len(stub.requests), 1)
+
+    def test_read_timeout_is_per_endpoint(self):
+        with StubPayChangu({"/charge-card/verify/c1": [(200, VERIFIED, 0.5)]}) as stub:
+            client = self.client_for(stub, timeouts={"verify": (1, 0.1)}, max_retries=0)
+            started = time.perf_counter()
+            result = client.verify_payment("c1")
+            elapsed = time.perf_counter() - started
+        self.assertEqual(result["status"], "error")
+        self.assertLess(elapsed, 0.5)
+
+    def test_module_functions_use_shared_client(self):
+        path = "/mobile-money/payments/initialize"
+        reply = {"status": "success", "message": "ok",
+                 "data": {"charge_id": "c9", "amount": 500, "mobile_money": {"name": "Airtel Money"}}}
+        with StubPayChangu({path: [(200, reply, 0)]}) as stub:
+            with mock.patch.object(paychangu, "_client", self.client_for(stub)):
+                result = paychangu.mobile_initialize_payment("0991000000", "Airtel Money", 500, "a@b.mw")
+        self.assertEqual(result["init_status"], "success")
+        self.assertEqual(result["operator"], "Airtel Money")
+        self.assertEqual(stub.requests[0][3]["mobile_money_operator_ref_id"], paychangu.AIRTEL_REF_ID)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AsyncPayChanguClientTests(TestCase):
+    def setUp(self):
+        caching.get_cache().clear()
+
+    def test_slow_calls_overlap_instead_of_queueing(self):
+        async def verify_many(client, n):
+            try:
+                return await asyncio.gather(*(client.verify_payment("c1") for _ in range(n)))
+            finally:
+                await client.aclose()
+
+        with StubPayChangu({"/charge-card/verify/c1": [(200, VERIFIED, 0.3)]}) as stub:
+            client = paychangu.AsyncPayChanguClient(base_url=stub.base_url)
+            started = time.perf_counter()
+            results = asyncio.run(verify_many(client, 5))
+            elapsed = time.perf_counter() - started
+        self.assertEqual(results, [VERIFIED_REPLY] * 5)
+        self.assertLess(elapsed, 1.0)
+
+    def test_verify_is_retried_on_upstream_errors(self):
+        path = "/mobile-money/payments/c1/verify"
+        with StubPayChangu({path: [(503, {}, 0), (200, VERIFIED, 0)]}) as stub:
+            client = paychangu.AsyncPayChanguClient(base_url=stub.base_url, backoff_factor=0)
+            result = asyncio.run(client.verify_payment("c1", payment_type="mobile"))
+        self.assertEqual(result, VERIFIED_REPLY)
+        self.assertEqual(len(stub.requests), 2)
+
+
+class PaymentViewTests(CoreTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user("buyer", "buyer@example.com", "pw")
+        self.client_profile = Client.objects.create(user=self.user)
+        self.product = make_product(price=Decimal("2500.00"))
+        self.client.force_login(self.user)
+
+    def stub(self, responses):
+        stub = StubPayChangu(responses)
+        settings = override_settings(PAYCHANGU_BASE_URL=stub.base_url)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        paychangu.reset_clients()
+        self.addCleanup(paychangu.reset_clients)
+        return stub
+
+    def test_mobile_payment_records_pending_attempt(self):
+        reply = {"status": "success", "message": "Check your phone",
+                 "data": {"charge_id": "mm-1", "amount": 2500, "mobile_money": {"name": "Airtel Money"}}}
+        with self.stub({"/mobile-money/payments/initialize": [(200, reply, 0)]}):
+            response = self.client.post(
+                reverse("mobile_money_payment", args=[self.product.pk]),
+                {"phone-number": "0991000000", "provider": "Airtel Money"},
+            )
+        self.assertEqual(response.json(), {"status": "success", "tx_ref": "mm-1", "message": "Check your phone"})
+        attempt = PaymentAttempt.objects.get(tx_ref="mm-1")
+        self.assertEqual((attempt.status, attempt.payment_type), ("pending", "airtel"))
+        self.assertEqual(list(attempt.order.items.values_list("product", flat=True)), [self.product.pk])
+
+    MOBILE_OK = {"status": "success", "message": "Check your phone",
+                 "data": {"charge_id": "mm-7", "amount": 2500, "mobile_money": {"name": "Airtel Money"}}}
+
+    def pay_mobile(self, key, phone="0991000000"):
+        return self.client.post(
+            reverse("mobile_money_payment", args=[self.product.pk]),
+            {"phone-number": phone, "provider": "Airtel Money", "idempotency_key": key},
+        )
+
+    def test_repeated_key_replays_first_response(self):
+        with self.stub({"/mobile-money/payments/initialize": [(200, self.MOBILE_OK, 0)]}) as stub:
+            first = self.pay_mobile("k1")
+            second = self.pay_mobile("k1")
+        self.assertEqual(len(stub.requests), 1)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second["Idempotent-Replayed"], "true")
+        self.assertEqual(PaymentAttempt.objects.count(), 1)
+
+    def test_key_reused_with_different_details_is_rejected(self):
+        with self.stub({"/mobile-money/payments/initialize": [(200, self.MOBILE_OK, 0)]}) as stub:
+            self.pay_mobile("k4")
+            response = self.pay_mobile("k4", phone="0881000000")
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(len(stub.requests), 1)
+
+    def test_concurrent_duplicate_waits_for_in_flight_request(self):
+        form = RequestFactory().post("/", {"phone-number": "0991000000", "provider": "Airtel Money"})
+        record = IdempotencyKey.objects.create(user=self.user, product=self.product, scope="mobile", key="k2",
+                                               fingerprint=idempotency.fingerprint(form))
+
+        async def first_request_finishes(interval):
+            await IdempotencyKey.objects.filter(pk=record.pk).aupdate(
+                status_code=200, response={"status": "success", "tx_ref": "mm-6"},
+            )
+
+        with self.stub({"/mobile-money/payments/initialize": [(200, self.MOBILE_OK, 0)]}) as stub, \
+                mock.patch.object(idempotency, "_sleep", side_effect=first_request_finishes) as sleep:
+            response = self.pay_mobile("k2")
+        self.assertEqual(response.json(), {"status": "success", "tx_ref": "mm-6"})
+        self.assertEqual(sleep.call_count, 1)
+        self.assertEqual(stub.requests, [])
+
+    def test_failed_initialization_can_be_retried_with_same_key(self):
+        declined = {"status": "failed", "message": "Insufficient balance"}
+        with self.stub({"/mobile-money/payments/initialize": [(200, declined, 0), (200, self.MOBILE_OK, 0)]}) as stub:
+            self.assertEqual(self.pay_mobile("k3").status_code, 400)
+            self.assertEqual(self.pay_mobile("k3").json()["tx_ref"], "mm-7")
+        self.assertEqual(len(stub.requests), 2)
+
+    def test_verify_payment_settles_order(self):
+        order = Order.objects.create(client=self.client_profile)
+        order.items.create(product=self.product, price=self.product.price)
+        PaymentAttempt.objects.create(order=order, tx_ref="mm-2", payment_type="airtel", amount=Decimal("2500"),
+                                      created_at=timezone.now() - timedelta(minutes=5))
+        with self.stub({"/mobile-money/payments/mm-2/verify": [(200, VERIFIED, 0)]}) as stub:
+            response = self.client.post(reverse("verify_payment", args=["mm-2"]), {"type": "mobile"})
+            again = self.client.post(reverse("verify_payment", args=["mm-2"]), {"type": "mobile"})
+        self.assertEqual(response.json()["status"], "success")
+        self.assertEqual(again.json()["status"], "success")
+        self.assertEqual(len(stub.requests), 1)  # the second answer came from the DB
+        order.refresh_from_db()
+        self.product.refresh_from_db()
+        self.assertTrue(order.paid)
+        self.assertEqual(self.product.sold_count, 1)
+
+    def test_upstream_error_leaves_attempt_pending(self):
+        order = Order.objects.create(client=self.client_profile)
+        attempt = PaymentAttempt.objects.create(order=order, tx_ref="mm-4", payment_type="airtel",
+                                                amount=Decimal("2500"),
+                                                created_at=timezone.now() - timedelta(minutes=5))
+        with self.stub({"/mobile-money/payments/mm-4/verify": [(500, {"status": "failed"}, 0)]}):
+            response = self.client.post(reverse("verify_payment", args=["mm-4"]), {"type": "mobile"})
+        self.assertEqual(response.json()["status"], "pending")
+        attempt.refresh_from_db()
+        self.assertEqual(attempt.status, "pending")
+        self.assertTrue(payments.settle(attempt, "success", VERIFIED))  # the late webhook still applies
+        order.refresh_from_db()
+        self.assertTrue(order.paid)
+
+    def test_recent_attempt_is_reported_pending_without_upstream_call(self):
+        order = Order.objects.create(client=self.client_profile)
+        PaymentAttempt.objects.create(order=order, tx_ref="mm-3", payment_type="airtel", amount=Decimal("2500"))
+        with self.stub({"/mobile-money/payments/mm-3/verify": [(200, VERIFIED, 0)]}) as stub:
+            response = self.client.post(reverse("verify_payment", args=["mm-3"]), {"type": "mobile"})
+        self.assertEqual(response.json()["status"], "pending")
+        self.assertEqual(stub.requests, [])
+
+
+@override_settings(CACHES=LOCMEM_CACHES, PAYCHANGU_WEBHOOK_SECRET="whsec-test")
+class PayChanguSimulatorTests(TestCase):
+    def setUp(self):
+        caching.get_cache().clear()
+
+    def client_for(self, simulator):
+        client = paychangu.PayChanguClient(base_url=simulator.base_url, max_retries=0)
+        self.addCleanup(client.close)
+        return client
+
+    def charge(self, client):
+        return client.mobile_initialize_payment("0991000000", "Airtel Money", 500, "a@b.mw")["charge_id"]
+
+    def test_charges_stay_pending_until_they_complete(self):
+        with PayChanguSimulator(completion_delay=0.2, decline_rate=1) as simulator:
+            client = self.client_for(simulator)
+            charge_id = self.charge(client)
+            pending = client.verify_payment(charge_id, payment_type="mobile")
+            time.sleep(0.3)
+            declined = client.verify_payment(charge_id, payment_type="mobile")
+        self.assertEqual(pending["data"]["status"], "pending")
+        self.assertIsNone(payments.verified_status(pending))
+        self.assertEqual(payments.verified_status(declined), "failed")
+
+    def test_injected_errors(self):
+        with PayChanguSimulator(error_rate=1) as simulator:
+            result = self.client_for(simulator).verify_payment("c1")
+        self.assertEqual(result["message"], "Simulated upstream error")
+        self.assertEqual(simulator.stats()["errors"], 1)
+
+    def test_completion_webhook_is_signed_and_retried(self):
+        with StubPayChangu({"/hook": [(404, {}, 0), (200, {}, 0)]}) as app, \
+                mock.patch("core.simulator.WEBHOOK_RETRY_DELAY", 0.01), \
+                PayChanguSimulator(completion_delay=0, webhook_url=app.base_url + "/hook") as simulator:
+            charge_id = self.charge(self.client_for(simulator))
+            deadline = time.monotonic() + 5
+            while len(app.requests) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        self.assertEqual(len(app.requests), 2)
+        _, _, headers, body = app.requests[-1]
+        self.assertEqual(body, {"event_type": "api.charge.payment", "charge_id": charge_id,
+                                "tx_ref": charge_id, "status": "success"})
+        self.assertTrue(payments.valid_signature(json.dumps(body).encode(), headers["Signature"]))
+
+
+@override_settings(PAYCHANGU_BREAKER_THRESHOLD=3, PAYCHANGU_BREAKER_COOLDOWN=30)
+class CircuitBreakerTests(CoreTestCase):
+    INIT = "/mobile-money/payments/initialize"
+    CHARGE = {"status": "success", "message": "ok",
+              "data": {"charge_id": "c1", "amount": 500, "mobile_money": {"name": "Airtel Money"}}}
+
+    def initialize(self, client):
+        return client.mobile_initialize_payment("0991000000", "Airtel Money", 500, "a@b.mw")
+
+    def client_for(self, stub):
+        client = paychangu.PayChanguClient(base_url=stub.base_url, backoff_factor=0)
+        self.addCleanup(client.close)
+        return client
+
+    def trip(self, endpoint="mobile_initialize"):
+        for _ in range(3):
+            paychangu.BREAKERS[endpoint].record_failure()
+
+    def test_opens_after_repeated_failures_and_fails_fast(self):
+        with StubPayChangu({self.INIT: [(500, {"status": "failed"}, 0)]}) as stub:
+            client = self.client_for(stub)
+            for _ in range(3):
+                self.assertNotIn("unavailable", self.initialize(client))
+            result = self.initialize(client)
+        self.assertEqual(len(stub.requests), 3)
+        self.assertTrue(result["unavailable"])
+        self.assertEqual(result["init_message"], "PayChangu is temporarily unavailable, please try again in 30s.")
+        self.assertEqual(paychangu.BREAKERS["mobile_initialize"].state(), breaker.OPEN)
+        # Other endpoints keep their own circuit.
+        self.assertEqual(paychangu.BREAKERS["verify"].state(), breaker.CLOSED)
+
+    def test_closed_circuit_costs_one_read_per_call(self):
+        circuit = paychangu.BREAKERS["mobile_initialize"]
+        with StubPayChangu({self.INIT: [(200, self.CHARGE, 0)]}) as stub:
+            client = self.client_for(stub)
+            with self.assertNumQueries(1):
+                self.initialize(client)
+            circuit.record_failure()
+            with self.assertNumQueries(2):  # the read, then resetting the failure count
+                self.initialize(client)
+        self.assertEqual(BreakerState.objects.get(name=circuit.name).failures, 0)
+
+    def test_client_errors_do_not_trip(self):
+        with StubPayChangu({self.INIT: [(400, {"status": "failed", "message": "Bad number"}, 0)]}) as stub:
+            client = self.client_for(stub)
+            for _ in range(5):
+                self.assertEqual(self.initialize(client)["init_message"], "Bad number")
+        self.assertEqual(paychangu.BREAKERS["mobile_initialize"].state(), breaker.CLOSED)
+
+    def test_half_open_lets_one_probe_through_and_closes_on_success(self):
+        self.trip()
+        circuit = paychangu.BREAKERS["mobile_initialize"]
+        with StubPayChangu({self.INIT: [(200, self.CHARGE, 0)]}) as stub, \
+                mock.patch.object(breaker, "_now", return_value=time.time() + 31):
+            self.assertEqual(circuit.state(), breaker.HALF_OPEN)
+            circuit.before_call()  # a probe from another worker is in flight
+            self.assertTrue(self.initialize(self.client_for(stub))["unavailable"])
+            BreakerState.objects.filter(name=circuit.name).update(probe_until=None)  # that probe timed out
+            result = self.initialize(self.client_for(stub))
+        self.assertEqual(result["init_status"], "success")
+        self.assertEqual(len(stub.requests), 1)
+        self.assertEqual(circuit.state(), breaker.CLOSED)
+
+    def test_failed_probe_reopens(self):
+        self.trip()
+        with StubPayChangu({self.INIT: [(503, {}, 0)]}) as stub:
+            with mock.patch.object(breaker, "_now", return_value=time.time() + 31):
+                self.initialize(self.client_for(stub))
+            self.assertTrue(self.initialize(self.client_for(stub))["unavailable"])
+        self.assertEqual(len(stub.requests), 1)
+        self.assertEqual(paychangu.BREAKERS["mobile_initialize"].state(), breaker.OPEN)
+
+    def test_payment_view_returns_503_while_open(self):
+        user = User.objects.create_user("buyer", "buyer@example.com", "pw")
+        Client.objects.create(user=user)
+        product = make_product()
+        self.client.force_login(user)
+        self.trip()
+        response = self.client.post(
+            reverse("mobile_money_payment", args=[product.pk]),
+            {"phone-number": "0991000000", "provider": "Airtel Money"},
+        )
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "30")
+        self.assertEqual(response.json()["status"], "failed")
+        self.assertFalse(PaymentAttempt.objects.exists())
+
+
+class MetricsTests(CoreTestCase):
+    def test_calls_are_counted_and_timed_per_endpoint(self):
+        path = "/charge-card/verify/c1"
+        with StubPayChangu({path: [(200, VERIFIED, 0), (404, {"status": "failed"}, 0)]}) as stub:
+            client = paychangu.PayChanguClient(base_url=stub.base_url, max_retries=0)
+            self.addCleanup(client.close)
+            for _ in range(3):
+                client.verify_payment("c1")
+        snapshot = paychangu.REQUEST_SECONDS.snapshot(endpoint="verify")
+        self.assertEqual(snapshot["count"], 3)
+        self.assertGreater(snapshot["sum"], 0)
+
+        self.client.force_login(User.objects.create_user("ops", is_staff=True))
+        body = self.client.get(reverse("metrics")).content.decode()
+        self.assertIn('paychangu_requests_total{endpoint="verify",outcome="success"} 1', body)
+        self.assertIn('paychangu_requests_total{endpoint="verify",outcome="client_error"} 2', body)
+        self.assertIn('paychangu_request_duration_seconds_bucket{endpoint="verify",le="+Inf"} 3', body)
+        self.assertIn('paychangu_request_duration_seconds_count{endpoint="payout"} 0', body)
+        self.assertIn('paychangu_circuit_state{endpoint="verify"} 0', body)
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = paychangu.REQUEST_SECONDS
+        for seconds in (0.01, 0.3, 0.3, 45):
+            histogram.observe(seconds, endpoint="payout")
+        buckets = dict(histogram.snapshot(endpoint="payout")["buckets"])
+        self.assertEqual((buckets[0.05], buckets[0.5], buckets[30], buckets[float("inf")]), (1, 3, 3, 4))
+
+    @override_settings(METRICS_TOKEN="scrape-me")
+    def test_token_is_required_when_configured(self):
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 401)
+        response = self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer scrape-me")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+
+
+class InstrumentationTests(CoreTestCase):
+    def setUp(self):
+        metrics.flush()  # leftovers from other tests would land in this test's cache
+        super().setUp()
+        make_product()
+
+    def timings(self, response):
+        """Server-Timing as {name: (dur, desc)}."""
+        entries = {}
+        for entry in response["Server-Timing"].split(", "):
+            name, *params = entry.split(";")
+            params = dict(param.split("=", 1) for param in params)
+            entries[name] = (float(params.get("dur", 0)), params.get("desc", "").strip('"'))
+        return entries
+
+    def test_server_timing_reports_queries_templates_and_cache(self):
+        with CaptureQueriesContext(connection) as ctx:
+            first = self.timings(self.client.get(reverse("marketplace")))
+        self.assertEqual(first["sql"][1], f"{len(ctx.captured_queries)} queries")
+        second = self.timings(self.client.get(reverse("marketplace")))
+        self.assertGreater(first["tpl"][0], 0)
+        self.assertEqual(first["cache"][1], "0 hit 1 miss")
+        self.assertEqual(second["cache"][1], "1 hit 0 miss")
+        self.assertGreaterEqual(first["total"][0], first["sql"][0] + first["tpl"][0])
+
+    def test_async_views_are_measured(self):
+        self.client.force_login(User.objects.create_user("buyer"))
+        response = self.client.post(reverse("verify_payment", args=["nope"]))
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.timings(response)["sql"][1], "3 queries")  # session, user, attempt
+
+    def test_histograms_per_url_name(self):
+        for _ in range(2):
+            self.client.get(reverse("gallery"))
+        self.client.get("/no-such-page/")
+        metrics.flush()
+        self.assertEqual(instrumentation.REQUEST_SECONDS.snapshot(view="gallery")["count"], 2)
+        self.assertEqual(instrumentation.QUERIES.snapshot(view="other")["count"], 1)
+        self.assertGreater(instrumentation.TEMPLATE_SECONDS.snapshot(view="gallery")["sum"], 0)
+
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 401)
+        self.client.force_login(User.objects.create_user("shopper"))
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 403)
+        self.client.force_login(User.objects.create_user("ops", is_staff=True))
+        body = self.client.get(reverse("metrics")).content.decode()
+        self.assertIn('http_request_duration_seconds_count{view="gallery"} 2', body)
+        self.assertIn('http_request_queries_bucket{view="marketplace",le="+Inf"} 0', body)
+
+    @override_settings(SLOW_REQUEST_MS=0, SLOW_REQUEST_SQL=1)
+    def test_slow_requests_are_logged_with_their_sql(self):
+        with self.assertLogs("core.instrumentation", "WARNING") as logs:
+            self.client.get(reverse("marketplace"), {"category": "code"})
+        message = logs.output[0]
+        self.assertIn("Slow request: GET /marketplace/ (marketplace)", message)
+        self.assertEqual(message.count("SELECT"), 1)
+        self.assertNotIn("'code'", message)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, PAYCHANGU_VERIFY_AFTER=3600, PAYMENT_EVENTS_TIMEOUT=5)
+class PaymentEventsTests(TransactionTestCase):
+    def setUp(self):
+        caching.get_cache().clear()
+        self.user = User.objects.create_user("buyer", "buyer@example.com", "pw")
+        order = Order.objects.create(client=Client.objects.create(user=self.user))
+        self.attempt = PaymentAttempt.objects.create(order=order, tx_ref="ev-1", payment_type="airtel",
+                                                     amount=Decimal("1000"))
+        self.async_client.force_login(self.user)
+
+    async def stream(self, tx_ref="ev-1"):
+        response = await self.async_client.get(reverse("payment_events", args=[tx_ref]))
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        events = []
+        async for chunk in response.streaming_content:
+            text = chunk.decode() if isinstance(chunk, bytes) else chunk
+            if text.startswith("event: status"):
+                events.append(json.loads(text.split("data: ", 1)[1])["status"])
+        return events
+
+    def later(self, delay, fn):
+        def run():
+            try:
+                fn()
+            finally:
+                connections.close_all()
+        timer = threading.Timer(delay, run)
+        timer.start()
+        self.addCleanup(timer.join)
+
+    async def test_settled_attempt_is_reported_at_once(self):
+        await PaymentAttempt.objects.filter(pk=self.attempt.pk).aupdate(status="failed")
+        self.assertEqual(await self.stream(), ["failed"])
+
+    async def test_webhook_settlement_is_pushed(self):
+        self.later(0.2, lambda: payments.settle(PaymentAttempt.objects.get(pk=self.attempt.pk), "success", {}))
+        started = time.perf_counter()
+        self.assertEqual(await self.stream(), ["pending", "success"])
+        self.assertLess(time.perf_counter() - started, notifier.SHARED_POLL_INTERVAL)
+
+    async def test_change_made_by_another_process_is_picked_up(self):
+        def settle_elsewhere():
+            PaymentAttempt.objects.filter(pk=self.attempt.pk).update(status="success")
+            caching.get_cache().set(notifier.marker_key("ev-1"), "other-process")
+        self.later(0.1, settle_elsewhere)
+        with mock.patch.object(notifier, "SHARED_POLL_INTERVAL", 0.05):
+            self.assertEqual(await self.stream(), ["pending", "success"])
+
+    async def test_paychangu_is_asked_once_when_no_webhook_arrives(self):
+        pending = {"status": "success", "data": {"status": "pending"}}
+        with StubPayChangu({"/mobile-money/payments/ev-1/verify": [(200, pending, 0)]}) as stub, \
+                override_settings(PAYCHANGU_BASE_URL=stub.base_url, PAYCHANGU_VERIFY_AFTER=0,
+                                  PAYMENT_EVENTS_TIMEOUT=0.5):
+            paychangu.reset_clients()
+            self.addCleanup(paychangu.reset_clients)
+            self.assertEqual(await self.stream(), ["pending"])
+        self.assertEqual(len(stub.requests), 1)
+
+    def test_wsgi_gets_current_status_without_holding_the_worker(self):
+        self.client.force_login(self.user)
+        started = time.perf_counter()
+        response = self.client.get(reverse("payment_events", args=["ev-1"]))
+        self.assertLess(time.perf_counter() - started, 1)
+        self.assertFalse(response.streaming)
+        self.assertEqual(response.content.decode().split("\n")[0], f"retry: {views.EVENTS_POLL_RETRY_MS}")
+        self.assertIn('"status": "pending"', response.content.decode())
+
+    async def test_other_users_attempts_are_hidden(self):
+        other = await sync_to_async(User.objects.create_user)("other", "other@example.com", "pw")
+        await self.async_client.aforce_login(other)
+        response = await self.async_client.get(reverse("payment_events", args=["ev-1"]))
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(PAYCHANGU_WEBHOOK_SECRET="whsec-test")
+class PayChanguWebhookTests(CoreTestCase):
+    def setUp(self):
+        super().setUp()
+        self.product = make_product()
+        self.order = Order.objects.create()
+        self.order.items.create(product=self.product, price=self.product.price)
+        self.attempt = PaymentAttempt.objects.create(
+            order=self.order, tx_ref="mm-9", payment_type="airtel", amount=Decimal("1000")
+        )
+
+    def deliver(self, payload, signature=None):
+        body = json.dumps(payload).encode()
+        return self.client.post(
+            reverse("paychangu_webhook"), body, content_type="application/json",
+            headers={"Signature": signature or payments.webhook_signature(body)},
+        )
+
+    def test_rejects_bad_signature(self):
+        response = self.deliver({"tx_ref": "mm-9", "status": "success"}, signature="0" * 64)
+        self.assertEqual(response.status_code, 403)
+        self.attempt.refresh_from_db()
+        self.assertEqual(self.attempt.status, "pending")
+
+    def test_success_settles_once(self):
+        for _ in range(2):
+            response = self.deliver({"tx_ref": "mm-9", "status": "success", "event_type": "api.charge.payment"})
+        self.assertEqual(response.json(), {"status": "ok", "applied": False})
+        self.attempt.refresh_from_db()
+        self.order.refresh_from_db()
+        self.product.refresh_from_db()
+        self.assertEqual(self.attempt.status, "success")
+        self.assertTrue(self.order.paid)
+        self.assertEqual(self.product.sold_count, 1)
+
+    def test_settled_attempt_is_not_reopened(self):
+        self.deliver({"tx_ref": "mm-9", "status": "failed"})
+        self.deliver({"tx_ref": "mm-9", "status": "success"})
+        self.attempt.refresh_from_db()
+        self.assertEqual(self.attempt.status, "failed")
+
+    def test_unknown_attempt_is_retried_later(self):
+        self.assertEqual(self.deliver({"tx_ref": "nope", "status": "success"}).status_code, 404)
+
+
+class ReconcilerTests(CoreTestCase):
+    def attempt(self, tx_ref, age_minutes, **kwargs):
+        return PaymentAttempt.objects.create(
+            tx_ref=tx_ref, payment_type="airtel", amount=Decimal("1000"),
+            created_at=timezone.now() - timedelta(minutes=age_minutes), **kwargs,
+        )
+
+    def test_settles_due_attempts_in_age_order(self):
+        product = make_product()
+        order = Order.objects.create()
+        order.items.create(product=product, price=product.price)
+        paid = self.attempt("r-paid", 30, order=order)
+        declined = self.attempt("r-declined", 20)
+        unreachable = self.attempt("r-unknown", 10)
+        fresh = self.attempt("r-fresh", 0)
+        responses = {
+            "/mobile-money/payments/r-paid/verify": [(200, VERIFIED, 0)],
+            "/mobile-money/payments/r-declined/verify": [(200, {"status": "failed", "message": "Declined"}, 0)],
+            "/mobile-money/payments/r-unknown/verify": [(503, {"status": "failed"}, 0)],
+        }
+        lines = []
+        with StubPayChangu(responses) as stub:
+            client = paychangu.AsyncPayChanguClient(base_url=stub.base_url, backoff_factor=0)
+            reconciler = Reconciler(client, batch_size=2, concurrency=2, rate=0, min_age=60)
+            reports = async_to_sync(reconciler.run)(report=lines.append)
+
+        self.assertEqual([r.checked for r in reports], [2, 1])
+        self.assertEqual(sum(r.applied for r in reports), 2)
+        self.assertEqual(len(lines), 2)
+        self.assertEqual({path for _, path, _, _ in stub.requests[:2]}, {  # oldest batch first
+            "/mobile-money/payments/r-paid/verify", "/mobile-money/payments/r-declined/verify",
+        })
+        for attempt, status in ((paid, "success"), (declined, "failed"), (unreachable, "pending"), (fresh, "pending")):
+            attempt.refresh_from_db()
+            self.assertEqual(attempt.status, status, attempt.tx_ref)
+        declined.refresh_from_db()
+        self.assertEqual(declined.raw_response["message"], "Declined")
+        order.refresh_from_db()
+        self.assertTrue(order.paid)
+
+
+class SettlementTests(CoreTestCase):
+    def order_with(self, n_items, qty=1):
+        order = Order.objects.create()
+        for i in range(n_items):
+            product = make_product(title=f"Product {i}")
+            order.items.create(product=product, price=product.price, qty=qty)
+        attempt = PaymentAttempt.objects.create(
+            order=order, tx_ref=f"s-{n_items}-{qty}", payment_type="visa", amount=Decimal("99")
+        )
+        return order, attempt
+
+    def settle_queries(self, attempt):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(payments.settle(attempt, "success", {"status": "success"}))
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_order_size(self):
+        small = self.settle_queries(self.order_with(1)[1])
+        large = self.settle_queries(self.order_with(25)[1])
+        self.assertEqual(small, large)
+
+    def test_sold_count_rises_by_quantity_once(self):
+        order, attempt = self.order_with(2, qty=3)
+        payments.settle(attempt, "success", {})
+        self.assertFalse(payments.settle(attempt, "success", {}))
+        self.assertEqual(
+            sorted(order.items.values_list("product__sold_count", "product__booked")), [(3, True), (3, True)]
+        )
+        order.refresh_from_db()
+        self.assertEqual((order.paid, order.total), (True, Decimal("99")))
+
+    def test_second_successful_attempt_does_not_sell_again(self):
+        order, attempt = self.order_with(1, qty=2)
+        retry = PaymentAttempt.objects.create(order=order, tx_ref="s-retry", payment_type="visa", amount=Decimal("99"))
+        self.assertTrue(payments.settle(attempt, "success", {}))
+        self.assertTrue(payments.settle(retry, "success", {}))
+        self.assertEqual(list(order.items.values_list("product__sold_count", flat=True)), [2])
+
+    def test_listings_are_invalidated_on_commit(self):
+        _, attempt = self.order_with(1)
+        version = caching.catalog_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            payments.settle(attempt, "success", {})
+        self.assertGreater(caching.catalog_version(), version)
+
+
+class PayoutEngineTests(CoreTestCase):
+    PAYOUT = "/mobile-money/payouts/initialize"
+    QUEUED = {"status": "success", "message": "Payout queued."}
+
+    def withdrawal(self, method="airtel", status="queued", **kwargs):
+        return WithdrawalRequest.objects.create(
+            amount=Decimal("1500"), method=method, account_info="0991000000", status=status, **kwargs,
+        )
+
+    def engine(self, stub, **kwargs):
+        client = paychangu.AsyncPayChanguClient(base_url=stub.base_url, backoff_factor=0, **kwargs)
+        return payouts.PayoutEngine(client, batch_size=2, concurrency=2, rate=0)
+
+    def test_concurrent_engines_pay_each_withdrawal_once(self):
+        queued = [self.withdrawal(method=method) for method in ("airtel", "mpamba") * 3]
+        untouched = self.withdrawal(status="pending")
+        with StubPayChangu({self.PAYOUT: [(200, self.QUEUED, 0.05)]}) as stub:
+            async def both():
+                return await asyncio.gather(self.engine(stub).run(report=list), self.engine(stub).run(report=list))
+            first, second = async_to_sync(both)()
+
+        refs = [body["charge_id"] for _, _, _, body in stub.requests]
+        self.assertCountEqual(refs, [f"ikpixels-payout-{w.pk}" for w in queued])
+        self.assertEqual(sum(r.processed for r in first + second), 6)
+        self.assertEqual(
+            {body["mobile_money_operator_ref_id"] for _, _, _, body in stub.requests},
+            {paychangu.AIRTEL_REF_ID, paychangu.TNM_REF_ID},
+        )
+        self.assertEqual(WithdrawalRequest.objects.filter(status="processed", processed_at__isnull=False).count(), 6)
+        untouched.refresh_from_db()
+        self.assertEqual(untouched.status, "pending")
+
+    def test_claims_are_exclusive(self):
+        rows = [self.withdrawal() for _ in range(3)]
+        found, mine = payouts.claim_batch(2, "worker-a")
+        _, theirs = payouts.claim_batch(2, "worker-b")
+        self.assertTrue(found)
+        self.assertEqual([w.pk for w in mine], [rows[0].pk, rows[1].pk])
+        self.assertEqual([w.pk for w in theirs], [rows[2].pk])
+        self.assertEqual(payouts.claim_batch(2, "worker-c"), (False, []))
+
+    def test_results_are_recorded_in_bulk(self):
+        processed, declined, lost, errored = (self.withdrawal() for _ in range(4))
+        _, batch = payouts.claim_batch(4, "worker-a")
+        outcomes = [(w, payouts.payout_status(result), result) for w, result in zip(batch, (
+            {**self.QUEUED, "http_status": 200},
+            {"status": "failed", "message": "Invalid number", "http_status": 200},
+            {"status": "error", "message": "timed out"},
+            {"status": "failed", "message": "Service unavailable", "http_status": 503},
+        ))]
+        with self.assertNumQueries(1):
+            payouts.record_results(outcomes)
+        statuses = dict(WithdrawalRequest.objects.values_list("pk", "status"))
+        self.assertEqual([statuses[w.pk] for w in (processed, declined, lost, errored)],
+                         ["processed", "failed", "processing", "processing"])
+
+    def test_unknown_outcome_is_not_resent(self):
+        withdrawal = self.withdrawal()
+        with StubPayChangu({self.PAYOUT: [(200, self.QUEUED, 0.5)]}) as stub:
+            engine = self.engine(stub, timeouts={"payout": (1, 0.1)})
+            reports = async_to_sync(engine.run)(report=list)
+            async_to_sync(self.engine(stub).run)(report=list)
+        self.assertEqual(reports[0].unknown, 1)
+        self.assertEqual(len(stub.requests), 1)
+        withdrawal.refresh_from_db()
+        self.assertEqual(withdrawal.status, "processing")
+
+    def test_admin_action_queues_mobile_money_selection(self):
+        admin_user = User.objects.create_superuser("staff", "staff@example.com", "pw")
+        self.client.force_login(admin_user)
+        mobile, bank = self.withdrawal(status="pending"), self.withdrawal(method="bank", status="pending")
+        self.client.post(reverse("admin:core_withdrawalrequest_changelist"),
+                         {"action": "queue_for_payout", "_selected_action": [mobile.pk, bank.pk]})
+        statuses = dict(WithdrawalRequest.objects.values_list("pk", "status"))
+        self.assertEqual((statuses[mobile.pk], statuses[bank.pk]), ("queued", "pending"))
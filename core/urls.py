@@ -21,6 +21,10 @@ urlpatterns = [
     path("pay/mobile/<int:product_id>/", views.mobile_money_payment, name="mobile_money_payment"),
     path("pay/card/<int:product_id>/", views.card_payment, name="card_payment"),
     path("pay/verify/<tx_ref>/", views.verify_payment, name="verify_payment"),
+    path("pay/events/<tx_ref>/", views.payment_events, name="payment_events"),
+    path("pay/webhook/", views.paychangu_webhook, name="paychangu_webhook"),
+
+    path("metrics/", views.metrics_view, name="metrics"),
 
 
 ]
@@ -0,0 +1,121 @@
+# viewcounter.py
+"""
+Write-behind view counter for product pages.
+
+product_detail only records a hit in an in-process buffer. A daemon thread
+flushes the buffer every VIEW_COUNT_FLUSH_INTERVAL seconds as a handful of
+``UPDATE ... SET views = views + n`` statements (one per distinct n), so a
+page view never takes the SQLite write lock and concurrent workers cannot
+overwrite each other's counts. Whatever is still buffered is flushed when
+the process exits cleanly (atexit, plus gunicorn's worker_exit hook).
+"""
+import atexit
+import logging
+import os
+import threading
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = Counter()
+        self._pid = os.getpid()
+        self._thread = None
+        self._stop = threading.Event()
+
+    def record(self, product_id, n=1):
+        with self._lock:
+            self._check_fork()
+            self._pending[product_id] += n
+        self._ensure_thread()
+
+    def pending(self):
+        """Number of buffered views not yet written to the database."""
+        with self._lock:
+            return sum(self._pending.values())
+
+    def pending_for(self, product_id):
+        with self._lock:
+            return self._pending.get(product_id, 0)
+
+    def flush(self, using="default"):
+        """Write buffered counts to the database. Returns the number of views flushed."""
+        from .models import Product
+
+        with self._lock:
+            self._check_fork()
+            batch, self._pending = self._pending, Counter()
+        if not batch:
+            return 0
+
+        by_increment = defaultdict(list)
+        for product_id, n in batch.items():
+            by_increment[n].append(product_id)
+
+        try:
+            with transaction.atomic(using=using):
+                for n, ids in by_increment.items():
+                    Product.objects.using(using).filter(pk__in=ids).update(views=F("views") + n)
+        except Exception:
+            # Put the counts back so the next flush retries them.
+            with self._lock:
+                self._pending.update(batch)
+            raise
+        return sum(batch.values())
+
+    def _check_fork(self):
+        # A forked child inherits the parent's buffer and a dead thread
+        # handle; the parent still owns (and will flush) those counts.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._pending = Counter()
+            self._thread = None
+            self._stop = threading.Event()
+
+    def _ensure_thread(self):
+        interval = getattr(settings, "VIEW_COUNT_FLUSH_INTERVAL", 5)
+        if not interval or (self._thread and self._thread.is_alive()):
+            return
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, args=(interval, self._stop), name="view-counter", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self, interval, stop):
+        while not stop.wait(interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Flushing product view counts failed")
+            finally:
+                connections.close_all()
+
+    def shutdown(self):
+        """Stop the flusher thread and write out whatever is left."""
+        self._stop.set()
+        thread = self._thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            # Let an in-progress flush finish rather than dying with its batch.
+            thread.join(timeout=10)
+        try:
+            flushed = self.flush()
+        except Exception:
+            logger.exception("Lost %d product views at shutdown", self.pending())
+            return 0
+        if flushed:
+            logger.info("Flushed %d product views at shutdown", flushed)
+        return flushed
+
+
+counter = ViewCounter()
+atexit.register(counter.shutdown)
@@ -1,19 +1,41 @@
-from django.shortcuts import render,redirect,get_object_or_404
+from asgiref.sync import sync_to_async
+from django.shortcuts import render,redirect,get_object_or_404,aget_object_or_404
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.models import User
 from django.views.decorators.csrf import csrf_protect
 from django.contrib.auth.decorators import login_required
+from django.core.handlers.wsgi import WSGIRequest
 from django.core.paginator import Paginator
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.cache import cache_control, never_cache
+from django.views.decorators.http import condition, require_POST
+from django.views.decorators.vary import vary_on_headers
 from django.utils import timezone
 from django.db import transaction
+from django.conf import settings
+from datetime import timedelta
+import asyncio
+import hmac
+import json
 
 from .paychangu import (
-    mobile_initialize_payment,
-    card_initialize_payment,
-    verify_paychangu_payment,
+    amobile_initialize_payment,
+    acard_initialize_payment,
+    averify_paychangu_payment,
 )
+from . import idempotency, metrics
+from .caching import cached_listing
+from .notifier import notifier
+from .conditional import (
+    catalog_etag, catalog_last_modified, product_etag, product_last_modified,
+)
+from .pagination import InvalidCursor, encode_cursor, keyset_page
+from .payments import SETTLED, settle, valid_signature, verified_status, webhook_status
+from .querywatch import query_budget
+from .search import search_products
+from .serializers import dumps as dump_json, product_listing_item, product_listing_values
+from .viewcounter import counter as view_counter
 import uuid
 
 from .models import (
@@ -25,6 +47,7 @@ from .models import (
 # -----------------------------------
 # REGISTER VIEW
 # -----------------------------------
+@query_budget(12)
 @csrf_protect
 def register_view(request):
     """
@@ -65,6 +88,7 @@ def register_view(request):
 
     return render(request, "core/register.html")
 
+@query_budget(9)
 @csrf_protect
 def login_view(request):
 
@@ -85,36 +109,53 @@ def login_view(request):
     return render(request, "core/login.html")
 
 
+@query_budget(2)
 @login_required
 def admin_dashboard(request):
     return render(request, 'core/admin.html')
 
+@query_budget(4)
 @login_required
 def logout_view(request):
     logout(request)
     return redirect('index')
 
 
+# Catalog pages revalidate on every visit (no-cache) and get a 304 with no
+# database work while the catalog version is unchanged.
+revalidate_with_catalog = condition(etag_func=catalog_etag, last_modified_func=catalog_last_modified)
+
+
+@query_budget(5)
+@cache_control(private=True, no_cache=True)
+@revalidate_with_catalog
 def index(request):
 	context = {}
 	context['products'] = Product.objects.all()[:3]
 	context['gallery_items'] = Gallery.objects.all().order_by('id')[:3]
 	return render(request,'core/home.html',context)
 
+@query_budget(2)
 def about(request):
 	return render(request,'core/about.html')
 
+@query_budget(2)
 def services(request):
 	return render(request,'core/service.html')
 
+@query_budget(2)
 def contact(request):
 	return render(request,'core/contact.html')
 
+@query_budget(3)
+@cache_control(private=True, no_cache=True)
+@revalidate_with_catalog
 def gallery(request):
 	context = {}
 	context['gallery_items'] = Gallery.objects.all().order_by('-uploaded_at')[:12]
 	return render(request,'core/gallery.html',context)
 
+@query_budget(3)
 @login_required
 def product_create(request):
     if request.method == 'POST':
@@ -157,6 +198,10 @@ def product_create(request):
     return render(request, 'products/product_form.html')
 
 
+@query_budget(4)
+@vary_on_headers('X-Requested-With')
+@cache_control(private=True, no_cache=True)
+@revalidate_with_catalog
 def marketplace(request):
     search_query = request.GET.get('search', '')
     category_filter = request.GET.get('category', 'all')
@@ -165,45 +210,69 @@ def marketplace(request):
     products = Product.objects.all()
 
     if category_filter != 'all':
-        products = products.filter(category__iexact=category_filter)
+        # Categories are stored lowercase; an exact match (unlike iexact,
+        # which is LIKE on SQLite) can use product_category_recent_idx.
+        products = products.filter(category=category_filter.lower())
 
     if search_query:
-        products = products.filter(title__icontains=search_query)
-
-    paginator = Paginator(products, 8)  # 8 products per page
-    page_obj = paginator.get_page(page_number)
+        products = search_products(products, search_query)
+    else:
+        products = products.order_by('-created_at', '-id')
 
-    # Handle AJAX request (for lazy loading or search)
+    # Handle AJAX request (for lazy loading or search): keyset pagination,
+    # so scrolling deeper never costs a COUNT(*) or a bigger OFFSET.
     if request.headers.get('x-requested-with') == 'XMLHttpRequest':
-        products_data = []
-        for product in page_obj:
-            products_data.append({
-                'id': product.id,
-                'title': product.title,
-                'price': str(product.price),
-                'description': product.description[:100],
-                'rating': product.views,
-                'views': product.views,
-                'category': product.category,
-                'image': product.image.url if product.image else '',
+        cursor = request.GET.get('cursor', '')
+
+        def build_json():
+            page = keyset_page(product_listing_values(products), cursor, per_page=8)
+            return dump_json({
+                'products': [product_listing_item(row) for row in page],
+                'next_cursor': page.next_cursor,
             })
-        return JsonResponse({
-            'products': products_data,
-            'has_next': page_obj.has_next(),
-        })
+
+        try:
+            body = cached_listing(('json', category_filter, search_query, cursor), build_json)
+        except InvalidCursor:
+            return JsonResponse({'error': 'Invalid cursor'}, status=400)
+        return HttpResponse(body, content_type='application/json')
+
+    def build_page():
+        page_obj = Paginator(products, 8).get_page(page_number)  # 8 products per page
+        return {
+            'products': list(page_obj),
+            'number': page_obj.number,
+            'num_pages': page_obj.paginator.num_pages,
+            # Lets the infinite scroll continue from the server-rendered page.
+            'next_cursor': encode_cursor(page_obj[-1]) if page_obj.has_next() else '',
+        }
+
+    listing = cached_listing(('html', category_filter, search_query, page_number), build_page)
 
     context = {
-        'products': page_obj,
+        'products': listing['products'],
+        'page_number': listing['number'],
+        'num_pages': listing['num_pages'],
         'search_query': search_query,
         'category_filter': category_filter,
+        'next_cursor': listing['next_cursor'],
     }
     return render(request, 'core/marketplace.html', context)
 
 # views.py
+@query_budget(4)
 def product_detail(request, pk):
+    # Counted even when the browser revalidates its copy and gets a 304.
+    # Buffered and flushed in batches; see core/viewcounter.py.
+    view_counter.record(pk)
+    return _product_detail_page(request, pk)
+
+
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=product_etag, last_modified_func=product_last_modified)
+def _product_detail_page(request, pk):
     product = get_object_or_404(Product, pk=pk)
     product.views += 1
-    product.save()
 
     # Split technologies for template
     technologies = [tech.strip() for tech in product.technologies_used.split(',')]
@@ -217,75 +286,90 @@ def product_detail(request, pk):
 # ----------------------------------------------------------
 # 🟢 CREATE OR GET USER ORDER
 # ----------------------------------------------------------
-@login_required
-def get_or_create_order(client):
+# The payment views below are async: under ASGI (the Procfile's worker) a slow
+# PayChangu call parks a coroutine instead of a whole worker. The ORM is
+# used through its async API or sync_to_async.
+async def get_or_create_order(client):
     """Helper to get or create a pending order for client."""
-    order, created = Order.objects.get_or_create(client=client, paid=False)
+    order, created = await Order.objects.aget_or_create(client=client, paid=False)
     return order
 
 
 # ----------------------------------------------------------
 # 💰 MOBILE MONEY PAYMENT
 # ----------------------------------------------------------
+def provider_unavailable(result):
+    """503 for an initialization the PayChangu circuit breaker refused."""
+    response = JsonResponse({"status": "failed", "message": result["init_message"]}, status=503)
+    response["Retry-After"] = str(result["retry_after"])
+    return response
+
+
+@query_budget(16)
 @csrf_exempt
 @login_required
-def mobile_money_payment(request, product_id):
-    product = get_object_or_404(Product, id=product_id)
+async def mobile_money_payment(request, product_id):
+    product = await aget_object_or_404(Product, id=product_id)
+    user = await request.auser()
 
     try:
-        client = Client.objects.get(user=request.user)
+        client = await Client.objects.aget(user=user)
     except Client.DoesNotExist:
         return JsonResponse({"status": "failed", "message": "No client record found."}, status=400)
 
     if request.method == "POST":
-        phone = request.POST.get("phone-number")
-        provider = request.POST.get("provider") or request.POST.get("operator")
-        email = request.user.email or "ikpixels.py@gmail.com"
-
-        if not phone or not provider:
-            return JsonResponse({"status": "failed", "message": "Missing phone or provider"}, status=400)
-
-        # Create order if not exists
-        order = get_or_create_order(client)
-        order_item, _ = OrderItem.objects.get_or_create(
-            order=order, product=product, defaults={"price": product.price, "qty": 1}
-        )
+        async def initialize():
+            phone = request.POST.get("phone-number")
+            provider = request.POST.get("provider") or request.POST.get("operator")
+            email = user.email or "ikpixels.py@gmail.com"
+
+            if not phone or not provider:
+                return JsonResponse({"status": "failed", "message": "Missing phone or provider"}, status=400)
+
+            # Create order if not exists
+            order = await get_or_create_order(client)
+            order_item, _ = await OrderItem.objects.aget_or_create(
+                order=order, product=product, defaults={"price": product.price, "qty": 1}
+            )
 
-        # Initialize payment with PayChangu
-        result = mobile_initialize_payment(
-            mobile=phone,
-            operator=provider,
-            amount=float(product.price),
-            email=email,
-        )
+            # Initialize payment with PayChangu
+            result = await amobile_initialize_payment(
+                mobile=phone,
+                operator=provider,
+                amount=float(product.price),
+                email=email,
+            )
 
-        print(result)
+            if result.get("unavailable"):
+                return provider_unavailable(result)
+            if result.get("init_status") != "success":
+                return JsonResponse({
+                    "status": "failed",
+                    "message": result.get("init_message", "Payment init failed."),
+                }, status=400)
+
+            tx_ref = result["charge_id"]
+
+            # Record attempt
+            await PaymentAttempt.objects.acreate(
+                order=order,
+                tx_ref=tx_ref,
+                payment_type="airtel" if "airtel" in provider.lower() else "mpamba",
+                amount=product.price,
+                email=email,
+                metadata={"mobile": phone, "operator": provider},
+                status="pending",
+                raw_response=result,
+            )
 
-        if result.get("init_status") != "success":
             return JsonResponse({
-                "status": "failed",
-                "message": result.get("init_message", "Payment init failed."),
-            }, status=400)
-
-        tx_ref = result["charge_id"]
-
-        # Record attempt
-        PaymentAttempt.objects.create(
-            order=order,
-            tx_ref=tx_ref,
-            payment_type="airtel" if "airtel" in provider.lower() else "mpamba",
-            amount=product.price,
-            email=email,
-            metadata={"mobile": phone, "operator": provider},
-            status="pending",
-            raw_response=result,
-        )
+                "status": "success",
+                "tx_ref": tx_ref,
+                "message": result.get("message", "Awaiting mobile confirmation."),
+            })
 
-        return JsonResponse({
-            "status": "success",
-            "tx_ref": tx_ref,
-            "message": result.get("message", "Awaiting mobile confirmation."),
-        })
+        # Double clicks and client retries share one PayChangu call.
+        return await idempotency.run_once(request, user, product, "mobile", initialize)
 
     # Always return JSON, even for GET requests
     return JsonResponse({
@@ -296,105 +380,255 @@ def mobile_money_payment(request, product_id):
 # ----------------------------------------------------------
 # 💳 CARD (VISA/MASTERCARD) PAYMENT
 # ----------------------------------------------------------
+@query_budget(8)
 @csrf_exempt
 @login_required
-def card_payment(request, product_id):
-    product = get_object_or_404(Product, id=product_id)
-    client = get_object_or_404(Client, user=request.user)
+async def card_payment(request, product_id):
+    product = await aget_object_or_404(Product, id=product_id)
+    user = await request.auser()
+    client = await aget_object_or_404(Client, user=user)
 
     if request.method == "POST":
-        card_number = request.POST.get("card-number")
-        expiry = request.POST.get("expiry")
-        cvv = request.POST.get("cvv")
-        cardholder_name = request.POST.get("cardholder-name")
-        email = request.user.email or "guest@ikpixels.com"
-
-        if not all([card_number, expiry, cvv, cardholder_name]):
-            return JsonResponse({"error": "All fields are required"}, status=400)
-
-        order = get_or_create_order(client)
-        OrderItem.objects.get_or_create(
-            order=order, product=product, defaults={"price": product.price, "qty": 1}
-        )
+        async def initialize():
+            card_number = request.POST.get("card-number")
+            expiry = request.POST.get("expiry")
+            cvv = request.POST.get("cvv")
+            cardholder_name = request.POST.get("cardholder-name")
+            email = user.email or "guest@ikpixels.com"
+
+            if not all([card_number, expiry, cvv, cardholder_name]):
+                return JsonResponse({"error": "All fields are required"}, status=400)
+
+            order = await get_or_create_order(client)
+            await OrderItem.objects.aget_or_create(
+                order=order, product=product, defaults={"price": product.price, "qty": 1}
+            )
 
-        redirect_url = request.build_absolute_uri("/pay/verify/")
-
-        result = card_initialize_payment(
-            card_number=card_number,
-            expiry=expiry,
-            cvv=cvv,
-            cardholder_name=cardholder_name,
-            amount=float(product.price),
-            currency="MWK",
-            email=email,
-            redirect_url=redirect_url,
-        )
+            redirect_url = request.build_absolute_uri("/pay/verify/")
+
+            result = await acard_initialize_payment(
+                card_number=card_number,
+                expiry=expiry,
+                cvv=cvv,
+                cardholder_name=cardholder_name,
+                amount=float(product.price),
+                currency="MWK",
+                email=email,
+                redirect_url=redirect_url,
+            )
+
+            if result.get("unavailable"):
+                return provider_unavailable(result)
+            if result.get("init_status") != "success":
+                return JsonResponse(
+                    {
+                        "status": "failed",
+                        "message": result.get("init_message", "Card payment failed."),
+                    },
+                    status=400,
+                )
+
+            tx_ref = result["charge_id"]
+
+            await PaymentAttempt.objects.acreate(
+                order=order,
+                tx_ref=tx_ref,
+                payment_type="visa",
+                amount=product.price,
+                email=email,
+                metadata={"cardholder": cardholder_name},
+                status="pending",
+                raw_response=result,
+            )
 
-        if result.get("init_status") != "success":
             return JsonResponse(
                 {
-                    "status": "failed",
-                    "message": result.get("init_message", "Card payment failed."),
-                },
-                status=400,
+                    "status": "success",
+                    "tx_ref": tx_ref,
+                    "redirect_url": redirect_url,
+                    "message": result.get("message", "Card payment initialized."),
+                }
             )
 
-        tx_ref = result["charge_id"]
-
-        PaymentAttempt.objects.create(
-            order=order,
-            tx_ref=tx_ref,
-            payment_type="visa",
-            amount=product.price,
-            email=email,
-            metadata={"cardholder": cardholder_name},
-            status="pending",
-            raw_response=result,
-        )
-
-        return JsonResponse(
-            {
-                "status": "success",
-                "tx_ref": tx_ref,
-                "redirect_url": redirect_url,
-                "message": result.get("message", "Card payment initialized."),
-            }
-        )
+        # Double clicks and client retries share one PayChangu call.
+        return await idempotency.run_once(request, user, product, "card", initialize)
 
-    return render(request, "payments/visa_payment_form.html", {"product": product})
+    # Context processors read request.user, which is sync-only.
+    return await sync_to_async(render)(request, "payments/visa_payment_form.html", {"product": product})
 
 
 # ----------------------------------------------------------
 # 🔍 VERIFY PAYMENT
 # ----------------------------------------------------------
+VERIFY_MESSAGES = {
+    "success": "Payment verified.",
+    "failed": "Verification failed.",
+    "pending": "Awaiting payment confirmation.",
+}
+
+
+def verification_response(status):
+    return JsonResponse({"status": status, "message": VERIFY_MESSAGES[status]})
+
+
+@query_budget(10)
 @login_required
 @csrf_exempt
-def verify_payment(request, tx_ref):
+async def verify_payment(request, tx_ref):
+    """
+    Report the status of a payment attempt. Webhooks normally settle the
+    attempt first, so this is a DB read; PayChangu is only asked directly
+    once the attempt has been pending for PAYCHANGU_VERIFY_AFTER seconds.
+    """
     payment_type = request.POST.get("type", "card")
 
     if not tx_ref:
         return JsonResponse({"error": "Missing tx_ref"}, status=400)
 
-    attempt = PaymentAttempt.objects.filter(tx_ref=tx_ref).first()
+    attempt = await PaymentAttempt.objects.filter(tx_ref=tx_ref).afirst()
     if not attempt:
         return JsonResponse({"error": "Payment attempt not found"}, status=404)
 
-    result = verify_paychangu_payment(tx_ref, payment_type=payment_type)
-    status = result.get("status")
+    if attempt.status in SETTLED:
+        return verification_response(attempt.status)
+    if timezone.now() - attempt.created_at < timedelta(seconds=settings.PAYCHANGU_VERIFY_AFTER):
+        return verification_response("pending")
 
-    attempt.raw_response = result
-    attempt.status = "success" if status == "success" else "failed"
-    attempt.save()
+    return verification_response(await verify_upstream(attempt, payment_type))
 
-    if status == "success":
-        order = attempt.order
-        order.paid = True
-        order.total = attempt.amount
-        order.save()
 
-        for item in order.items.all():
-            item.product.mark_sold(1)
+async def verify_upstream(attempt, payment_type):
+    """Ask PayChangu about a pending attempt and settle it; returns the resulting status."""
+    result = await averify_paychangu_payment(attempt.tx_ref, payment_type=payment_type)
+    status = verified_status(result)
+    if status is None:
+        return "pending"
 
-        return JsonResponse({"status": "success", "message": "Payment verified."})
-    else:
-        return JsonResponse({"status": "failed", "message": "Verification failed."})
+    if not await sync_to_async(settle)(attempt, status, result):
+        # Settled meanwhile (webhook or reconciler): report what was stored.
+        status = await PaymentAttempt.objects.filter(pk=attempt.pk).values_list("status", flat=True).aget()
+    return status
+
+
+# ----------------------------------------------------------
+# 📡 PAYMENT STATUS EVENTS
+# ----------------------------------------------------------
+EVENTS_HEARTBEAT = 15
+EVENTS_POLL_RETRY_MS = 5000  # under WSGI, see payment_events
+
+
+def status_event(status):
+    data = json.dumps({"status": status, "message": VERIFY_MESSAGES[status]})
+    return f"event: status\ndata: {data}\n\n"
+
+
+@query_budget(3)
+@login_required
+async def payment_events(request, tx_ref):
+    """
+    Server-sent events stream of one payment attempt's status, meant for
+    the ASGI app: the connection stays open (costing a coroutine, not a
+    worker) until the webhook or the reconciler settles the attempt. If
+    nothing has arrived PAYCHANGU_VERIFY_AFTER seconds after the attempt
+    was created, PayChangu is asked once. The stream ends after
+    PAYMENT_EVENTS_TIMEOUT seconds and EventSource reconnects.
+
+    A WSGI server would buffer the whole stream while it holds a worker,
+    so there the reply is the current status alone. EventSource then
+    reconnects after EVENTS_POLL_RETRY_MS, which amounts to polling.
+    """
+    user = await request.auser()
+    # Read the marker before the row, so a change in between is not missed.
+    marker = await notifier.amarker(tx_ref)
+    attempt = await PaymentAttempt.objects.filter(tx_ref=tx_ref, order__client__user=user).afirst()
+    if not attempt:
+        return JsonResponse({"error": "Payment attempt not found"}, status=404)
+
+    if isinstance(request, WSGIRequest):
+        response = HttpResponse(f"retry: {EVENTS_POLL_RETRY_MS}\n\n{status_event(attempt.status)}",
+                                content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        return response
+
+    response = StreamingHttpResponse(payment_status_stream(attempt, marker), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # stop nginx from buffering the stream
+    return response
+
+
+async def payment_status_stream(attempt, marker):
+    yield "retry: 3000\n\n"
+    yield status_event(attempt.status)
+    if attempt.status in SETTLED:
+        return
+
+    payment_type = "card" if attempt.payment_type == "visa" else "mobile"
+    verify_at = attempt.created_at + timedelta(seconds=settings.PAYCHANGU_VERIFY_AFTER)
+    verified = False
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.PAYMENT_EVENTS_TIMEOUT
+    while (remaining := deadline - loop.time()) > 0:
+        timeout = min(remaining, EVENTS_HEARTBEAT)
+        if not verified:
+            timeout = min(timeout, max(0, (verify_at - timezone.now()).total_seconds()))
+        changed, marker = await notifier.wait(attempt.tx_ref, timeout, marker)
+        if changed:
+            status = await PaymentAttempt.objects.filter(pk=attempt.pk).values_list("status", flat=True).aget()
+        elif not verified and timezone.now() >= verify_at:
+            # No webhook yet: one upstream check per stream.
+            verified = True
+            status = await verify_upstream(attempt, payment_type)
+        else:
+            yield ": keep-alive\n\n"
+            continue
+        if status in SETTLED:
+            yield status_event(status)
+            return
+
+
+# ----------------------------------------------------------
+# 📬 PAYCHANGU WEBHOOK
+# ----------------------------------------------------------
+@query_budget(7)
+@csrf_exempt
+@require_POST
+def paychangu_webhook(request):
+    """Payment notifications from PayChangu, authenticated by HMAC signature."""
+    if not valid_signature(request.body, request.headers.get("Signature")):
+        return JsonResponse({"error": "Invalid signature"}, status=403)
+
+    try:
+        payload = json.loads(request.body)
+    except ValueError:
+        return JsonResponse({"error": "Invalid JSON"}, status=400)
+
+    tx_ref = payload.get("tx_ref") or payload.get("charge_id")
+    if not tx_ref:
+        return JsonResponse({"error": "Missing tx_ref"}, status=400)
+
+    # tx_ref is unique, so this is an index lookup.
+    attempt = PaymentAttempt.objects.filter(tx_ref=tx_ref).first()
+    if not attempt:
+        # The notification can beat the PaymentAttempt insert; PayChangu retries.
+        return JsonResponse({"error": "Payment attempt not found"}, status=404)
+
+    status = webhook_status(payload)
+    applied = status is not None and settle(attempt, status, payload)
+    return JsonResponse({"status": "ok", "applied": applied})
+
+
+# ----------------------------------------------------------
+# 📈 METRICS
+# ----------------------------------------------------------
+@query_budget(3)
+@never_cache
+def metrics_view(request):
+    """
+    Prometheus scrape target for staff users, and for scrapers sending
+    ``Authorization: Bearer <METRICS_TOKEN>`` when that is set.
+    """
+    token = settings.METRICS_TOKEN
+    scraper = token and hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}")
+    if not (scraper or request.user.is_staff):
+        return HttpResponse(status=403 if request.user.is_authenticated else 401)
+    return HttpResponse(metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
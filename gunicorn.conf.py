@@ -0,0 +1,8 @@
+# gunicorn.conf.py -- picked up automatically by `gunicorn` from the project root.
+
+
+def worker_exit(server, worker):
+    """Write out buffered product view counts before the worker goes away."""
+    from core.viewcounter import counter
+
+    counter.shutdown()
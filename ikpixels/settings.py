@@ -48,6 +48,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    # After WhiteNoise, so static files are not measured.
+    'core.instrumentation.RequestTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -61,7 +63,8 @@ ROOT_URLCONF = 'ikpixels.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates, timing renders for RequestTimingMiddleware.
+        'BACKEND': 'core.instrumentation.TimedDjangoTemplates',
         'DIRS': [],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -80,13 +83,128 @@ WSGI_APPLICATION = 'ikpixels.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Connections are kept for CONN_MAX_AGE seconds instead of being opened
+# (and re-tuned) on every request. IMMEDIATE transactions take SQLite's
+# write lock at BEGIN, so a read-then-write transaction waits its turn
+# (busy_timeout) instead of failing with "database is locked" when it
+# tries to upgrade its lock.
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': int(os.environ.get('CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+        },
     }
 }
 
+# Applied to every new SQLite connection (see core/sqlite.py).
+SQLITE_PRAGMAS = {
+    'journal_mode': os.environ.get('SQLITE_JOURNAL_MODE', 'wal'),
+    'synchronous': os.environ.get('SQLITE_SYNCHRONOUS', 'normal'),
+    'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000)),
+    'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE', 128 * 1024 * 1024)),
+    'cache_size': int(os.environ.get('SQLITE_CACHE_SIZE', -32000)),  # negative: KiB, i.e. 32 MB
+    'temp_store': os.environ.get('SQLITE_TEMP_STORE', 'memory'),
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+#
+# CACHE_BACKEND selects the store for marketplace listings:
+#   "file"   - shared by every worker on the host (default)
+#   "locmem" - per process, fine for development and tests
+#   "redis"  - any Redis-compatible server at REDIS_URL (needs redis-py)
+
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'file')
+
+# The file and locmem backends cull a third of their entries at random
+# once they hold MAX_ENTRIES (Django's default is 300). One search can
+# add a listing entry, so allow far more than that.
+CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 100_000))
+
+if CACHE_BACKEND == 'redis':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ.get('REDIS_URL', 'redis://127.0.0.1:6379/0'),
+        }
+    }
+elif CACHE_BACKEND == 'locmem':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'OPTIONS': {'MAX_ENTRIES': CACHE_MAX_ENTRIES},
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ.get('CACHE_DIR', '/tmp/ikpixels-cache'),
+            'OPTIONS': {'MAX_ENTRIES': CACHE_MAX_ENTRIES},
+        }
+    }
+
+MARKETPLACE_CACHE_ALIAS = 'default'
+MARKETPLACE_CACHE_TIMEOUT = 300
+
+# Seconds between write-behind flushes of product view counts (0 disables
+# the background thread; counts are then written only at process exit).
+VIEW_COUNT_FLUSH_INTERVAL = int(os.environ.get('VIEW_COUNT_FLUSH_INTERVAL', 5))
+
+# PayChangu API root; point it at a local stand-in for load tests.
+PAYCHANGU_BASE_URL = os.environ.get('PAYCHANGU_BASE_URL', 'https://api.paychangu.com')
+
+# Webhook signing secret from the PayChangu dashboard. Payment status
+# normally arrives by webhook; verify_payment only asks PayChangu itself
+# once an attempt has been pending this many seconds.
+PAYCHANGU_WEBHOOK_SECRET = os.environ.get('PAYCHANGU_WEBHOOK_SECRET', '')
+PAYCHANGU_VERIFY_AFTER = int(os.environ.get('PAYCHANGU_VERIFY_AFTER', 30))
+
+# Seconds a payment status event stream stays open before the browser
+# reconnects (see views.payment_events).
+PAYMENT_EVENTS_TIMEOUT = int(os.environ.get('PAYMENT_EVENTS_TIMEOUT', 120))
+
+# After this many consecutive PayChangu failures (5xx, 429, timeouts) on an
+# endpoint, calls fail fast for PAYCHANGU_BREAKER_COOLDOWN seconds before a
+# single probe is let through. The state is kept in the database
+# (core.BreakerState), shared by every worker.
+PAYCHANGU_BREAKER_THRESHOLD = int(os.environ.get('PAYCHANGU_BREAKER_THRESHOLD', 5))
+PAYCHANGU_BREAKER_COOLDOWN = int(os.environ.get('PAYCHANGU_BREAKER_COOLDOWN', 30))
+
+# /metrics/ is open to staff users, and to scrapers sending this bearer
+# token (empty: staff only).
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+# Request metrics are buffered in each process and written to the cache
+# at most this often (seconds).
+METRICS_FLUSH_INTERVAL = int(os.environ.get('METRICS_FLUSH_INTERVAL', 5))
+
+# RequestTimingMiddleware: send the Server-Timing header, and log requests
+# slower than SLOW_REQUEST_MS milliseconds with their SLOW_REQUEST_SQL
+# slowest statements.
+SERVER_TIMING = os.environ.get('SERVER_TIMING', 'true').lower() == 'true'
+SLOW_REQUEST_MS = int(os.environ.get('SLOW_REQUEST_MS', 1000))
+SLOW_REQUEST_SQL = int(os.environ.get('SLOW_REQUEST_SQL', 5))
+
+# RepeatedQueryMiddleware logs queries of the same shape run
+# QUERY_REPEAT_THRESHOLD or more times in one request (an N+1), with the
+# code that sent them, and requests over their view's query budget. It
+# walks the stack for every query, so it is on by default only with DEBUG.
+QUERY_WATCH = os.environ.get('QUERY_WATCH', str(DEBUG)).lower() == 'true'
+QUERY_REPEAT_THRESHOLD = int(os.environ.get('QUERY_REPEAT_THRESHOLD', 3))
+if QUERY_WATCH:
+    MIDDLEWARE.insert(MIDDLEWARE.index('core.instrumentation.RequestTimingMiddleware') + 1,
+                      'core.querywatch.RepeatedQueryMiddleware')
+
+# Seconds a successful payment initialization is replayed for repeats of
+# the same idempotency key.
+PAYMENT_IDEMPOTENCY_TTL = int(os.environ.get('PAYMENT_IDEMPOTENCY_TTL', 24 * 60 * 60))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -126,6 +244,19 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 STATIC_URL = "/static/"
 MEDIA_URL = '/media/'
 
+# collectstatic (run in the deploy build) writes content-hashed copies of
+# every asset plus .gz/.br siblings; WhiteNoise serves the hashed names with
+# a one-year immutable Cache-Control and picks the compressed variant from
+# Accept-Encoding.
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field